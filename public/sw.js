@@ -1,51 +1,143 @@
 // Service Worker for Trade Union Hotel Search Platform
-// Basic service worker for future PWA features
-
-const CACHE_NAME = 'sindicatos-hoteis-v1';
-const urlsToCache = [
-  '/',
-  '/index.html',
-  '/styles/main.css',
-  '/main.js',
-  '/assets/icons/logo.svg',
-  '/assets/icons/favicon.svg'
-];
-
-// Install event - cache resources
+// Precaches the assets listed in precache-manifest.js (generated by
+// scripts/generate-precache-manifest.py) under a cache named after the
+// manifest version, so a deploy with changed assets gets a fresh cache and
+// unchanged assets are copied over instead of downloaded again.
+
+// A tree served without `npm run build` has no manifest. index.html does not
+// register the worker there, but a worker installed earlier still updates
+// to this file, so it must install (with nothing to precache) rather than throw.
+try {
+  importScripts('precache-manifest.js');
+} catch (error) {
+  console.warn('No precache manifest; precaching nothing:', error);
+}
+
+const MANIFEST = self.__PRECACHE_MANIFEST || { version: 'dev', assets: [], runtime: [] };
+const PRECACHE_PREFIX = 'monitora-precache-';
+const PRECACHE_NAME = `${PRECACHE_PREFIX}${MANIFEST.version}`;
+const RUNTIME_NAME = 'monitora-runtime-v1';
+const RUNTIME_MAX_ENTRIES = 60;
+const LEGACY_CACHES = ['sindicatos-hoteis-v1'];
+const REVISION_HEADER = 'X-Precache-Revision';
+
+const assetUrl = (url) => new URL(url, self.registration.scope).href;
+const PRECACHED = new Map(MANIFEST.assets.map((asset) => [assetUrl(asset.url), asset.revision]));
+
+// Only the CDNs the page loads from are runtime-cached (Bootstrap and icons
+// from jsDelivr, Google Fonts CSS and font files). The manifest's runtime
+// list is not added: it also holds analytics (googletagmanager), which,
+// like every other cross-origin request, passes through
+const RUNTIME_ORIGINS = new Set([
+  'https://cdn.jsdelivr.net',
+  'https://fonts.googleapis.com',
+  'https://fonts.gstatic.com'
+]);
+
+async function withRevision(response, revision) {
+  const headers = new Headers(response.headers);
+  headers.set(REVISION_HEADER, revision);
+  return new Response(await response.blob(), {
+    status: response.status,
+    statusText: response.statusText,
+    headers
+  });
+}
+
+async function findPrevious(url, revision) {
+  const names = await caches.keys();
+  for (const name of names) {
+    if (name === PRECACHE_NAME || !name.startsWith(PRECACHE_PREFIX)) continue;
+    const cached = await (await caches.open(name)).match(url);
+    if (cached && cached.headers.get(REVISION_HEADER) === revision) return cached;
+  }
+  return null;
+}
+
+// Install event - precache every manifest asset, reusing unchanged ones
 self.addEventListener('install', (event) => {
-  event.waitUntil(
-    caches.open(CACHE_NAME)
-      .then((cache) => {
-        console.log('Opened cache');
-        return cache.addAll(urlsToCache);
-      })
-  );
-});
+  event.waitUntil((async () => {
+    const cache = await caches.open(PRECACHE_NAME);
+    await Promise.all(Array.from(PRECACHED, async ([url, revision]) => {
+      const existing = await cache.match(url);
+      if (existing && existing.headers.get(REVISION_HEADER) === revision) return;
 
-// Fetch event - serve cached content when offline
-self.addEventListener('fetch', (event) => {
-  event.respondWith(
-    caches.match(event.request)
-      .then((response) => {
-        // Return cached version or fetch from network
-        return response || fetch(event.request);
+      const previous = await findPrevious(url, revision);
+      if (previous) {
+        await cache.put(url, previous);
+        return;
       }
-    )
-  );
+
+      const response = await fetch(url, { cache: 'reload' });
+      if (!response.ok) throw new Error(`Precache failed for ${url}: ${response.status}`);
+      await cache.put(url, await withRevision(response, revision));
+    }));
+    await self.skipWaiting();
+  })());
 });
 
-// Activate event - clean up old caches
+// Activate event - drop precaches from older manifests and the legacy cache
 self.addEventListener('activate', (event) => {
-  event.waitUntil(
-    caches.keys().then((cacheNames) => {
-      return Promise.all(
-        cacheNames.map((cacheName) => {
-          if (cacheName !== CACHE_NAME) {
-            console.log('Deleting old cache:', cacheName);
-            return caches.delete(cacheName);
-          }
-        })
-      );
-    })
-  );
-});
\ No newline at end of file
+  event.waitUntil((async () => {
+    const names = await caches.keys();
+    await Promise.all(names
+      .filter((name) => LEGACY_CACHES.includes(name) ||
+        (name.startsWith(PRECACHE_PREFIX) && name !== PRECACHE_NAME))
+      .map((name) => {
+        console.log('Deleting old cache:', name);
+        return caches.delete(name);
+      }));
+    await self.clients.claim();
+  })());
+});
+
+// Oldest entries first (Cache.keys() is in insertion order)
+async function trimRuntimeCache(cache) {
+  const keys = await cache.keys();
+  const excess = keys.slice(0, Math.max(0, keys.length - RUNTIME_MAX_ENTRIES));
+  await Promise.all(excess.map((key) => cache.delete(key)));
+}
+
+async function staleWhileRevalidate(event) {
+  const cache = await caches.open(RUNTIME_NAME);
+  const cached = await cache.match(event.request);
+  const network = fetch(event.request)
+    .then(async (response) => {
+      if (response.ok || response.type === 'opaque') {
+        await cache.put(event.request, response.clone());
+        await trimRuntimeCache(cache);
+      }
+      return response;
+    });
+  if (cached) {
+    event.waitUntil(network.catch(() => undefined));
+    return cached;
+  }
+  return network;
+}
+
+// Fetch event - precached assets from cache, API always from the network,
+// known CDN assets (Bootstrap, fonts) stale-while-revalidate
+self.addEventListener('fetch', (event) => {
+  const { request } = event;
+  if (request.method !== 'GET') return;
+
+  const url = new URL(request.url);
+  url.hash = '';
+  const key = url.origin === self.location.origin ? `${url.origin}${url.pathname}` : url.href;
+
+  if (PRECACHED.has(key)) {
+    event.respondWith(
+      caches.open(PRECACHE_NAME)
+        .then((cache) => cache.match(key))
+        .then((response) => response || fetch(request))
+    );
+    return;
+  }
+
+  if (url.pathname.startsWith('/api/')) return;
+
+  if (RUNTIME_ORIGINS.has(url.origin)) {
+    event.respondWith(staleWhileRevalidate(event));
+  }
+});
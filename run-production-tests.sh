@@ -20,7 +20,7 @@ NC='\033[0m' # No Color
 
 # Production environment configuration
 PRODUCTION_URL="https://www.mpbarbosa.com/submodules/monitora_vagas/public/"
-PRODUCTION_API_URL="https://www.mpbarbosa.com/api/vagas/hoteis/scrape"
+PRODUCTION_API_URL="https://www.mpbarbosa.com/api/vagas/hoteis"
 
 # Test results tracking
 TOTAL_TESTS=0
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""
+Selenium vs Playwright Driver Overhead
+
+Runs the scenarios of tests/config/driver_benchmark.py (page load, hotel
+dropdown population, date entry, search against the mock API on :3001)
+through each engine and prints the median wall time, driver round trips,
+CPU (process tree and this Python process) and RSS per scenario.
+
+Usage:
+    python3 scripts/benchmark-drivers.py
+    python3 scripts/benchmark-drivers.py --runs 10 --json driver-benchmark.json
+    python3 scripts/benchmark-drivers.py --engine playwright --scenario mocked_search
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+
+sys.path.insert(0, str(ROOT_DIR / "tests"))
+from config.driver_benchmark import (  # noqa: E402
+    ENGINE_FACTORIES, ENGINES, SCENARIOS, run_benchmark, summarize,
+)
+from config.mock_api import MockAPI  # noqa: E402
+from config.render_benchmark import synthetic_search_response  # noqa: E402
+from config.static_server import start_server  # noqa: E402
+
+
+def cell(value, unit=''):
+    return f"{value:>9.1f}{unit}" if isinstance(value, float) else f"{value if value is not None else '-':>9}{unit}"
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Compare Selenium and Playwright overhead per scenario")
+    parser.add_argument("--engine", action="append", choices=ENGINES,
+                        help="Engine to run (repeatable, default: both)")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS,
+                        help="Scenario to run (repeatable, default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="Measured runs per scenario (default: 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="Discarded runs per scenario (default: 1)")
+    parser.add_argument("--hotels", type=int, default=24, help="Hotels in the search response")
+    parser.add_argument("--vacancies", type=int, default=20, help="Vacancies per hotel")
+    parser.add_argument("--json", help="Write every sample to this file")
+    args = parser.parse_args()
+
+    print("🏎️  Selenium vs Playwright Driver Overhead\n")
+
+    engines = args.engine or ENGINES
+    scenarios = args.scenario or SCENARIOS
+    samples = []
+    httpd, base_url = start_server(ROOT_DIR)
+    api = MockAPI(search_response=synthetic_search_response(args.hotels, args.vacancies)).start()
+    url = f"{base_url}/public/index.html?useLocalAPI=true"
+    try:
+        for name in engines:
+            try:
+                with ENGINE_FACTORIES[name]() as engine:
+                    samples += run_benchmark(engine, url, scenarios, args.runs, args.warmup)
+            except ImportError as e:
+                print(f"   ⚠️  {name} skipped: {e}")
+                continue
+            print(f"   ✓ {name}: {len(scenarios)} scenarios x {args.runs} runs")
+    finally:
+        api.stop()
+        httpd.shutdown()
+
+    if not samples:
+        print("❌ No engine could run")
+        return 1
+
+    summary = summarize(samples)
+    print(f"\n{'Scenario':<22}{'Engine':<12}{'wall':>11}{'trips':>9}{'CPU':>11}{'client':>11}{'RSS':>11}")
+    print('-' * 87)
+    for scenario in scenarios:
+        for name in engines:
+            row = summary.get((name, scenario))
+            if row is None:
+                continue
+            print(f"{scenario:<22}{name:<12}{cell(row['wall_ms'], 'ms')}{cell(row['round_trips'])}"
+                  f"{cell(row['cpu_ms'], 'ms')}{cell(row['client_cpu_ms'], 'ms')}{cell(row['rss_mb'], 'MB')}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            'runs': args.runs,
+            'samples': [sample.as_dict() for sample in samples],
+        }, indent=2) + '\n', encoding='utf-8')
+        print(f"\n💾 Written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,6 +22,9 @@ ROOT_DIR = Path(__file__).parent.parent
 USE_CASES_DIR = ROOT_DIR / "tests" / "use_cases"
 RESULTS_FILE = USE_CASES_DIR / "results.json"
 
+sys.path.insert(0, str(ROOT_DIR / "tests"))
+from config.event_log import EventLog  # noqa: E402
+
 # Use case test files mapping
 USE_CASES = {
     "UC-001: API Hotel List": "test_uc001_api_hotel_list.py",
@@ -37,12 +40,13 @@ USE_CASES = {
 }
 
 
-def run_test(test_file: str) -> dict:
+def run_test(test_file: str, env: dict = None) -> dict:
     """
     Run a single test file and return result.
     
     Args:
         test_file: Name of the test file
+        env: Environment for the test process (default: inherited)
         
     Returns:
         Dictionary with test result information
@@ -63,6 +67,7 @@ def run_test(test_file: str) -> dict:
         result = subprocess.run(
             [sys.executable, str(test_path)],
             cwd=ROOT_DIR,
+            env=env,
             capture_output=True,
             text=True,
             timeout=60
@@ -114,23 +119,32 @@ def main():
         "tests": {}
     }
     
+    events = EventLog("collect-use-case-results")
+    events.run_start(use_cases=len(USE_CASES))
+    
     # Run each use case test
     for name, test_file in USE_CASES.items():
         print(f"Running {name}...", end=" ", flush=True)
         
-        result = run_test(test_file)
+        events.suite_start(name, file=test_file)
+        result = run_test(test_file, events.child_env())
         results["tests"][name] = result
         results["summary"]["duration"] += result["duration"]
         
         if result["skipped"]:
             results["summary"]["skipped"] += 1
+            outcome = "skipped"
             print("⏭️  SKIPPED")
         elif result["passed"]:
             results["summary"]["passed"] += 1
+            outcome = "passed"
             print("✅ PASSED")
         else:
             results["summary"]["failed"] += 1
+            outcome = "failed"
             print(f"❌ FAILED: {result['message']}")
+        
+        events.suite_end(name, outcome, duration=result["duration"], message=result["message"])
     
     # Ensure directory exists
     USE_CASES_DIR.mkdir(parents=True, exist_ok=True)
@@ -147,6 +161,14 @@ def main():
     print(f"   Duration: {results['summary']['duration']:.2f}s")
     print(f"\n✅ Results saved to: {RESULTS_FILE}")
     
+    events.run_end(
+        "passed" if results['summary']['failed'] == 0 else "failed",
+        total=results['summary']['total'],
+        passed=results['summary']['passed'],
+        failed=results['summary']['failed'],
+        skipped=results['summary']['skipped']
+    )
+    
     # Return exit code based on failures
     return 0 if results['summary']['failed'] == 0 else 1
 
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+"""
+Critical CSS Extractor
+
+Renders public/index.html headlessly at the mobile (375x667) and desktop
+(1920x1080) viewports, keeps the rules that style above-the-fold content
+and writes:
+
+    build/critical/critical.css                 the critical rules, minified
+    build/critical/critical-inline.html         <style> block + deferred <link>s
+    build/critical/deferred-stylesheets.json    stylesheets to load after first paint
+
+Usage:
+    python3 scripts/extract-critical-css.py
+    python3 scripts/extract-critical-css.py --output-dir /tmp/critical
+    python3 scripts/extract-critical-css.py --url http://localhost:8080/public/index.html
+"""
+
+import argparse
+import gzip
+import sys
+from pathlib import Path
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+
+sys.path.insert(0, str(ROOT_DIR / "tests"))
+from config.critical_css import (  # noqa: E402
+    CRITICAL_BUDGET_BYTES, OUTPUT_DIR, VIEWPORTS, extract, write_outputs,
+)
+from config.page_helpers import API_STUB_SCRIPT  # noqa: E402
+from config.selenium_config import get_chrome_options, get_chromedriver_path  # noqa: E402
+from config.static_server import start_server  # noqa: E402
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Extract above-the-fold CSS for index.html")
+    parser.add_argument("--url", help="Page to render (default: serve the repo and open public/index.html)")
+    parser.add_argument("--output-dir", default=str(OUTPUT_DIR),
+                        help=f"Where to write the outputs (default: {OUTPUT_DIR})")
+    parser.add_argument("--budget", type=int, default=CRITICAL_BUDGET_BYTES,
+                        help=f"Maximum critical CSS size in bytes (default: {CRITICAL_BUDGET_BYTES})")
+    args = parser.parse_args()
+
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    print("✂️  Critical CSS Extractor\n")
+
+    httpd = None
+    url = args.url
+    if not url:
+        httpd, base_url = start_server(ROOT_DIR)
+        url = f"{base_url}/public/index.html"
+
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=get_chrome_options(warm_profile=False))
+    try:
+        # Same hotel list on every run, no dependency on the live API
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': API_STUB_SCRIPT})
+        critical, links, opaque, counts = extract(driver, url)
+    finally:
+        driver.quit()
+        if httpd:
+            httpd.shutdown()
+
+    for name, (width, height) in VIEWPORTS.items():
+        print(f"   📐 {name:<8} {width}x{height}: {counts[name]} critical rules")
+    for href in opaque:
+        print(f"   ⚠️  Not readable (no CORS), left to the deferred load: {href}")
+
+    output_dir = write_outputs(critical, links, args.output_dir)
+    size = len(critical.encode('utf-8'))
+    compressed = len(gzip.compress(critical.encode('utf-8')))
+    print(f"\n📦 Critical CSS: {size:,} bytes ({compressed:,} gzipped), "
+          f"{len(links)} stylesheets deferred")
+    print(f"💾 Written to {output_dir}")
+
+    if size > args.budget:
+        print(f"❌ Over budget: {size:,} > {args.budget:,} bytes")
+        return 1
+    print(f"✅ Within budget ({args.budget:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
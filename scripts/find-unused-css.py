@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+
+"""
+Unused CSS Finder
+
+Drives public/index.html through its main states (initial, searching,
+results, empty state, modals, dark mode, mobile) with the API stubbed out,
+records which rules matched via Chrome DevTools CSS rule-usage tracking and
+reports the never-matched rules per stylesheet with byte counts.
+
+Usage:
+    python3 scripts/find-unused-css.py                      # serve the repo locally
+    python3 scripts/find-unused-css.py --details 20         # list unused selectors
+    python3 scripts/find-unused-css.py --json unused-css-report.json
+    python3 scripts/find-unused-css.py --url http://localhost:8080/public/index.html
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+MOBILE_VIEWPORT = {'width': 375, 'height': 812, 'deviceScaleFactor': 3, 'mobile': True}
+SEARCH_DELAY_MS = 3000
+
+sys.path.insert(0, str(ROOT_DIR / "tests"))
+from config.css_coverage import CSSCoverageRecorder, local_path  # noqa: E402
+from config.page_helpers import submit_search, wait_for  # noqa: E402
+from config.selenium_config import get_chrome_options, get_chromedriver_path  # noqa: E402
+from config.static_server import start_server  # noqa: E402
+
+
+def drive_states(driver, recorder, url):
+    """Visit every UI state, taking a coverage snapshot after each"""
+    def state(name, action):
+        started = time.perf_counter()
+        try:
+            action()
+            time.sleep(0.3)  # let transitions and deferred styles settle
+        except Exception as e:
+            print(f"   ⚠️  {name}: {e}")
+        new_rules = recorder.snapshot(name)
+        print(f"   📸 {name:<12} {new_rules:4d} newly matched rules "
+              f"({time.perf_counter() - started:.1f}s)")
+
+    def initial():
+        driver.get(url)
+        wait_for(driver, "document.readyState === 'complete'")
+        wait_for(driver, "document.querySelectorAll('#hotel-select option').length > 1")
+
+    def searching():
+        submit_search(driver, True, SEARCH_DELAY_MS)
+        time.sleep(0.5)
+
+    def results():
+        wait_for(driver, "document.querySelector('#hotels-cards-container .hotel-card')",
+                 SEARCH_DELAY_MS / 1000 + 15)
+
+    def empty_state():
+        submit_search(driver, False)
+        wait_for(driver, "document.querySelector('#hotels-cards-container .empty-state')")
+
+    def modals():
+        for modal_id in ('aboutModal', 'clearResultsModal'):
+            driver.execute_script(
+                "bootstrap.Modal.getOrCreateInstance(document.getElementById(arguments[0])).show();",
+                modal_id)
+            wait_for(driver, f"document.getElementById('{modal_id}').classList.contains('show')")
+            driver.execute_script(
+                "bootstrap.Modal.getInstance(document.getElementById(arguments[0])).hide();",
+                modal_id)
+            wait_for(driver, "!document.querySelector('.modal.show')")
+
+    def dark_mode():
+        driver.find_element('id', 'dark-mode-toggle').click()
+
+    def mobile():
+        driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', MOBILE_VIEWPORT)
+        driver.execute_script("window.dispatchEvent(new Event('resize'));")
+
+    for name, action in [
+        ('initial', initial),
+        ('searching', searching),
+        ('results', results),
+        ('empty-state', empty_state),
+        ('modals', modals),
+        ('dark-mode', dark_mode),
+        ('mobile', mobile),
+    ]:
+        state(name, action)
+
+
+def print_report(report, origin, details):
+    total = sum(f['rule_bytes'] for f in report)
+    unused = sum(f['unused_bytes'] for f in report)
+
+    print("\n📊 Unused CSS by stylesheet\n")
+    print(f"   {'Unused':>9} {'Rules':>9}  {'%':>5}  Stylesheet")
+    for entry in report:
+        share = entry['unused_bytes'] / entry['rule_bytes'] * 100 if entry['rule_bytes'] else 0
+        print(f"   {entry['unused_bytes']:>8,}B {entry['rule_bytes']:>8,}B  {share:4.0f}%  "
+              f"{local_path(entry['url'], origin)} ({entry['unused_rules']}/{entry['rules']} rules)")
+        for rule in entry['unused'][:details]:
+            print(f"{'':27}L{rule['line']:<5} {rule['selector'][:70]} ({rule['bytes']}B)")
+
+    share = unused / total * 100 if total else 0
+    print(f"\n🧹 {unused:,} of {total:,} rule bytes never matched ({share:.1f}%)")
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Report never-matched CSS rules per stylesheet")
+    parser.add_argument("--url", help="Page to audit (default: serve the repo and open public/index.html)")
+    parser.add_argument("--details", type=int, default=0, metavar="N",
+                        help="List up to N unused selectors per stylesheet")
+    parser.add_argument("--json", metavar="FILE", help="Also write the full report as JSON")
+    parser.add_argument("--include-vendor", action="store_true",
+                        help="Include CDN and public/vendor stylesheets")
+    args = parser.parse_args()
+
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    print("🔍 Unused CSS Finder\n")
+
+    httpd = None
+    url = args.url
+    if not url:
+        httpd, base_url = start_server(ROOT_DIR)
+        url = f"{base_url}/public/index.html"
+    parsed = urlparse(url)
+    origin = f"{parsed.scheme}://{parsed.netloc}"
+
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=get_chrome_options(warm_profile=False))
+    try:
+        recorder = CSSCoverageRecorder(driver)
+        recorder.start()
+        print(f"🌐 {url}")
+        drive_states(driver, recorder, url)
+        report = recorder.stop()
+    finally:
+        driver.quit()
+        if httpd:
+            httpd.shutdown()
+
+    if not args.include_vendor:
+        report = [f for f in report
+                  if f['url'].startswith(origin) and '/vendor/' not in f['url']]
+
+    print_report(report, origin, args.details)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'url': url,
+                'states': recorder.states,
+                'stylesheets': [dict(entry, path=local_path(entry['url'], origin)) for entry in report],
+            }, f, indent=2, ensure_ascii=False)
+        print(f"💾 Report written to {args.json}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
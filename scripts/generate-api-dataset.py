@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+"""
+Synthetic API Dataset Generator
+
+Writes a /vagas/search (or /vagas/hoteis) payload from
+tests/config/api_factory.py to a file or stdout. The search body is
+streamed hotel by hotel, so multi-hundred-megabyte datasets can be written
+without building them in memory.
+
+Usage:
+    python3 scripts/generate-api-dataset.py --hotels 25 --vacancies 1000 -o todas.json
+    python3 scripts/generate-api-dataset.py --checkin 2026-12-22 --checkout 2026-12-27
+    python3 scripts/generate-api-dataset.py --accentless 0.3 --singular 0.1 --unavailable 0.2
+    python3 scripts/generate-api-dataset.py --hotels-list --hotels 40
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+
+sys.path.insert(0, str(ROOT_DIR / "tests"))
+from config.api_factory import DatasetSpec, hotels_payload, iter_search_json  # noqa: E402
+
+
+def capacity_weights(text):
+    """'2:40,3:25,4:20' -> {2: 40.0, 3: 25.0, 4: 20.0}"""
+    weights = {}
+    for pair in text.split(','):
+        capacity, weight = pair.split(':')
+        weights[int(capacity)] = float(weight)
+    return weights
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Generate synthetic Busca Vagas API payloads")
+    parser.add_argument("--hotels", type=int, default=25, help="Hotels (default: 25)")
+    parser.add_argument("--vacancies", type=int, default=100, help="Vacancies per hotel (default: 100)")
+    parser.add_argument("--capacities", type=capacity_weights,
+                        help="Capacity weights, e.g. 1:2,2:40,3:25,4:20,5:8,6:5")
+    parser.add_argument("--unavailable", type=float, default=0.0,
+                        help="Share of searches answered with hasAvailability=false")
+    parser.add_argument("--accentless", type=float, default=0.0, help='Share of "ate" instead of "até"')
+    parser.add_argument("--singular", type=float, default=0.0, help='Share of "pessoa" instead of "pessoas"')
+    parser.add_argument("--checkin", help="Check-in (YYYY-MM-DD, default: 30 days ahead)")
+    parser.add_argument("--checkout", help="Check-out (YYYY-MM-DD)")
+    parser.add_argument("--hotel", default='-1', help='hotelId to search (default: -1, "Todas")')
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--hotels-list", action="store_true", help="Write the /vagas/hoteis payload instead")
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    spec = DatasetSpec(hotels=args.hotels, vacancies_per_hotel=args.vacancies,
+                       unavailable_ratio=args.unavailable, accentless_ratio=args.accentless,
+                       singular_ratio=args.singular, seed=args.seed)
+    if args.capacities:
+        spec.capacity_weights = args.capacities
+
+    if args.hotels_list:
+        chunks = [json.dumps(hotels_payload(spec), ensure_ascii=False)]
+    else:
+        chunks = iter_search_json(spec, args.checkin, args.checkout, args.hotel)
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        written = 0
+        for chunk in chunks:
+            output.write(chunk)
+            written += len(chunk.encode('utf-8'))
+        output.write('\n')
+    finally:
+        if args.output:
+            output.close()
+
+    if args.output:
+        print(f"💾 {written / 1024 / 1024:.1f} MB written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
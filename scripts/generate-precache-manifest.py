@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+"""
+Precache Manifest Generator
+
+Crawls public/index.html (stylesheets, scripts, CSS @import/url(), static
+ES module imports) and writes public/precache-manifest.js, the list of
+same-origin assets public/sw.js precaches, each with a content hash. The
+manifest version changes whenever any asset changes, which gives the
+service worker a new cache name and retires the old one.
+
+Usage:
+    python3 scripts/generate-precache-manifest.py
+    python3 scripts/generate-precache-manifest.py --check
+    python3 scripts/generate-precache-manifest.py --list
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+
+sys.path.insert(0, str(ROOT_DIR / "tests"))
+from config.precache import MANIFEST_FILE, build_manifest, render_manifest, write_manifest  # noqa: E402
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Generate the sw.js precache manifest")
+    parser.add_argument("--output", default=str(MANIFEST_FILE),
+                        help=f"Manifest path (default: {MANIFEST_FILE})")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit 1 if the manifest on disk is out of date instead of writing it")
+    parser.add_argument("--list", action="store_true", help="Print every precached URL")
+    args = parser.parse_args()
+
+    print("📦 Precache Manifest Generator\n")
+
+    manifest = build_manifest()
+    print(f"   Version:  {manifest['version']}")
+    print(f"   Assets:   {len(manifest['assets'])} precached")
+    print(f"   Runtime:  {len(manifest['runtime'])} cross-origin (cached on first use)")
+
+    if args.list:
+        for asset in manifest['assets']:
+            print(f"      {asset['revision']}  {asset['url']}")
+        for url in manifest['runtime']:
+            print(f"      {'runtime':<16}  {url}")
+
+    for path in manifest['missing']:
+        print(f"   ⚠️  Referenced but missing, not precached: {path}")
+
+    output = Path(args.output)
+    if args.check:
+        current = output.read_text(encoding='utf-8') if output.exists() else None
+        if current != render_manifest(manifest):
+            print(f"\n❌ {output} is out of date; run this script without --check")
+            return 1
+        print(f"\n✅ {output} is up to date")
+        return 0
+
+    write_manifest(manifest, output)
+    print(f"\n💾 Written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
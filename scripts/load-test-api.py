@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+"""
+Adaptive API Load Test
+
+Sends distinct /vagas/search requests (hotel x weekend) through the AIMD
+limiter in tests/config/adaptive_limiter.py. Concurrency grows while
+latency stays healthy and is cut on 429s, timeouts and latency spikes.
+Prints throughput, latency percentiles and the concurrency the limiter
+settled on. By default it runs against the local mock API with a fixed
+search capacity (429 beyond it); a real API (the production one is a
+scraper) is only loaded when named with --api.
+
+Usage:
+    python3 scripts/load-test-api.py --capacity 6 --requests 200
+    python3 scripts/load-test-api.py --api http://localhost:3001/api --requests 50 --max-concurrency 8
+    python3 scripts/load-test-api.py --latency-target 0.5 --json load.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+
+sys.path.insert(0, str(ROOT_DIR / "tests"))
+from config.adaptive_limiter import AdaptiveLimiter, run_adaptive  # noqa: E402
+from config.api_factory import weekend_dates  # noqa: E402
+from config.hotel_cache import HotelListCache  # noqa: E402
+from config.mock_api import MockAPI  # noqa: E402
+from config.search_client import SearchClient  # noqa: E402
+from config.synthetic_monitor import percentile  # noqa: E402
+
+
+def workload(hotels, count):
+    """count distinct (hotel, checkin, checkout) searches, hotels first"""
+    hotel_ids = [hotel['hotelId'] for hotel in hotels if hotel.get('type') != 'All'] or ['-1']
+    weekends = weekend_dates(count // len(hotel_ids) + 1, date.today().isoformat())
+    return [(hotel_id, checkin, checkout)
+            for checkin, checkout in weekends
+            for hotel_id in hotel_ids][:count]
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Adaptive-concurrency load test of the search API")
+    parser.add_argument("--api", help="Load this API base URL instead of the mock (never the default)")
+    parser.add_argument("--mock", action="store_true",
+                        help="Use the local mock API on a free port (the default without --api)")
+    parser.add_argument("--capacity", type=int, default=6, help="Mock: searches served at once (default: 6)")
+    parser.add_argument("--delay", type=float, default=0.2, help="Mock: seconds per search (default: 0.2)")
+    parser.add_argument("--requests", type=int, default=100, help="Searches to send (default: 100)")
+    parser.add_argument("--initial", type=int, default=2, help="Starting concurrency (default: 2)")
+    parser.add_argument("--max-concurrency", type=int, default=32, help="Concurrency ceiling (default: 32)")
+    parser.add_argument("--latency-target", type=float, help="Latency budget in seconds (default: 2x baseline)")
+    parser.add_argument("--retries", type=int, default=3, help="Retries of an overloaded search (default: 3)")
+    parser.add_argument("--timeout", type=float, default=600, help="Request timeout in seconds (default: 600)")
+    parser.add_argument("--json", help="Write the report to this file")
+    args = parser.parse_args()
+    if args.api and args.mock:
+        parser.error("--api and --mock are mutually exclusive")
+
+    api = None if args.api else MockAPI(port=0, search_delay=args.delay, search_capacity=args.capacity).start()
+    base_url = api.base_url if api else args.api
+    limiter = AdaptiveLimiter(initial=args.initial, max_limit=args.max_concurrency,
+                              latency_target=args.latency_target)
+    client = SearchClient(base_url, timeout=args.timeout)
+
+    try:
+        hotels = api.hotels if api else HotelListCache(base_url).get().hotels
+        searches = workload(hotels, args.requests)
+        print(f"🚦 {len(searches)} searches against {base_url} "
+              f"(concurrency {args.initial} → at most {args.max_concurrency})\n")
+        started = time.perf_counter()
+        outcomes = run_adaptive(limiter, lambda search: client.search(*search), searches, args.retries)
+        wall_time = time.perf_counter() - started
+    finally:
+        if api:
+            api.stop()
+
+    latencies = sorted(seconds for _, result, seconds in outcomes if not isinstance(result, Exception))
+    failures = [(search, result) for search, result, _ in outcomes if isinstance(result, Exception)]
+    report = limiter.report()
+    report.update({
+        'requests': len(outcomes),
+        'succeeded': len(latencies),
+        'failed': len(failures),
+        'wall_time': round(wall_time, 3),
+        'searches_per_second': round(len(latencies) / wall_time, 3) if wall_time else 0.0,
+        'p50_ms': round(percentile(latencies, 0.5) * 1000, 1) if latencies else None,
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 1) if latencies else None,
+    })
+
+    print(f"✅ {report['succeeded']}/{report['requests']} searches in {wall_time:.1f}s "
+          f"({report['searches_per_second']:.2f}/s), p50 {report['p50_ms']}ms, p95 {report['p95_ms']}ms")
+    print(f"🎚️  Concurrency settled at {report['settled']} (peak in flight {report['peak_in_flight']}, "
+          f"{report['decreases']} cuts: {report['overloads']} overloads, {report['spikes']} latency spikes)")
+    print("   Limit over time: " + ' '.join(f"{limit}@{seconds:.1f}s" for seconds, limit in report['history'][-12:]))
+    if api:
+        print(f"   Mock API: {api.rejected} searches refused with 429, peak {api.peak_searches} served at once")
+    for (hotel, checkin, checkout), error in failures[:5]:
+        print(f"❌ hotel {hotel} {checkin} → {checkout}: {error}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+        print(f"💾 Written to {args.json}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
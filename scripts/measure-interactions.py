@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+"""
+Interaction Latency Report
+
+Loads public/index.html with Event Timing / Long Task / Long Animation
+Frame observers installed, renders a synthetic "Todas" result set through
+the stubbed API and drives the guest +/- buttons, filter chip removal, the
+inline editor toggle and keyboard shortcuts with real input. Prints the
+interaction-to-next-paint distribution per control and the modules the
+long frames spent their time in.
+
+Usage:
+    python3 scripts/measure-interactions.py
+    python3 scripts/measure-interactions.py --hotels 25 --vacancies 300 --repeats 10
+    python3 scripts/measure-interactions.py --cpu-throttle 4 --json interactions.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+
+sys.path.insert(0, str(ROOT_DIR / "tests"))
+from config.interaction_latency import measure  # noqa: E402
+from config.render_benchmark import synthetic_search_response  # noqa: E402
+from config.selenium_config import get_chrome_options, get_chromedriver_path  # noqa: E402
+from config.static_server import start_server  # noqa: E402
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Per-control INP and long task attribution")
+    parser.add_argument("--hotels", type=int, default=25, help="Hotels in the result set (default: 25)")
+    parser.add_argument("--vacancies", type=int, default=100, help="Vacancies per hotel (default: 100)")
+    parser.add_argument("--repeats", type=int, default=5, help="Rounds over every control (default: 5)")
+    parser.add_argument("--cpu-throttle", type=float, default=1,
+                        help="CPU slowdown factor via Emulation.setCPUThrottlingRate (default: 1)")
+    parser.add_argument("--json", help="Write latencies, attribution and raw entries to this file")
+    args = parser.parse_args()
+
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    print("👆 Interaction Latency Report\n")
+    print(f"   {args.hotels} hotels x {args.vacancies} vacancies, {args.repeats} rounds, "
+          f"CPU {args.cpu_throttle:g}x\n")
+
+    httpd, base_url = start_server(ROOT_DIR)
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=get_chrome_options(warm_profile=False))
+    try:
+        if args.cpu_throttle > 1:
+            driver.execute_cdp_cmd('Emulation.setCPUThrottlingRate', {'rate': args.cpu_throttle})
+        latencies, attribution, recorded = measure(
+            driver, f"{base_url}/public/index.html",
+            synthetic_search_response(args.hotels, args.vacancies), repeats=args.repeats
+        )
+    finally:
+        driver.quit()
+        httpd.shutdown()
+
+    print(f"{'Control':<22}{'n':>4}{'<16ms':>7}{'p50':>8}{'p75':>8}{'p98':>8}{'max':>8}")
+    print('-' * 65)
+    for control, stats in latencies.items():
+        print(f"{control:<22}{len(stats['samples']):>4}{stats['below_threshold']:>7}"
+              f"{stats['p50']:>6.0f}ms{stats['p75']:>6.0f}ms{stats['p98']:>6.0f}ms{stats['max']:>6.0f}ms")
+
+    if not recorded['frames']:
+        print("\n⚠️  No long-animation-frame support; long tasks are unattributed")
+    print("\n🧱 Time in long frames by module:")
+    for control, modules in attribution.items():
+        if not modules:
+            continue
+        print(f"   {control}")
+        for module, duration in sorted(modules.items(), key=lambda item: -item[1]):
+            print(f"      {duration:>7.0f}ms  {module}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            'latencies': latencies, 'attribution': attribution, 'recorded': recorded,
+        }, indent=2) + '\n', encoding='utf-8')
+        print(f"\n💾 Written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
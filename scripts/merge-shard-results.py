@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+"""
+Shard Results Merger
+
+Combines the per-shard result files written by `pytest --shard i/n` into a
+single tests/use_cases/results.json for the coverage dashboard. Refuses
+(exit 1, nothing written) when shards are missing or were planned from
+different duration histories.
+
+Usage:
+    python3 scripts/merge-shard-results.py tests/use_cases/results.shard-*.json
+    python3 scripts/merge-shard-results.py shard1.json shard2.json --output merged.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+RESULTS_FILE = ROOT_DIR / "tests" / "use_cases" / "results.json"
+
+sys.path.insert(0, str(ROOT_DIR / "tests"))
+from config.sharding import merge_shard_results  # noqa: E402
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Merge per-shard test results")
+    parser.add_argument("shards", nargs="+", help="Shard result files")
+    parser.add_argument(
+        "--output",
+        default=str(RESULTS_FILE),
+        help=f"Merged results file (default: {RESULTS_FILE})"
+    )
+    args = parser.parse_args()
+
+    print("🧩 Merging Shard Results\n")
+
+    shard_results = []
+    expected_count = None
+    expected_durations = None
+    seen_indexes = set()
+
+    for shard_file in args.shards:
+        try:
+            with open(shard_file) as f:
+                result = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read {shard_file}: {e}")
+            return 1
+
+        shard = result.get("shard", {})
+        if expected_count is None:
+            expected_count = shard.get("count")
+        elif shard.get("count") != expected_count:
+            print(f"❌ {shard_file} belongs to a {shard.get('count')}-shard plan, "
+                  f"expected {expected_count}")
+            return 1
+        if expected_durations is None:
+            expected_durations = shard.get("durations")
+        elif shard.get("durations") != expected_durations:
+            print(f"❌ {shard_file} was planned from a different duration history "
+                  f"({shard.get('durations')}, expected {expected_durations}); "
+                  f"its tests may overlap or be missing from the other shards")
+            return 1
+        seen_indexes.add(shard.get("index"))
+
+        print(f"   Shard {shard.get('index', '?')}/{shard.get('count', '?')}: "
+              f"{result['summary']['total']} tests, {result['summary']['duration']:.2f}s")
+        shard_results.append(result)
+
+    missing = sorted(set(range(1, (expected_count or 0) + 1)) - seen_indexes)
+    if not expected_count or missing:
+        print(f"\n❌ Missing shards: {', '.join(map(str, missing)) or 'unknown shard count'}; "
+              f"not writing partial results")
+        return 1
+
+    merged = merge_shard_results(shard_results)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(merged, f, indent=2)
+
+    print(f"\n📊 Summary:")
+    print(f"   Total:   {merged['summary']['total']}")
+    print(f"   Passed:  {merged['summary']['passed']}")
+    print(f"   Failed:  {merged['summary']['failed']}")
+    print(f"   Skipped: {merged['summary']['skipped']}")
+    print(f"   Duration: {merged['summary']['duration']:.2f}s")
+    print(f"\n✅ Results saved to: {output}")
+
+    return 0 if merged['summary']['failed'] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
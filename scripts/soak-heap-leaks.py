@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+"""
+Heap Leak Soak
+
+Runs N search / inline edit / clear cycles on public/index.html with the
+API stubbed, samples heap, DOM nodes, event listeners and leftover toasts,
+chips and modal backdrops every K cycles (after a forced GC) and fails on
+sustained growth. Heap snapshots from after the first K cycles and from the
+end are written for a DevTools Memory "Comparison" diff.
+
+Usage:
+    python3 scripts/soak-heap-leaks.py
+    python3 scripts/soak-heap-leaks.py --cycles 200 --every 10
+    python3 scripts/soak-heap-leaks.py --no-snapshots --json soak.json
+    python3 scripts/soak-heap-leaks.py --cpu-throttle 4        # low-end phone
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+
+sys.path.insert(0, str(ROOT_DIR / "tests"))
+from config.page_helpers import API_STUB_SCRIPT  # noqa: E402
+from config.heap_soak import SNAPSHOT_DIR, SoakHarness  # noqa: E402
+from config.selenium_config import get_chrome_options, get_chromedriver_path  # noqa: E402
+from config.static_server import start_server  # noqa: E402
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Soak index.html search/clear cycles for leaks")
+    parser.add_argument("--cycles", type=int, default=60, help="Search/clear cycles (default: 60)")
+    parser.add_argument("--every", type=int, default=5, help="Sample every K cycles (default: 5)")
+    parser.add_argument("--url", help="Page to soak (default: serve the repo and open public/index.html)")
+    parser.add_argument("--snapshot-dir", default=str(SNAPSHOT_DIR),
+                        help=f"Where to write heap snapshots (default: {SNAPSHOT_DIR})")
+    parser.add_argument("--no-snapshots", action="store_true", help="Skip heap snapshots")
+    parser.add_argument("--cpu-throttle", type=float, default=1,
+                        help="CPU slowdown factor via Emulation.setCPUThrottlingRate (default: 1)")
+    parser.add_argument("--json", help="Write samples and findings to this file")
+    args = parser.parse_args()
+
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    print("🧪 Heap Leak Soak\n")
+    print(f"   {args.cycles} cycles, sampling every {args.every}\n")
+
+    httpd = None
+    url = args.url
+    if not url:
+        httpd, base_url = start_server(ROOT_DIR)
+        url = f"{base_url}/public/index.html"
+
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=get_chrome_options(warm_profile=False))
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': API_STUB_SCRIPT})
+        if args.cpu_throttle > 1:
+            driver.execute_cdp_cmd('Emulation.setCPUThrottlingRate', {'rate': args.cpu_throttle})
+        harness = SoakHarness(driver, url, every=args.every,
+                              snapshot_dir=None if args.no_snapshots else args.snapshot_dir)
+        samples, findings = harness.run(args.cycles)
+    finally:
+        driver.quit()
+        if httpd:
+            httpd.shutdown()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            'samples': samples,
+            'findings': [vars(finding) for finding in findings],
+            'snapshots': [str(path) for path in harness.snapshots],
+        }, indent=2) + '\n', encoding='utf-8')
+        print(f"\n💾 Written to {args.json}")
+
+    if findings:
+        print("\n❌ Sustained growth:")
+        for finding in findings:
+            print(f"   • {finding.describe()}")
+        if harness.snapshots:
+            print("   Compare the heap snapshots in DevTools > Memory > Comparison")
+        return 1
+    print("\n✅ No sustained growth")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+"""
+Streaming Weekend Search
+
+Runs /vagas/search/weekends and prints each weekend as soon as its bytes
+arrive (tests/config/json_stream.py) instead of after the whole scrape,
+with the time since the request was sent. --mock serves synthetic
+weekends from the local mock API, trickled --delay seconds apart.
+
+Usage:
+    python3 scripts/stream-weekend-search.py --count 12
+    python3 scripts/stream-weekend-search.py --api http://localhost:3001/api --count 4
+    python3 scripts/stream-weekend-search.py --mock --delay 2 --json weekends.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+DEFAULT_API = "https://www.mpbarbosa.com/api"
+
+sys.path.insert(0, str(ROOT_DIR / "tests"))
+from config.json_stream import fetch_weekends  # noqa: E402
+from config.mock_api import MockAPI  # noqa: E402
+
+
+def print_weekend(weekend, seconds):
+    icon = '✅' if weekend.get('hasAvailability') else '➖'
+    vacancies = len((weekend.get('result') or {}).get('vacancies') or [])
+    print(f"  {seconds:7.1f}s  {icon} #{weekend.get('weekendNumber', '?'):<3}"
+          f"{weekend.get('checkin')} → {weekend.get('checkout')}  {vacancies} vacancies", flush=True)
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Print weekend search results as they arrive")
+    parser.add_argument("--count", type=int, default=8, help="Weekends to search, 1-12 (default: 8)")
+    parser.add_argument("--api", default=DEFAULT_API, help=f"API base URL (default: {DEFAULT_API})")
+    parser.add_argument("--mock", action="store_true", help="Use the local mock API on a free port")
+    parser.add_argument("--delay", type=float, default=1.0, help="Mock: seconds between weekends (default: 1)")
+    parser.add_argument("--timeout", type=float, default=600, help="Socket timeout in seconds (default: 600)")
+    parser.add_argument("--json", help="Write the complete response data to this file")
+    args = parser.parse_args()
+
+    print(f"📅 Weekend search ({args.count} weekends)\n")
+
+    api = MockAPI(port=0, weekend_delay=args.delay).start() if args.mock else None
+    try:
+        data = fetch_weekends(api.base_url if api else args.api, args.count, print_weekend, args.timeout)
+    except Exception as e:
+        print(f"❌ Weekend search failed: {e}")
+        return 1
+    finally:
+        if api:
+            api.stop()
+
+    availability = data.get('availability') or {}
+    print(f"\n✅ {availability.get('weekendsWithVacancies', 0)} of {len(data.get('weekends', []))} "
+          f"weekends with vacancies")
+    if args.json:
+        Path(args.json).write_text(json.dumps(data, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+        print(f"💾 Written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
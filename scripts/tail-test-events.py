@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+"""
+Test Event Log Reader
+
+Aggregates the unified JSONL test-event log (tests/test-events.jsonl or
+$TEST_EVENT_LOG) written by pytest and every test runner.
+
+Usage:
+    python3 scripts/tail-test-events.py                  # summarize the log
+    python3 scripts/tail-test-events.py --follow         # live, like tail -f
+    python3 scripts/tail-test-events.py --run <run-id>   # one run only
+    python3 scripts/tail-test-events.py --json           # summary as JSON
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+
+sys.path.insert(0, str(ROOT_DIR / "tests"))
+from config.event_log import EventAggregator, event_log_path, read_events  # noqa: E402
+
+OUTCOME_SYMBOLS = {"passed": "✅", "failed": "❌", "error": "💥", "skipped": "⏭️ "}
+
+
+def describe(event):
+    """One human-readable line for a notable event, or None"""
+    kind = event.get("event")
+    if kind == "run_start":
+        return f"▶️  {event.get('runner')} run {event.get('run', '')[:8]} started"
+    if kind == "run_end":
+        return (f"⏹️  {event.get('runner')} run {event.get('run', '')[:8]} "
+                f"{event.get('outcome')} in {event.get('duration', 0):.1f}s")
+    if kind == "suite_end":
+        return (f"{OUTCOME_SYMBOLS.get(event.get('outcome'), '•')} suite {event.get('suite')} "
+                f"({event.get('duration', 0):.1f}s)")
+    if kind == "test_end" and event.get("outcome") in ("failed", "error"):
+        message = f" - {event['message']}" if event.get("message") else ""
+        return f"   {OUTCOME_SYMBOLS[event['outcome']]} {event.get('test')}{message}"
+    return None
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Aggregate the unified test-event log")
+    parser.add_argument("path", nargs="?", default=None,
+                        help="Event log (default: $TEST_EVENT_LOG or tests/test-events.jsonl)")
+    parser.add_argument("--follow", "-f", action="store_true", help="Keep reading new events")
+    parser.add_argument("--run", help="Only events of this run id (prefix allowed)")
+    parser.add_argument("--json", action="store_true", help="Print the final summary as JSON")
+    parser.add_argument("--every", type=float, default=5.0,
+                        help="Seconds between live summary lines with --follow (default: 5)")
+    args = parser.parse_args()
+
+    path = Path(args.path) if args.path else event_log_path()
+    if not args.follow and not path.exists():
+        print(f"❌ No event log at {path}")
+        return 1
+
+    aggregator = EventAggregator()
+    last_summary = time.monotonic()
+
+    try:
+        for event in read_events(path, follow=args.follow):
+            if args.run and not str(event.get("run", "")).startswith(args.run):
+                continue
+            aggregator.consume(event)
+
+            if args.follow:
+                line = describe(event)
+                if line:
+                    print(line, flush=True)
+                if time.monotonic() - last_summary >= args.every:
+                    print(f"📊 {aggregator.summary_line()}", flush=True)
+                    last_summary = time.monotonic()
+    except KeyboardInterrupt:
+        pass
+
+    if args.json:
+        print(json.dumps({
+            "runs": aggregator.runs,
+            "counts": aggregator.counts,
+            "total": aggregator.total,
+            "test_time": round(aggregator.test_time, 3),
+            "failures": aggregator.failures,
+        }, indent=2))
+        return 0
+
+    print(f"\n📊 {aggregator.summary_line()}")
+    if aggregator.slowest:
+        print("\n🐢 Slowest tests:")
+        for duration, test in aggregator.slowest:
+            print(f"   {duration:7.2f}s  {test}")
+    if aggregator.failures:
+        print(f"\n❌ Failures ({len(aggregator.failures)}):")
+        for event in aggregator.failures[-20:]:
+            print(describe(event))
+
+    return 0 if not aggregator.failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
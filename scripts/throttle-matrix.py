@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+"""
+Throttling Profile Matrix
+
+Times page load, first contentful paint, hotel list population, search and
+guest filtering for public/index.html under each CPU/network profile in
+tests/config/throttling.py. Each run uses a fresh browser (cold cache) and
+the local mock API on :3001; the table shows the median of --runs runs.
+
+Usage:
+    python3 scripts/throttle-matrix.py
+    python3 scripts/throttle-matrix.py --runs 5 --json throttle-matrix.json
+    python3 scripts/throttle-matrix.py --profile low-end-fast-3g --profile unthrottled
+"""
+
+import argparse
+import json
+import statistics
+import sys
+from pathlib import Path
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+
+sys.path.insert(0, str(ROOT_DIR / "tests"))
+from config.mock_api import MockAPI  # noqa: E402
+from config.render_benchmark import synthetic_search_response  # noqa: E402
+from config.selenium_config import get_chrome_options, get_chromedriver_path  # noqa: E402
+from config.static_server import start_server  # noqa: E402
+from config.throttling import FLOWS, PROFILES, run_flows  # noqa: E402
+
+
+def median(runs, flow):
+    values = [run[flow] for run in runs if run.get(flow) is not None]
+    return statistics.median(values) if values else None
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Time the core flows under throttling profiles")
+    parser.add_argument("--profile", action="append", choices=list(PROFILES),
+                        help="Profile to run (repeatable, default: all)")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per profile (default: 3)")
+    parser.add_argument("--hotels", type=int, default=24, help="Hotels in the search response")
+    parser.add_argument("--vacancies", type=int, default=20, help="Vacancies per hotel")
+    parser.add_argument("--json", help="Write every run to this file")
+    args = parser.parse_args()
+
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    print("🐢 Throttling Profile Matrix\n")
+
+    names = args.profile or list(PROFILES)
+    results = {}
+    httpd, base_url = start_server(ROOT_DIR)
+    api = MockAPI(search_response=synthetic_search_response(args.hotels, args.vacancies)).start()
+    url = f"{base_url}/public/index.html?useLocalAPI=true"
+    try:
+        for name in names:
+            results[name] = []
+            for run in range(1, args.runs + 1):
+                driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                                          options=get_chrome_options(warm_profile=False))
+                try:
+                    results[name].append(run_flows(driver, url, PROFILES[name]))
+                finally:
+                    driver.quit()
+                print(f"   ✓ {name} run {run}/{args.runs}")
+    finally:
+        api.stop()
+        httpd.shutdown()
+
+    headers = ['load', 'FCP', 'hotels', 'search', 'guests']
+    print(f"\n{'Profile':<22}" + ''.join(f"{header:>10}" for header in headers) + f"{'KB':>8}")
+    print('-' * (22 + 10 * len(headers) + 8))
+    for name, runs in results.items():
+        cells = []
+        for flow in FLOWS:
+            value = median(runs, flow)
+            cells.append(f"{value:>8.0f}ms" if value is not None else f"{'-':>10}")
+        transferred = statistics.median(run['transferred'] for run in runs) / 1024
+        print(f"{name:<22}" + ''.join(cells) + f"{transferred:>8.0f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            'profiles': {name: PROFILES[name] for name in names},
+            'runs': results,
+        }, indent=2) + '\n', encoding='utf-8')
+        print(f"\n💾 Written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
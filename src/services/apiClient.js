@@ -16,6 +16,7 @@ import { IbiraAPIFetchManager } from './ibira-loader.js';
 import { getEnvironment } from '../config/environment.js';
 import { TIME, API } from '../config/constants.js';
 import { hotelCache } from './hotelCache.js';
+import { readJSONItems } from './jsonStream.js';
 
 // ============================================================================
 // PURE HELPER FUNCTIONS (Referentially Transparent)
@@ -118,6 +119,22 @@ export function ensureISOFormat(date) {
     return date instanceof Date ? formatDateISO(date) : date;
 }
 
+/**
+ * Error message for a non-OK response: the API's JSON `error` field when
+ * there is one, else the HTTP status (proxies answer with HTML or nothing)
+ * @param {Response} response - Fetch response with response.ok false
+ * @returns {Promise<string>} Error message
+ */
+async function readErrorMessage(response) {
+    const status = `API returned HTTP ${response.status}${response.statusText ? ` ${response.statusText}` : ''}`;
+    try {
+        const body = JSON.parse(await response.text());
+        return body?.error || status;
+    } catch {
+        return status;
+    }
+}
+
 // ============================================================================
 // API CLIENT CLASS
 // ============================================================================
@@ -195,6 +212,9 @@ export class BuscaVagasAPIClient {
             retryMultiplier: TIME.RETRY.MULTIPLIER
         });
         
+        // In-flight vacancy searches by URL (single-flight, see searchVacancies)
+        this.inFlightSearches = new Map();
+        
         this.logger.log(`✅ BuscaVagasAPIClient initialized with base URL: ${this.apiBaseUrl}`);
         this.logger.log(`✅ Using ibira.js for API fetching and caching`);
     }
@@ -337,6 +357,8 @@ export class BuscaVagasAPIClient {
     /**
      * Search for vacancies between two dates using Puppeteer
      * Performs automated browser search on AFPESP website
+     * Concurrent calls for the same search share one in-flight request and
+     * its result (e.g. a form submitted again while its search is running)
      * @param {Date|string} checkinDate - Check-in date (Date object or ISO string YYYY-MM-DD)
      * @param {Date|string} checkoutDate - Check-out date (Date object or ISO string YYYY-MM-DD)
      * @param {string} [hotel='-1'] - Hotel filter: '-1' for all hotels, or specific hotel ID
@@ -378,6 +400,36 @@ export class BuscaVagasAPIClient {
         
         // Build URL using pure helper
         const url = buildSearchUrl(this.apiBaseUrl, hotel, checkin, checkout, applyBookingRules);
+        
+        // Single-flight: join an identical search that is still running
+        const inFlight = this.inFlightSearches.get(url);
+        if (inFlight) {
+            this.logger.log(`🔗 Joining in-flight search: ${url}`);
+            return inFlight;
+        }
+        
+        const search = this.fetchSearch(url, checkin, checkout, hotel, applyBookingRules);
+        this.inFlightSearches.set(url, search);
+        try {
+            return await search;
+        } finally {
+            if (this.inFlightSearches.get(url) === search) {
+                this.inFlightSearches.delete(url);
+            }
+        }
+    }
+
+    /**
+     * Run one vacancy search request (see searchVacancies)
+     * @param {string} url - Search URL
+     * @param {string} checkin - Check-in date (ISO format)
+     * @param {string} checkout - Check-out date (ISO format)
+     * @param {string} hotel - Hotel filter
+     * @param {boolean} applyBookingRules - Apply booking rules validation (FR-014)
+     * @returns {Promise<Object>} Vacancy search results
+     * @private
+     */
+    async fetchSearch(url, checkin, checkout, hotel, applyBookingRules) {
         this.logger.log(`🔍 Searching vacancies: ${url}`);
         this.logger.log(`📅 Check-in: ${checkin}, Check-out: ${checkout}, Hotel: ${hotel}, Booking Rules: ${applyBookingRules}`);
         
@@ -394,11 +446,57 @@ export class BuscaVagasAPIClient {
         return data;
     }
 
+    /**
+     * Fetch a JSON response incrementally, calling onItem for each item of
+     * the array at path as soon as its bytes arrive
+     * Bypasses the ibira.js cache (a streamed body is read only once)
+     * @param {string} url - Full URL to fetch
+     * @param {number} timeoutMs - Timeout for the whole body in milliseconds
+     * @param {Function} onItem - Called with (item, index)
+     * @param {Array<string>} path - Keys from the root to the array
+     * @returns {Promise<Object>} API response object with { success, data, ... }
+     * @throws {Error} If request times out or API returns error
+     * @private
+     */
+    async fetchStreaming(url, timeoutMs, onItem, path) {
+        const controller = new AbortController();
+        const timer = setTimeout(() => controller.abort(), timeoutMs);
+        try {
+            const response = await fetch(url, { signal: controller.signal });
+            if (!response.ok) {
+                throw new Error(await readErrorMessage(response));
+            }
+            
+            const result = response.body
+                ? await readJSONItems(response, onItem, path)
+                : await response.json();
+            
+            if (result.success === false) {
+                throw new Error(result.error || 'API returned error without message');
+            }
+            
+            return result;
+            
+        } catch (error) {
+            if (error.name === 'AbortError') {
+                throw new Error('Request timeout - please try again');
+            }
+            
+            throw error;
+        } finally {
+            clearTimeout(timer);
+        }
+    }
+
     /**
      * Search for weekend vacancies using Puppeteer
      * Searches multiple consecutive weekends for availability
      * NOTE: This is a long-running operation (up to 10 minutes for 12 weekends)
+     * With options.onWeekend the response is parsed incrementally and each
+     * weekend is passed to the callback as soon as it arrives
      * @param {number} [count=8] - Number of weekends to search (1-12, default 8)
+     * @param {Object} [options={}] - Search options
+     * @param {Function} [options.onWeekend] - Called with (weekend, index) per weekend as it arrives
      * @returns {Promise<Object>} Weekend search results
      * @returns {boolean} returns.success - Whether search completed successfully
      * @returns {Object} returns.searchDetails - Search metadata
@@ -421,8 +519,14 @@ export class BuscaVagasAPIClient {
      *     console.log(`Vacancy: ${weekend.checkin} to ${weekend.checkout}`);
      *   }
      * });
+     * 
+     * @example
+     * // Show each weekend as soon as the API has searched it
+     * await apiClient.searchWeekendVacancies(12, {
+     *   onWeekend: (weekend) => renderWeekend(weekend)
+     * });
      */
-    async searchWeekendVacancies(count = 8) {
+    async searchWeekendVacancies(count = 8, options = {}) {
         // Validate using pure helper function
         const error = getWeekendCountError(count);
         if (error) {
@@ -434,7 +538,9 @@ export class BuscaVagasAPIClient {
         this.logger.log(`🔍 Searching ${count} weekend(s): ${url}`);
         this.logger.log(`⏳ This may take several minutes (up to 10 minutes)...`);
         
-        const result = await this.fetchWithTimeout(url, this.timeout.weekendSearch);
+        const result = typeof options.onWeekend === 'function'
+            ? await this.fetchStreaming(url, this.timeout.weekendSearch, options.onWeekend, ['data', 'weekends'])
+            : await this.fetchWithTimeout(url, this.timeout.weekendSearch);
         
         const { data } = result;
         this.logger.log(`✅ Weekend search completed:`);
@@ -0,0 +1,207 @@
+/**
+ * Incremental JSON Array Parser
+ * Emits the items of one array inside a JSON document as soon as each
+ * item's closing bytes arrive, instead of after the whole body
+ *
+ * Used for /vagas/search/weekends, where the API answers one weekend at a
+ * time over several minutes: the first weekend can be shown in seconds.
+ * tests/config/json_stream.py is the same scanner for the Python tooling.
+ *
+ * Features:
+ * - Tracks only nesting, strings and object keys; each complete item is
+ *   handed to JSON.parse
+ * - Keeps only the unfinished item in its scan buffer
+ * - The whole document is still parsed once at the end (close())
+ */
+
+const WHITESPACE = ' \t\r\n';
+const STRING_SPECIAL = /["\\]/g;
+
+export class JSONItemStream {
+    /**
+     * Creates a parser for the array at a key path
+     * @param {Array<string>} [path=['data', 'weekends']] - Keys from the root to the array
+     */
+    constructor(path = ['data', 'weekends']) {
+        this.path = path;
+        this.text = [];
+        this.buffer = '';
+        this.offset = 0;          // document position of buffer[0]
+        this.frames = [];         // { bracket, key (or index), expectingKey }
+        this.inString = false;
+        this.escaped = false;
+        this.stringStart = null;
+        this.itemStart = null;    // document position of the current target item
+        this.itemDepth = null;    // frames.length inside the target array
+        this.items = 0;
+    }
+
+    /**
+     * Whether the innermost container is the target array
+     * @returns {boolean}
+     * @private
+     */
+    inTargetArray() {
+        const top = this.frames[this.frames.length - 1];
+        if (!top || top.bracket !== '[' || this.frames.length - 1 !== this.path.length) {
+            return false;
+        }
+        return this.path.every((key, i) => this.frames[i].key === key);
+    }
+
+    /**
+     * Note a value starting at position when it is an item of the target array
+     * @param {number} position - Document position
+     * @private
+     */
+    valueStarts(position) {
+        if (this.itemStart === null && this.inTargetArray()) {
+            this.itemStart = position;
+            this.itemDepth = this.frames.length;
+        }
+    }
+
+    /**
+     * Feed the next piece of text
+     * @param {string} chunk - Decoded text (use a streaming TextDecoder for bytes)
+     * @returns {Array} Items of the target array completed by this chunk
+     * @example
+     * const stream = new JSONItemStream(['data', 'weekends']);
+     * stream.feed('{"data": {"weekends": [{"checkin"').length; // 0
+     * stream.feed(': "2026-01-02"}, ').length;                  // 1
+     */
+    feed(chunk) {
+        this.text.push(chunk);
+        let index = this.buffer.length;
+        this.buffer += chunk;
+        const items = [];
+        while (index < this.buffer.length) {
+            if (this.inString && !this.escaped) {
+                // Skip string contents up to the next quote or backslash
+                STRING_SPECIAL.lastIndex = index;
+                const special = STRING_SPECIAL.exec(this.buffer);
+                if (!special) {
+                    break;
+                }
+                index = special.index;
+            }
+            this.scan(this.buffer[index], this.offset + index, items);
+            index += 1;
+        }
+
+        // Only an unfinished item or key has to stay in the scan buffer
+        let keepFrom = this.offset + this.buffer.length;
+        for (const position of [this.itemStart, this.stringStart]) {
+            if (position !== null) {
+                keepFrom = Math.min(keepFrom, position);
+            }
+        }
+        this.buffer = this.buffer.slice(keepFrom - this.offset);
+        this.offset = keepFrom;
+        return items;
+    }
+
+    /**
+     * Parse the item ending at `end` and reset the item state
+     * @private
+     */
+    emit(end, items) {
+        items.push(JSON.parse(this.buffer.slice(this.itemStart - this.offset, end - this.offset)));
+        this.items += 1;
+        this.itemStart = null;
+        this.itemDepth = null;
+    }
+
+    /**
+     * Advance the scanner by one significant character
+     * @private
+     */
+    scan(char, position, items) {
+        const frame = this.frames[this.frames.length - 1];
+        if (this.inString) {
+            if (this.escaped) {
+                this.escaped = false;
+            } else if (char === '\\') {
+                this.escaped = true;
+            } else if (char === '"') {
+                this.inString = false;
+                if (frame && frame.bracket === '{' && frame.expectingKey) {
+                    frame.key = JSON.parse(
+                        this.buffer.slice(this.stringStart - this.offset, position - this.offset + 1)
+                    );
+                }
+                this.stringStart = null;
+            }
+            return;
+        }
+
+        if (WHITESPACE.includes(char)) {
+            return;
+        }
+        // A scalar item of the target array ends at the next ',' or ']'
+        if ((char === ',' || char === ']') && this.itemStart !== null && this.itemDepth === this.frames.length) {
+            this.emit(position, items);
+        }
+
+        if (char === '"') {
+            this.inString = true;
+            if (frame && frame.bracket === '{' && frame.expectingKey) {
+                this.stringStart = position;
+            } else {
+                this.valueStarts(position);
+            }
+        } else if (char === '{' || char === '[') {
+            this.valueStarts(position);
+            this.frames.push({ bracket: char, key: char === '{' ? null : 0, expectingKey: char === '{' });
+        } else if (char === '}' || char === ']') {
+            this.frames.pop();
+            if (this.itemStart !== null && this.itemDepth === this.frames.length) {
+                this.emit(position + 1, items);
+            }
+        } else if (char === ':') {
+            frame.expectingKey = false;
+        } else if (char === ',') {
+            if (frame.bracket === '{') {
+                frame.expectingKey = true;
+            } else {
+                frame.key += 1;
+            }
+        } else {
+            this.valueStarts(position);
+        }
+    }
+
+    /**
+     * Parse and return the whole document
+     * @returns {Object} The complete JSON document
+     * @throws {SyntaxError} If the document is incomplete or malformed
+     */
+    close() {
+        return JSON.parse(this.text.join(''));
+    }
+}
+
+/**
+ * Read a fetch Response body, calling onItem for each item of the array at
+ * path as soon as it arrives
+ * @param {Response} response - fetch Response with a readable body
+ * @param {Function} onItem - Called with (item, index)
+ * @param {Array<string>} [path=['data', 'weekends']] - Keys from the root to the array
+ * @returns {Promise<Object>} The complete JSON document
+ */
+export async function readJSONItems(response, onItem, path = ['data', 'weekends']) {
+    const stream = new JSONItemStream(path);
+    const decoder = new TextDecoder();
+    const reader = response.body.getReader();
+    let index = 0;
+    for (;;) {
+        const { done, value } = await reader.read();
+        const text = done ? decoder.decode() : decoder.decode(value, { stream: true });
+        for (const item of stream.feed(text)) {
+            onItem(item, index++);
+        }
+        if (done) {
+            return stream.close();
+        }
+    }
+}
@@ -606,6 +606,104 @@ describe('BuscaVagasAPIClient - Instance Methods', () => {
             expect(client.fetchManager).not.toBeNull();
         });
     });
+
+    describe('searchVacancies single-flight', () => {
+        let release;
+
+        beforeEach(() => {
+            client.fetchWithTimeout = jest.fn((url) => new Promise((resolve, reject) => {
+                release = (error) => error ? reject(error) : resolve({ success: true, data: { url, hasAvailability: true } });
+            }));
+        });
+
+        test('identical concurrent searches share one request', async () => {
+            const searches = [
+                client.searchVacancies('2025-12-20', '2025-12-22', '-1'),
+                client.searchVacancies(new Date('2025-12-20T12:00:00Z'), '2025-12-22', '-1'),
+                client.searchVacancies('2025-12-20', '2025-12-22')
+            ];
+            release();
+            const results = await Promise.all(searches);
+
+            expect(client.fetchWithTimeout).toHaveBeenCalledTimes(1);
+            expect(results[1]).toBe(results[0]);
+            expect(results[2]).toBe(results[0]);
+            expect(client.inFlightSearches.size).toBe(0);
+        });
+
+        test('different or later searches send their own request', async () => {
+            const first = client.searchVacancies('2025-12-20', '2025-12-22', '-1');
+            const releaseFirst = release;
+            const other = client.searchVacancies('2025-12-20', '2025-12-22', '12');
+            release();
+            releaseFirst();
+            await Promise.all([first, other]);
+
+            const again = client.searchVacancies('2025-12-20', '2025-12-22', '-1');
+            release();
+            await again;
+
+            expect(client.fetchWithTimeout).toHaveBeenCalledTimes(3);
+        });
+
+        test('a failure rejects every caller and is not kept', async () => {
+            const searches = [
+                client.searchVacancies('2025-12-20', '2025-12-22'),
+                client.searchVacancies('2025-12-20', '2025-12-22')
+            ];
+            release(new Error('Request timeout - please try again'));
+
+            for (const search of searches) {
+                await expect(search).rejects.toThrow('Request timeout');
+            }
+            expect(client.inFlightSearches.size).toBe(0);
+        });
+    });
+});
+
+describe('BuscaVagasAPIClient - fetchStreaming errors', () => {
+    let client;
+    const originalFetch = global.fetch;
+
+    beforeEach(() => {
+        client = new BuscaVagasAPIClient({ logger: { log: jest.fn(), error: jest.fn(), warn: jest.fn() } });
+    });
+
+    afterEach(() => {
+        global.fetch = originalFetch;
+    });
+
+    function respond(status, statusText, text) {
+        global.fetch = jest.fn().mockResolvedValue({
+            ok: status >= 200 && status < 300,
+            status,
+            statusText,
+            body: null,
+            text: jest.fn().mockResolvedValue(text),
+            json: jest.fn(() => Promise.resolve(JSON.parse(text)))
+        });
+    }
+
+    test('a non-JSON error body gives the HTTP status, not a SyntaxError', async () => {
+        respond(502, 'Bad Gateway', '<html>502 Bad Gateway</html>');
+
+        await expect(client.fetchStreaming('http://api/x', 1000, jest.fn(), []))
+            .rejects.toThrow('API returned HTTP 502 Bad Gateway');
+    });
+
+    test('a JSON error body gives the API error message', async () => {
+        respond(500, 'Internal Server Error', JSON.stringify({ success: false, error: 'Scraper crashed' }));
+
+        await expect(client.fetchStreaming('http://api/x', 1000, jest.fn(), []))
+            .rejects.toThrow('Scraper crashed');
+    });
+
+    test('an empty error body without status text still gives the status', async () => {
+        respond(503, '', '');
+
+        await expect(client.fetchStreaming('http://api/x', 1000, jest.fn(), []))
+            .rejects.toThrow(/^API returned HTTP 503$/);
+    });
 });
 
 // ============================================================================
@@ -6,6 +6,7 @@ from .selenium_config import (
     create_chrome_driver,
     setup_chrome,
 )
+from .durations import DurationStore, DURATIONS_FILE
 
 __all__ = [
     'get_chrome_binary_path',
@@ -13,4 +14,6 @@ __all__ = [
     'get_chrome_options',
     'create_chrome_driver',
     'setup_chrome',
+    'DurationStore',
+    'DURATIONS_FILE',
 ]
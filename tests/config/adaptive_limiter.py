@@ -0,0 +1,237 @@
+"""
+Adaptive Concurrency Limiter
+AIMD (additive increase, multiplicative decrease) limit on concurrent API
+requests, for the Python tooling that talks to the scraper backend: the
+load generator (scripts/load-test-api.py), SearchClient and the synthetic
+monitor.
+
+- Every healthy completion adds increase/limit, so the limit grows by
+  `increase` per limit's worth of requests (one "round trip")
+- A 429 / 503 (API.STATUS.RATE_LIMIT, SERVICE_UNAVAILABLE in
+  src/config/constants.js), a timeout or a latency spike (latency_factor
+  times the smoothed baseline, or over latency_target) multiplies it by
+  `backoff`, at most once per round trip: signals from requests that
+  started before the last cut are ignored
+- Retry-After on a 429 pauses new requests for that long
+- report() gives the concurrency it settled on (median over the recent
+  completions) along with throughput and signal counts
+
+Usage:
+    limiter = AdaptiveLimiter(initial=2, max_limit=32)
+    outcomes = run_adaptive(limiter, lambda search: client.search(*search), searches, retries=3)
+    print(limiter.report()['settled'])
+"""
+import socket
+import statistics
+import threading
+import time
+import urllib.error
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+OVERLOAD_STATUSES = (429, 503)  # API.STATUS.RATE_LIMIT, API.STATUS.SERVICE_UNAVAILABLE
+MAX_RETRY_AFTER = 60            # seconds; longer pauses are capped
+BASELINE_ALPHA = 0.05           # weight of a new latency sample in the baseline
+BASELINE_SAMPLES = 5            # samples before latency spikes are judged
+
+
+def is_overload(error):
+    """Whether an exception means the backend is saturated (429/503 or a timeout)"""
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code in OVERLOAD_STATUSES
+    if isinstance(error, urllib.error.URLError):
+        error = error.reason
+    return isinstance(error, (TimeoutError, socket.timeout))
+
+
+def retry_after(error):
+    """Seconds from an HTTPError's Retry-After header (None without one)"""
+    headers = getattr(error, 'headers', None)
+    value = headers.get('Retry-After') if headers else None
+    try:
+        return min(float(value), MAX_RETRY_AFTER) if value is not None else None
+    except ValueError:
+        return None  # an HTTP date: fall back to the backoff alone
+
+
+class AdaptiveLimiter:
+    """
+    Thread-safe AIMD concurrency limit
+
+    Args:
+        initial: starting limit
+        min_limit / max_limit: bounds of the limit
+        increase: limit added per round trip of healthy completions
+        backoff: factor applied to the limit on an overload signal
+        latency_factor: a completion slower than this many times the
+                        smoothed baseline latency is a spike
+        latency_target: fixed latency budget in seconds (replaces the
+                        baseline comparison)
+        window: completions the settled limit is computed over
+    """
+
+    def __init__(self, initial=2, min_limit=1, max_limit=32, increase=1.0, backoff=0.5,
+                 latency_factor=2.0, latency_target=None, window=100):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_factor = latency_factor
+        self.latency_target = latency_target
+        self.limit = float(min(max(initial, min_limit), max_limit))
+
+        self._cond = threading.Condition()
+        self._epoch = 0              # bumped on every decrease
+        self._paused_until = 0.0
+        self._recent_limits = deque(maxlen=window)
+        self.started = time.monotonic()
+        self.baseline = None         # smoothed latency, seconds
+        self.samples = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.errors = 0
+        self.overloads = 0
+        self.spikes = 0
+        self.decreases = 0
+        self.history = [(0.0, self.concurrency)]   # (seconds, concurrency) at each change
+
+    @property
+    def concurrency(self):
+        """Requests allowed in flight right now"""
+        return max(self.min_limit, int(self.limit))
+
+    def acquire(self):
+        """Wait for a slot; returns a ticket for release()"""
+        with self._cond:
+            while True:
+                pause = self._paused_until - time.monotonic()
+                if pause <= 0 and self.in_flight < self.concurrency:
+                    break
+                self._cond.wait(pause if pause > 0 else None)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            return self._epoch
+
+    def release(self, ticket, seconds, outcome='ok', retry_after=None):
+        """
+        Return a slot with its request's latency and outcome: 'ok',
+        'overload' (429/503/timeout) or 'error' (any other failure, which
+        does not move the limit)
+        """
+        with self._cond:
+            self.in_flight -= 1
+            before = self.concurrency
+            if outcome == 'ok' and self._is_spike(seconds):
+                outcome = 'spike'
+            if outcome == 'ok':
+                self.completed += 1
+                self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+            elif outcome in ('overload', 'spike'):
+                if outcome == 'overload':
+                    self.overloads += 1
+                else:
+                    self.completed += 1
+                    self.spikes += 1
+                if ticket == self._epoch:
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    self._epoch += 1
+                    self.decreases += 1
+                if retry_after:
+                    self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            else:
+                self.errors += 1
+
+            if outcome != 'overload':
+                self._track_latency(seconds)
+            self._recent_limits.append(self.concurrency)
+            if self.concurrency != before:
+                self.history.append((round(time.monotonic() - self.started, 3), self.concurrency))
+            self._cond.notify_all()
+
+    def _is_spike(self, seconds):
+        if self.latency_target is not None:
+            return seconds > self.latency_target
+        return self.samples >= BASELINE_SAMPLES and seconds > self.baseline * self.latency_factor
+
+    def _track_latency(self, seconds):
+        # Slow-moving average: a lasting slowdown becomes the new normal
+        self.baseline = seconds if self.baseline is None else \
+            self.baseline + BASELINE_ALPHA * (seconds - self.baseline)
+        self.samples += 1
+
+    def call(self, fn, *args, **kwargs):
+        """fn(*args, **kwargs) inside a slot, feeding its latency and outcome back"""
+        ticket = self.acquire()
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            outcome = 'overload' if is_overload(e) else 'error'
+            self.release(ticket, time.perf_counter() - start, outcome, retry_after(e))
+            raise
+        self.release(ticket, time.perf_counter() - start)
+        return result
+
+    def settled(self):
+        """Median concurrency over the recent completions"""
+        with self._cond:
+            return statistics.median(self._recent_limits) if self._recent_limits else self.concurrency
+
+    def report(self):
+        elapsed = time.monotonic() - self.started
+        return {
+            'limit': self.concurrency,
+            'settled': self.settled(),
+            'peak_in_flight': self.peak_in_flight,
+            'completed': self.completed,
+            'overloads': self.overloads,
+            'spikes': self.spikes,
+            'errors': self.errors,
+            'decreases': self.decreases,
+            'baseline_ms': round(self.baseline * 1000, 1) if self.baseline is not None else None,
+            'throughput': round(self.completed / elapsed, 3) if elapsed else 0.0,
+            'history': self.history,
+        }
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_limiter():
+    """The process-wide limiter for requests to the real API"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = AdaptiveLimiter()
+        return _shared
+
+
+def run_adaptive(limiter, fn, items, retries=0):
+    """
+    fn(item) for every item, as concurrently as the limiter allows;
+    overloaded calls are retried up to `retries` times (after the limiter
+    has already backed off)
+
+    Returns: [(item, result or exception, seconds)] in item order, seconds
+    being the last attempt's service time (not the wait for a slot)
+    """
+    def attempt(item):
+        started = []
+
+        def timed():
+            started.append(time.perf_counter())
+            return fn(item)
+
+        for remaining in range(retries, -1, -1):
+            try:
+                result = limiter.call(timed)
+            except Exception as e:
+                if remaining and is_overload(e):
+                    continue
+                result = e
+            return item, result, time.perf_counter() - started[-1]
+
+    with ThreadPoolExecutor(max_workers=limiter.max_limit) as pool:
+        return list(pool.map(attempt, items))
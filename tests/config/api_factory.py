@@ -0,0 +1,260 @@
+"""
+Synthetic API Data Factory
+Valid /vagas/hoteis, /vagas/search and /vagas/search/weekends payloads at
+any scale, in the shape docs/features/API_CLIENT_FUNCTIONAL_REQUIREMENTS.md
+documents, with the edge cases the UI has to cope with:
+
+    capacity distribution   weights for "até N pessoas" (the guest filter input)
+    holiday packages        searches matching a Christmas/New Year window carry
+                            holidayPackage and full-window vacancies
+    unavailable ratio       share of searches answered with hasAvailability=false
+    text variants           accent-less "ate" and singular "pessoa", both of
+                            which guestNumberFilter.js accepts
+
+Every value is a pure function of the spec, the search query and the
+hotel index, so search_payload() and the streamed iter_search_json() give
+the same document, and iter_search_json() never holds more than one hotel's
+vacancies in memory.
+"""
+import json
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from .page_helpers import search_dates
+
+# Hotels offered by the API (tests/use_cases/test_hotel_list_verification.py)
+HOTEL_NAMES = [
+    "Amparo", "Appenzell", "Areado", "Avaré", "Boraceia", "Campos do Jordão",
+    "Caraguatatuba", "Fazenda Ibirá", "Guarujá", "Itanhaém", "Lindoia", "Maresias",
+    "Monte Verde", "Peruíbe I", "Peruíbe II", "Poços de Caldas", "Saha",
+    "São Lourenço", "São Pedro", "Serra Negra", "Socorro", "Termas de Ibirá",
+    "Ubatuba", "Unidade Capital",
+]
+ROOM_TYPES = ["COQUEIROS", "JAZZ Luxo", "FURNAS STANDARD", "FURNAS", "CHALÉ", "APARTAMENTO"]
+
+# Mirrors HOLIDAY_PACKAGES in src/js/holidayPackageService.js (month, day)
+HOLIDAY_PACKAGES = {
+    'CHRISTMAS': {'name': 'Natal', 'start': (12, 22), 'end': (12, 27), 'duration': '5 dias / 4 noites'},
+    'NEW_YEAR': {'name': 'Ano Novo', 'start': (12, 27), 'end': (1, 2), 'duration': '6 dias / 5 noites'},
+}
+
+# Room capacity -> relative weight (two-person rooms dominate)
+DEFAULT_CAPACITY_WEIGHTS = {1: 2, 2: 40, 3: 25, 4: 20, 5: 8, 6: 5}
+
+NO_AVAILABILITY_SUMMARY = 'No período escolhido não há nenhum quarto disponível'
+
+
+@dataclass
+class DatasetSpec:
+    """Shape of the synthetic data; ratios are probabilities in 0..1"""
+    hotels: int = 25
+    vacancies_per_hotel: int = 100
+    capacity_weights: dict = field(default_factory=lambda: dict(DEFAULT_CAPACITY_WEIGHTS))
+    holiday_packages: dict = field(default_factory=lambda: dict(HOLIDAY_PACKAGES))
+    unavailable_ratio: float = 0.0
+    accentless_ratio: float = 0.0
+    singular_ratio: float = 0.0
+    max_rooms: int = 7
+    seed: int = 0
+
+    def hotel_name(self, index):
+        name = HOTEL_NAMES[index % len(HOTEL_NAMES)]
+        if index >= len(HOTEL_NAMES):
+            name = f"{name} {index // len(HOTEL_NAMES) + 1}"
+        return name
+
+
+def hotels_payload(spec=None):
+    """/vagas/hoteis body: "Todas" plus spec.hotels hotels (ids "1".."N")"""
+    spec = spec or DatasetSpec()
+    return {'success': True, 'data': [{'hotelId': '-1', 'name': 'Todas', 'type': 'All'}] + [
+        {'hotelId': str(index + 1), 'name': spec.hotel_name(index), 'type': 'Hotel'}
+        for index in range(spec.hotels)
+    ]}
+
+
+def holiday_package(spec, checkin, checkout):
+    """holidayPackage for a search that exactly covers one of the spec's windows"""
+    checkin, checkout = date.fromisoformat(checkin), date.fromisoformat(checkout)
+    for package_type, package in spec.holiday_packages.items():
+        start = date(checkin.year, *package['start'])
+        end = date(checkin.year + (package['end'] < package['start']), *package['end'])
+        if (checkin, checkout) == (start, end):
+            return {
+                'type': package_type, 'name': package['name'], 'duration': package['duration'],
+                'dates': {'checkin': start.isoformat(), 'checkout': end.isoformat()},
+            }
+    return None
+
+
+def has_availability(spec, checkin, checkout, hotel='-1'):
+    """Whether this search is answered with vacancies (unavailable_ratio decides)"""
+    if not spec.hotels or not spec.vacancies_per_hotel:
+        return False
+    return random.Random(f"{spec.seed}:{checkin}:{checkout}:{hotel}").random() >= spec.unavailable_ratio
+
+
+def hotel_indexes(spec, hotel='-1'):
+    """Hotels a search covers: all for "-1", else the one with that hotelId"""
+    if str(hotel) == '-1':
+        return range(spec.hotels)
+    index = int(hotel) - 1
+    return range(index, index + 1) if 0 <= index < spec.hotels else range(0)
+
+
+def vacancy_texts(spec, index, checkin, checkout, package=None):
+    """The vacancy strings of one hotel, e.g. "FURNAS (até 3 pessoas)10/02 - 12/02 (2 dias livres) - 4 Quarto(s)" """
+    rng = random.Random(f"{spec.seed}:{checkin}:{checkout}:{index}")
+    start, end = date.fromisoformat(checkin), date.fromisoformat(checkout)
+    nights = max((end - start).days, 1)
+    capacities, weights = zip(*spec.capacity_weights.items())
+    texts = []
+    for _ in range(spec.vacancies_per_hotel):
+        capacity = rng.choices(capacities, weights)[0]
+        if package:
+            first, length = start, nights
+        else:
+            length = rng.randint(1, nights)
+            first = start + timedelta(days=rng.randint(0, nights - length))
+        last = first + timedelta(days=length)
+        up_to = 'ate' if rng.random() < spec.accentless_ratio else 'até'
+        people = 'pessoa' if rng.random() < spec.singular_ratio else 'pessoas'
+        texts.append(
+            f"{rng.choice(ROOM_TYPES)} ({up_to} {capacity} {people})"
+            f"{first:%d/%m} - {last:%d/%m} ({length} dias livres) - {rng.randint(1, spec.max_rooms)} Quarto(s)"
+        )
+    return texts
+
+
+def _query(checkin, checkout):
+    if checkin is None or checkout is None:
+        return search_dates()
+    return checkin, checkout
+
+
+def _envelope(spec, checkin, checkout, hotel):
+    """The body without vacancies/hotelGroups, the hotels it covers and its holidayPackage"""
+    available = has_availability(spec, checkin, checkout, hotel)
+    package = holiday_package(spec, checkin, checkout)
+    indexes = hotel_indexes(spec, hotel) if available else range(0)
+    names = [spec.hotel_name(index) for index in indexes]
+    result = {
+        'hasAvailability': bool(names),
+        'status': 'AVAILABLE' if names else 'NO AVAILABILITY',
+        'summary': (f"Found vacancies in {len(names)} hotel(s)" if names else NO_AVAILABILITY_SUMMARY),
+    }
+    body = {
+        'success': True,
+        'method': 'synthetic',
+        'headlessMode': True,
+        'hotelFilter': str(hotel),
+        'data': {
+            'success': True,
+            'date': f"{checkin}T12:00:00.000Z",
+            'hasAvailability': bool(names),
+            'result': result,
+        },
+    }
+    return body, indexes, names, package
+
+
+def search_payload(spec=None, checkin=None, checkout=None, hotel='-1'):
+    """/vagas/search body as a dict (built in memory)"""
+    spec = spec or DatasetSpec()
+    checkin, checkout = _query(checkin, checkout)
+    body, indexes, names, package = _envelope(spec, checkin, checkout, hotel)
+    groups = {name: vacancy_texts(spec, index, checkin, checkout, package)
+              for index, name in zip(indexes, names)}
+    body['data']['result']['vacancies'] = [f"{name}: {text}" for name, texts in groups.items()
+                                           for text in texts]
+    body['data']['result']['hotelGroups'] = groups
+    if package:
+        body['holidayPackage'] = package
+    return body
+
+
+def iter_search_json(spec=None, checkin=None, checkout=None, hotel='-1'):
+    """
+    The same /vagas/search body as JSON text, one chunk per hotel and list;
+    vacancies are regenerated for hotelGroups instead of being kept
+    """
+    spec = spec or DatasetSpec()
+    checkin, checkout = _query(checkin, checkout)
+    body, indexes, names, package = _envelope(spec, checkin, checkout, hotel)
+    head = json.dumps(body, ensure_ascii=False)
+    # Re-open the result object: '...}}}' -> '..., "vacancies": ['
+    yield head[:-3] + ', "vacancies": ['
+
+    for position, (index, name) in enumerate(zip(indexes, names)):
+        texts = vacancy_texts(spec, index, checkin, checkout, package)
+        chunk = ', '.join(json.dumps(f"{name}: {text}", ensure_ascii=False) for text in texts)
+        yield (', ' if position and chunk else '') + chunk
+    yield '], "hotelGroups": {'
+
+    for position, (index, name) in enumerate(zip(indexes, names)):
+        texts = vacancy_texts(spec, index, checkin, checkout, package)
+        yield (', ' if position else '') + json.dumps(name, ensure_ascii=False) + ': ' \
+            + json.dumps(texts, ensure_ascii=False)
+    yield '}}}'
+
+    if package:
+        yield ', "holidayPackage": ' + json.dumps(package, ensure_ascii=False)
+    yield '}'
+
+
+def weekend_dates(count, start=None):
+    """(Friday, Sunday) ISO pairs of the next `count` weekends after start (default today)"""
+    start = date.fromisoformat(start) if isinstance(start, str) else start or date.today()
+    friday = start + timedelta(days=(4 - start.weekday()) % 7 or 7)
+    return [((friday + timedelta(weeks=week)).isoformat(),
+             (friday + timedelta(weeks=week, days=2)).isoformat()) for week in range(count)]
+
+
+def weekend_result(spec, number, checkin, checkout):
+    """One entry of data.weekends: a "Todas" search of that Friday-Sunday"""
+    data = search_payload(spec, checkin, checkout)['data']
+    return {'weekendNumber': number, 'checkin': checkin, 'checkout': checkout,
+            'hasAvailability': data['hasAvailability'], 'result': data['result']}
+
+
+def _weekend_envelope(count, dates):
+    return {'success': True, 'data': {'searchDetails': {
+        'totalWeekendsSearched': count,
+        'startDate': dates[0][0] if dates else None,
+        'endDate': dates[-1][1] if dates else None,
+    }}}
+
+
+def _availability(available, count):
+    return {'weekendsWithVacancies': available, 'weekendsWithoutVacancies': count - available}
+
+
+def weekend_payload(spec=None, count=8, start=None):
+    """/vagas/search/weekends?count=N body as a dict"""
+    spec = spec or DatasetSpec()
+    dates = weekend_dates(count, start)
+    body = _weekend_envelope(count, dates)
+    weekends = [weekend_result(spec, number, *pair) for number, pair in enumerate(dates, 1)]
+    body['data']['weekends'] = weekends
+    body['data']['availability'] = _availability(sum(w['hasAvailability'] for w in weekends), count)
+    return body
+
+
+def iter_weekend_json(spec=None, count=8, start=None):
+    """
+    The same /vagas/search/weekends body as JSON text: the head, one chunk
+    per weekend, then the availability summary (known only at the end)
+    """
+    spec = spec or DatasetSpec()
+    dates = weekend_dates(count, start)
+    head = json.dumps(_weekend_envelope(count, dates), ensure_ascii=False)
+    # Re-open the data object: '...}}' -> '..., "weekends": ['
+    yield head[:-2] + ', "weekends": ['
+
+    available = 0
+    for number, pair in enumerate(dates, 1):
+        weekend = weekend_result(spec, number, *pair)
+        available += weekend['hasAvailability']
+        yield (', ' if number > 1 else '') + json.dumps(weekend, ensure_ascii=False)
+    yield '], "availability": ' + json.dumps(_availability(available, count)) + '}}'
@@ -0,0 +1,162 @@
+"""
+Warm Chrome Profiles
+Template user-data directories with a pre-warmed HTTP cache and V8 code cache.
+
+Every driver gets its own copy-on-write clone of the template, so runs stay
+isolated while Bootstrap, Bootstrap Icons, Google Fonts and the other vendor
+assets come from the disk cache instead of the network. Local assets are only
+cache hits when served from the same origin (host and port) as during warm-up.
+
+Usage:
+    cd tests && python3 -m config.chrome_profile http://localhost:8080/public/index.html
+    pytest tests/ --warm-profile
+    CHROME_WARM_PROFILE=1 python3 tests/test-index-e2e.py
+"""
+import atexit
+import copy
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROFILE_ROOT = Path(os.getenv(
+    'CHROME_PROFILE_ROOT',
+    Path.home() / '.cache' / 'monitora_vagas' / 'chrome-profiles'
+))
+TEMPLATE_DIR = PROFILE_ROOT / 'template'
+CLONES_DIR = PROFILE_ROOT / 'clones'
+
+DEFAULT_WARMUP_URL = 'http://localhost:8080/public/index.html'
+
+# Chrome refuses to open a profile that still carries another process' locks
+LOCK_FILES = ('SingletonLock', 'SingletonSocket', 'SingletonCookie', 'lockfile')
+
+_clones = []
+
+
+def warm_profile_enabled():
+    """True when CHROME_WARM_PROFILE is set to a truthy value"""
+    return os.getenv('CHROME_WARM_PROFILE', '').lower() in ('1', 'true', 'yes')
+
+
+def has_template():
+    """True when a warmed template profile exists"""
+    return (TEMPLATE_DIR / 'Default').is_dir()
+
+
+def _remove_locks(profile_dir):
+    for name in LOCK_FILES:
+        lock = Path(profile_dir) / name
+        if lock.exists() or lock.is_symlink():
+            lock.unlink()
+
+
+def _clone_tree(source, destination):
+    """
+    Copy a directory tree, sharing blocks with the source when possible
+    (reflinks on btrfs/XFS, clonefile on APFS), plain copy otherwise
+    """
+    if sys.platform.startswith('linux'):
+        command = ['cp', '-a', '--reflink=auto', str(source), str(destination)]
+    elif sys.platform == 'darwin':
+        command = ['cp', '-c', '-R', str(source), str(destination)]
+    else:
+        command = None
+
+    if command:
+        result = subprocess.run(command, capture_output=True)
+        if result.returncode == 0:
+            return
+        shutil.rmtree(destination, ignore_errors=True)
+
+    shutil.copytree(source, destination, symlinks=True)
+
+
+def clone_template():
+    """
+    Create a private clone of the template profile
+    Returns: Path of the clone, removed automatically at interpreter exit
+    """
+    CLONES_DIR.mkdir(parents=True, exist_ok=True)
+    worker = os.getenv('PYTEST_XDIST_WORKER', 'main')
+    parent = Path(tempfile.mkdtemp(prefix=f'{worker}-', dir=CLONES_DIR))
+    clone = parent / 'profile'
+    _clone_tree(TEMPLATE_DIR, clone)
+    _remove_locks(clone)
+    _clones.append(parent)
+    return clone
+
+
+def cleanup_clones():
+    """Delete every clone made by this process"""
+    while _clones:
+        shutil.rmtree(_clones.pop(), ignore_errors=True)
+
+
+atexit.register(cleanup_clones)
+
+
+def with_warm_profile(options):
+    """
+    Copy Chrome options and point the copy at a fresh clone of the template
+    Returns the options unchanged when no template has been warmed yet
+    """
+    if not has_template():
+        print("   ⚠️ No warm Chrome profile template, using an empty profile")
+        return options
+    warm_options = copy.deepcopy(options)
+    warm_options.add_argument(f"--user-data-dir={clone_template()}")
+    return warm_options
+
+
+def warm_template(urls=(DEFAULT_WARMUP_URL,), rounds=2):
+    """
+    Build (or rebuild) the template profile by loading each URL
+
+    Pages are loaded more than once because Chrome only stores compiled
+    code for scripts that have run repeatedly.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.support.ui import WebDriverWait
+    from .selenium_config import get_chrome_options, get_chromedriver_path
+
+    PROFILE_ROOT.mkdir(parents=True, exist_ok=True)
+    build_dir = Path(tempfile.mkdtemp(prefix='template-build-', dir=PROFILE_ROOT))
+
+    options = get_chrome_options(warm_profile=False)
+    options.add_argument(f"--user-data-dir={build_dir}")
+    driver = webdriver.Chrome(
+        service=Service(executable_path=get_chromedriver_path()),
+        options=options
+    )
+    try:
+        for _ in range(rounds):
+            for url in urls:
+                print(f"🔥 Warming cache: {url}")
+                driver.get(url)
+                WebDriverWait(driver, 30).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
+    finally:
+        driver.quit()
+
+    _remove_locks(build_dir)
+
+    # Swap the new template in, then drop the old one
+    previous = None
+    if TEMPLATE_DIR.exists():
+        previous = TEMPLATE_DIR.with_name(f'template-old-{os.getpid()}')
+        TEMPLATE_DIR.rename(previous)
+    build_dir.rename(TEMPLATE_DIR)
+    if previous:
+        shutil.rmtree(previous, ignore_errors=True)
+
+    print(f"✅ Warm profile template ready: {TEMPLATE_DIR}")
+    return TEMPLATE_DIR
+
+
+if __name__ == "__main__":
+    warm_template(sys.argv[1:] or (DEFAULT_WARMUP_URL,))
@@ -0,0 +1,236 @@
+"""
+API Circuit Breaker
+Keeps a dead API from turning every API-dependent test into a timeout.
+The breaker opens after `failure_threshold` consecutive failures (of
+/api/health probes, or of API calls made through call()) and, while open, either
+fails API-dependent tests at once or routes them to the local mock API
+(config/mock_api.py). A background thread re-probes /health every
+`probe_interval` seconds and closes the breaker as soon as the API
+answers again.
+
+Usage (unittest):
+    breaker = CircuitBreaker(API_BASE_URL, fallback=MockAPI())
+    breaker.probe()                  # prime at setup
+    base_url = breaker.route()       # API, mock, or CircuitOpen raised
+
+Usage (pytest):
+    pytest tests/ --api-circuit=mock   # 'api'-marked tests; see api_base_url
+"""
+import threading
+import time
+import urllib.error
+import urllib.request
+
+API_BASE_URL = 'https://www.mpbarbosa.com/api'
+FAILURE_THRESHOLD = 3
+PROBE_INTERVAL = 15   # seconds between background re-probes while open
+PROBE_TIMEOUT = 3
+
+CLOSED = 'closed'
+OPEN = 'open'
+
+# Failures that say the API is unreachable or unhealthy (a wrong assertion
+# in a test does not count)
+CONNECTION_ERRORS = (urllib.error.URLError, ConnectionError, TimeoutError)
+
+
+class CircuitOpen(Exception):
+    """The API is marked down and there is no fallback"""
+
+
+def health_url(base_url):
+    """Same URL as buildHealthUrl() in src/services/apiClient.js"""
+    return f"{base_url}/health"
+
+
+def probe_health(base_url, timeout=PROBE_TIMEOUT):
+    """GET /health; returns None when healthy, else the error text"""
+    request = urllib.request.Request(health_url(base_url), headers={'User-Agent': 'Mozilla/5.0'})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return None if response.getcode() == 200 else f"HTTP {response.getcode()}"
+    except (OSError, ValueError) as e:
+        return str(e)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure breaker with background health re-probes
+
+    Args:
+        api_base_url: API under test
+        failure_threshold: consecutive failures that open the breaker
+        probe_interval: seconds between re-probes while open
+        probe_timeout: /health timeout in seconds
+        fallback: MockAPI to route to while open (started on first use);
+                  None fails fast with CircuitOpen instead
+        probe: callable(base_url) -> None or error text (default: probe_health)
+    """
+
+    def __init__(self, api_base_url=API_BASE_URL, failure_threshold=FAILURE_THRESHOLD,
+                 probe_interval=PROBE_INTERVAL, probe_timeout=PROBE_TIMEOUT, fallback=None, probe=None):
+        self.api_base_url = api_base_url.rstrip('/')
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.fallback = fallback
+        self._probe = probe or (lambda base_url: probe_health(base_url, self.probe_timeout))
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._reprober = None
+        self._fallback_started = False
+        self.state = CLOSED
+        self.failures = 0          # consecutive
+        self.last_error = None
+        self.opened_at = None
+        self.transitions = []      # (time.time(), state)
+        self.fast_failed = 0
+        self.rerouted = 0
+
+    @property
+    def is_open(self):
+        return self.state == OPEN
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            if self.state == OPEN:
+                self._set_state(CLOSED)
+
+    def record_failure(self, error=None):
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error) if error is not None else self.last_error
+            if self.state == CLOSED and self.failures >= self.failure_threshold:
+                self._open()
+
+    def trip(self, error=None):
+        """Open at once (e.g. the API is already down at setup)"""
+        with self._lock:
+            self.last_error = str(error) if error is not None else self.last_error
+            if self.state == CLOSED:
+                self._open()
+
+    def _open(self):
+        self._set_state(OPEN)
+        self.opened_at = time.time()
+        self._start_reprober()
+
+    def _set_state(self, state):
+        self.state = state
+        self.transitions.append((time.time(), state))
+
+    def probe(self, trip=False):
+        """
+        Probe /health now and record the outcome (trip=True opens the
+        breaker on a single failure); returns whether it is healthy
+        """
+        error = self._probe(self.api_base_url)
+        if error is None:
+            self.record_success()
+        elif trip:
+            self.trip(error)
+        else:
+            self.record_failure(error)
+        return error is None
+
+    def _start_reprober(self):
+        if self._reprober and self._reprober.is_alive():
+            return
+        self._reprober = threading.Thread(target=self._reprobe, name='api-circuit-probe', daemon=True)
+        self._reprober.start()
+
+    def _reprobe(self):
+        while self.state == OPEN and not self._stop.wait(self.probe_interval):
+            if self._probe(self.api_base_url) is None:
+                self.record_success()
+
+    def route(self):
+        """
+        Base URL for an API-dependent test: the API while closed, the
+        fallback's while open; raises CircuitOpen without a fallback
+        """
+        if not self.is_open:
+            return self.api_base_url
+        if self.fallback is None:
+            self.fast_failed += 1
+            raise CircuitOpen(self.describe())
+        if not self._fallback_started:
+            try:
+                self.fallback.start()
+                self._fallback_started = True
+            except OSError:
+                # Port taken: fine if it is another xdist worker's mock
+                if self._probe(self.fallback.base_url) is not None:
+                    raise
+        self.rerouted += 1
+        return self.fallback.base_url
+
+    def call(self, fn, *args, **kwargs):
+        """fn(*args, **kwargs) against the API, counting connection errors"""
+        if self.is_open:
+            self.fast_failed += 1
+            raise CircuitOpen(self.describe())
+        try:
+            result = fn(*args, **kwargs)
+        except CONNECTION_ERRORS as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return result
+
+    def describe(self):
+        if not self.is_open:
+            return f"API circuit closed ({self.api_base_url})"
+        since = time.strftime('%H:%M:%S', time.localtime(self.opened_at))
+        return f"API circuit open since {since} ({self.api_base_url}): {self.last_error}"
+
+    def stop(self):
+        self._stop.set()
+        if self._reprober:
+            self._reprober.join(timeout=self.probe_timeout + 1)
+        if self._fallback_started:
+            self.fallback.stop()
+            self._fallback_started = False
+
+
+class CircuitBreakerPlugin:
+    """
+    pytest side: tests marked 'api' are failed at setup while the breaker
+    is open without a fallback; a failed 'api' test is checked with a
+    /health probe, so only an unhealthy API counts toward opening it
+    """
+
+    def __init__(self, breaker):
+        self.breaker = breaker
+
+    def pytest_sessionstart(self, session):
+        # An API that is already down opens the breaker before the first test
+        self.breaker.probe(trip=True)
+
+    def pytest_runtest_setup(self, item):
+        if item.get_closest_marker('api') and self.breaker.is_open and self.breaker.fallback is None:
+            import pytest
+            self.breaker.fast_failed += 1
+            pytest.fail(self.breaker.describe(), pytrace=False)
+
+    def pytest_runtest_logreport(self, report):
+        # While open, tests run against the fallback; only re-probes close it
+        if report.when != 'call' or 'api' not in report.keywords or self.breaker.is_open:
+            return
+        if report.passed:
+            self.breaker.record_success()
+        elif report.failed:
+            self.breaker.probe()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        breaker = self.breaker
+        if breaker.transitions or breaker.fast_failed or breaker.rerouted:
+            terminalreporter.write_line(
+                f"🔌 {breaker.describe()}; {breaker.fast_failed} fast-failed, "
+                f"{breaker.rerouted} routed to the mock API"
+            )
+
+    def pytest_sessionfinish(self, session):
+        self.breaker.stop()
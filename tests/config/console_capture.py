@@ -0,0 +1,293 @@
+"""
+Console Capture
+Push-based browser console and exception capture: a second DevTools
+connection to the page (page_connection(), which heap_soak.save_heap_snapshot
+uses too) subscribes to Runtime and Log events, and a reader thread appends
+each one to a bounded ring buffer as it happens, with its source location.
+
+    Runtime.consoleAPICalled   console.log/info/warn/error/...
+    Runtime.exceptionThrown    uncaught exceptions and unhandled rejections
+    Log.entryAdded             browser-side messages: failed resource loads,
+                               CSP violations, deprecations
+
+Compared with get_log('browser') there is no 'goog:loggingPrefs' capability
+to set, nothing is lost between polls, and flush() is a round-trip barrier
+(events for one DevTools session arrive in order, before the reply to a
+later command), so "no errors so far" holds at any point without a sleep.
+WebDriver BiDi log handlers would need every driver started with
+enable_bidi; the DevTools socket works with any ChromeDriver session.
+
+Usage:
+    with ConsoleCapture(driver) as console:
+        driver.get(url)
+        ...
+        console.assert_no_errors()
+"""
+import itertools
+import json
+import threading
+import time
+import urllib.request
+from collections import deque
+from dataclasses import dataclass, field
+
+DEFAULT_CAPACITY = 500
+
+# Runtime.consoleAPICalled type -> level
+CONSOLE_LEVELS = {
+    'error': 'error', 'assert': 'error',
+    'warning': 'warning',
+    'debug': 'debug', 'trace': 'debug',
+}
+
+ERROR_LEVELS = ('error',)
+
+
+@dataclass
+class ConsoleEvent:
+    """One console message, exception or browser log entry"""
+    source: str  # 'console', 'exception' or the Log.entryAdded source ('network', ...)
+    level: str   # 'debug', 'info', 'warning' or 'error'
+    text: str
+    url: str = ''
+    line: int = 0    # 1-based, 0 when unknown
+    column: int = 0
+    timestamp: float = 0.0
+    stack: list = field(default_factory=list)
+    sequence: int = 0
+
+    @property
+    def location(self):
+        if not self.url:
+            return ''
+        return f"{self.url}:{self.line}:{self.column}" if self.line else self.url
+
+    def __str__(self):
+        location = f" ({self.location})" if self.location else ''
+        return f"[{self.level}] {self.source}: {self.text}{location}"
+
+
+def _remote_object_text(value):
+    """Readable text for a Runtime.RemoteObject console argument"""
+    if 'value' in value:
+        return value['value'] if isinstance(value['value'], str) else json.dumps(value['value'])
+    if 'unserializableValue' in value:
+        return value['unserializableValue']
+    return value.get('description') or value.get('type', '')
+
+
+def _frames(stack_trace):
+    return [
+        f"{frame.get('functionName') or '(anonymous)'} "
+        f"{frame.get('url', '')}:{frame.get('lineNumber', -1) + 1}:{frame.get('columnNumber', -1) + 1}"
+        for frame in (stack_trace or {}).get('callFrames', [])
+    ]
+
+
+def _top_frame(stack_trace):
+    frames = (stack_trace or {}).get('callFrames', [])
+    if not frames:
+        return '', 0, 0
+    top = frames[0]
+    return top.get('url', ''), top.get('lineNumber', -1) + 1, top.get('columnNumber', -1) + 1
+
+
+def parse_event(message):
+    """ConsoleEvent for a DevTools event message, None for anything else"""
+    method = message.get('method')
+    params = message.get('params', {})
+
+    if method == 'Runtime.consoleAPICalled':
+        url, line, column = _top_frame(params.get('stackTrace'))
+        return ConsoleEvent(
+            source='console',
+            level=CONSOLE_LEVELS.get(params.get('type'), 'info'),
+            text=' '.join(_remote_object_text(arg) for arg in params.get('args', [])),
+            url=url, line=line, column=column,
+            timestamp=params.get('timestamp', 0.0),
+            stack=_frames(params.get('stackTrace')),
+        )
+
+    if method == 'Runtime.exceptionThrown':
+        details = params.get('exceptionDetails', {})
+        exception = details.get('exception') or {}
+        text = exception.get('description') or details.get('text', '')
+        url = details.get('url', '')
+        line, column = details.get('lineNumber', -1) + 1, details.get('columnNumber', -1) + 1
+        if not url:
+            url, line, column = _top_frame(details.get('stackTrace'))
+        return ConsoleEvent(
+            source='exception', level='error', text=text.splitlines()[0] if text else '',
+            url=url, line=line, column=column,
+            timestamp=params.get('timestamp', 0.0),
+            stack=_frames(details.get('stackTrace')),
+        )
+
+    if method == 'Log.entryAdded':
+        entry = params.get('entry', {})
+        level = entry.get('level', 'info')
+        return ConsoleEvent(
+            source=entry.get('source', 'other'),
+            level='info' if level == 'verbose' else level,
+            text=entry.get('text', ''),
+            url=entry.get('url', ''),
+            line=entry.get('lineNumber', -1) + 1 if 'lineNumber' in entry else 0,
+            timestamp=entry.get('timestamp', 0.0),
+            stack=_frames(entry.get('stackTrace')),
+        )
+
+    return None
+
+
+class ConsoleBuffer:
+    """Thread-safe ring buffer of ConsoleEvents with monotonically numbered entries"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self._events = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self._last = 0
+        self.dropped = 0
+
+    def append(self, event):
+        with self._lock:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            event.sequence = self._last = next(self._sequence)
+            self._events.append(event)
+
+    def mark(self):
+        """Sequence number of the newest event; pass to events(since=...)"""
+        with self._lock:
+            return self._last
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+            self.dropped = 0
+
+    def events(self, since=0, levels=None):
+        with self._lock:
+            return [event for event in self._events
+                    if event.sequence > since and (levels is None or event.level in levels)]
+
+    def errors(self, since=0, ignore=()):
+        """Error-level events whose text or URL contains none of the ignore substrings"""
+        return [event for event in self.events(since, ERROR_LEVELS)
+                if not any(pattern in event.text or pattern in event.url for pattern in ignore)]
+
+    def trail(self, limit=30, since=0):
+        """The newest events as printable lines, oldest first"""
+        events = self.events(since)[-limit:]
+        lines = [str(event) for event in events]
+        if self.dropped:
+            lines.insert(0, f"... {self.dropped} older event(s) dropped from the ring buffer")
+        return lines
+
+    def assert_no_errors(self, since=0, ignore=()):
+        errors = self.errors(since, ignore)
+        if errors:
+            trail = '\n'.join(f"  {line}" for line in self.trail(since=since))
+            raise AssertionError(f"{len(errors)} browser error(s):\n"
+                                 + '\n'.join(f"  {event}" for event in errors)
+                                 + f"\nConsole trail:\n{trail}")
+
+
+def page_target(driver):
+    """DevTools target of the WebDriver's current page"""
+    address = driver.capabilities['goog:chromeOptions']['debuggerAddress']
+    with urllib.request.urlopen(f"http://{address}/json") as response:
+        targets = json.load(response)
+    pages = [target for target in targets if target.get('type') == 'page']
+    current = driver.current_url
+    return next((target for target in pages if target.get('url') == current), pages[0])
+
+
+def page_connection(driver, timeout=None):
+    """WebSocket to the DevTools endpoint of the WebDriver's current page"""
+    import websocket  # installed with selenium
+
+    return websocket.create_connection(page_target(driver)['webSocketDebuggerUrl'],
+                                       timeout=timeout, suppress_origin=True)
+
+
+class ConsoleCapture(ConsoleBuffer):
+    """ConsoleBuffer fed by a DevTools connection to the driver's page"""
+
+    def __init__(self, driver, capacity=DEFAULT_CAPACITY, timeout=10):
+        super().__init__(capacity)
+        self.driver = driver
+        self.timeout = timeout
+        self._connection = None
+        self._thread = None
+        self._ids = itertools.count(1)
+        self._replies = {}
+        self._replied = threading.Condition()
+
+    def start(self):
+        self._connection = page_connection(self.driver)
+        self._thread = threading.Thread(target=self._read, daemon=True)
+        self._thread.start()
+        # Runtime.enable replays what the current document already logged
+        self._command('Runtime.enable')
+        self._command('Log.enable')
+        return self
+
+    def stop(self):
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+        if self._thread:
+            self._thread.join(self.timeout)
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _read(self):
+        import websocket
+
+        while True:
+            try:
+                message = json.loads(self._connection.recv())
+            except (websocket.WebSocketException, OSError, AttributeError):
+                break
+            if 'id' in message:
+                with self._replied:
+                    self._replies[message['id']] = message
+                    self._replied.notify_all()
+                continue
+            event = parse_event(message)
+            if event:
+                self.append(event)
+        with self._replied:
+            self._replied.notify_all()
+
+    def _command(self, method, params=None):
+        command_id = next(self._ids)
+        self._connection.send(json.dumps({'id': command_id, 'method': method, 'params': params or {}}))
+        deadline = time.monotonic() + self.timeout
+        with self._replied:
+            while command_id not in self._replies:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._thread.is_alive():
+                    raise TimeoutError(f"No DevTools reply to {method} within {self.timeout}s")
+                self._replied.wait(remaining)
+            return self._replies.pop(command_id)
+
+    def flush(self):
+        """Wait until every event the page emitted before this call is buffered"""
+        self._command('Runtime.evaluate', {'expression': '0'})
+
+    def mark(self):
+        if self._connection:
+            self.flush()
+        return super().mark()
+
+    def events(self, since=0, levels=None):
+        if self._connection:
+            self.flush()
+        return super().events(since, levels)
@@ -0,0 +1,241 @@
+"""
+Critical CSS
+Computes the above-the-fold CSS of a page at the viewports used by the
+responsive tests (test-index-e2e.py test_14 mobile / test_16 desktop) and
+builds an inlinable <style> block plus the list of stylesheets to defer.
+
+A rule is critical when, at some viewport, its media conditions match and
+one of its selectors (with pseudo-elements and interaction states removed)
+matches an element whose box starts above the fold. Unrendered elements
+count by their nearest rendered ancestor, so the rules that keep hidden
+panels hidden are critical too.
+"""
+import html
+import json
+import re
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+OUTPUT_DIR = ROOT_DIR / 'build' / 'critical'
+
+# (width, height) from test_14_mobile_viewport and test_16_desktop_viewport
+VIEWPORTS = {
+    'mobile': (375, 667),
+    'desktop': (1920, 1080),
+}
+
+# The critical block must fit in the first round trip (~14 KB) with room
+# for the HTML around it
+CRITICAL_BUDGET_BYTES = 14 * 1024
+
+# Walks every same-origin or CORS-readable stylesheet (including @import
+# chains and nested @media/@supports) and classifies each style rule.
+# Returns {rules: [{key, href, wrappers, text, critical}], links: [...],
+#          opaque: [href]}
+COLLECT_SCRIPT = r"""
+const fold = window.innerHeight;
+const DYNAMIC = /::?(?:before|after|first-line|first-letter|placeholder|selection|marker|backdrop|file-selector-button|-webkit-[\w-]+|-moz-[\w-]+)|:(?:hover|focus-visible|focus-within|focus|active|visited|target)(?![\w-])/g;
+
+function splitSelectors(text) {
+    const parts = [];
+    let depth = 0, current = '';
+    for (const ch of text) {
+        if (ch === '(') depth++;
+        if (ch === ')') depth--;
+        if (ch === ',' && depth === 0) { parts.push(current); current = ''; continue; }
+        current += ch;
+    }
+    parts.push(current);
+    return parts.map(s => s.trim()).filter(Boolean);
+}
+
+function aboveFold(el) {
+    while (el.parentElement && el.getClientRects().length === 0) {
+        el = el.parentElement;
+    }
+    if (el === document.documentElement || el === document.body) return true;
+    return el.getBoundingClientRect().top < fold;
+}
+
+function isCritical(selectorText) {
+    for (const raw of splitSelectors(selectorText)) {
+        let selector = raw.replace(DYNAMIC, '').trim();
+        if (!selector || /[>+~]$/.test(selector)) selector = (selector + ' *').trim();
+        if (/^(:root|html|body|\*)$/.test(selector)) return true;
+        let matches;
+        try { matches = document.querySelectorAll(selector); } catch (e) { continue; }
+        for (const el of matches) {
+            if (aboveFold(el)) return true;
+        }
+    }
+    return false;
+}
+
+const rules = [];
+const opaque = [];
+
+function walk(list, href, key, wrappers, active) {
+    Array.from(list).forEach((rule, index) => {
+        const path = key.concat(index);
+        if (rule.type === CSSRule.IMPORT_RULE) {
+            if (rule.styleSheet) visit(rule.styleSheet, path, wrappers, active);
+        } else if (rule.type === CSSRule.MEDIA_RULE) {
+            walk(rule.cssRules, href, path, wrappers.concat('@media ' + rule.conditionText),
+                 active && window.matchMedia(rule.conditionText).matches);
+        } else if (rule.type === CSSRule.SUPPORTS_RULE) {
+            walk(rule.cssRules, href, path, wrappers.concat('@supports ' + rule.conditionText),
+                 active && CSS.supports(rule.conditionText));
+        } else if (rule.type === CSSRule.STYLE_RULE) {
+            rules.push({key: path, href, wrappers, text: rule.cssText,
+                        critical: active && isCritical(rule.selectorText)});
+        }
+        // @font-face, @keyframes and the rest load with the deferred sheets
+    });
+}
+
+function visit(sheet, key, wrappers, active) {
+    const href = sheet.href || 'inline';
+    const media = sheet.media && sheet.media.mediaText;
+    if (media && media !== 'all') {
+        wrappers = wrappers.concat('@media ' + media);
+        active = active && window.matchMedia(media).matches;
+    }
+    let list;
+    try { list = sheet.cssRules; } catch (e) { opaque.push(href); return; }
+    walk(list, href, key, wrappers, active);
+}
+
+Array.from(document.styleSheets).forEach((sheet, index) => {
+    if (sheet.ownerNode && sheet.ownerNode.id === 'critical-css') return;
+    visit(sheet, [index], [], !sheet.disabled);
+});
+
+const links = Array.from(document.querySelectorAll('link[rel~="stylesheet"]')).map(link => ({
+    href: link.getAttribute('href'),
+    media: link.getAttribute('media'),
+    integrity: link.getAttribute('integrity'),
+    crossorigin: link.getAttribute('crossorigin')
+}));
+
+return {rules, links, opaque};
+"""
+
+
+_MINIFY_TOKEN = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|\s*([{};,>])\s*|\s+""")
+
+
+def minify(css):
+    """
+    Whitespace-level minification (cssText has no comments); strings are
+    kept verbatim and the space before ':' is kept since it is a descendant
+    combinator in selectors
+    """
+    css = _MINIFY_TOKEN.sub(lambda m: m.group(1) or m.group(2) or ' ', css)
+    return css.replace(';}', '}').strip()
+
+
+def merge_viewports(results):
+    """
+    Union of the per-viewport rule lists, in stylesheet order
+
+    Args:
+        results: [{'rules': [...]}, ...] as returned by COLLECT_SCRIPT
+    Returns: ordered list of the rules critical at any viewport
+    """
+    merged = {}
+    for result in results:
+        for rule in result['rules']:
+            key = tuple(rule['key'])
+            if key not in merged:
+                merged[key] = dict(rule, critical=False)
+            merged[key]['critical'] = merged[key]['critical'] or rule['critical']
+    return [merged[key] for key in sorted(merged) if merged[key]['critical']]
+
+
+def render_critical(rules):
+    """Critical rules as CSS, re-wrapping consecutive rules that share @media/@supports"""
+    chunks = []
+    current, body = None, []
+
+    def close():
+        if not body:
+            return
+        text = ''.join(body)
+        for wrapper in reversed(current):
+            text = f"{wrapper}{{{text}}}"
+        chunks.append(text)
+
+    for rule in rules:
+        wrappers = tuple(rule['wrappers'])
+        if wrappers != current:
+            close()
+            current, body = wrappers, []
+        body.append(minify(rule['text']))
+    close()
+    return ''.join(chunks)
+
+
+def _attributes(link, **overrides):
+    attributes = dict(link, **overrides)
+    return ' '.join(
+        f'{name}="{html.escape(str(value), quote=True)}"' if value is not True else name
+        for name, value in attributes.items() if value not in (None, False)
+    )
+
+
+def inline_snippet(css, links):
+    """<style> block plus deferred <link>s to replace the render-blocking ones"""
+    lines = [f'<style id="critical-css">{css}</style>']
+    for link in links:
+        preload = _attributes(link, rel='preload', **{'as': 'style'},
+                              onload="this.onload=null;this.rel='stylesheet'")
+        lines.append(f'<link {preload}>')
+    lines.append('<noscript>')
+    for link in links:
+        lines.append(f'    <link {_attributes(link, rel="stylesheet")}>')
+    lines.append('</noscript>')
+    return '\n'.join(lines) + '\n'
+
+
+def extract(driver, url, viewports=VIEWPORTS, wait=None):
+    """
+    Render url at each viewport and collect the critical rules
+
+    Returns: (critical_css, links, opaque_stylesheets, per_viewport_counts)
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    results = []
+    counts = {}
+    for name, (width, height) in viewports.items():
+        driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+            'width': width, 'height': height, 'deviceScaleFactor': 1,
+            'mobile': width < 768,
+        })
+        driver.get(url)
+        WebDriverWait(driver, 30).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        if wait:
+            wait(driver)
+        result = driver.execute_script(COLLECT_SCRIPT)
+        results.append(result)
+        counts[name] = sum(1 for rule in result['rules'] if rule['critical'])
+    driver.execute_cdp_cmd('Emulation.clearDeviceMetricsOverride', {})
+
+    critical = render_critical(merge_viewports(results))
+    links = results[0]['links'] if results else []
+    opaque = sorted({href for result in results for href in result['opaque']})
+    return critical, links, opaque, counts
+
+
+def write_outputs(css, links, output_dir=OUTPUT_DIR):
+    """Write critical.css, critical-inline.html and deferred-stylesheets.json"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / 'critical.css').write_text(css, encoding='utf-8')
+    (output_dir / 'critical-inline.html').write_text(inline_snippet(css, links), encoding='utf-8')
+    (output_dir / 'deferred-stylesheets.json').write_text(
+        json.dumps(links, indent=2) + '\n', encoding='utf-8'
+    )
+    return output_dir
@@ -0,0 +1,202 @@
+"""
+CSS Rule Coverage
+Records which style rules matched while a page is driven through its
+states, using Chrome DevTools Protocol rule-usage tracking, and reports the
+unused rules per stylesheet with byte counts.
+
+The CSS domain only reports stylesheet ids, and ChromeDriver's performance
+log does not forward CSS.styleSheetAdded events. So the page's own
+document.styleSheets gives the URLs and texts (DOCUMENT_SHEETS_SCRIPT),
+and each id is mapped to the sheet whose text CSS.getStyleSheetText
+returns for it. Sheets that matched no rule at all are reported from that
+list too; ids without a matching text are reported as 'inline:<id>'.
+
+Rule usage only lists rules that matched (each delta the ones since the
+previous delta), so the full rule list comes from parsing every
+stylesheet's text (css_parser.py); unused = all rules minus those covered
+by a used range from any snapshot.
+
+Usage (see scripts/find-unused-css.py):
+    recorder = CSSCoverageRecorder(driver)
+    recorder.start()
+    driver.get(url)
+    recorder.snapshot('initial')
+    ...
+    report = recorder.stop()
+"""
+from urllib.parse import urlparse
+
+from .css_parser import CSSVisitor, parse, walk
+from .page_helpers import API_STUB_SCRIPT
+
+# At-rules whose style rules are matched against elements (rules inside
+# @keyframes, @font-face or @page never appear in rule usage)
+GROUPING_AT_RULES = {'media', 'supports', 'layer', 'container', 'document', 'scope'}
+
+
+# [{href, text}] for every sheet in document.styleSheets: linked sheets are
+# fetched again (from the HTTP cache where possible), <style> blocks read
+# from the element; text is null where the fetch fails (e.g. CORS)
+DOCUMENT_SHEETS_SCRIPT = """
+const done = arguments[arguments.length - 1];
+Promise.all([...document.styleSheets].map(sheet => sheet.href
+    ? fetch(sheet.href, {cache: 'force-cache'})
+        .then(response => response.ok ? response.text() : null)
+        .catch(() => null)
+        .then(text => ({href: sheet.href, text}))
+    : Promise.resolve({href: null, text: sheet.ownerNode ? sheet.ownerNode.textContent : null})
+)).then(done);
+"""
+
+
+def _selector(rule_text):
+    return ' '.join(rule_text.split('{', 1)[0].split())
+
+
+class RuleLister(CSSVisitor):
+    """(start, end) of every style rule that rule usage can report"""
+
+    def __init__(self):
+        self.rules = []
+
+    def visit_block(self, block, parents):
+        if (block.at_keyword is None and block.body and block.end is not None
+                and all(p.at_keyword in GROUPING_AT_RULES for p in parents)):
+            self.rules.append((block.start, block.end))
+
+
+def style_rules(text):
+    """[(start, end)] character offsets of the style rules in a stylesheet"""
+    lister = RuleLister()
+    walk(parse(text), [lister])
+    return sorted(lister.rules)
+
+
+class CSSCoverageRecorder:
+    """Accumulates CDP rule usage across page states"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.used = {}
+        self.states = []
+
+    def start(self, stub_api=True):
+        """Enable tracking; call before loading the page so initial styles count"""
+        if stub_api:
+            self.driver.execute_cdp_cmd(
+                'Page.addScriptToEvaluateOnNewDocument', {'source': API_STUB_SCRIPT}
+            )
+        self.driver.execute_cdp_cmd('DOM.enable', {})
+        self.driver.execute_cdp_cmd('CSS.enable', {})
+        self.driver.execute_cdp_cmd('CSS.startRuleUsageTracking', {})
+
+    def _record(self, usages, state):
+        new = 0
+        for usage in usages:
+            key = (usage['styleSheetId'], usage['startOffset'], usage['endOffset'])
+            if usage.get('used') and key not in self.used:
+                self.used[key] = state
+                new += 1
+        return new
+
+    def snapshot(self, state):
+        """Record the rules that became used since the previous snapshot"""
+        delta = self.driver.execute_cdp_cmd('CSS.takeCoverageDelta', {})
+        self.states.append(state)
+        return self._record(delta.get('coverage', []), state)
+
+    def stop(self):
+        """Stop tracking and build the per-file report"""
+        final = self.driver.execute_cdp_cmd('CSS.stopRuleUsageTracking', {})
+        self._record(final.get('ruleUsage', []), self.states[-1] if self.states else 'final')
+
+        documents = [d for d in self.driver.execute_async_script(DOCUMENT_SHEETS_SCRIPT)
+                     if d.get('text') is not None]
+        sheets = {}
+        for sheet_id in sorted({key[0] for key in self.used}):
+            try:
+                text = self.driver.execute_cdp_cmd(
+                    'CSS.getStyleSheetText', {'styleSheetId': sheet_id}
+                )['text']
+            except Exception:
+                # Removed since (e.g. a replaced <style>); nothing to report
+                continue
+            match = next((d for d in documents if d['text'] == text), None)
+            if match is not None:
+                documents.remove(match)
+            sheets[sheet_id] = {
+                'url': (match and match['href']) or f'inline:{sheet_id}',
+                'text': text,
+            }
+        # Sheets no snapshot matched a single rule of
+        for index, document in enumerate(documents):
+            sheets[f'document:{index}'] = {
+                'url': document['href'] or f'inline:document-{index}',
+                'text': document['text'],
+            }
+        return build_report(sheets, self.used, self.states)
+
+
+def build_report(sheets, used, states=()):
+    """
+    Per-file coverage
+
+    Args:
+        sheets: {styleSheetId: {'url': ..., 'text': ...}}
+        used: {(styleSheetId, startOffset, endOffset): state that first matched it},
+              from every snapshot
+        states: state names in the order they were driven
+
+    Returns: list of per-file dicts, most unused bytes first
+    """
+    order = {state: index for index, state in enumerate(states)}
+    used_starts = {}
+    for (sheet_id, start, _), state in used.items():
+        used_starts.setdefault(sheet_id, []).append((start, state))
+
+    files = {}
+    for sheet_id, sheet in sheets.items():
+        url = sheet['url']
+        entry = files.get(url)
+        if entry is None:
+            entry = files[url] = {
+                'url': url,
+                'bytes': len(sheet['text'].encode('utf-8')),
+                'rules': 0,
+                'rule_bytes': 0,
+                'unused_rules': 0,
+                'unused_bytes': 0,
+                'unused': [],
+                'first_used_in': {state: 0 for state in states},
+            }
+        starts = used_starts.get(sheet_id, [])
+        for start, end in style_rules(sheet['text']):
+            text = sheet['text'][start:end]
+            size = len(text.encode('utf-8'))
+            entry['rules'] += 1
+            entry['rule_bytes'] += size
+            matched = [state for used_start, state in starts if start <= used_start < end]
+            if matched:
+                state = min(matched, key=lambda s: order.get(s, len(order)))
+                entry['first_used_in'][state] = entry['first_used_in'].get(state, 0) + size
+            else:
+                entry['unused_rules'] += 1
+                entry['unused_bytes'] += size
+                entry['unused'].append({
+                    'selector': _selector(text),
+                    'bytes': size,
+                    'line': sheet['text'].count('\n', 0, start) + 1,
+                })
+
+    report = sorted(files.values(), key=lambda f: (-f['unused_bytes'], f['url']))
+    for entry in report:
+        entry['unused'].sort(key=lambda rule: rule['line'])
+    return report
+
+
+def local_path(url, origin):
+    """'http://localhost:8080/src/styles/main.css' -> 'src/styles/main.css' for our origin"""
+    parsed = urlparse(url)
+    if f"{parsed.scheme}://{parsed.netloc}" != origin:
+        return url
+    return parsed.path.lstrip('/')
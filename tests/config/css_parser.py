@@ -0,0 +1,294 @@
+"""
+CSS Parser
+Single-pass tokenizer and rule tree for the stylesheets under src/styles.
+
+Each stylesheet is tokenized once with one master regex and folded into a
+tree of blocks (rules and at-rules) and declarations. Trees are cached on
+disk by content hash, so unchanged files are never parsed twice; cache
+misses are parsed in a process pool when there are enough of them.
+
+Checks walk the shared tree as visitors:
+
+    class ImportantCounter(CSSVisitor):
+        def visit_declaration(self, declaration, block):
+            self.count += declaration.important
+
+    sheets = parse_files(Path('src/styles').rglob('*.css'))
+    walk(sheets[path], [ImportantCounter()])
+"""
+import hashlib
+import os
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Bump when the tree layout changes so stale cache entries are ignored
+PARSER_VERSION = 2
+
+CACHE_DIR = Path(os.getenv(
+    'CSS_PARSE_CACHE',
+    Path.home() / '.cache' / 'monitora_vagas' / 'css-parse'
+))
+
+# A pool only pays off when several files have to be parsed
+MIN_PARALLEL_FILES = 8
+
+TOKEN_PATTERN = re.compile(r"""
+    (?P<comment>/\*.*?\*/)
+  | (?P<open_comment>/\*.*)
+  | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')
+  | (?P<open_string>["'][^\n]*)
+  | (?P<lbrace>\{)
+  | (?P<rbrace>\})
+  | (?P<semicolon>;)
+  | (?P<text>(?:url\((?:"[^"]*"|'[^']*'|[^)"'])*\)|/(?!\*)|[^{};/"'])+)
+""", re.VERBOSE | re.DOTALL)
+
+
+class Declaration:
+    """property: value [!important]"""
+
+    __slots__ = ('property', 'value', 'important', 'line')
+
+    def __init__(self, prop, value, line):
+        prop = prop.strip()
+        # Custom property names are case-sensitive, standard ones are not
+        self.property = prop if prop.startswith('--') else prop.lower()
+        value = value.strip()
+        self.important = value.lower().endswith('!important')
+        if self.important:
+            value = value[:-len('!important')].rstrip()
+        self.value = value
+        self.line = line
+
+    def __repr__(self):
+        return f"Declaration({self.property}: {self.value})"
+
+
+class Block:
+    """
+    A rule (selector { ... }) or an at-rule (@media ... { ... })
+
+    Statement at-rules such as @import have body=False and no contents.
+    start/end are character offsets of the prelude and of the end of the
+    closing brace (or ';'), the same span CDP rule usage reports.
+    """
+
+    __slots__ = ('prelude', 'line', 'declarations', 'children', 'body', 'start', 'end')
+
+    def __init__(self, prelude, line, body=True, start=None, end=None):
+        self.prelude = prelude
+        self.line = line
+        self.declarations = []
+        self.children = []
+        self.body = body
+        self.start = start
+        self.end = end
+
+    @property
+    def at_keyword(self):
+        """'media' for '@media (...)', None for style rules"""
+        if not self.prelude.startswith('@'):
+            return None
+        return self.prelude[1:].split(None, 1)[0].split('(', 1)[0].lower()
+
+    @property
+    def at_params(self):
+        return self.prelude.split(None, 1)[1] if ' ' in self.prelude else ''
+
+    @property
+    def selectors(self):
+        if self.at_keyword:
+            return []
+        return [s.strip() for s in self.prelude.split(',') if s.strip()]
+
+    def __repr__(self):
+        return f"Block({self.prelude!r}, {len(self.declarations)} declarations)"
+
+
+class Stylesheet(Block):
+    """Root of the tree, plus tokenizer statistics and parse errors"""
+
+    __slots__ = ('digest', 'braces', 'comments', 'errors')
+
+    def __init__(self, digest=None):
+        super().__init__('', 1)
+        self.digest = digest
+        self.braces = [0, 0]
+        self.comments = 0
+        self.errors = []
+
+
+def content_digest(content):
+    return hashlib.sha256(f"{PARSER_VERSION}\0{content}".encode('utf-8')).hexdigest()
+
+
+def parse(content, digest=None):
+    """Tokenize and build the rule tree in one pass over the text"""
+    sheet = Stylesheet(digest or content_digest(content))
+    stack = [sheet]
+    buffer = []
+    buffer_line = None
+    buffer_start = None
+    line = 1
+
+    def flush(terminated, end):
+        nonlocal buffer, buffer_line, buffer_start
+        segment = ''.join(buffer).strip()
+        segment_line = buffer_line or line
+        segment_start = buffer_start
+        buffer, buffer_line, buffer_start = [], None, None
+        if not segment:
+            return
+        parent = stack[-1]
+        if segment.startswith('@'):
+            parent.children.append(Block(segment, segment_line, body=False,
+                                         start=segment_start, end=end))
+        elif parent is sheet:
+            sheet.errors.append((segment_line, f"Declaration outside a rule: {segment[:60]}"))
+        elif ':' not in segment:
+            sheet.errors.append((segment_line, f"Malformed declaration: {segment[:60]}"))
+        else:
+            prop, value = segment.split(':', 1)
+            parent.declarations.append(Declaration(prop, value, segment_line))
+        if not terminated and parent is sheet:
+            sheet.errors.append((segment_line, "Missing ';' or '{'"))
+
+    for match in TOKEN_PATTERN.finditer(content):
+        kind = match.lastgroup
+        token = match.group()
+
+        if kind == 'comment':
+            sheet.comments += 1
+        elif kind == 'open_comment':
+            sheet.errors.append((line, "Unterminated comment"))
+        elif kind == 'lbrace':
+            sheet.braces[0] += 1
+            prelude = ''.join(buffer).strip()
+            block = Block(prelude, buffer_line or line,
+                          start=match.start() if buffer_start is None else buffer_start)
+            buffer, buffer_line, buffer_start = [], None, None
+            if not prelude:
+                sheet.errors.append((block.line, "Block without a selector"))
+            stack[-1].children.append(block)
+            stack.append(block)
+        elif kind == 'rbrace':
+            sheet.braces[1] += 1
+            flush(terminated=True, end=match.start())
+            if len(stack) == 1:
+                sheet.errors.append((line, "Unexpected '}'"))
+            else:
+                stack.pop().end = match.end()
+        elif kind == 'semicolon':
+            flush(terminated=True, end=match.end())
+        else:
+            if kind == 'open_string':
+                sheet.errors.append((line, "Unterminated string"))
+            if buffer_line is None and not token.isspace():
+                leading = len(token) - len(token.lstrip())
+                buffer_line = line + token.count('\n', 0, leading)
+                buffer_start = match.start() + leading
+            if buffer or not token.isspace():
+                buffer.append(token)
+
+        line += token.count('\n')
+
+    flush(terminated=False, end=len(content))
+    for block in stack[1:]:
+        sheet.errors.append((block.line, f"Unclosed block: {block.prelude[:60]}"))
+    return sheet
+
+
+class CSSVisitor:
+    """Base class for checks that walk a stylesheet tree"""
+
+    def visit_block(self, block, parents):
+        """Every rule and at-rule; parents is the tuple of enclosing blocks"""
+
+    def visit_declaration(self, declaration, block):
+        """Every declaration, with the block that contains it"""
+
+
+def walk(sheet, visitors):
+    """Walk the tree once, dispatching every node to every visitor"""
+    pending = [(child, ()) for child in reversed(sheet.children)]
+    for declaration in sheet.declarations:
+        for visitor in visitors:
+            visitor.visit_declaration(declaration, sheet)
+    while pending:
+        block, parents = pending.pop()
+        for visitor in visitors:
+            visitor.visit_block(block, parents)
+        for declaration in block.declarations:
+            for visitor in visitors:
+                visitor.visit_declaration(declaration, block)
+        inner = parents + (block,)
+        pending.extend((child, inner) for child in reversed(block.children))
+
+
+def _cache_path(digest):
+    return CACHE_DIR / digest[:2] / f"{digest}.pickle"
+
+
+def _load_cached(digest):
+    try:
+        with open(_cache_path(digest), 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError,
+            # Written by another version of this module, or garbage
+            ImportError, AttributeError, ValueError, TypeError, IndexError):
+        return None
+
+
+def _store_cached(sheet):
+    path = _cache_path(sheet.digest)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            pickle.dump(sheet, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        # A read-only cache only costs speed
+        pass
+
+
+def _parse_and_store(item):
+    digest, content, store = item
+    sheet = parse(content, digest)
+    if store:
+        _store_cached(sheet)
+    return sheet
+
+
+def parse_files(paths, use_cache=True, max_workers=None):
+    """
+    Parse stylesheets, reusing cached trees for unchanged content
+
+    Returns: {path: Stylesheet}; files that cannot be read map to an OSError
+    """
+    sheets = {}
+    misses = []
+    for path in paths:
+        try:
+            content = Path(path).read_text(encoding='utf-8')
+        except OSError as e:
+            sheets[path] = e
+            continue
+        digest = content_digest(content)
+        sheet = _load_cached(digest) if use_cache else None
+        if sheet is None:
+            misses.append((path, digest, content))
+        else:
+            sheets[path] = sheet
+
+    if len(misses) >= MIN_PARALLEL_FILES and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            parsed = pool.map(_parse_and_store, [(d, c, use_cache) for _, d, c in misses])
+            for (path, _, _), sheet in zip(misses, parsed):
+                sheets[path] = sheet
+    else:
+        for path, digest, content in misses:
+            sheets[path] = _parse_and_store((digest, content, use_cache))
+    return sheets
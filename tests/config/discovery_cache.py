@@ -0,0 +1,81 @@
+"""
+Environment Discovery Cache
+Results of harness environment discovery (Chrome binary, ChromeDriver,
+webdriver_manager downloads) kept across runs in
+~/.cache/monitora_vagas/discovery.json (override with
+HARNESS_DISCOVERY_CACHE).
+
+Each entry is keyed by a fingerprint of what the answer depends on: the
+size, mtime and inode of every candidate binary and of every directory on
+PATH (installing or removing a binary there changes the directory's
+mtime), plus PATH itself. A changed fingerprint, or a cached path that no
+longer exists, runs the discovery again.
+
+Usage:
+    path, cached = discover('chromedriver', CANDIDATES, lambda: shutil.which('chromedriver'))
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+DISCOVERY_CACHE = Path(os.getenv(
+    'HARNESS_DISCOVERY_CACHE',
+    Path.home() / '.cache' / 'monitora_vagas' / 'discovery.json'
+))
+
+
+def fingerprint(paths, include_path_dirs=True):
+    """Hash of (size, mtime, inode) of each path, and of the PATH directories"""
+    search_path = os.environ.get('PATH', '')
+    parts = [search_path]
+    entries = list(paths)
+    if include_path_dirs:
+        entries += [d for d in search_path.split(os.pathsep) if d]
+    for entry in entries:
+        try:
+            st = os.stat(entry)
+            parts.append(f"{entry}\0{st.st_size}\0{st.st_mtime_ns}\0{st.st_ino}")
+        except OSError:
+            parts.append(f"{entry}\0-")
+    return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _load(cache_file):
+    try:
+        return json.loads(Path(cache_file).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def _store(cache_file, entries):
+    cache_file = Path(cache_file)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entries, indent=1), encoding='utf-8')
+        os.replace(tmp, cache_file)
+    except OSError:
+        # An unwritable cache only means discovering again next time
+        pass
+
+
+def discover(key, paths, find, cache_file=None, refresh=False):
+    """
+    find() (a path or None), reused while the fingerprint of `paths` and
+    PATH is unchanged and the cached path still exists
+
+    Returns: (value, cached)
+    """
+    cache_file = cache_file or DISCOVERY_CACHE
+    current = fingerprint(paths)
+    entries = _load(cache_file)
+    entry = entries.get(key)
+    if (not refresh and isinstance(entry, dict) and entry.get('fingerprint') == current
+            and (entry.get('value') is None or os.path.exists(entry['value']))):
+        return entry.get('value'), True
+
+    value = find()
+    entries[key] = {'fingerprint': current, 'value': value}
+    _store(cache_file, entries)
+    return value, False
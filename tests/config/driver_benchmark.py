@@ -0,0 +1,374 @@
+"""
+Driver Overhead Benchmark
+The same scripted scenarios (page load, hotel dropdown population, date
+entry, search against the mock API) driven through Selenium and through
+Playwright, to compare what each engine costs per scenario.
+
+Scenarios are written once against a small engine interface (open, wait,
+script, click, set_value, value, count); SeleniumEngine and
+PlaywrightEngine implement it with each library's ordinary calls. Per
+scenario run we record:
+
+    wall_ms        perf_counter time of the whole scenario
+    round_trips    driver protocol requests: WebDriver HTTP commands for
+                   Selenium, Playwright connection messages for Playwright
+                   (None on Playwright releases outside
+                   PLAYWRIGHT_COUNTED_VERSIONS)
+    cpu_ms         user + system CPU of this process and all of its
+                   descendants (driver server and browser processes),
+                   including descendants that exited during the run
+    client_cpu_ms  the part spent in this Python process
+    rss_mb         resident memory of the same process tree after the run
+
+CPU and RSS are read from /proc, so they are None off Linux. An exited
+process's CPU moves to its parent's cutime/cstime once reaped, which the
+tree sum includes; only CPU of orphans re-parented outside the tree is
+lost, so cpu_ms is clamped at zero rather than going negative. The static
+server and mock API run as threads of this process and are counted in
+client_cpu_ms for both engines alike.
+"""
+import os
+import statistics
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from importlib.metadata import version
+
+from .index_page import HOTEL_CARDS, HOTELS_LOADED, LOCATORS, SEARCH_FINISHED
+from .page_helpers import search_dates
+
+ENGINES = ['selenium', 'playwright']
+SCENARIOS = ['page_load', 'dropdown_population', 'date_entry', 'mocked_search']
+METRICS = ['wall_ms', 'round_trips', 'cpu_ms', 'client_cpu_ms', 'rss_mb']
+PAGE_READY = "document.readyState === 'complete'"
+
+# Both engines set input values with this one script, so date entry is the
+# same work on each (typing into a date input depends on the browser locale)
+SET_VALUE_SCRIPT = """(el, value) => {
+    el.value = value;
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}"""
+
+# Playwright has no public message counter; Connection._last_id (id of the
+# last message sent) is private and only trusted in releases checked here
+PLAYWRIGHT_COUNTED_VERSIONS = ((1, 9), (2, 0))
+
+PROC = Path('/proc')
+
+
+# ============================================================================
+# Process tree usage
+# ============================================================================
+
+def _stat_fields(pid):
+    """Fields of /proc/<pid>/stat after the command name (which may contain spaces)"""
+    text = (PROC / str(pid) / 'stat').read_text()
+    return text[text.rindex(')') + 2:].split()
+
+
+def process_tree(root=None):
+    """PIDs of root (default: this process) and all of its descendants"""
+    root = root or os.getpid()
+    children = {}
+    for entry in PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            parent = int(_stat_fields(entry.name)[1])
+        except (OSError, ValueError, IndexError):
+            continue  # exited while scanning
+        children.setdefault(parent, []).append(int(entry.name))
+
+    tree, pending = [], [root]
+    while pending:
+        pid = pending.pop()
+        tree.append(pid)
+        pending.extend(children.get(pid, ()))
+    return tree
+
+
+def tree_usage(root=None):
+    """
+    (cpu_seconds, client_cpu_seconds, rss_bytes) of the process tree, or
+    (None, None, None) where /proc is not available. cpu_seconds adds each
+    process's reaped children (cutime + cstime), so processes that exited
+    between two readings still count.
+    """
+    if not (PROC / 'self' / 'stat').exists():
+        return None, None, None
+    root = root or os.getpid()
+    ticks = os.sysconf('SC_CLK_TCK')
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    cpu = client_cpu = 0.0
+    rss = 0
+    for pid in process_tree(root):
+        try:
+            fields = _stat_fields(pid)
+            seconds = (int(fields[11]) + int(fields[12])) / ticks  # utime + stime
+            reaped = (int(fields[13]) + int(fields[14])) / ticks   # cutime + cstime
+            rss += int((PROC / str(pid) / 'statm').read_text().split()[1]) * page_size
+        except (OSError, ValueError, IndexError):
+            continue
+        cpu += seconds + reaped
+        if pid == root:
+            client_cpu = seconds
+    return cpu, client_cpu, rss
+
+
+# ============================================================================
+# Engines
+# ============================================================================
+
+class SeleniumEngine:
+    """Engine interface over a Selenium WebDriver; counts every WebDriver command"""
+
+    name = 'selenium'
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.round_trips = 0
+        execute = driver.execute
+
+        # WebDriver and WebElement both send their commands through driver.execute
+        def counted(*args, **kwargs):
+            self.round_trips += 1
+            return execute(*args, **kwargs)
+        driver.execute = counted
+
+    def open(self, url):
+        self.driver.get(url)
+
+    def wait(self, expression, timeout=30):
+        from selenium.webdriver.support.ui import WebDriverWait
+        WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script(f"return {expression};"))
+
+    def script(self, expression):
+        return self.driver.execute_script(f"return {expression};")
+
+    def click(self, selector):
+        self.driver.find_element('css selector', selector).click()
+
+    def set_value(self, selector, value):
+        self.driver.execute_script(f"({SET_VALUE_SCRIPT})(arguments[0], arguments[1]);",
+                                   self.driver.find_element('css selector', selector), value)
+
+    def value(self, selector):
+        return self.driver.find_element('css selector', selector).get_attribute('value')
+
+    def count(self, selector):
+        return len(self.driver.find_elements('css selector', selector))
+
+    def texts(self, selector):
+        return [element.text for element in self.driver.find_elements('css selector', selector)]
+
+
+class PlaywrightEngine:
+    """
+    Engine interface over a Playwright (sync API) page; round trips are the
+    messages sent on the driver connection, None where they cannot be counted
+    """
+
+    name = 'playwright'
+
+    def __init__(self, page, playwright_version=None):
+        self.page = page
+        self._connection = counted_connection(page, playwright_version or version('playwright'))
+        self._base = self._sent()
+
+    def _sent(self):
+        return self._connection._last_id if self._connection else 0
+
+    @property
+    def round_trips(self):
+        return self._sent() - self._base if self._connection else None
+
+    @round_trips.setter
+    def round_trips(self, value):
+        self._base = self._sent() - value
+
+    def open(self, url):
+        self.page.goto(url)
+
+    def wait(self, expression, timeout=30):
+        self.page.wait_for_function(expression, timeout=timeout * 1000, polling=100)
+
+    def script(self, expression):
+        return self.page.evaluate(expression)
+
+    def click(self, selector):
+        self.page.click(selector)
+
+    def set_value(self, selector, value):
+        self.page.locator(selector).evaluate(SET_VALUE_SCRIPT, value)
+
+    def value(self, selector):
+        return self.page.input_value(selector)
+
+    def count(self, selector):
+        return self.page.locator(selector).count()
+
+    def texts(self, selector):
+        return self.page.locator(selector).all_inner_texts()
+
+
+def counted_connection(page, playwright_version):
+    """
+    The page's driver connection if its private message counter can be
+    trusted in this Playwright release, else None
+    """
+    try:
+        release = tuple(int(part) for part in playwright_version.split('.')[:2])
+    except ValueError:
+        return None
+    low, high = PLAYWRIGHT_COUNTED_VERSIONS
+    connection = getattr(getattr(page, '_impl_obj', None), '_connection', None)
+    if low <= release < high and isinstance(getattr(connection, '_last_id', None), int):
+        return connection
+    return None
+
+
+@contextmanager
+def selenium_engine():
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    from .selenium_config import get_chrome_options, get_chromedriver_path
+
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=get_chrome_options(warm_profile=False))
+    try:
+        yield SeleniumEngine(driver)
+    finally:
+        driver.quit()
+
+
+@contextmanager
+def playwright_engine():
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
+        try:
+            page = browser.new_context(viewport={'width': 1920, 'height': 1080}).new_page()
+            yield PlaywrightEngine(page)
+        finally:
+            browser.close()
+
+
+ENGINE_FACTORIES = {'selenium': selenium_engine, 'playwright': playwright_engine}
+
+
+# ============================================================================
+# Scenarios
+# ============================================================================
+
+def page_load(engine, url):
+    engine.open(url)
+    engine.wait(PAGE_READY)
+
+
+def dropdown_population(engine, url):
+    engine.open(url)
+    engine.wait(HOTELS_LOADED)
+    options = engine.texts(f"{LOCATORS['hotel_select']} option")
+    assert len(options) > 1, "hotel dropdown stayed empty"
+    return len(options)
+
+
+def date_entry(engine, url):
+    engine.open(url)
+    engine.wait(HOTELS_LOADED)
+    checkin, checkout = search_dates()
+    engine.set_value(LOCATORS['checkin'], checkin)
+    engine.set_value(LOCATORS['checkout'], checkout)
+    assert engine.value(LOCATORS['checkin']) == checkin
+    assert engine.value(LOCATORS['checkout']) == checkout
+
+
+def mocked_search(engine, url):
+    engine.open(url)
+    engine.wait(HOTELS_LOADED)
+    checkin, checkout = search_dates()
+    engine.set_value(LOCATORS['checkin'], checkin)
+    engine.set_value(LOCATORS['checkout'], checkout)
+    engine.click(LOCATORS['search_button'])
+    engine.wait(SEARCH_FINISHED, timeout=60)
+    cards = engine.count(HOTEL_CARDS)
+    assert cards > 0, "search rendered no hotel cards"
+    return cards
+
+
+SCENARIO_FUNCTIONS = {
+    'page_load': page_load,
+    'dropdown_population': dropdown_population,
+    'date_entry': date_entry,
+    'mocked_search': mocked_search,
+}
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+@dataclass
+class Sample:
+    engine: str
+    scenario: str
+    wall_ms: float
+    round_trips: int
+    cpu_ms: float = None
+    client_cpu_ms: float = None
+    rss_mb: float = None
+
+    def as_dict(self):
+        return asdict(self)
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+def measure(engine, scenario, url):
+    """Run one scenario on an engine and return its Sample"""
+    engine.open('about:blank')
+    engine.round_trips = 0
+    cpu_before, client_before, _ = tree_usage()
+    started = time.perf_counter()
+    SCENARIO_FUNCTIONS[scenario](engine, url)
+    wall = time.perf_counter() - started
+    round_trips = engine.round_trips
+    cpu_after, client_after, rss = tree_usage()
+
+    cpu = client = None
+    if cpu_before is not None:
+        cpu, client = max(0.0, cpu_after - cpu_before), client_after - client_before
+    return Sample(engine.name, scenario, _ms(wall), round_trips, _ms(cpu), _ms(client),
+                  round(rss / 1024 / 1024, 1) if rss is not None else None)
+
+
+def run_benchmark(engine, url, scenarios=SCENARIOS, runs=5, warmup=1):
+    """Samples of every scenario, `runs` times each after `warmup` discarded runs"""
+    samples = []
+    for scenario in scenarios:
+        for run in range(warmup + runs):
+            sample = measure(engine, scenario, url)
+            if run >= warmup:
+                samples.append(sample)
+    return samples
+
+
+def summarize(samples):
+    """{(engine, scenario): {metric: median}} over the samples"""
+    groups = {}
+    for sample in samples:
+        groups.setdefault((sample.engine, sample.scenario), []).append(sample)
+    summary = {}
+    for key, group in groups.items():
+        summary[key] = {'runs': len(group)}
+        for metric in METRICS:
+            values = [getattr(sample, metric) for sample in group if getattr(sample, metric) is not None]
+            summary[key][metric] = statistics.median(values) if values else None
+    return summary
@@ -0,0 +1,112 @@
+"""
+Historical Test Durations
+Stores per-test wall times between runs so schedulers can plan work
+"""
+import json
+import statistics
+from pathlib import Path
+
+# Local history, rewritten by every pytest run and git-ignored; sharded CI
+# runs plan from a shared copy passed with --durations-file (see sharding.py)
+DURATIONS_FILE = Path(__file__).resolve().parent.parent / '.test_durations.json'
+
+# Used for tests never seen before (no history at all)
+DEFAULT_DURATION = 1.0
+
+# Weight of the newest observation in the moving average
+SMOOTHING = 0.5
+
+
+class DurationStore:
+    """
+    Per-test duration history keyed by pytest nodeid
+    Durations include setup and teardown, so class-level browser/server
+    startup is charged to the first test of the class
+    """
+
+    def __init__(self, path=DURATIONS_FILE):
+        self.path = Path(path)
+        self.durations = self._load()
+        self._observed = {}
+
+    def _load(self):
+        """Read the history file, tolerating a missing or corrupt file"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {k: float(v) for k, v in data.items() if isinstance(v, (int, float))}
+
+    @property
+    def fallback(self):
+        """Estimate for unknown tests: median of the known ones"""
+        if not self.durations:
+            return DEFAULT_DURATION
+        return statistics.median(self.durations.values())
+
+    def estimate(self, nodeid):
+        """
+        Expected duration of a single test
+        Returns: seconds (float)
+        """
+        return self.durations.get(nodeid, self.fallback)
+
+    def estimate_group(self, nodeids):
+        """Expected duration of several tests run back to back"""
+        fallback = self.fallback
+        return sum(self.durations.get(nodeid, fallback) for nodeid in nodeids)
+
+    def record(self, nodeid, seconds):
+        """Accumulate one phase (setup/call/teardown) of a test run"""
+        self._observed[nodeid] = self._observed.get(nodeid, 0.0) + seconds
+
+    def save(self):
+        """Merge this run's observations into the history file"""
+        if not self._observed:
+            return
+        for nodeid, seconds in self._observed.items():
+            previous = self.durations.get(nodeid)
+            if previous is None:
+                self.durations[nodeid] = round(seconds, 3)
+            else:
+                self.durations[nodeid] = round(
+                    previous * (1 - SMOOTHING) + seconds * SMOOTHING, 3
+                )
+        self._observed = {}
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.durations, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+
+class DurationRecorder:
+    """
+    Pytest plugin that feeds test reports into a DurationStore
+    Only registered on the controller process; under xdist the worker
+    reports are forwarded to the controller, so nothing is lost
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    def pytest_runtest_logreport(self, report):
+        if report.skipped and report.when == 'call':
+            return
+        self.store.record(report.nodeid, report.duration)
+
+    def pytest_sessionfinish(self, session):
+        try:
+            self.store.save()
+        except OSError as e:
+            print(f"\n⚠️ Could not save test durations: {e}")
+
+
+def group_scope(nodeid):
+    """
+    Scheduling group of a test: its class, or its module for plain functions
+    Tests in a group share a class-scoped browser/server and run together
+    """
+    # Parametrize ids may contain '::' themselves
+    return nodeid.split('[', 1)[0].rsplit('::', 1)[0]
@@ -0,0 +1,307 @@
+"""
+Unified Test Event Log
+One append-only JSONL event stream shared by every runner and the pytest plugin.
+
+Event schema (one JSON object per line):
+    {
+        "v": 1,
+        "ts": 1767225600.123,            # Unix time
+        "run": "4f1c...",                # run id ("parent" on run_start for child runs)
+        "runner": "run_use_case_tests",  # who emitted the event
+        "event": "run_start" | "run_end" | "suite_start" | "suite_end"
+                 | "test_start" | "test_end",
+        "suite": "UC-001",               # suite_* and test_* events
+        "test": "TC-001-01",             # test_* events
+        "outcome": "passed" | "failed" | "skipped" | "error",  # *_end events
+        "duration": 1.234,               # seconds, *_end events
+        "message": "...",                # optional
+        "artifacts": ["path/to/screenshot.png"]                # optional
+    }
+
+The log is rotated to test-events.jsonl.1 once it reaches MAX_LOG_BYTES.
+
+Usage:
+    TEST_EVENT_LOG=/tmp/events.jsonl python3 tests/use_cases/run_use_case_tests.py
+    python3 scripts/tail-test-events.py --follow
+"""
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+from .durations import group_scope
+
+SCHEMA_VERSION = 1
+EVENT_LOG_FILE = Path(__file__).resolve().parent.parent / 'test-events.jsonl'
+MAX_LOG_BYTES = 10 * 1024 * 1024
+
+# Environment variable that hands a run id to child processes
+RUN_ID_ENV = 'TEST_EVENT_RUN_ID'
+
+OUTCOMES = ('passed', 'failed', 'skipped', 'error')
+
+
+def event_log_path():
+    """TEST_EVENT_LOG, or tests/test-events.jsonl"""
+    return Path(os.getenv('TEST_EVENT_LOG') or EVENT_LOG_FILE)
+
+
+class EventLog:
+    """
+    Append-only JSONL writer
+
+    Each event is a single write() on a file opened in append mode, so
+    several processes (a runner and the suites it spawns) can share a log.
+    A runner passes child_env() to the processes it spawns; their runs
+    record its run id as their "parent" (default: TEST_EVENT_RUN_ID).
+    """
+
+    def __init__(self, runner, path=None, run_id=None, parent=None, max_bytes=MAX_LOG_BYTES):
+        self.runner = runner
+        self.path = Path(path) if path else event_log_path()
+        self.parent = parent or os.getenv(RUN_ID_ENV)
+        self.run_id = run_id or uuid.uuid4().hex
+        self.max_bytes = max_bytes
+        self._starts = {}
+
+    def child_env(self, env=None):
+        """Copy of env (default: os.environ) that makes child runs record this one as parent"""
+        env = dict(os.environ if env is None else env)
+        env[RUN_ID_ENV] = self.run_id
+        return env
+
+    def _rotate(self):
+        """Move a full log to <name>.1, replacing the previous one"""
+        try:
+            if self.path.stat().st_size >= self.max_bytes:
+                os.replace(self.path, self.path.with_name(self.path.name + '.1'))
+        except OSError:
+            pass
+
+    def emit(self, event, **fields):
+        record = {
+            'v': SCHEMA_VERSION,
+            'ts': round(time.time(), 3),
+            'run': self.run_id,
+            'runner': self.runner,
+            'event': event,
+        }
+        record.update({k: v for k, v in fields.items() if v is not None})
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._rotate()
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+        except OSError:
+            # The event log must never break a test run
+            pass
+        return record
+
+    def _elapsed(self, key, duration):
+        started = self._starts.pop(key, None)
+        if duration is None and started is not None:
+            duration = time.perf_counter() - started
+        return round(duration, 3) if duration is not None else None
+
+    def run_start(self, **meta):
+        self._starts[('run',)] = time.perf_counter()
+        return self.emit('run_start', parent=self.parent, **meta)
+
+    def run_end(self, outcome, duration=None, **summary):
+        return self.emit('run_end', outcome=outcome,
+                         duration=self._elapsed(('run',), duration), **summary)
+
+    def suite_start(self, suite, **meta):
+        self._starts[('suite', suite)] = time.perf_counter()
+        return self.emit('suite_start', suite=suite, **meta)
+
+    def suite_end(self, suite, outcome, duration=None, **meta):
+        return self.emit('suite_end', suite=suite, outcome=outcome,
+                         duration=self._elapsed(('suite', suite), duration), **meta)
+
+    def test_start(self, suite, test):
+        self._starts[('test', suite, test)] = time.perf_counter()
+        return self.emit('test_start', suite=suite, test=test)
+
+    def test_end(self, suite, test, outcome, duration=None, message=None, artifacts=None):
+        return self.emit('test_end', suite=suite, test=test, outcome=outcome,
+                         duration=self._elapsed(('test', suite, test), duration),
+                         message=message, artifacts=artifacts or None)
+
+    @contextmanager
+    def suite(self, suite, **meta):
+        """Emit suite_start/suite_end around a block; the block sets outcome['value']"""
+        outcome = {'value': 'passed'}
+        self.suite_start(suite, **meta)
+        try:
+            yield outcome
+        except Exception:
+            outcome['value'] = 'error'
+            raise
+        finally:
+            self.suite_end(suite, outcome['value'])
+
+
+class EventLogPlugin:
+    """Pytest plugin streaming session, module/class and test events"""
+
+    def __init__(self, log):
+        self.log = log
+        self.pending = {}
+        self.suites = {}
+        self.outcomes = {}
+
+    def pytest_sessionstart(self, session):
+        self.log.run_start(args=list(session.config.invocation_params.args))
+
+    def pytest_collection_finish(self, session):
+        for item in session.items:
+            suite = group_scope(item.nodeid)
+            self.pending[suite] = self.pending.get(suite, 0) + 1
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        suite = group_scope(nodeid)
+        if suite not in self.suites:
+            self.suites[suite] = {'outcome': 'passed', 'duration': 0.0}
+            self.log.suite_start(suite)
+        self.outcomes[nodeid] = {'outcome': 'passed', 'duration': 0.0, 'message': None}
+        self.log.test_start(suite, nodeid)
+
+    def pytest_runtest_logreport(self, report):
+        result = self.outcomes.setdefault(
+            report.nodeid, {'outcome': 'passed', 'duration': 0.0, 'message': None}
+        )
+        result['duration'] += report.duration
+        # Tests attach files with record_property("artifact", path)
+        artifacts = [value for name, value in report.user_properties if name == 'artifact']
+        if artifacts:
+            result.setdefault('artifacts', []).extend(str(a) for a in artifacts)
+        if report.skipped and result['outcome'] == 'passed':
+            result['outcome'] = 'skipped'
+        elif report.failed:
+            result['outcome'] = 'failed' if report.when == 'call' else 'error'
+            lines = report.longreprtext.strip().splitlines()
+            result['message'] = lines[-1][:500] if lines else None
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        suite = group_scope(nodeid)
+        result = self.outcomes.pop(nodeid, {'outcome': 'passed', 'duration': 0.0, 'message': None})
+        self.log.test_end(suite, nodeid, result['outcome'], result['duration'],
+                          result['message'], result.get('artifacts'))
+
+        totals = self.suites[suite]
+        totals['duration'] += result['duration']
+        if result['outcome'] in ('failed', 'error'):
+            totals['outcome'] = 'failed'
+
+        if suite in self.pending:
+            self.pending[suite] -= 1
+            if self.pending[suite] == 0:
+                del self.pending[suite]
+                self._end_suite(suite)
+
+    def _end_suite(self, suite):
+        totals = self.suites.pop(suite)
+        self.log.suite_end(suite, totals['outcome'], totals['duration'])
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        # Suites whose size was unknown (xdist) are closed at the end
+        for suite in list(self.suites):
+            self._end_suite(suite)
+        self.log.run_end(
+            'passed' if exitstatus == 0 else 'failed',
+            tests=session.testscollected,
+            failed=session.testsfailed,
+        )
+
+
+class EventAggregator:
+    """Live aggregation of an event stream (see scripts/tail-test-events.py)"""
+
+    def __init__(self):
+        self.runs = {}
+        self.counts = {outcome: 0 for outcome in OUTCOMES}
+        self.running = {}
+        self.failures = []
+        self.test_time = 0.0
+        self.slowest = []
+
+    def consume(self, event):
+        kind = event.get('event')
+        run = event.get('run')
+        if kind == 'run_start':
+            self.runs[run] = {'runner': event.get('runner'), 'started': event.get('ts'),
+                              'outcome': None}
+        elif kind == 'run_end':
+            self.runs.setdefault(run, {'runner': event.get('runner')})['outcome'] = event.get('outcome')
+        elif kind == 'test_start':
+            self.running[(run, event.get('suite'), event.get('test'))] = event.get('ts')
+        elif kind == 'test_end':
+            self.running.pop((run, event.get('suite'), event.get('test')), None)
+            outcome = event.get('outcome', 'passed')
+            self.counts[outcome] = self.counts.get(outcome, 0) + 1
+            duration = event.get('duration') or 0.0
+            self.test_time += duration
+            self.slowest = sorted(
+                self.slowest + [(duration, event.get('test'))], reverse=True
+            )[:5]
+            if outcome in ('failed', 'error'):
+                self.failures.append(event)
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def summary_line(self):
+        active = sum(1 for r in self.runs.values() if r.get('outcome') is None)
+        return (f"runs: {len(self.runs)} ({active} active) | tests: {self.total} | "
+                f"✅ {self.counts['passed']} ❌ {self.counts['failed']} "
+                f"💥 {self.counts['error']} ⏭️  {self.counts['skipped']} | "
+                f"running: {len(self.running)} | test time: {self.test_time:.1f}s")
+
+
+def _rotated(path, f):
+    """True once path names a different file than the open f (see EventLog._rotate)"""
+    try:
+        return os.stat(path).st_ino != os.fstat(f.fileno()).st_ino
+    except OSError:
+        return False
+
+
+def read_events(path, follow=False, poll_interval=0.5):
+    """
+    Yield events from a JSONL log; with follow=True keep waiting for new lines
+    (like tail -f -F: a rotated log is reopened). Partial lines are held
+    until their newline arrives.
+    """
+    path = Path(path)
+    while follow and not path.exists():
+        time.sleep(poll_interval)
+    f = open(path, encoding='utf-8')
+    try:
+        buffer = ''
+        while True:
+            chunk = f.readline()
+            if chunk:
+                buffer += chunk
+                if not buffer.endswith('\n'):
+                    continue
+                line, buffer = buffer.strip(), ''
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+            elif follow and _rotated(path, f):
+                f.close()
+                f = open(path, encoding='utf-8')
+                buffer = ''
+            elif follow:
+                time.sleep(poll_interval)
+            else:
+                return
+    finally:
+        f.close()
@@ -0,0 +1,243 @@
+"""
+Heap Soak Harness
+Runs search / inline edit / clear cycles against the stubbed API the way a
+long-lived tab does and samples memory through CDP every few cycles:
+
+    heap        Runtime.getHeapUsage usedSize after HeapProfiler.collectGarbage
+    nodes       Performance.getMetrics Nodes (includes detached DOM)
+    listeners   Performance.getMetrics JSEventListeners
+    toasts, chips, backdrops, modals   leftovers still attached to the document
+
+A metric leaks when it keeps growing after the warm-up samples: its slope
+per cycle is over the threshold and most consecutive samples increase.
+Heap snapshots (.heapsnapshot, open two in DevTools > Memory > Comparison)
+are taken over a second DevTools connection, since Selenium's
+execute_cdp_cmd cannot receive the HeapProfiler chunk events.
+"""
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from .console_capture import page_connection
+from .page_helpers import search_dates, submit_search, wait_for
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+SNAPSHOT_DIR = ROOT_DIR / 'build' / 'heap-snapshots'
+
+# Growth per cycle that counts as a leak once sustained
+THRESHOLDS = {
+    'heap': 64 * 1024,
+    'nodes': 10,
+    'listeners': 2,
+    'toasts': 0.5,
+    'chips': 0.5,
+    'backdrops': 0.2,
+    'modals': 0.2,
+}
+WARMUP_SAMPLES = 1
+MIN_RISING_FRACTION = 0.75
+
+LEFTOVERS_SCRIPT = """
+return {
+    toasts: document.querySelectorAll('.toast').length,
+    chips: document.querySelectorAll('.filter-chip').length,
+    backdrops: document.querySelectorAll('.modal-backdrop').length,
+    modals: document.querySelectorAll('.modal.show').length
+};
+"""
+
+
+@dataclass
+class LeakFinding:
+    metric: str
+    slope: float
+    threshold: float
+    rising: float
+    first: float
+    last: float
+
+    def describe(self):
+        unit = ' bytes' if self.metric == 'heap' else ''
+        return (f"{self.metric}: {self.first:,.0f} -> {self.last:,.0f}{unit}, "
+                f"+{self.slope:,.1f}{unit}/cycle (threshold {self.threshold:,.1f}), "
+                f"rising in {self.rising:.0%} of samples")
+
+
+def linear_slope(xs, ys):
+    """Least-squares slope of ys over xs"""
+    n = len(xs)
+    if n < 2:
+        return 0.0
+    mean_x, mean_y = sum(xs) / n, sum(ys) / n
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if not variance:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+def detect_leaks(samples, thresholds=THRESHOLDS, warmup=WARMUP_SAMPLES,
+                 min_rising=MIN_RISING_FRACTION):
+    """
+    Sustained growth per metric
+
+    Args:
+        samples: [{'cycle': int, metric: value, ...}] in cycle order
+    Returns: list of LeakFinding
+    """
+    samples = samples[warmup:]
+    if len(samples) < 3:
+        return []
+    findings = []
+    cycles = [sample['cycle'] for sample in samples]
+    for metric, threshold in thresholds.items():
+        values = [sample[metric] for sample in samples if metric in sample]
+        if len(values) != len(samples):
+            continue
+        slope = linear_slope(cycles, values)
+        steps = list(zip(values, values[1:]))
+        rising = sum(1 for before, after in steps if after > before) / len(steps)
+        if slope > threshold and rising >= min_rising:
+            findings.append(LeakFinding(metric, slope, threshold, rising, values[0], values[-1]))
+    return findings
+
+
+def take_sample(driver, cycle):
+    """Force GC, then read heap, node and listener counts plus UI leftovers"""
+    driver.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+    heap = driver.execute_cdp_cmd('Runtime.getHeapUsage', {})
+    metrics = {
+        metric['name']: metric['value']
+        for metric in driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+    }
+    sample = {
+        'cycle': cycle,
+        'heap': heap['usedSize'],
+        'nodes': int(metrics.get('Nodes', 0)),
+        'listeners': int(metrics.get('JSEventListeners', 0)),
+        'documents': int(metrics.get('Documents', 0)),
+    }
+    sample.update(driver.execute_script(LEFTOVERS_SCRIPT))
+    return sample
+
+
+def save_heap_snapshot(driver, path, timeout=120):
+    """Write a .heapsnapshot of the current page through a direct DevTools socket"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = page_connection(driver, timeout)
+    try:
+        connection.send(json.dumps({'id': 1, 'method': 'HeapProfiler.enable'}))
+        connection.send(json.dumps({'id': 2, 'method': 'HeapProfiler.takeHeapSnapshot',
+                                    'params': {'reportProgress': False}}))
+        deadline = time.monotonic() + timeout
+        with open(path, 'w', encoding='utf-8') as output:
+            while time.monotonic() < deadline:
+                message = json.loads(connection.recv())
+                if message.get('method') == 'HeapProfiler.addHeapSnapshotChunk':
+                    output.write(message['params']['chunk'])
+                elif message.get('id') == 2:
+                    break
+            else:
+                raise TimeoutError(f"Heap snapshot not finished after {timeout}s")
+    finally:
+        connection.close()
+    return path
+
+
+class SoakHarness:
+    """Repeats the search/clear cycle and samples memory every `every` cycles"""
+
+    def __init__(self, driver, url, every=5, snapshot_dir=None, log=print):
+        self.driver = driver
+        self.url = url
+        self.every = every
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else None
+        self.log = log
+        self.samples = []
+        self.snapshots = []
+        self._searches = 0
+
+    def open(self):
+        self.driver.get(self.url)
+        wait_for(self.driver, "document.querySelectorAll('#hotel-select option').length > 1", 30)
+        self.driver.execute_cdp_cmd('Performance.enable', {})
+
+    def _wait_for_response(self):
+        self._searches += 1
+        wait_for(self.driver,
+                 f"performance.getEntriesByName('monitora:search-response').length >= {self._searches}"
+                 " && !document.querySelector('#hotels-cards-container .skeleton-hotel-card')", 30)
+
+    def search(self, has_availability=True):
+        submit_search(self.driver, has_availability)
+        self._wait_for_response()
+
+    def inline_edit(self):
+        """Move the inline editor's check-out one day and apply (handleInlineParamChange)"""
+        _, checkout = search_dates()
+        moved = self.driver.execute_script("""
+            const checkout = document.getElementById('inline-checkout');
+            const apply = document.getElementById('inline-apply-btn');
+            if (!checkout || !apply) return false;
+            const next = new Date(checkout.value || arguments[0]);
+            next.setDate(next.getDate() + 1);
+            checkout.value = next.toISOString().slice(0, 10);
+            apply.click();
+            return true;
+        """, checkout)
+        if moved:
+            self._wait_for_response()
+
+    def clear(self):
+        """Clear results through the confirmation modal (executeClearResults)"""
+        self.driver.execute_script("document.getElementById('clear-results-btn').click();")
+        wait_for(self.driver, "document.getElementById('clearResultsModal').classList.contains('show')")
+        self.driver.execute_script("document.getElementById('confirmClearBtn').click();")
+        wait_for(self.driver, "!document.querySelector('.modal.show')"
+                              " && !document.getElementById('results-container').classList.contains('visible')")
+
+    def new_search_from_empty_state(self):
+        """Empty result, then the empty state's "Nova busca" button"""
+        self.search(has_availability=False)
+        self.driver.execute_script(
+            "const button = document.getElementById('empty-state-new-search');"
+            "if (button) button.click();"
+        )
+
+    def cycle(self, number):
+        self.search()
+        self.inline_edit()
+        self.clear()
+        if number % 2 == 0:
+            self.new_search_from_empty_state()
+
+    def sample(self, cycle):
+        sample = take_sample(self.driver, cycle)
+        self.samples.append(sample)
+        self.log(f"   🔬 cycle {cycle:>4}: heap {sample['heap'] / 1024 / 1024:7.2f} MB, "
+                 f"nodes {sample['nodes']:>6}, listeners {sample['listeners']:>5}, "
+                 f"toasts {sample['toasts']}, chips {sample['chips']}, backdrops {sample['backdrops']}")
+        return sample
+
+    def snapshot(self, label):
+        if not self.snapshot_dir:
+            return None
+        path = save_heap_snapshot(self.driver, self.snapshot_dir / f"{label}.heapsnapshot")
+        self.snapshots.append(path)
+        self.log(f"   📸 {path}")
+        return path
+
+    def run(self, cycles):
+        """Run the soak; returns (samples, findings)"""
+        self.open()
+        self.sample(0)
+        for number in range(1, cycles + 1):
+            self.cycle(number)
+            if number % self.every == 0 or number == cycles:
+                self.sample(number)
+            if number == self.every:
+                # Baseline after the first cycles, so lazy initialisation is not in the diff
+                self.snapshot(f"cycle-{number:04d}")
+        self.snapshot(f"cycle-{cycles:04d}")
+        return self.samples, detect_leaks(self.samples)
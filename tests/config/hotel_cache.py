@@ -0,0 +1,192 @@
+"""
+Hotel List Cache
+File-backed counterpart of HotelCache (src/services/hotelCache.js) for
+the Python tooling: the hotel list is kept for 24 hours
+(TIME.CACHE.HOTEL_LIST) in ~/.cache/monitora_vagas/hotel-list.json
+(override with HOTEL_LIST_CACHE), one entry per API base URL.
+
+The list comes from the cheap /vagas/hoteis endpoint, never from
+/vagas/hoteis/scrape (which drives a headless-browser scrape on the
+backend) unless asked for. An expired entry is revalidated with
+If-None-Match / If-Modified-Since when the server sent an ETag or
+Last-Modified; a 304 only renews the timestamp. When the API cannot be
+reached, an expired entry is still returned, marked stale.
+
+Usage:
+    hotels = HotelListCache().get()
+    print(hotels.count, hotels.source)   # 25 'cache'
+"""
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+
+API_BASE_URL = 'https://www.mpbarbosa.com/api'
+HOTEL_LIST_TTL = 24 * 60 * 60  # seconds; TIME.CACHE.HOTEL_LIST in src/config/constants.js
+REQUEST_TIMEOUT = 10
+
+CACHE_FILE = Path(os.getenv(
+    'HOTEL_LIST_CACHE',
+    Path.home() / '.cache' / 'monitora_vagas' / 'hotel-list.json'
+))
+
+
+@dataclass
+class HotelList:
+    body: dict           # the API response ({success, data, count?})
+    source: str          # 'cache', 'revalidated', 'hoteis', 'scrape' or 'stale'
+    fetched_at: float    # when the body was last fetched or revalidated
+
+    @property
+    def hotels(self):
+        return self.body.get('data', [])
+
+    @property
+    def count(self):
+        """The count the API reported (/vagas/hoteis may omit it: the list length)"""
+        return self.body.get('count', len(self.hotels))
+
+    @property
+    def names(self):
+        return [hotel.get('name') for hotel in self.hotels]
+
+
+class HotelListCache:
+    """24-hour hotel list cache with conditional revalidation"""
+
+    def __init__(self, api_base_url=API_BASE_URL, path=CACHE_FILE, ttl=HOTEL_LIST_TTL,
+                 timeout=REQUEST_TIMEOUT, clock=time.time):
+        self.api_base_url = api_base_url.rstrip('/')
+        self.path = Path(path)
+        self.ttl = ttl
+        self.timeout = timeout
+        self.clock = clock
+        # Requests actually sent, for reporting: [(url, status)]
+        self.requests = []
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _load_all(self):
+        try:
+            return json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def _entry(self):
+        entry = self._load_all().get(self.api_base_url)
+        return entry if isinstance(entry, dict) and 'body' in entry else None
+
+    def _store(self, entry):
+        entries = self._load_all()
+        entries[self.api_base_url] = entry
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(entries, ensure_ascii=False), encoding='utf-8')
+            os.replace(tmp, self.path)
+        except OSError:
+            # A read-only cache only costs requests
+            pass
+
+    def clear(self):
+        entries = self._load_all()
+        if entries.pop(self.api_base_url, None) is not None:
+            try:
+                self.path.write_text(json.dumps(entries, ensure_ascii=False), encoding='utf-8')
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def _request(self, url, headers=()):
+        """GET url; returns (status, body or None for 304, response headers)"""
+        request = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0', **dict(headers)})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                status, body, response_headers = response.getcode(), response.read(), response.headers
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                self.requests.append((url, e.code))
+                raise
+            status, body, response_headers = 304, None, e.headers
+        self.requests.append((url, status))
+        if body is None:
+            return status, None, response_headers
+        data = json.loads(body.decode('utf-8'))
+        if data.get('success') is False:
+            raise RuntimeError(data.get('error') or 'API returned error without message')
+        return status, data, response_headers
+
+    def _fetch(self, entry, scrape=False):
+        endpoint = '/vagas/hoteis/scrape' if scrape else '/vagas/hoteis'
+        headers = {}
+        if entry and not scrape:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        status, body, response_headers = self._request(f"{self.api_base_url}{endpoint}", headers)
+        now = self.clock()
+        if status == 304:
+            entry['timestamp'] = now
+            self._store(entry)
+            return HotelList(entry['body'], 'revalidated', now)
+
+        self._store({
+            'body': body,
+            'timestamp': now,
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified'),
+        })
+        return HotelList(body, 'scrape' if scrape else 'hoteis', now)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, force_refresh=False, max_age=None, scrape=False):
+        """
+        The hotel list: from the cache while younger than max_age (default:
+        the TTL), else revalidated or fetched from /vagas/hoteis; scrape=True
+        fetches /vagas/hoteis/scrape instead (the expensive endpoint)
+        """
+        entry = self._entry()
+        max_age = self.ttl if max_age is None else max_age
+        if entry and not (force_refresh or scrape) and self.clock() - entry['timestamp'] < max_age:
+            return HotelList(entry['body'], 'cache', entry['timestamp'])
+        try:
+            return self._fetch(entry, scrape)
+        except (OSError, ValueError, RuntimeError):
+            if entry and not scrape:
+                return HotelList(entry['body'], 'stale', entry['timestamp'])
+            raise
+
+    def get_stats(self):
+        """Like hotelCache.getStats(): exists, count, age/remaining (minutes), expired, size"""
+        entry = self._entry()
+        if not entry:
+            return {'exists': False}
+        age = self.clock() - entry['timestamp']
+        return {
+            'exists': True,
+            'count': len(entry['body'].get('data', [])),
+            'age': round(age / 60),
+            'remaining': round((self.ttl - age) / 60),
+            'expired': age > self.ttl,
+            'size': len(json.dumps(entry['body'], ensure_ascii=False).encode('utf-8')),
+            'etag': entry.get('etag'),
+            'last_modified': entry.get('last_modified'),
+        }
+
+
+def hotel_list(api_base_url=API_BASE_URL, **options):
+    """HotelListCache(api_base_url).get(**options)"""
+    return HotelListCache(api_base_url).get(**options)
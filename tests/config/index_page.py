@@ -0,0 +1,258 @@
+"""
+Index Page Object
+One place for the selectors of public/index.html and the composite actions
+the suites repeat (run a search, set the guest count, clear results).
+
+Each named element is looked up once per page state and its handle is
+cached; assertions on the same element reuse it instead of calling
+find_element again. A handle that went stale because the app re-rendered
+that part of the DOM is re-resolved from its selector and the call is
+retried once. Navigating through the page object (open/refresh) drops
+every cached handle.
+
+Usage:
+    page = IndexPage(driver, f"{base_url}/public/index.html").open()
+    page.run_search(checkin='2026-02-10', checkout='2026-02-12')
+    page.set_guests(4)
+    assert page.result_count() > 0
+"""
+from .page_helpers import search_dates, wait_for
+from .startup_profile import phase
+
+# By.CSS_SELECTOR; kept as a string so this module imports without selenium
+CSS = 'css selector'
+
+LOCATORS = {
+    # Search form
+    'search_form': '#search-form',
+    'hotel_select': '#hotel-select',
+    'checkin': '#input-checkin',
+    'checkout': '#input-checkout',
+    'guest_card': '#guest-filter-card',
+    'guest_quantity': '#guest-filter-card .quantity',
+    'guest_plus': '#guest-filter-card .plus',
+    'guest_minus': '#guest-filter-card .minus',
+    'booking_rules_toggle': '#booking-rules-toggle',
+    'search_button': '#search-button',
+    'reset_button': '#reset-btn',
+    'holiday_notice': '#holiday-package-notice',
+    # Results
+    'results_container': '#results-container',
+    'filter_chips': '#filter-chips-container',
+    'results_counter': '#results-counter',
+    'cards_container': '#hotels-cards-container',
+    'pagination': '#pagination-container',
+    'copy_results_button': '#copy-results-btn',
+    'clear_results_button': '#clear-results-btn',
+    'clear_modal': '#clearResultsModal',
+    'confirm_clear_button': '#confirmClearBtn',
+    # Page chrome
+    'breadcrumb': '#breadcrumb-nav',
+    'dark_mode_toggle': '#dark-mode-toggle',
+    'keyboard_shortcuts_button': '#keyboard-shortcuts-btn',
+    'about_link': '#about-link',
+    'about_modal': '#aboutModal',
+}
+
+HOTEL_CARDS = '#hotels-cards-container .hotel-card'
+
+HOTELS_LOADED = "document.querySelectorAll('#hotel-select option').length > 1"
+# hotelSearch.js enables the guest filter in the search's finally block, so
+# this holds after results, empty results and errors alike
+SEARCH_FINISHED = "!document.querySelector('#guest-filter-card .plus').disabled"
+
+
+def _is_stale(error):
+    from selenium.common.exceptions import StaleElementReferenceException
+    return isinstance(error, StaleElementReferenceException)
+
+
+class CachedElement:
+    """
+    Proxy for one located element: resolves on first use, keeps the handle
+    and re-resolves it when the browser reports it stale
+    """
+
+    def __init__(self, page, name):
+        self._page = page
+        self.name = name
+        self._handle = None
+
+    @property
+    def element(self):
+        """The underlying WebElement (e.g. for execute_script arguments)"""
+        if self._handle is None:
+            self._handle = self._page.find(self.name)
+        return self._handle
+
+    def invalidate(self):
+        self._handle = None
+
+    def _retry(self, operation):
+        try:
+            return operation(self.element)
+        except Exception as error:
+            if not _is_stale(error):
+                raise
+            self._page.stale_recoveries += 1
+            self.invalidate()
+            return operation(self.element)
+
+    def __getattr__(self, attribute):
+        # Properties such as .text hit the driver on access; methods on call
+        value = self._retry(lambda element: getattr(element, attribute))
+        if not callable(value):
+            return value
+        return lambda *args, **kwargs: self._retry(
+            lambda element: getattr(element, attribute)(*args, **kwargs)
+        )
+
+    def __repr__(self):
+        return f"<CachedElement {self.name} {LOCATORS[self.name]!r}>"
+
+
+class IndexPage:
+    """Page object for public/index.html"""
+
+    def __init__(self, driver, url):
+        self.driver = driver
+        self.url = url
+        self._elements = {}
+        # WebDriver element lookups issued, and stale handles re-resolved
+        self.lookups = 0
+        self.stale_recoveries = 0
+
+    # ------------------------------------------------------------------
+    # Element cache
+    # ------------------------------------------------------------------
+
+    def find(self, name):
+        """Uncached lookup of a named element (one WebDriver round-trip)"""
+        self.lookups += 1
+        return self.driver.find_element(CSS, LOCATORS[name])
+
+    def element(self, name):
+        """Cached proxy for a named element"""
+        if name not in LOCATORS:
+            raise KeyError(f"Unknown element {name!r}; add it to LOCATORS")
+        if name not in self._elements:
+            self._elements[name] = CachedElement(self, name)
+        return self._elements[name]
+
+    def __getattr__(self, name):
+        if name in LOCATORS:
+            return self.element(name)
+        raise AttributeError(f"{type(self).__name__} has no attribute {name!r}")
+
+    def invalidate(self):
+        """Drop every cached handle; proxies already handed out re-resolve lazily"""
+        for element in self._elements.values():
+            element.invalidate()
+
+    def script(self, source, *args):
+        """execute_script with CachedElement arguments unwrapped"""
+        args = [arg.element if isinstance(arg, CachedElement) else arg for arg in args]
+        return self.driver.execute_script(source, *args)
+
+    # ------------------------------------------------------------------
+    # Navigation
+    # ------------------------------------------------------------------
+
+    def open(self, query='', wait_for_hotels=True, timeout=30):
+        """Load the page (query e.g. '?useLocalAPI=true') and wait for the hotel list"""
+        with phase('first navigation', once=True):
+            self.driver.get(f"{self.url}{query}")
+            self.invalidate()
+            if wait_for_hotels:
+                wait_for(self.driver, HOTELS_LOADED, timeout)
+        return self
+
+    def refresh(self, wait_for_hotels=True, timeout=30):
+        self.driver.refresh()
+        self.invalidate()
+        if wait_for_hotels:
+            wait_for(self.driver, HOTELS_LOADED, timeout)
+        return self
+
+    # ------------------------------------------------------------------
+    # Composite actions
+    # ------------------------------------------------------------------
+
+    def fill_search(self, hotel='-1', checkin=None, checkout=None):
+        """Set hotel and dates in one round-trip (send_keys into date inputs is locale-dependent)"""
+        if checkin is None or checkout is None:
+            checkin, checkout = search_dates()
+        self.driver.execute_script("""
+            const set = (selector, value) => {
+                const el = document.querySelector(selector);
+                el.value = value;
+                el.dispatchEvent(new Event('change', {bubbles: true}));
+            };
+            set(arguments[0], arguments[3]);
+            set(arguments[1], arguments[4]);
+            set(arguments[2], arguments[5]);
+        """, LOCATORS['hotel_select'], LOCATORS['checkin'], LOCATORS['checkout'], hotel, checkin, checkout)
+
+    def run_search(self, hotel='-1', checkin=None, checkout=None, wait=True, timeout=60):
+        """Fill the form, submit it and (by default) wait until the search settles"""
+        self.fill_search(hotel, checkin, checkout)
+        self.search_button.click()
+        if wait:
+            self.wait_for_search(timeout)
+        return self
+
+    def wait_for_search(self, timeout=60):
+        wait_for(self.driver, SEARCH_FINISHED, timeout)
+
+    def guests(self):
+        return int(self.guest_quantity.get_attribute('value') or 0)
+
+    def set_guests(self, count, timeout=10):
+        """
+        Step the guest counter to count with its +/- buttons (enabled only
+        after a search); all clicks go out in one script
+        """
+        if count < 1:
+            raise ValueError(f"Guest count must be at least 1, got {count}")
+        current = self.guests()
+        if count != current:
+            button = self.guest_plus if count > current else self.guest_minus
+            self.script("for (let i = 0; i < arguments[1]; i++) arguments[0].click();",
+                        button, abs(count - current))
+            wait_for(self.driver,
+                     f"document.querySelector('{LOCATORS['guest_quantity']}').value === '{count}'",
+                     timeout)
+        return self
+
+    def clear_results(self, timeout=15):
+        """Clear results through the confirmation modal"""
+        self.script("arguments[0].click();", self.clear_results_button)
+        wait_for(self.driver, f"document.querySelector('{LOCATORS['clear_modal']}')"
+                              ".classList.contains('show')", timeout)
+        self.script("arguments[0].click();", self.confirm_clear_button)
+        wait_for(self.driver, "!document.querySelector('.modal.show') && "
+                              f"!document.querySelector('{LOCATORS['results_container']}')"
+                              ".classList.contains('visible')", timeout)
+        return self
+
+    def reset(self):
+        """The 🔄 new-search button (back to the initial form state)"""
+        self.reset_button.click()
+        return self
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def result_cards(self):
+        """Current hotel cards; never cached, they are replaced on every render"""
+        self.lookups += 1
+        return self.driver.find_elements(CSS, HOTEL_CARDS)
+
+    def result_count(self):
+        return self.driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;", HOTEL_CARDS
+        )
+
+    def results_visible(self):
+        return 'visible' in (self.results_container.get_attribute('class') or '').split()
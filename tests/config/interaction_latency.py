@@ -0,0 +1,229 @@
+"""
+Interaction Latency
+Instrumentation mode for interaction-to-next-paint (INP) and long tasks:
+PerformanceObserver listeners for 'event', 'longtask' and, where Chrome
+supports it, 'long-animation-frame' entries are installed at document
+start, then the UI controls are driven with real (trusted) WebDriver
+input, since Event Timing ignores synthetic element.click() events.
+
+Each scripted action is bracketed by performance.now() readings; entries
+that start inside an action's window belong to that control. Long
+animation frames carry script attribution (sourceURL), which maps long
+tasks back to the source module that ran them.
+"""
+from urllib.parse import urlparse
+
+from .page_helpers import submit_search, wait_for
+from .synthetic_monitor import percentile
+
+# Event Timing does not report interactions faster than this
+DURATION_THRESHOLD_MS = 16
+LONG_TASK_MS = 50
+
+PROBE_SCRIPT = """
+(() => {
+    const store = window.__monitoraInteractions = {events: [], longTasks: [], frames: []};
+    const observe = (type, options, handler) => {
+        if (!(PerformanceObserver.supportedEntryTypes || []).includes(type)) return;
+        new PerformanceObserver(list => list.getEntries().forEach(handler))
+            .observe(Object.assign({type, buffered: true}, options));
+    };
+    observe('event', {durationThreshold: 16}, e => {
+        if (!e.interactionId) return;
+        store.events.push({name: e.name, interactionId: e.interactionId, startTime: e.startTime,
+                           duration: e.duration, processingStart: e.processingStart,
+                           processingEnd: e.processingEnd});
+    });
+    observe('longtask', {}, e => store.longTasks.push({startTime: e.startTime, duration: e.duration}));
+    observe('long-animation-frame', {}, e => store.frames.push({
+        startTime: e.startTime, duration: e.duration, renderStart: e.renderStart,
+        blockingDuration: e.blockingDuration,
+        scripts: e.scripts.map(s => ({sourceURL: s.sourceURL, sourceFunctionName: s.sourceFunctionName,
+                                      invoker: s.invoker, duration: s.duration}))
+    }));
+})();
+"""
+
+NEXT_PAINT_SCRIPT = """
+const done = arguments[arguments.length - 1];
+requestAnimationFrame(() => setTimeout(() => done(performance.now()), 0));
+"""
+
+
+def _in_window(entry, action):
+    return action['start'] <= entry['startTime'] <= action['end']
+
+
+def interaction_latencies(events, actions):
+    """
+    Per control: the latency of each action (the longest interaction in its
+    window; actions with no entry were faster than DURATION_THRESHOLD_MS)
+
+    Returns: {control: {'samples', 'below_threshold', 'p50', 'p75', 'p98', 'max'}}
+    """
+    longest = {}
+    for event in events:
+        current = longest.get(event['interactionId'])
+        if current is None or event['duration'] > current['duration']:
+            longest[event['interactionId']] = event
+
+    report = {}
+    for action in actions:
+        latencies = [event['duration'] for event in longest.values() if _in_window(event, action)]
+        entry = report.setdefault(action['control'], {'samples': [], 'below_threshold': 0})
+        if latencies:
+            entry['samples'].append(max(latencies))
+        else:
+            entry['samples'].append(DURATION_THRESHOLD_MS)
+            entry['below_threshold'] += 1
+
+    for entry in report.values():
+        samples = entry['samples']
+        ordered = sorted(samples)
+        entry.update({
+            'p50': percentile(ordered, 0.5),
+            'p75': percentile(ordered, 0.75),
+            'p98': percentile(ordered, 0.98),
+            'max': max(samples),
+        })
+    return report
+
+
+def module_name(source_url, origin=None):
+    """'http://host/src/js/guestCounter.js' -> 'src/js/guestCounter.js'"""
+    if not source_url:
+        return '(inline or browser)'
+    parsed = urlparse(source_url)
+    if origin and f"{parsed.scheme}://{parsed.netloc}" != origin:
+        return source_url
+    return parsed.path.lstrip('/') or source_url
+
+
+def attribute_long_tasks(frames, long_tasks, actions, origin=None):
+    """
+    Time spent in long frames (>= LONG_TASK_MS) per source module and control
+
+    Long animation frames are split into their scripts, plus
+    '(style/layout/paint)' for the rendering phase. Without LoAF support the
+    plain long tasks are reported as '(unattributed)'.
+
+    Returns: {control: {module: milliseconds}}
+    """
+    report = {}
+    for action in actions:
+        modules = report.setdefault(action['control'], {})
+        long_frames = [f for f in frames if f['duration'] >= LONG_TASK_MS and _in_window(f, action)]
+        for frame in long_frames:
+            for script in frame['scripts']:
+                name = module_name(script['sourceURL'], origin)
+                modules[name] = modules.get(name, 0) + script['duration']
+            if frame.get('renderStart'):
+                rendering = frame['startTime'] + frame['duration'] - frame['renderStart']
+                modules['(style/layout/paint)'] = modules.get('(style/layout/paint)', 0) + rendering
+        if not frames:
+            for task in long_tasks:
+                if _in_window(task, action):
+                    modules['(unattributed)'] = modules.get('(unattributed)', 0) + task['duration']
+    return report
+
+
+class InteractionDriver:
+    """Drives the UI controls with trusted input and records action windows"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.actions = []
+
+    def _act(self, control, perform):
+        start = self.driver.execute_script("return performance.now();")
+        perform()
+        end = self.driver.execute_async_script(NEXT_PAINT_SCRIPT)
+        self.actions.append({'control': control, 'start': start, 'end': end})
+
+    def _click(self, selector):
+        from selenium.webdriver.common.by import By
+        element = self.driver.find_element(By.CSS_SELECTOR, selector)
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+        element.click()
+
+    def _keys(self, *keys, modifier=None):
+        from selenium.webdriver.common.action_chains import ActionChains
+        chain = ActionChains(self.driver)
+        if modifier:
+            chain.key_down(modifier)
+        chain.send_keys(*keys)
+        if modifier:
+            chain.key_up(modifier)
+        chain.perform()
+
+    def search(self, response):
+        submit_search(self.driver, True, response=response)
+        wait_for(self.driver, "document.querySelector('#hotels-cards-container .hotel-card')", 60)
+        wait_for(self.driver, "!document.querySelector('.js-number-input .plus').disabled", 30)
+
+    def guest_buttons(self):
+        self._act('guest-plus', lambda: self._click('.js-number-input .plus'))
+        self._act('guest-minus', lambda: self._click('.js-number-input .minus'))
+
+    def filter_chip(self):
+        """Remove the guests chip the guest filter adds (re-filters at 2 guests)"""
+        self._click('.js-number-input .plus')
+        wait_for(self.driver, "document.querySelector('.filter-chip-remove[aria-label$=\"Hóspedes\"]')")
+        self._act('filter-chip-remove',
+                  lambda: self._click('.filter-chip-remove[aria-label$="Hóspedes"]'))
+        # The counter keeps its own value; step it back so the next round starts at 2
+        self._click('.js-number-input .minus')
+
+    def inline_editor(self):
+        self._act('inline-editor-toggle', lambda: self._click('.inline-editor-container .toggle-editor'))
+
+    def keyboard(self):
+        from selenium.webdriver.common.keys import Keys
+        self._act('keyboard-help', lambda: self._keys('/', modifier=Keys.CONTROL))
+        self._act('keyboard-help', lambda: self._keys('/', modifier=Keys.CONTROL))
+        self.driver.execute_script(
+            "const card = document.querySelector('#hotels-cards-container .hotel-card');"
+            "card.setAttribute('tabindex', card.getAttribute('tabindex') || '0'); card.focus();"
+        )
+        self._act('keyboard-arrow', lambda: self._keys(Keys.ARROW_DOWN))
+
+    def run(self, response, repeats=5):
+        """Search once, then repeat every control; returns the action windows"""
+        self.search(response)
+        for _ in range(repeats):
+            self.guest_buttons()
+            self.filter_chip()
+            self.inline_editor()
+            self.keyboard()
+        return self.actions
+
+
+def collect(driver):
+    """Entries recorded by PROBE_SCRIPT (after the observers have flushed)"""
+    driver.execute_async_script(NEXT_PAINT_SCRIPT)
+    return driver.execute_script("return window.__monitoraInteractions;")
+
+
+def measure(driver, url, response, repeats=5):
+    """
+    Load url with the probe and API stub installed, drive the controls
+
+    Returns: (latencies, attribution, recorded) as returned by
+    interaction_latencies() / attribute_long_tasks() and collect()
+    """
+    from .page_helpers import API_STUB_SCRIPT
+
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': API_STUB_SCRIPT})
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': PROBE_SCRIPT})
+    driver.set_script_timeout(60)
+    driver.get(url)
+    wait_for(driver, "document.querySelectorAll('#hotel-select option').length > 1", 30)
+
+    actions = InteractionDriver(driver).run(response, repeats)
+    recorded = collect(driver)
+    origin = '{0.scheme}://{0.netloc}'.format(urlparse(url))
+    return (
+        interaction_latencies(recorded['events'], actions),
+        attribute_long_tasks(recorded['frames'], recorded['longTasks'], actions, origin),
+        recorded,
+    )
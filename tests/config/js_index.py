@@ -0,0 +1,288 @@
+"""
+JS Source Index
+Parses src/js/*.js and src/services/*.js once per session and records each
+module's exports, imports, function declarations and string literals.
+
+Entries are keyed by content hash and persisted between runs, so only
+changed files are re-scanned. Static structure checks become set lookups:
+
+    index = source_index()
+    hotel_search = index['src/js/hotelSearch.js']
+    assert 'getAllHotelCards' in hotel_search.exports
+    assert hotel_search.contains_string('id="results-container"')
+
+Paths that do not exist are recorded in index.missing and reported once as
+a StaleSourceWarning, so tests can skip instead of each failing on them.
+"""
+import atexit
+import hashlib
+import json
+import os
+import posixpath
+import re
+import warnings
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+SOURCE_PATTERNS = ('src/js/*.js', 'src/services/*.js')
+
+# Bump when the recorded fields change so stale entries are ignored
+INDEX_VERSION = 1
+
+INDEX_FILE = Path(os.getenv(
+    'JS_INDEX_CACHE',
+    Path.home() / '.cache' / 'monitora_vagas' / 'js-source-index.json'
+))
+
+_STRING_OR_COMMENT = re.compile(r"""
+    (?P<line_comment>//[^\n]*)
+  | (?P<block_comment>/\*.*?\*/)
+  | (?P<string>'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`)
+  | (?P<slash>/)
+""", re.VERBOSE | re.DOTALL)
+
+_REGEX_LITERAL = re.compile(r"/(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/[a-z]*")
+
+# A '/' after one of these starts a regex literal rather than a division
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^') | {''}
+
+_LITERAL = r'"§(\d+)"'
+_IMPORT_FROM = re.compile(r'\bimport\s+([\w$\s{},*]+?)\s*from\s*' + _LITERAL)
+_IMPORT_BARE = re.compile(r'\bimport\s*\(?\s*' + _LITERAL)
+_EXPORT_DECL = re.compile(
+    r'\bexport\s+(?:default\s+)?(?:async\s+)?(function\s*\*?|class|const|let|var)\s*([\w$]+)'
+)
+_EXPORT_DEFAULT = re.compile(r'\bexport\s+default\b')
+_EXPORT_LIST = re.compile(r'\bexport\s*\{([^}]*)\}(?:\s*from\s*' + _LITERAL + ')?')
+_EXPORT_STAR = re.compile(r'\bexport\s*\*\s*(?:as\s+([\w$]+)\s*)?from\s*' + _LITERAL)
+_FUNCTION = re.compile(r'\b(?:function\s*\*?\s*|class\s+)([\w$]+)')
+_ASSIGNED_FUNCTION = re.compile(
+    r'([\w$]+)\s*[:=]\s*(?:async\s+)?(?:function\b|\([^()]*\)\s*=>|[\w$]+\s*=>)'
+)
+_METHOD = re.compile(
+    r'^[ \t]*(?:static\s+)?(?:async\s+)?\*?([\w$]+)\s*\([^()]*\)\s*\{', re.MULTILINE
+)
+_KEYWORDS = {'if', 'for', 'while', 'switch', 'catch', 'function', 'return', 'with', 'else'}
+
+
+def strip_literals(source):
+    """
+    Replace comments with spaces and string/template/regex literals with
+    "§N" placeholders in one scan
+    Returns: (code, literals)
+    """
+    code = []
+    literals = []
+    position = 0
+    while True:
+        match = _STRING_OR_COMMENT.search(source, position)
+        if not match:
+            code.append(source[position:])
+            break
+        code.append(source[position:match.start()])
+        kind = match.lastgroup
+        if kind == 'string':
+            literals.append(match.group()[1:-1])
+            code.append(f'"§{len(literals) - 1}"')
+            position = match.end()
+        elif kind == 'slash':
+            previous = ''.join(code[-2:]).rstrip()[-1:]
+            regex = _REGEX_LITERAL.match(source, match.start())
+            if previous in _REGEX_PRECEDERS and regex:
+                code.append('0')
+                position = regex.end()
+            else:
+                code.append('/')
+                position = match.end()
+        else:
+            code.append(' ')
+            position = match.end()
+    return ''.join(code), literals
+
+
+def _split_names(clause):
+    """'a, b as c' -> [('a', 'a'), ('b', 'c')]"""
+    names = []
+    for part in clause.split(','):
+        words = part.split()
+        if not words:
+            continue
+        names.append((words[0], words[-1]))
+    return names
+
+
+def scan(source):
+    """Index one module's source; returns a JSON-serialisable dict"""
+    code, literals = strip_literals(source)
+    exports = set()
+    imports = {}
+    functions = set()
+
+    def add_import(specifier, names):
+        imports.setdefault(specifier, set()).update(names)
+
+    for clause, literal in _IMPORT_FROM.findall(code):
+        names = []
+        default, _, named = clause.partition('{')
+        for name in default.split(','):
+            name = name.strip()
+            if name.startswith('*'):
+                names.append('*')
+            elif name:
+                names.append('default')
+        names += [original for original, _ in _split_names(named.rstrip('} '))]
+        add_import(literals[int(literal)], names)
+    for literal in _IMPORT_BARE.findall(code):
+        add_import(literals[int(literal)], [])
+
+    for kind, name in _EXPORT_DECL.findall(code):
+        exports.add(name)
+    if _EXPORT_DEFAULT.search(code):
+        exports.add('default')
+    for clause, literal in _EXPORT_LIST.findall(code):
+        pairs = _split_names(clause)
+        exports.update(alias for _, alias in pairs)
+        if literal:
+            add_import(literals[int(literal)], [original for original, _ in pairs])
+    for alias, literal in _EXPORT_STAR.findall(code):
+        if alias:
+            exports.add(alias)
+        add_import(literals[int(literal)], ['*'])
+
+    functions.update(_FUNCTION.findall(code))
+    functions.update(_ASSIGNED_FUNCTION.findall(code))
+    functions.update(name for name in _METHOD.findall(code) if name not in _KEYWORDS)
+
+    return {
+        'exports': sorted(exports),
+        'imports': {specifier: sorted(names) for specifier, names in imports.items()},
+        'functions': sorted(functions),
+        'strings': literals,
+    }
+
+
+class StaleSourceWarning(UserWarning):
+    """A test looked up a source file that no longer exists"""
+
+
+class JSModule:
+    """Lookup view over one indexed module"""
+
+    def __init__(self, path, digest, info):
+        self.path = path
+        self.digest = digest
+        self.exports = frozenset(info['exports'])
+        self.imports = {specifier: frozenset(names) for specifier, names in info['imports'].items()}
+        self.functions = frozenset(info['functions'])
+        self.strings = frozenset(info['strings'])
+        self._string_blob = '\0'.join(info['strings'])
+
+    def defines(self, name):
+        """Function, class, method or export of that name"""
+        return name in self.functions or name in self.exports
+
+    def contains_string(self, fragment):
+        """True when a string or template literal contains the fragment"""
+        return fragment in self.strings or fragment in self._string_blob
+
+    def resolve(self, specifier):
+        """Repo-relative path of a relative import specifier"""
+        return posixpath.normpath(posixpath.join(posixpath.dirname(self.path), specifier))
+
+    def __repr__(self):
+        return f"JSModule({self.path}, {len(self.exports)} exports)"
+
+
+class SourceIndex:
+    """Content-hash keyed index of JS modules, persisted in INDEX_FILE"""
+
+    def __init__(self, root=ROOT_DIR, patterns=SOURCE_PATTERNS, index_file=None):
+        self.root = Path(root)
+        self.patterns = patterns
+        self.index_file = Path(index_file) if index_file else INDEX_FILE
+        self.modules = {}
+        self.missing = {}
+        self.scanned = 0
+        self._entries = self._load()
+        self._used = {}
+
+    def _load(self):
+        try:
+            data = json.loads(self.index_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != INDEX_VERSION:
+            return {}
+        return data.get('modules', {})
+
+    def build(self):
+        """Index every file matching the source patterns"""
+        for pattern in self.patterns:
+            for path in sorted(self.root.glob(pattern)):
+                self.module(path.relative_to(self.root).as_posix())
+        return self
+
+    def module(self, path):
+        """The indexed module at a repo-relative path, or None if it does not exist"""
+        path = Path(path).as_posix()
+        if path in self.modules:
+            return self.modules[path]
+        if path in self.missing:
+            self.missing[path] += 1
+            return None
+        try:
+            source = (self.root / path).read_text(encoding='utf-8')
+        except OSError:
+            self.missing[path] = 1
+            warnings.warn(f"Stale source path: {path}", StaleSourceWarning, stacklevel=2)
+            return None
+
+        digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        info = self._entries.get(digest)
+        if info is None:
+            info = scan(source)
+            self._entries[digest] = info
+            self.scanned += 1
+        self._used[digest] = info
+        self.modules[path] = JSModule(path, digest, info)
+        return self.modules[path]
+
+    def __getitem__(self, path):
+        module = self.module(path)
+        if module is None:
+            raise KeyError(f"Source file not found: {path}")
+        return module
+
+    def __contains__(self, path):
+        return self.module(path) is not None
+
+    def save(self):
+        """Persist the entries used in this session (drops stale hashes)"""
+        if not self.scanned:
+            return
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_file.with_name(f'.{self.index_file.name}.{os.getpid()}.tmp')
+            tmp.write_text(json.dumps({'version': INDEX_VERSION, 'modules': self._used}),
+                           encoding='utf-8')
+            os.replace(tmp, self.index_file)
+        except OSError:
+            # A read-only cache only costs speed
+            pass
+
+
+_index = None
+
+
+def source_index():
+    """The process-wide index, built on first use and saved at exit"""
+    global _index
+    if _index is None:
+        _index = SourceIndex().build()
+        atexit.register(_index.save)
+    return _index
+
+
+def stale_paths():
+    """{path: lookups} for missing files requested this session"""
+    return dict(_index.missing) if _index else {}
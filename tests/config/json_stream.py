@@ -0,0 +1,171 @@
+"""
+Incremental JSON Array Parsing
+Emits the items of one array inside a JSON document (e.g. data.weekends of
+/vagas/search/weekends) as soon as each item's closing bytes arrive,
+instead of after the whole body. src/services/jsonStream.js is the same
+scanner for the page.
+
+The scanner only tracks nesting, strings and object keys; each complete
+item is handed to json.loads, and the whole document is parsed once at the
+end, so malformed input raises json.JSONDecodeError as usual.
+
+Usage:
+    stream = JSONItemStream(('data', 'weekends'))
+    for chunk in chunks:
+        for weekend in stream.feed(chunk):
+            show(weekend)
+    document = stream.close()
+"""
+import codecs
+import json
+import re
+import time
+import urllib.request
+
+WEEKENDS_PATH = ('data', 'weekends')
+WHITESPACE = ' \t\r\n'
+STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class JSONItemStream:
+    """Feed text or bytes; returns the array items at `path` completed so far"""
+
+    def __init__(self, path=WEEKENDS_PATH):
+        self.path = tuple(path)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._text = []
+        self._buffer = ''
+        self._offset = 0          # position of _buffer[0] in the document
+        self._frames = []         # [bracket, current key or index, expecting a key]
+        self._in_string = False
+        self._escaped = False
+        self._string_start = None
+        self._item_start = None   # document position of the current target item
+        self._item_depth = None   # len(_frames) inside the target array
+        self.items = 0
+
+    def _in_target_array(self):
+        return (bool(self._frames) and self._frames[-1][0] == '['
+                and tuple(frame[1] for frame in self._frames[:-1]) == self.path)
+
+    def _value_starts(self, position):
+        """A value begins at position; note it when it is an item of the target array"""
+        if self._item_start is None and self._in_target_array():
+            self._item_start = position
+            self._item_depth = len(self._frames)
+
+    def feed(self, data):
+        text = self._decoder.decode(data) if isinstance(data, bytes) else data
+        self._text.append(text)
+        start = len(self._buffer)
+        self._buffer += text
+        items = []
+        index = start
+        while index < len(self._buffer):
+            if self._in_string and not self._escaped:
+                # Skip string contents up to the next quote or backslash
+                special = STRING_SPECIAL.search(self._buffer, index)
+                if not special:
+                    break
+                index = special.start()
+            self._scan(self._buffer[index], self._offset + index, items)
+            index += 1
+        # Only an unfinished item or key has to stay in the scan buffer
+        keep_from = self._offset + len(self._buffer)
+        for position in (self._item_start, self._string_start):
+            if position is not None:
+                keep_from = min(keep_from, position)
+        self._buffer = self._buffer[keep_from - self._offset:]
+        self._offset = keep_from
+        return items
+
+    def _emit(self, end, items):
+        items.append(json.loads(self._buffer[self._item_start - self._offset:end - self._offset]))
+        self.items += 1
+        self._item_start = self._item_depth = None
+
+    def _scan(self, char, position, items):
+        frame = self._frames[-1] if self._frames else None
+        if self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == '\\':
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+                if frame and frame[0] == '{' and frame[2]:
+                    key = self._buffer[self._string_start - self._offset:position - self._offset + 1]
+                    frame[1] = json.loads(key)
+                self._string_start = None
+            return
+
+        if char in WHITESPACE:
+            return
+        # A scalar item of the target array ends at the next ',' or ']'
+        if char in ',]' and self._item_start is not None and self._item_depth == len(self._frames):
+            self._emit(position, items)
+
+        if char == '"':
+            self._in_string = True
+            if frame and frame[0] == '{' and frame[2]:
+                self._string_start = position
+            else:
+                self._value_starts(position)
+        elif char in '{[':
+            self._value_starts(position)
+            self._frames.append([char, None if char == '{' else 0, char == '{'])
+        elif char in '}]':
+            self._frames.pop()
+            if self._item_start is not None and self._item_depth == len(self._frames):
+                self._emit(position + 1, items)
+        elif char == ':':
+            frame[2] = False
+        elif char == ',':
+            if frame[0] == '{':
+                frame[2] = True
+            else:
+                frame[1] += 1
+        else:
+            self._value_starts(position)
+
+    def close(self):
+        """Parse and return the whole document"""
+        self._text.append(self._decoder.decode(b'', final=True))
+        return json.loads(''.join(self._text))
+
+
+def iter_json_items(chunks, path=WEEKENDS_PATH):
+    """Yield the items at path from an iterable of text/bytes chunks"""
+    stream = JSONItemStream(path)
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+    stream.close()
+
+
+def iter_response_chunks(response, chunk_size=8192):
+    """Bytes of an HTTP response as they arrive (read1 returns what is buffered)"""
+    while True:
+        chunk = response.read1(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def fetch_weekends(base_url, count=8, on_weekend=None, timeout=600):
+    """
+    GET {base_url}/vagas/search/weekends?count=N, calling on_weekend(weekend,
+    seconds since the request) for each weekend as soon as it arrives
+
+    Returns: the response's data object (like apiClient.searchWeekendVacancies)
+    """
+    started = time.perf_counter()
+    stream = JSONItemStream(WEEKENDS_PATH)
+    with urllib.request.urlopen(f"{base_url}/vagas/search/weekends?count={count}", timeout=timeout) as response:
+        for chunk in iter_response_chunks(response):
+            for weekend in stream.feed(chunk):
+                if on_weekend:
+                    on_weekend(weekend, time.perf_counter() - started)
+    body = stream.close()
+    if body.get('success') is False:
+        raise RuntimeError(body.get('error') or 'API returned error without message')
+    return body['data']
@@ -0,0 +1,238 @@
+"""
+Mock Busca Vagas API
+A local HTTP stand-in for the API on http://localhost:3001/api, the URL
+the page uses with ?useLocalAPI=true (src/config/environment.js).
+
+Unlike the in-page fetch override (page_helpers.API_STUB_SCRIPT), requests
+to this server cross the browser's network stack, so CDP network
+throttling and offline emulation apply to them.
+
+Routes:
+    GET /api/health
+    GET /api/vagas/hoteis
+    GET /api/vagas/hoteis/scrape
+    GET /api/vagas/search?hotel=&checkin=&checkout=[&applyBookingRules=]
+    GET /api/vagas/search/weekends?count=N
+
+A search_response given as an api_factory.DatasetSpec is generated per
+query and streamed (iter_search_json), so very large bodies are never
+held in memory. Weekend searches are always streamed (iter_weekend_json)
+with Transfer-Encoding: chunked, one HTTP chunk per weekend, and
+weekend_delay seconds before each one to trickle the body like the
+real multi-minute scrape.
+
+The hotel list carries an ETag (a hash of the body) and a Last-Modified
+(when the MockAPI was created) and answers If-None-Match /
+If-Modified-Since with 304, like a conditional-GET-aware production API.
+
+search_capacity models a saturated scraper: searches beyond that many in
+flight are refused with 429 (and Retry-After when retry_after is set).
+"""
+import email.utils
+import hashlib
+import http.server
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+from .api_factory import HOTEL_NAMES, DatasetSpec, hotels_payload, iter_search_json, iter_weekend_json
+from .render_benchmark import synthetic_search_response
+
+DEFAULT_PORT = 3001
+
+DEFAULT_HOTELS = hotels_payload(DatasetSpec(hotels=len(HOTEL_NAMES)))['data']
+DEFAULT_WEEKENDS = DatasetSpec(hotels=len(HOTEL_NAMES), vacancies_per_hotel=5)
+MAX_WEEKENDS = 12  # isValidWeekendCount in src/services/apiClient.js
+
+
+class MockAPIHandler(http.server.BaseHTTPRequestHandler):
+    """Answers from the MockAPI attached to the server"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body, headers=None):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        for name, value in (headers or {'Cache-Control': 'no-store'}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_hotels(self, body):
+        """Hotel list with validators; 304 when the client's copy is current"""
+        etag = '"%s"' % hashlib.sha1(json.dumps(body).encode('utf-8')).hexdigest()[:16]
+        headers = {'ETag': etag, 'Last-Modified': self.server.api.hotels_modified,
+                   'Cache-Control': 'no-cache'}
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            current = etag in [tag.strip() for tag in if_none_match.split(',')]
+        else:
+            try:
+                since = email.utils.parsedate_to_datetime(self.headers.get('If-Modified-Since'))
+                current = since >= email.utils.parsedate_to_datetime(headers['Last-Modified'])
+            except (TypeError, ValueError):
+                current = False
+        if not current:
+            self._send_json(200, body, headers)
+            return
+        self.send_response(304)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def _send_json_stream(self, status, chunks, delay=0):
+        """
+        Chunked HTTP/1.1 body, one HTTP chunk per JSON text chunk; delay
+        sleeps before every chunk after the first
+        """
+        self.protocol_version = 'HTTP/1.1'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_header('Connection', 'close')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        try:
+            for position, chunk in enumerate(chunks):
+                if delay and position:
+                    time.sleep(delay)
+                data = chunk.encode('utf-8')
+                if data:
+                    self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+            self.wfile.write(b'0\r\n\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client gave up (e.g. an aborted fetch)
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', '*')
+        self.end_headers()
+
+    def do_GET(self):
+        api = self.server.api
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        api.requests.append((url.path, query))
+
+        if url.path == '/api/health':
+            self._send_json(200, {'success': True, 'status': 'OK'})
+        elif url.path == '/api/vagas/hoteis':
+            self._send_hotels({'success': True, 'data': api.hotels})
+        elif url.path == '/api/vagas/hoteis/scrape':
+            self._send_json(200, {'success': True, 'data': api.hotels, 'count': len(api.hotels)})
+        elif url.path == '/api/vagas/search/weekends':
+            count = query.get('count', '8')
+            count = int(count) if count.isdigit() else 0
+            if not 1 <= count <= MAX_WEEKENDS:
+                self._send_json(400, {'success': False,
+                                      'error': f'Weekend count must be between 1 and {MAX_WEEKENDS}'})
+            else:
+                self._send_json_stream(200, api.weekend_response(count), api.weekend_delay)
+        elif url.path == '/api/vagas/search':
+            if not api.admit_search():
+                headers = {'Cache-Control': 'no-store'}
+                if api.retry_after is not None:
+                    headers['Retry-After'] = str(api.retry_after)
+                self._send_json(429, {'success': False, 'error': 'Too many requests'}, headers)
+                return
+            try:
+                if api.search_delay:
+                    time.sleep(api.search_delay)
+                body = api.search_response(query)
+                if isinstance(body, dict):
+                    self._send_json(200, body)
+                else:
+                    self._send_json_stream(200, body)
+            finally:
+                api.finish_search()
+        else:
+            self._send_json(404, {'success': False, 'error': f'Unknown route {url.path}'})
+
+
+class MockAPI:
+    """
+    Threaded mock API server
+
+    Usage:
+        with MockAPI(search_response=synthetic_search_response(25, 50)) as api:
+            driver.get(f"{page_url}?useLocalAPI=true")
+    """
+
+    def __init__(self, port=DEFAULT_PORT, hotels=None, search_response=None, search_delay=0,
+                 weekend_spec=None, weekend_delay=0, search_capacity=None, retry_after=None):
+        self.port = port
+        self.hotels = hotels or DEFAULT_HOTELS
+        self._search_response = search_response or synthetic_search_response(24, 5)
+        self.search_delay = search_delay
+        self.weekend_spec = weekend_spec or DEFAULT_WEEKENDS
+        self.weekend_delay = weekend_delay
+        self.hotels_modified = email.utils.formatdate(usegmt=True)
+        self.search_capacity = search_capacity
+        self.retry_after = retry_after
+        self.searches_in_flight = 0
+        self.peak_searches = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self.requests = []
+        self.httpd = None
+
+    def search_response(self, query):
+        """
+        Body for one search; search_response may be a dict, a callable(query)
+        or a DatasetSpec (returns an iterator of JSON text chunks)
+        """
+        if isinstance(self._search_response, DatasetSpec):
+            return iter_search_json(self._search_response, query.get('checkin'), query.get('checkout'),
+                                    query.get('hotel', '-1'))
+        if callable(self._search_response):
+            return self._search_response(query)
+        return self._search_response
+
+    def admit_search(self):
+        """Count a search in flight; False (and counted as rejected) over capacity"""
+        with self._lock:
+            if self.search_capacity is not None and self.searches_in_flight >= self.search_capacity:
+                self.rejected += 1
+                return False
+            self.searches_in_flight += 1
+            self.peak_searches = max(self.peak_searches, self.searches_in_flight)
+            return True
+
+    def finish_search(self):
+        with self._lock:
+            self.searches_in_flight -= 1
+
+    def weekend_response(self, count):
+        """JSON text chunks of a weekend search: head, one per weekend, summary"""
+        return iter_weekend_json(self.weekend_spec, count)
+
+    @property
+    def base_url(self):
+        return f"http://localhost:{self.port}/api"
+
+    def start(self):
+        self.httpd = http.server.ThreadingHTTPServer(("localhost", self.port), MockAPIHandler)
+        self.httpd.api = self
+        self.port = self.httpd.server_address[1]
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,90 @@
+"""
+Page Helpers
+Shared by the browser-driven harness tools (CSS coverage, critical CSS,
+heap soak, render and interaction benchmarks, throttling, the page object):
+an in-page stub of the Busca Vagas API, search dates outside the holiday
+packages, JS polling and a form-driven search.
+"""
+from datetime import date, timedelta
+
+# Intercepts the Busca Vagas API so every UI state can be reached offline.
+# Tools change window.__monitoraApiStub between states (results vs. empty,
+# search delay to hold the "searching" state, or a full searchResponse body).
+API_STUB_SCRIPT = """
+(() => {
+    window.__monitoraApiStub = {
+        searchDelay: 0,
+        hasAvailability: true,
+        searchResponse: null,
+        hotels: [
+            {hotelId: '-1', name: 'Todas', type: 'All'},
+            {hotelId: '1', name: 'Hotel Amparo', type: 'Hotel'},
+            {hotelId: '2', name: 'Hotel Avaré', type: 'Hotel'}
+        ]
+    };
+    const json = (body) => new Response(JSON.stringify(body), {
+        status: 200, headers: {'Content-Type': 'application/json'}
+    });
+    const realFetch = window.fetch.bind(window);
+    window.fetch = async (input, init) => {
+        const url = typeof input === 'string' ? input : input.url;
+        const stub = window.__monitoraApiStub;
+        if (url.includes('/vagas/hoteis')) {
+            return json({success: true, data: stub.hotels});
+        }
+        if (url.includes('/vagas/search')) {
+            await new Promise(resolve => setTimeout(resolve, stub.searchDelay));
+            performance.mark('monitora:search-response');
+            if (stub.searchResponse) {
+                return json(stub.searchResponse);
+            }
+            const groups = stub.hasAvailability
+                ? {'Hotel Amparo': ['Quarto 101 (2 pessoas)', 'Quarto 102 (4 pessoas)'],
+                   'Hotel Avaré': ['Chalé 7 (3 pessoas)']}
+                : {};
+            return json({success: true, method: 'stub', data: {
+                success: true, date: new Date().toISOString(),
+                hasAvailability: stub.hasAvailability,
+                result: {status: 'OK', vacancies: Object.values(groups).flat(), hotelGroups: groups}
+            }});
+        }
+        if (url.includes('/health')) {
+            return json({success: true, status: 'OK'});
+        }
+        return realFetch(input, init);
+    };
+})();
+"""
+
+
+def search_dates():
+    """A check-in/check-out pair outside the holiday-package periods"""
+    checkin = date.today() + timedelta(days=30)
+    if checkin.month in (12, 1):
+        checkin = date(checkin.year + (checkin.month == 12), 2, 10)
+    return checkin.isoformat(), (checkin + timedelta(days=2)).isoformat()
+
+
+def wait_for(driver, script, timeout=15):
+    """Poll a JS expression until it is truthy"""
+    from selenium.webdriver.support.ui import WebDriverWait
+    WebDriverWait(driver, timeout).until(lambda d: d.execute_script(f"return {script};"))
+
+
+def submit_search(driver, has_availability, delay_ms=0, response=None):
+    """Search all hotels through the form; response replaces the stubbed search body"""
+    checkin, checkout = search_dates()
+    driver.execute_script("""
+        Object.assign(window.__monitoraApiStub, {
+            hasAvailability: arguments[0], searchDelay: arguments[1], searchResponse: arguments[4]
+        });
+        const set = (id, value) => {
+            const el = document.getElementById(id);
+            el.value = value;
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        };
+        set('hotel-select', '-1');
+        set('input-checkin', arguments[2]);
+        set('input-checkout', arguments[3]);
+        document.getElementById('search-button').click();
+    """, has_availability, delay_ms, checkin, checkout, response)
@@ -0,0 +1,173 @@
+"""
+Concurrent Playwright Runner
+Runs use-case checks written against Playwright's async API inside one
+Chromium process. Every test gets its own browser context (cookies,
+storage, service workers and cache are isolated as in a fresh browser)
+and up to `concurrency` of them run at once, which costs a fraction of a
+separate Chrome instance per test.
+
+Cases register themselves with @use_case; results use the
+tests/use_cases/results.json format of collect-use-case-results.py and
+every test emits test_start/test_end into the unified event log.
+
+Usage:
+    @use_case('UC-005', 'TC-005-02', 'Hotel select dropdown exists')
+    async def hotel_select_exists(page, env):
+        await env.open(page)
+        await expect(page.locator('#hotel-select')).to_be_visible()
+
+    outcomes = asyncio.run(run_cases(CASES, CaseEnv(url), concurrency=8))
+"""
+import asyncio
+import time
+import traceback
+from dataclasses import dataclass
+from datetime import datetime
+
+from .index_page import HOTELS_LOADED
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 90
+VIEWPORT = {'width': 1920, 'height': 1080}
+LAUNCH_ARGS = ['--no-sandbox', '--disable-dev-shm-usage']
+
+CASES = []
+
+
+class CaseSkipped(Exception):
+    """Raised by a case that does not apply to the environment"""
+
+
+@dataclass
+class UseCase:
+    suite: str  # 'UC-001'
+    test: str   # 'TC-001-01'
+    title: str
+    run: object  # async (page, env) -> optional message
+
+    @property
+    def key(self):
+        """Key in the results document"""
+        return f"{self.suite}: {self.test} {self.title}"
+
+
+def use_case(suite, test, title):
+    """Register an async (page, env) case in CASES"""
+    def register(function):
+        CASES.append(UseCase(suite, test, title, function))
+        return function
+    return register
+
+
+def select_cases(cases, suites=None, tests=None):
+    """Cases of the given suites ('UC-001') and/or test ids ('TC-001-01')"""
+    suites = {suite.upper() for suite in suites or ()}
+    tests = {test.upper() for test in tests or ()}
+    return [case for case in cases
+            if (not suites or case.suite in suites) and (not tests or case.test in tests)]
+
+
+@dataclass
+class CaseEnv:
+    """Where the cases run; query is appended to url (e.g. '?useLocalAPI=true')"""
+    url: str
+    query: str = ''
+    api_url: str = ''
+
+    @property
+    def page_url(self):
+        return f"{self.url}{self.query}"
+
+    async def open(self, page, wait_for_hotels=True, timeout=30):
+        await page.goto(self.page_url)
+        if wait_for_hotels:
+            await page.wait_for_function(HOTELS_LOADED, timeout=timeout * 1000)
+
+
+def _outcome(status, message, duration, error=None):
+    outcome = {
+        'passed': status == 'passed',
+        'skipped': status == 'skipped',
+        'message': message,
+        'duration': round(duration, 3),
+    }
+    if error is not None:
+        outcome['stderr'] = ''.join(traceback.format_exception(error))[-500:]
+    return outcome
+
+
+async def run_case(browser, case, env, timeout=DEFAULT_TIMEOUT, events=None):
+    """Run one case in a fresh context; returns its results.json entry"""
+    if events:
+        events.test_start(case.suite, case.test)
+    started = time.perf_counter()
+    context = await browser.new_context(viewport=VIEWPORT)
+    try:
+        page = await context.new_page()
+        message = await asyncio.wait_for(case.run(page, env), timeout)
+        outcome = _outcome('passed', message or 'Success', time.perf_counter() - started)
+    except CaseSkipped as skip:
+        outcome = _outcome('skipped', str(skip) or 'Skipped', time.perf_counter() - started)
+    except asyncio.TimeoutError as error:
+        outcome = _outcome('failed', f"Test timed out after {timeout}s", time.perf_counter() - started, error)
+    except Exception as error:
+        outcome = _outcome('failed', f"Failed: {error}".splitlines()[0], time.perf_counter() - started, error)
+    finally:
+        await context.close()
+
+    if events:
+        status = 'skipped' if outcome['skipped'] else 'passed' if outcome['passed'] else 'failed'
+        events.test_end(case.suite, case.test, status, duration=outcome['duration'],
+                        message=outcome['message'])
+    return outcome
+
+
+async def run_in_browser(browser, cases, env, concurrency=DEFAULT_CONCURRENCY,
+                         timeout=DEFAULT_TIMEOUT, events=None, on_result=None):
+    """Run cases concurrently (at most `concurrency` contexts open) in an existing browser"""
+    limit = asyncio.Semaphore(max(1, concurrency))
+
+    async def bounded(case):
+        async with limit:
+            outcome = await run_case(browser, case, env, timeout, events)
+        if on_result:
+            on_result(case, outcome)
+        return case.key, outcome
+
+    return dict(await asyncio.gather(*(bounded(case) for case in cases)))
+
+
+async def run_cases(cases, env, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT,
+                    headless=True, events=None, on_result=None):
+    """Launch one Chromium and run the cases; returns {case.key: outcome}"""
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=headless, args=LAUNCH_ARGS)
+        try:
+            return await run_in_browser(browser, cases, env, concurrency, timeout, events, on_result)
+        finally:
+            await browser.close()
+
+
+def results_document(outcomes, started, wall_time=None):
+    """
+    results.json document for the outcomes; summary.duration is the summed
+    test time like the Selenium runner, wall_time what the run really took
+    """
+    tests = dict(sorted(outcomes.items()))
+    document = {
+        'timestamp': started.isoformat() if isinstance(started, datetime) else started,
+        'summary': {
+            'total': len(tests),
+            'passed': sum(1 for outcome in tests.values() if outcome['passed']),
+            'failed': sum(1 for outcome in tests.values()
+                          if not outcome['passed'] and not outcome['skipped']),
+            'skipped': sum(1 for outcome in tests.values() if outcome['skipped']),
+            'duration': round(sum(outcome['duration'] for outcome in tests.values()), 3),
+        },
+        'tests': tests,
+    }
+    if wall_time is not None:
+        document['summary']['wall_time'] = round(wall_time, 3)
+    return document
@@ -0,0 +1,193 @@
+"""
+Precache Manifest
+Crawls the real dependency graph of public/index.html (stylesheets, classic
+and module scripts, CSS @import/url() and static JS imports) and builds the
+content-hashed manifest public/sw.js precaches.
+
+URLs are relative to public/ (where sw.js lives), so '../src/js/hotelSearch.js'
+resolves the same way it does from index.html. Cross-origin assets (CDN
+Bootstrap, Google Fonts, analytics) cannot be hashed at build time; they are
+listed as runtime entries for reference. The service worker runtime-caches
+only its own CDN/font origins (RUNTIME_ORIGINS in sw.js).
+"""
+import hashlib
+import json
+import posixpath
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+
+from .css_parser import parse as parse_css
+from .js_index import scan as scan_js
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+ENTRY_PAGE = 'public/index.html'
+SCOPE_DIR = 'public'
+MANIFEST_FILE = ROOT_DIR / 'public' / 'precache-manifest.js'
+
+CSS_URL = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)')
+
+# Browsers that run service workers all take woff2/woff; skip the legacy formats
+LEGACY_FONT_FORMATS = ('.eot', '.ttf', '.otf', '.svg')
+
+
+def _is_external(url):
+    return bool(re.match(r'^(?:[a-z][a-z0-9+.-]*:)?//', url, re.I)) or url.startswith('data:')
+
+
+def _split_url(url):
+    """'a/b.css?v=2#x' -> ('a/b.css', 'a/b.css?v=2')"""
+    url = url.split('#', 1)[0]
+    return url.split('?', 1)[0], url
+
+
+class _PageParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.references = []
+        self.inline_modules = []
+        self._in_module = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        rel = (attrs.get('rel') or '').lower().split()
+        if tag == 'link' and attrs.get('href') and (
+                {'stylesheet', 'icon', 'manifest', 'modulepreload'} & set(rel)):
+            self.references.append(('css' if 'stylesheet' in rel else 'file', attrs['href']))
+        elif tag == 'script':
+            if attrs.get('src'):
+                kind = 'module' if attrs.get('type') == 'module' else 'file'
+                self.references.append((kind, attrs['src']))
+            elif attrs.get('type') == 'module':
+                self._in_module = True
+        elif tag == 'img' and attrs.get('src'):
+            self.references.append(('file', attrs['src']))
+
+    def handle_endtag(self, tag):
+        if tag == 'script':
+            self._in_module = False
+
+    def handle_data(self, data):
+        if self._in_module and data.strip():
+            self.inline_modules.append(data)
+
+
+def _css_references(text):
+    sheet = parse_css(text)
+    references = []
+    pending = [sheet]
+    while pending:
+        block = pending.pop()
+        for child in block.children:
+            if not child.body and child.at_keyword == 'import':
+                match = CSS_URL.search(child.at_params) or re.search(r'["\']([^"\']+)["\']', child.at_params)
+                if match:
+                    references.append(('css', match.groups()[-1]))
+            else:
+                pending.append(child)
+        urls = [url for decl in block.declarations for _, url in CSS_URL.findall(decl.value)]
+        if block.at_keyword == 'font-face':
+            modern = [u for u in urls if not _split_url(u)[0].lower().endswith(LEGACY_FONT_FORMATS)]
+            urls = modern or urls
+        references.extend(('file', url) for url in urls)
+    return references
+
+
+def _js_references(text):
+    return [('module', specifier) for specifier in scan_js(text)['imports']]
+
+
+class DependencyGraph:
+    """Files reachable from the entry page; paths are repo-relative"""
+
+    def __init__(self, root=ROOT_DIR, entry=ENTRY_PAGE):
+        self.root = Path(root)
+        self.entry = entry
+        self.files = []
+        self.external = []
+        self.missing = []
+        self._seen = set()
+
+    def crawl(self):
+        self._visit('page', self.entry)
+        return self
+
+    def _visit(self, kind, path):
+        if path in self._seen:
+            return
+        self._seen.add(path)
+        file = self.root / path
+        if not file.is_file():
+            self.missing.append(path)
+            return
+        self.files.append(path)
+
+        if kind == 'page':
+            parser = _PageParser()
+            parser.feed(file.read_text(encoding='utf-8'))
+            references = parser.references + [
+                reference for module in parser.inline_modules for reference in _js_references(module)
+            ]
+        elif kind == 'css':
+            references = _css_references(file.read_text(encoding='utf-8'))
+        elif kind == 'module':
+            references = _js_references(file.read_text(encoding='utf-8'))
+        else:
+            references = []
+
+        base = posixpath.dirname(path)
+        for ref_kind, reference in references:
+            if _is_external(reference):
+                if not reference.startswith('data:') and reference not in self.external:
+                    self.external.append(reference)
+                continue
+            if reference.startswith('/'):
+                target = reference.lstrip('/')
+            else:
+                target = posixpath.normpath(posixpath.join(base, _split_url(reference)[0]))
+            self._visit(ref_kind, target)
+
+
+def file_revision(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()[:16]
+
+
+def build_manifest(root=ROOT_DIR, entry=ENTRY_PAGE, scope_dir=SCOPE_DIR):
+    """
+    Returns: {'version', 'assets': [{'url', 'revision'}], 'runtime': [url], 'missing': [path]}
+    """
+    graph = DependencyGraph(root, entry).crawl()
+    assets = []
+    for path in graph.files:
+        url = posixpath.relpath(path, scope_dir)
+        assets.append({'url': url, 'revision': file_revision(Path(root) / path)})
+        if path == entry:
+            # The page is also reachable as its directory URL
+            assets.append({'url': './', 'revision': assets[-1]['revision']})
+    assets.sort(key=lambda asset: asset['url'])
+
+    digest = hashlib.sha256()
+    for asset in assets:
+        digest.update(f"{asset['url']} {asset['revision']}\n".encode('utf-8'))
+
+    return {
+        'version': digest.hexdigest()[:12],
+        'assets': assets,
+        'runtime': graph.external,
+        'missing': graph.missing,
+    }
+
+
+def render_manifest(manifest):
+    """precache-manifest.js contents, loaded by sw.js with importScripts()"""
+    public = {key: manifest[key] for key in ('version', 'assets', 'runtime')}
+    return (
+        "// Generated by scripts/generate-precache-manifest.py - do not edit\n"
+        f"self.__PRECACHE_MANIFEST = {json.dumps(public, indent=2)};\n"
+    )
+
+
+def write_manifest(manifest, path=MANIFEST_FILE):
+    path = Path(path)
+    path.write_text(render_manifest(manifest), encoding='utf-8')
+    return path
@@ -0,0 +1,220 @@
+"""
+Result Rendering Benchmark
+Feeds synthetic search responses (N hotels x M vacancies) through the real
+displayResults() -> createHotelCard() -> pagination path of hotelSearch.js
+and measures the main-thread cost from the Chrome trace.
+
+ChromeDriver records the trace into the performance log when the session
+is created with trace_logging(options). Each measured window runs between
+two performance.mark()s, so only that work is attributed:
+
+    monitora:search-response  set by the API stub just before it responds
+    monitora:render-end       first frame after the hotel cards are attached
+    monitora:page-start/-end  around a click on the "next page" control
+"""
+import json
+
+from .api_factory import DatasetSpec, search_payload
+from .page_helpers import submit_search, wait_for
+
+TRACE_CATEGORIES = ','.join([
+    'devtools.timeline',
+    'disabled-by-default-devtools.timeline',
+    'v8.execute',
+    'blink.user_timing',
+])
+
+# Timeline event names by DevTools summary category. Events not listed
+# inherit the category of their enclosing event (V8 internals under a
+# FunctionCall count as scripting).
+EVENT_CATEGORIES = {
+    'scripting': {
+        'EvaluateScript', 'FunctionCall', 'EventDispatch', 'TimerFire', 'FireAnimationFrame',
+        'RunMicrotasks', 'FireIdleCallback', 'XHRReadyStateChange', 'v8.compile',
+        'v8.compileModule', 'v8.evaluateModule', 'V8.Execute', 'v8.run', 'MajorGC', 'MinorGC',
+        'V8.GCScavenger', 'V8.GCFinalizeMC', 'BlinkGC.AtomicPhase', 'ParseHTML',
+    },
+    'rendering': {
+        'UpdateLayoutTree', 'RecalculateStyles', 'Layout', 'HitTest', 'UpdateLayerTree',
+        'ScheduleStyleRecalculation', 'InvalidateLayout', 'ParseAuthorStyleSheet',
+        'IntersectionObserverController::computeIntersections',
+    },
+    'painting': {
+        'Paint', 'PaintImage', 'PrePaint', 'Layerize', 'CompositeLayers', 'Commit',
+        'Decode Image', 'RasterTask', 'UpdateLayer', 'PaintSetup',
+    },
+}
+_CATEGORY_OF = {name: category for category, names in EVENT_CATEGORIES.items() for name in names}
+TOP_LEVEL_TASKS = {'RunTask', 'ThreadControllerImpl::RunTask'}
+
+# Long tasks (https://w3c.github.io/longtasks/) start at 50ms
+LONG_TASK_MS = 50
+
+
+def synthetic_search_response(hotels=25, vacancies_per_hotel=100, seed=0, **spec):
+    """
+    A /vagas/search body in the shape apiClient.searchVacancies returns,
+    with vacancy texts the guest filter can parse ("até N pessoas");
+    extra keyword arguments go to api_factory.DatasetSpec
+    """
+    return search_payload(DatasetSpec(hotels, vacancies_per_hotel, seed=seed, **spec))
+
+
+def trace_logging(options):
+    """Enable the performance log with trace categories on Chrome options"""
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    options.add_experimental_option('perfLoggingPrefs', {'traceCategories': TRACE_CATEGORIES})
+    return options
+
+
+def read_trace_events(driver):
+    """Trace events collected since the last call (ChromeDriver drains its buffer)"""
+    events = []
+    for entry in driver.get_log('performance'):
+        message = json.loads(entry['message'])['message']
+        if message.get('method') == 'Tracing.dataCollected':
+            events.append(message['params'])
+    return events
+
+
+def _find_mark(events, name):
+    for event in events:
+        if event.get('name') == name and 'blink.user_timing' in event.get('cat', ''):
+            return event
+    return None
+
+
+def summarize_trace(events, start_mark, end_mark):
+    """
+    Self time per category on the renderer main thread between two marks
+
+    Returns: {'scripting', 'rendering', 'painting', 'other', 'tasks',
+              'long_tasks', 'longest_task'} in milliseconds (counts for tasks),
+              or None if a mark is missing from the trace
+    """
+    start, end = _find_mark(events, start_mark), _find_mark(events, end_mark)
+    if not start or not end:
+        return None
+    thread = (start['pid'], start['tid'])
+    window = [
+        event for event in events
+        if (event.get('pid'), event.get('tid')) == thread and event.get('ph') == 'X'
+        and start['ts'] <= event['ts'] <= end['ts'] and 'dur' in event
+    ]
+    window.sort(key=lambda event: (event['ts'], -event['dur']))
+
+    totals = {'scripting': 0.0, 'rendering': 0.0, 'painting': 0.0, 'other': 0.0}
+    tasks = []
+    stack = []  # [end_ts, category, children_dur, dur]
+
+    def close(frame):
+        totals[frame[1]] += frame[3] - frame[2]
+
+    for event in window:
+        while stack and event['ts'] >= stack[-1][0]:
+            close(stack.pop())
+        parent = stack[-1] if stack else None
+        category = _CATEGORY_OF.get(event['name']) or (parent[1] if parent else 'other')
+        if parent:
+            parent[2] += event['dur']
+        elif event['name'] in TOP_LEVEL_TASKS:
+            tasks.append(event['dur'] / 1000)
+        stack.append([event['ts'] + event['dur'], category, 0, event['dur']])
+    while stack:
+        close(stack.pop())
+
+    summary = {category: round(value / 1000, 1) for category, value in totals.items()}
+    summary.update({
+        'tasks': len(tasks),
+        'long_tasks': sum(1 for task in tasks if task >= LONG_TASK_MS),
+        'longest_task': round(max(tasks, default=0.0), 1),
+    })
+    return summary
+
+
+WAIT_RENDERED_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const container = document.getElementById('hotels-cards-container');
+(function poll() {
+    if (!container.querySelector('.hotel-card')) {
+        requestAnimationFrame(poll);
+        return;
+    }
+    // rAF + task: runs after the frame with the new cards was produced
+    requestAnimationFrame(() => setTimeout(() => {
+        performance.mark('monitora:render-end');
+        const [response] = performance.getEntriesByName('monitora:search-response').slice(-1);
+        const [rendered] = performance.getEntriesByName('monitora:render-end').slice(-1);
+        done({
+            elapsed: rendered.startTime - response.startTime,
+            cards: container.querySelectorAll('.hotel-card').length,
+            vacancyItems: container.querySelectorAll('.vacancy-item').length,
+            containerNodes: container.getElementsByTagName('*').length,
+            documentNodes: document.getElementsByTagName('*').length
+        });
+    }, 0));
+})();
+"""
+
+NEXT_PAGE_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const container = document.getElementById('hotels-cards-container');
+const next = document.querySelector('#pagination-container [data-page="next"]');
+if (!next || next.disabled) { done(null); return; }
+const first = container.querySelector('.hotel-card');
+performance.mark('monitora:page-start');
+next.click();
+(function poll() {
+    if (container.querySelector('.hotel-card') === first) {
+        requestAnimationFrame(poll);
+        return;
+    }
+    requestAnimationFrame(() => setTimeout(() => {
+        const end = performance.mark('monitora:page-end');
+        const [start] = performance.getEntriesByName('monitora:page-start').slice(-1);
+        done({
+            elapsed: end.startTime - start.startTime,
+            cards: container.querySelectorAll('.hotel-card').length,
+            vacancyItems: container.querySelectorAll('.vacancy-item').length,
+            containerNodes: container.getElementsByTagName('*').length,
+            documentNodes: document.getElementsByTagName('*').length
+        });
+    }, 0));
+})();
+"""
+
+
+def _heap_nodes(driver):
+    """DOM nodes alive in the renderer, including detached ones kept by scripts"""
+    metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+    return int(next(metric['value'] for metric in metrics if metric['name'] == 'Nodes'))
+
+
+def run_case(driver, url, hotels, vacancies_per_hotel, timeout=120):
+    """
+    Load the page, render one synthetic response and flip to page 2
+
+    Returns: {'hotels', 'vacancies', 'render': {...}, 'page': {...} or None}
+    """
+    driver.get(url)
+    wait_for(driver, "document.querySelectorAll('#hotel-select option').length > 1", 30)
+    driver.execute_cdp_cmd('Performance.enable', {})
+    driver.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+    nodes_before = _heap_nodes(driver)
+    read_trace_events(driver)
+
+    response = synthetic_search_response(hotels, vacancies_per_hotel)
+    driver.set_script_timeout(timeout)
+    submit_search(driver, True, response=response)
+    render = driver.execute_async_script(WAIT_RENDERED_SCRIPT)
+    render['trace'] = summarize_trace(
+        read_trace_events(driver), 'monitora:search-response', 'monitora:render-end'
+    )
+    render['liveNodes'] = _heap_nodes(driver) - nodes_before
+
+    page = driver.execute_async_script(NEXT_PAGE_SCRIPT)
+    if page:
+        page['trace'] = summarize_trace(
+            read_trace_events(driver), 'monitora:page-start', 'monitora:page-end'
+        )
+    return {'hotels': hotels, 'vacancies': vacancies_per_hotel, 'render': render, 'page': page}
@@ -0,0 +1,118 @@
+"""
+Single-Flight Search Client
+Vacancy searches for the Python tooling, coalesced per request: while a
+search for the same URL (hotel, checkin, checkout) is in flight, further
+callers in the process wait for it and share its result instead of
+starting another backend scrape. BuscaVagasAPIClient.searchVacancies
+does the same in the page (src/services/apiClient.js).
+
+Only concurrent calls are shared; nothing is cached once the search
+completes, and a failure is raised to every caller waiting on it.
+Results are shared objects, so callers must not mutate them. With a
+limiter (config/adaptive_limiter.py), each request that is actually sent
+waits for a slot and feeds its latency and 429s back into it.
+
+Usage:
+    client = SearchClient('http://localhost:3001/api')
+    with ThreadPoolExecutor(8) as pool:   # one scrape, eight results
+        results = list(pool.map(lambda _: client.search('-1', '2026-11-06', '2026-11-08'), range(8)))
+"""
+import json
+import threading
+import urllib.request
+from urllib.parse import urlencode
+
+from .json_stream import fetch_weekends
+
+API_BASE_URL = 'https://www.mpbarbosa.com/api'
+SEARCH_TIMEOUT = 600  # seconds; a scrape of every hotel takes minutes
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Runs one call per key at a time; concurrent callers share its outcome"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.started = 0   # calls actually run
+        self.shared = 0    # callers served by another caller's call
+
+    def in_flight(self):
+        with self._lock:
+            return list(self._calls)
+
+    def do(self, key, fn):
+        """fn() once per concurrent burst of callers with this key"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.started += 1
+            else:
+                call.waiters += 1
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+def search_url(base_url, hotel, checkin, checkout):
+    """Same URL as buildSearchUrl() in src/services/apiClient.js"""
+    return f"{base_url}/vagas/search?{urlencode({'hotel': hotel, 'checkin': checkin, 'checkout': checkout})}"
+
+
+class SearchClient:
+    """Vacancy and weekend searches, single-flight per request URL"""
+
+    def __init__(self, api_base_url=API_BASE_URL, timeout=SEARCH_TIMEOUT, flight=None, limiter=None):
+        self.api_base_url = api_base_url.rstrip('/')
+        self.timeout = timeout
+        self.flight = flight or SingleFlight()
+        self.limiter = limiter
+
+    def _send(self, fn, *args):
+        return self.limiter.call(fn, *args) if self.limiter else fn(*args)
+
+    def _get(self, url):
+        request = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            body = json.loads(response.read().decode('utf-8'))
+        if body.get('success') is False:
+            raise RuntimeError(body.get('error') or 'API returned error without message')
+        return body
+
+    def search(self, hotel, checkin, checkout):
+        """
+        GET /vagas/search; returns the response's data object (like
+        apiClient.searchVacancies)
+        """
+        url = search_url(self.api_base_url, hotel, checkin, checkout)
+        return self.flight.do(url, lambda: self._send(self._get, url))['data']
+
+    def search_weekends(self, count=8):
+        """GET /vagas/search/weekends?count=N; returns the response's data object"""
+        url = f"{self.api_base_url}/vagas/search/weekends?count={count}"
+        return self.flight.do(url, lambda: self._send(fetch_weekends, self.api_base_url, count, None, self.timeout))
@@ -1,11 +1,28 @@
 """
 Selenium WebDriver Configuration
 Handles Chrome binary detection across different environments
+
+Discovery results are cached across runs by binary fingerprint
+(discovery_cache.py) and timed in the startup profile (startup_profile.py).
 """
 import os
 import shutil
 from pathlib import Path
 
+try:
+    from .discovery_cache import discover
+    from .startup_profile import phase
+except ImportError:
+    # Running this file directly as a script
+    from discovery_cache import discover
+    from startup_profile import phase
+
+CHROMEDRIVER_FALLBACK_PATHS = [
+    "/usr/bin/chromedriver",
+    "/usr/local/bin/chromedriver",
+    "/snap/bin/chromedriver",
+]
+
 def get_chrome_binary_path():
     """
     Auto-detect Chrome binary location
@@ -23,53 +40,63 @@ def get_chrome_binary_path():
         "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe",  # Windows 32-bit
     ]
     
-    print("🔍 Searching for Chrome binary...")
-    for path in possible_paths:
-        if os.path.exists(path):
-            # Check if executable (skip on Windows)
-            if os.name != 'nt':
-                if not os.access(path, os.X_OK):
-                    print(f"   ⚠️ Found but not executable: {path}")
-                    continue
-            print(f"   ✅ Found Chrome: {path}")
-            return path
-        else:
-            print(f"   ❌ Not found: {path}")
-    
-    print("   ⚠️ Chrome binary not found in standard locations")
-    return None
+    def scan():
+        print("🔍 Searching for Chrome binary...")
+        for path in possible_paths:
+            if os.path.exists(path):
+                # Check if executable (skip on Windows)
+                if os.name != 'nt':
+                    if not os.access(path, os.X_OK):
+                        print(f"   ⚠️ Found but not executable: {path}")
+                        continue
+                print(f"   ✅ Found Chrome: {path}")
+                return path
+            else:
+                print(f"   ❌ Not found: {path}")
+        
+        print("   ⚠️ Chrome binary not found in standard locations")
+        return None
+    
+    with phase('binary discovery', 'chrome'):
+        path, cached = discover('chrome_binary', possible_paths, scan)
+    if cached:
+        print(f"🔍 Chrome binary: {path or 'not found'} (cached)")
+    return path
 
 def get_chromedriver_path():
     """
     Auto-detect ChromeDriver location
     Returns: Path to chromedriver executable
     """
-    print("🔍 Searching for ChromeDriver...")
-    
-    # Try to find in PATH
-    driver_path = shutil.which("chromedriver")
-    if driver_path:
-        print(f"   ✅ Found ChromeDriver: {driver_path}")
-        return driver_path
-    
-    # Fallback to common locations
-    fallback_paths = [
-        "/usr/bin/chromedriver",
-        "/usr/local/bin/chromedriver",
-        "/snap/bin/chromedriver",
-    ]
-    
-    for path in fallback_paths:
-        if os.path.exists(path):
-            print(f"   ✅ Found ChromeDriver: {path}")
-            return path
-    
-    print("   ⚠️ ChromeDriver not found, using default")
-    return "chromedriver"  # Let Selenium handle it
+    def scan():
+        print("🔍 Searching for ChromeDriver...")
+        
+        # Try to find in PATH
+        driver_path = shutil.which("chromedriver")
+        if driver_path:
+            print(f"   ✅ Found ChromeDriver: {driver_path}")
+            return driver_path
+        
+        # Fallback to common locations
+        for path in CHROMEDRIVER_FALLBACK_PATHS:
+            if os.path.exists(path):
+                print(f"   ✅ Found ChromeDriver: {path}")
+                return path
+        
+        print("   ⚠️ ChromeDriver not found, using default")
+        return None
+    
+    with phase('binary discovery', 'chromedriver'):
+        driver_path, cached = discover('chromedriver', CHROMEDRIVER_FALLBACK_PATHS, scan)
+    if cached and driver_path:
+        print(f"🔍 ChromeDriver: {driver_path} (cached)")
+    return driver_path or "chromedriver"  # Let Selenium handle it
 
-def get_chrome_options():
+def get_chrome_options(warm_profile=None):
     """
     Get configured Chrome options with proper binary detection
+    Args: warm_profile - start from a clone of the warmed profile template
+          (default: CHROME_WARM_PROFILE environment variable)
     Returns: Configured Options object
     """
     from selenium.webdriver.chrome.options import Options
@@ -103,6 +130,17 @@ def get_chrome_options():
     options.add_argument("--log-level=3")
     options.add_experimental_option('excludeSwitches', ['enable-logging'])
     
+    # Pre-warmed HTTP/code cache (each call gets its own profile clone)
+    try:
+        from .chrome_profile import warm_profile_enabled, with_warm_profile
+    except ImportError:
+        # Running this file directly as a script
+        from chrome_profile import warm_profile_enabled, with_warm_profile
+    if warm_profile is None:
+        warm_profile = warm_profile_enabled()
+    if warm_profile:
+        options = with_warm_profile(options)
+    
     return options
 
 def create_chrome_driver():
@@ -124,7 +162,8 @@ def create_chrome_driver():
     
     # Create driver
     try:
-        driver = webdriver.Chrome(service=service, options=options)
+        with phase('driver launch'):
+            driver = webdriver.Chrome(service=service, options=options)
         print("✅ Chrome WebDriver started successfully")
         return driver
     except Exception as e:
@@ -0,0 +1,236 @@
+"""
+Cross-Machine Test Sharding
+Deterministic, duration-balanced shard plans for splitting a run across CI agents
+
+Usage:
+    pytest tests/ --shard 1/3      # agent 1
+    pytest tests/ --shard 2/3      # agent 2
+    pytest tests/ --shard 3/3      # agent 3
+    python3 scripts/merge-shard-results.py tests/use_cases/results.shard-*.json
+
+Every agent computes the same plan from the same collection and the same
+duration history, so no coordination between agents is needed. The history
+must therefore be a shared file (--durations-file, e.g. a committed snapshot
+or the previous run's artifact), not each machine's local one; its digest is
+written into every shard result so the merge can reject mixed plans.
+"""
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+
+from .durations import group_scope
+
+# Approximate startup cost (seconds) of session-wide resources.
+# A shard pays each cost once, the first time one of its groups needs it.
+RESOURCE_COSTS = {
+    'browser': 3.0,
+    'web_server': 0.5,
+    'api_mock': 1.5,
+}
+
+# Fixtures and markers that imply a resource
+RESOURCE_FIXTURES = {
+    'driver': 'browser',
+    'driver_session': 'browser',
+    'driver_function': 'browser',
+    'web_server': 'web_server',
+    'app_server': 'web_server',
+    'api_mock': 'api_mock',
+}
+RESOURCE_MARKERS = {
+    'selenium': 'browser',
+    'api': 'api_mock',
+}
+
+RESULTS_DIR = Path(__file__).resolve().parent.parent / 'use_cases'
+
+
+def parse_shard(value):
+    """
+    Parse a "i/n" shard spec (1-based)
+    Returns: (index, count) tuple
+    Raises: ValueError on malformed or out-of-range specs
+    """
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except (AttributeError, ValueError):
+        raise ValueError(f"Invalid shard '{value}', expected i/n (e.g. 2/4)")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{value}', index must be between 1 and {count}")
+    return index, count
+
+
+def durations_digest(store):
+    """Identifies the duration history a plan was built from"""
+    content = json.dumps(store.durations, sort_keys=True)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+
+
+def item_resources(item):
+    """Session resources a collected test needs"""
+    resources = {
+        RESOURCE_FIXTURES[name]
+        for name in getattr(item, 'fixturenames', ())
+        if name in RESOURCE_FIXTURES
+    }
+    resources.update(
+        resource for marker, resource in RESOURCE_MARKERS.items()
+        if item.get_closest_marker(marker)
+    )
+    return resources
+
+
+def build_shard_plan(groups, count, store):
+    """
+    Balance test groups across shards, longest group first
+
+    Args:
+        groups: {scope: {'nodeids': [...], 'resources': set()}}
+        count: number of shards
+        store: DurationStore with historical durations
+
+    Returns:
+        List of shards, each {'scopes': [...], 'load': seconds, 'resources': set()}
+    """
+    shards = [{'scopes': [], 'load': 0.0, 'resources': set()} for _ in range(count)]
+    costs = {scope: store.estimate_group(group['nodeids']) for scope, group in groups.items()}
+
+    # Sort by cost, then name, so every agent derives the identical plan
+    for scope in sorted(groups, key=lambda s: (-costs[s], s)):
+        resources = groups[scope]['resources']
+
+        def load_with(shard):
+            startup = sum(RESOURCE_COSTS[r] for r in resources - shard['resources'])
+            return shard['load'] + costs[scope] + startup
+
+        target = min(shards, key=load_with)
+        target['load'] = load_with(target)
+        target['scopes'].append(scope)
+        target['resources'] |= resources
+
+    return shards
+
+
+def shard_results_path(index, count):
+    """Default per-shard results file"""
+    return RESULTS_DIR / f"results.shard-{index}-of-{count}.json"
+
+
+class ShardPlugin:
+    """
+    Pytest plugin that keeps only this agent's shard of the collection and
+    writes its outcomes in the tests/use_cases/results.json format
+    """
+
+    def __init__(self, index, count, store, results_path=None):
+        self.index = index
+        self.count = count
+        self.store = store
+        self.results_path = Path(results_path or shard_results_path(index, count))
+        # Taken before this run's durations are merged into the store
+        self.durations = durations_digest(store)
+        self.plan = None
+        self.started = None
+        self.outcomes = {}
+
+    def pytest_collection_modifyitems(self, config, items):
+        groups = {}
+        for item in items:
+            group = groups.setdefault(
+                group_scope(item.nodeid), {'nodeids': [], 'resources': set()}
+            )
+            group['nodeids'].append(item.nodeid)
+            group['resources'] |= item_resources(item)
+
+        self.plan = build_shard_plan(groups, self.count, self.store)
+        mine = set(self.plan[self.index - 1]['scopes'])
+
+        selected = [item for item in items if group_scope(item.nodeid) in mine]
+        deselected = [item for item in items if group_scope(item.nodeid) not in mine]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+    def pytest_report_collectionfinish(self, config, items):
+        if not self.plan:
+            return None
+        loads = ', '.join(f"{shard['load']:.1f}s" for shard in self.plan)
+        return f"🧩 Shard {self.index}/{self.count}: {len(items)} tests (planned loads: {loads})"
+
+    def pytest_sessionstart(self, session):
+        self.started = datetime.now()
+
+    def pytest_runtest_logreport(self, report):
+        outcome = self.outcomes.setdefault(report.nodeid, {
+            'passed': True,
+            'skipped': False,
+            'message': 'Success',
+            'duration': 0.0,
+        })
+        outcome['duration'] = round(outcome['duration'] + report.duration, 3)
+        if report.skipped:
+            outcome['skipped'] = True
+            outcome['passed'] = False
+            outcome['message'] = 'Skipped'
+        elif report.failed:
+            outcome['passed'] = False
+            outcome['message'] = 'Failed' if report.when == 'call' else f"Error in {report.when}"
+            outcome['stderr'] = report.longreprtext[-500:]
+
+    def pytest_sessionfinish(self, session):
+        # Under xdist only the controller writes the file
+        if hasattr(session.config, 'workerinput'):
+            return
+        results = {
+            'timestamp': (self.started or datetime.now()).isoformat(),
+            'shard': {'index': self.index, 'count': self.count, 'durations': self.durations},
+            'summary': {
+                'total': len(self.outcomes),
+                'passed': sum(1 for o in self.outcomes.values() if o['passed']),
+                'failed': sum(1 for o in self.outcomes.values()
+                              if not o['passed'] and not o['skipped']),
+                'skipped': sum(1 for o in self.outcomes.values() if o['skipped']),
+                'duration': round(sum(o['duration'] for o in self.outcomes.values()), 3),
+            },
+            'tests': self.outcomes,
+        }
+        try:
+            self.results_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.results_path, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"\n📊 Shard results saved to: {self.results_path}")
+        except OSError as e:
+            print(f"\n⚠️ Could not save shard results: {e}")
+
+
+def merge_shard_results(shard_results):
+    """
+    Combine per-shard results into a single results.json document
+
+    Args:
+        shard_results: list of parsed shard result dictionaries
+
+    Returns:
+        Dictionary in the collect-use-case-results.py format
+    """
+    merged = {
+        'timestamp': datetime.now().isoformat(),
+        'summary': {'total': 0, 'passed': 0, 'failed': 0, 'skipped': 0, 'duration': 0},
+        'tests': {},
+    }
+    for result in shard_results:
+        merged['tests'].update(result.get('tests', {}))
+
+    tests = merged['tests'].values()
+    merged['summary'] = {
+        'total': len(tests),
+        'passed': sum(1 for t in tests if t.get('passed')),
+        'failed': sum(1 for t in tests if not t.get('passed') and not t.get('skipped')),
+        'skipped': sum(1 for t in tests if t.get('skipped')),
+        'duration': round(sum(t.get('duration', 0) for t in tests), 3),
+    }
+    timestamps = [r['timestamp'] for r in shard_results if r.get('timestamp')]
+    if timestamps:
+        merged['timestamp'] = min(timestamps)
+    return merged
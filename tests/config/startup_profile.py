@@ -0,0 +1,173 @@
+"""
+Harness Startup Profiling
+Where the first seconds of a test run go: every harness phase (binary
+discovery, driver launch, web server start, first navigation, pytest
+collection) is timed with phase() into one process-wide profiler, and
+the breakdown is printed at the end of the run.
+
+Time spent before this module was first imported (interpreter start,
+pytest/plugin imports) comes from /proc on Linux and is shown as
+"interpreter + imports".
+
+Usage:
+    with phase('driver launch'):
+        driver = webdriver.Chrome(...)
+
+    pytest tests/ --startup-profile            # breakdown in the summary
+    STARTUP_PROFILE=1 python3 test-index-e2e.py   # breakdown at exit
+"""
+import atexit
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
+BAR_WIDTH = 30
+
+
+def process_age():
+    """Seconds since this process started (Linux /proc; None elsewhere)"""
+    try:
+        with open('/proc/self/stat') as f:
+            # Field 22 (starttime, clock ticks after boot) follows the ')' of comm
+            start_ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf('SC_CLK_TCK'))
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class Phase:
+    name: str
+    start: float      # seconds since the profiler was created
+    seconds: float
+    detail: str = ''
+
+
+class StartupProfiler:
+    """Collects timed phases and milestones of one process"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.before = process_age()   # interpreter + imports before the profiler existed
+        self.phases = []
+        self.milestones = {}          # name -> seconds since origin
+        self.printed = False
+
+    def now(self):
+        return time.perf_counter() - self.origin
+
+    @contextmanager
+    def phase(self, name, detail='', once=False):
+        """Time the block as `name`; with once=True only its first occurrence counts"""
+        if once and any(p.name == name for p in self.phases):
+            yield
+            return
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.phases.append(Phase(name, start, self.now() - start, detail))
+
+    def record(self, name, start, end=None, detail=''):
+        """Add a phase measured elsewhere (start/end in seconds since origin)"""
+        end = self.now() if end is None else end
+        self.phases.append(Phase(name, start, end - start, detail))
+
+    def milestone(self, name):
+        """Note the first time something happened (e.g. 'first test')"""
+        self.milestones.setdefault(name, self.now())
+
+    def breakdown(self):
+        """[(name, total seconds, count, details)] in order of first occurrence"""
+        rows = {}
+        if self.before is not None:
+            rows['interpreter + imports'] = [self.before, 1, []]
+        for p in sorted(self.phases, key=lambda p: p.start):
+            row = rows.setdefault(p.name, [0.0, 0, []])
+            row[0] += p.seconds
+            row[1] += 1
+            if p.detail and p.detail not in row[2]:
+                row[2].append(p.detail)
+        return [(name, total, count, details) for name, (total, count, details) in rows.items()]
+
+    def render(self):
+        rows = self.breakdown()
+        if not rows:
+            return ''
+        offset = self.before or 0.0
+        longest = max(total for _, total, _, _ in rows) or 1.0
+        width = max(len(name) for name, *_ in rows)
+        lines = ['⏱️  Harness startup breakdown']
+        for name, total, count, details in rows:
+            bar = '█' * max(1, round(total / longest * BAR_WIDTH)) if total >= 0.0005 else ''
+            extra = f" ×{count}" if count > 1 else ''
+            if details:
+                extra += f"  ({', '.join(details)})"
+            lines.append(f"   {name:<{width}}  {total:8.3f}s  {bar}{extra}")
+        for name, seconds in sorted(self.milestones.items(), key=lambda item: item[1]):
+            lines.append(f"   ➜ {name} after {offset + seconds:.2f}s")
+        return '\n'.join(lines)
+
+    def to_dict(self):
+        return {
+            'before_profiler': self.before,
+            'phases': [asdict(p) for p in self.phases],
+            'milestones': self.milestones,
+            'breakdown': [{'name': name, 'seconds': round(total, 6), 'count': count}
+                          for name, total, count, _ in self.breakdown()],
+        }
+
+    def print_breakdown(self, file=None):
+        if not self.printed:
+            self.printed = True
+            print('\n' + self.render(), file=file or sys.stdout)
+
+
+profiler = StartupProfiler()
+
+
+def phase(name, detail='', once=False):
+    """profiler.phase() on the process-wide profiler"""
+    return profiler.phase(name, detail, once)
+
+
+def enabled():
+    return os.getenv('STARTUP_PROFILE', '').lower() in ('1', 'true', 'yes')
+
+
+class StartupProfilePlugin:
+    """pytest side: collection and first-test milestones, breakdown in the summary"""
+
+    def __init__(self, output=None):
+        self.output = output
+        self._session_start = None
+
+    def pytest_sessionstart(self, session):
+        self._session_start = profiler.now()
+
+    def pytest_collection_finish(self, session):
+        if self._session_start is not None:
+            profiler.record('session start + collection', self._session_start,
+                            detail=f"{len(session.items)} tests")
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        profiler.milestone('first test')
+
+    def pytest_terminal_summary(self, terminalreporter):
+        profiler.printed = True
+        for line in profiler.render().splitlines():
+            terminalreporter.write_line(line)
+        if self.output:
+            with open(self.output, 'w', encoding='utf-8') as f:
+                json.dump(profiler.to_dict(), f, indent=2)
+            terminalreporter.write_line(f"   💾 Written to {self.output}")
+
+
+# Scripts (unittest suites, CLI tools) print the breakdown when they exit
+if enabled():
+    atexit.register(profiler.print_breakdown)
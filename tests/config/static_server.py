@@ -0,0 +1,36 @@
+"""
+Static File Server
+Serves the repository root so public/index.html can load its ../src assets
+(the web_server fixture serves public/ only).
+"""
+import functools
+import http.server
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(directory=ROOT_DIR, handler=QuietHandler):
+    """Start a threaded server on a free port; returns (httpd, base_url)"""
+    bound = functools.partial(handler, directory=str(directory))
+    httpd = http.server.ThreadingHTTPServer(("localhost", 0), bound)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, f"http://localhost:{httpd.server_address[1]}"
+
+
+@contextmanager
+def serve_directory(directory=ROOT_DIR, handler=QuietHandler):
+    """Context manager yielding the base URL of a server for directory"""
+    httpd, base_url = start_server(directory, handler)
+    try:
+        yield base_url
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
@@ -0,0 +1,221 @@
+"""
+Synthetic Monitoring
+Runs probes concurrently on an interval, keeps rolling latency percentiles
+and availability per endpoint, and exports them in the Prometheus text
+exposition format (suitable for the node_exporter textfile collector).
+With an AdaptiveLimiter, the API probes run through it and its current
+limit is exported too.
+"""
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+METRIC_PREFIX = 'monitora'
+QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+def percentile(sorted_values, q):
+    """Linear-interpolated percentile of an already sorted list"""
+    if not sorted_values:
+        return float('nan')
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+class EndpointStats:
+    """Rolling window of probe samples plus lifetime counters"""
+
+    def __init__(self, window):
+        self.samples = deque(maxlen=window)
+        self.successes = 0
+        self.failures = 0
+        self.latency_sum = 0.0
+        self.last_success = None
+        self.last_error = None
+
+    def record(self, ok, seconds, error=None):
+        self.samples.append((ok, seconds))
+        self.latency_sum += seconds
+        if ok:
+            self.successes += 1
+        else:
+            self.failures += 1
+            self.last_error = error
+        self.last_success = ok
+
+    @property
+    def count(self):
+        return self.successes + self.failures
+
+    @property
+    def availability(self):
+        if not self.samples:
+            return float('nan')
+        return sum(1 for ok, _ in self.samples if ok) / len(self.samples)
+
+    def quantiles(self):
+        latencies = sorted(seconds for _, seconds in self.samples)
+        return {q: percentile(latencies, q) for q in QUANTILES}
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class SyntheticMonitor:
+    """
+    Periodic concurrent prober
+
+    Args:
+        probes: {endpoint_name: callable} - a probe passes by returning a
+                truthy value and fails by returning falsy or raising
+        interval: seconds between the start of two cycles
+        window: number of recent samples kept per endpoint
+        metrics_file: Prometheus textfile written after every cycle
+        limiter: optional AdaptiveLimiter the probes share with other API traffic
+        limited: names of the probes that go through the limiter (default:
+                 all); probes of other services (e.g. the page) would skew
+                 the API's latency baseline
+    """
+
+    def __init__(self, probes, interval=60, window=100, metrics_file=None, limiter=None, limited=None):
+        self.probes = probes
+        self.limiter = limiter
+        self.limited = set(probes if limited is None else limited) if limiter else set()
+        self.interval = interval
+        self.metrics_file = Path(metrics_file) if metrics_file else None
+        self.stats = {name: EndpointStats(window) for name in probes}
+
+    def _timed(self, name):
+        probe = self.probes[name]
+        elapsed = [0.0]
+
+        def timed_probe():
+            # Timed inside the limiter slot: waiting for a slot or a
+            # Retry-After pause is not the endpoint's latency
+            start = time.perf_counter()
+            try:
+                return probe()
+            finally:
+                elapsed[0] = time.perf_counter() - start
+
+        try:
+            result = self.limiter.call(timed_probe) if name in self.limited else timed_probe()
+            ok, error = bool(result), None
+        except Exception as e:
+            ok, error = False, str(e)
+        return name, ok, elapsed[0], error
+
+    def run_cycle(self):
+        """Run every probe once, concurrently"""
+        with ThreadPoolExecutor(max_workers=len(self.probes)) as pool:
+            for name, ok, seconds, error in pool.map(self._timed, self.probes):
+                self.stats[name].record(ok, seconds, error)
+        if self.metrics_file:
+            self.write_metrics()
+
+    def run(self, cycles=None, on_cycle=None):
+        """
+        Probe until interrupted (or for a fixed number of cycles)
+        on_cycle(monitor) is called after each cycle, e.g. to print a status line
+        """
+        completed = 0
+        try:
+            while cycles is None or completed < cycles:
+                started = time.monotonic()
+                self.run_cycle()
+                completed += 1
+                if on_cycle:
+                    on_cycle(self)
+                if cycles is not None and completed >= cycles:
+                    break
+                time.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            pass
+        return completed
+
+    def render_metrics(self):
+        """Prometheus text exposition of the current state"""
+        latency = f'{METRIC_PREFIX}_probe_latency_seconds'
+        lines = [
+            f'# HELP {latency} Probe latency; quantiles over the rolling window',
+            f'# TYPE {latency} summary',
+        ]
+        for name, stats in self.stats.items():
+            endpoint = _label(name)
+            if stats.samples:
+                for q, value in stats.quantiles().items():
+                    lines.append(f'{latency}{{endpoint="{endpoint}",quantile="{q}"}} {value:.6f}')
+            lines.append(f'{latency}_sum{{endpoint="{endpoint}"}} {stats.latency_sum:.6f}')
+            lines.append(f'{latency}_count{{endpoint="{endpoint}"}} {stats.count}')
+
+        availability = f'{METRIC_PREFIX}_probe_availability_ratio'
+        lines += [
+            f'# HELP {availability} Share of successful probes in the rolling window',
+            f'# TYPE {availability} gauge',
+        ]
+        for name, stats in self.stats.items():
+            if stats.samples:
+                lines.append(f'{availability}{{endpoint="{_label(name)}"}} {stats.availability:.6f}')
+
+        up = f'{METRIC_PREFIX}_probe_success'
+        lines += [
+            f'# HELP {up} Whether the most recent probe succeeded',
+            f'# TYPE {up} gauge',
+        ]
+        for name, stats in self.stats.items():
+            if stats.last_success is not None:
+                lines.append(f'{up}{{endpoint="{_label(name)}"}} {int(stats.last_success)}')
+
+        total = f'{METRIC_PREFIX}_probes_total'
+        lines += [
+            f'# HELP {total} Probes run since the monitor started',
+            f'# TYPE {total} counter',
+        ]
+        for name, stats in self.stats.items():
+            endpoint = _label(name)
+            lines.append(f'{total}{{endpoint="{endpoint}",result="success"}} {stats.successes}')
+            lines.append(f'{total}{{endpoint="{endpoint}",result="failure"}} {stats.failures}')
+
+        if self.limiter:
+            limit = f'{METRIC_PREFIX}_concurrency_limit'
+            report = self.limiter.report()
+            lines += [
+                f'# HELP {limit} Adaptive concurrency limit for API requests (current and settled)',
+                f'# TYPE {limit} gauge',
+                f'{limit}{{value="current"}} {report["limit"]}',
+                f'{limit}{{value="settled"}} {report["settled"]}',
+            ]
+
+        stamp = f'{METRIC_PREFIX}_monitor_last_run_timestamp_seconds'
+        lines += [
+            f'# HELP {stamp} Unix time of the last completed probe cycle',
+            f'# TYPE {stamp} gauge',
+            f'{stamp} {time.time():.3f}',
+        ]
+        return '\n'.join(lines) + '\n'
+
+    def write_metrics(self):
+        """Write the metrics file atomically so scrapers never see half a file"""
+        self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.metrics_file.with_name(f'.{self.metrics_file.name}.{os.getpid()}.tmp')
+        tmp.write_text(self.render_metrics(), encoding='utf-8')
+        os.replace(tmp, self.metrics_file)
+
+    def status_line(self):
+        """One-line human summary of the latest cycle"""
+        parts = []
+        for name, stats in self.stats.items():
+            q = stats.quantiles()
+            parts.append(
+                f"{name}: {'UP' if stats.last_success else 'DOWN'} "
+                f"p50={q[0.5] * 1000:.0f}ms p95={q[0.95] * 1000:.0f}ms "
+                f"avail={stats.availability * 100:.1f}%"
+            )
+        return f"[{datetime.now().strftime('%H:%M:%S')}] " + ' | '.join(parts)
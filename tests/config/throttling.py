@@ -0,0 +1,155 @@
+"""
+CPU and Network Throttling Profiles
+CDP emulation profiles for the mobile experience and the core flows timed
+under each one (page load, hotel list population, search, guest filter).
+
+Network presets use the Chrome DevTools values (bytes/s, latency in ms);
+'slow-4g' is the Lighthouse mobile preset. The API is the local MockAPI
+(tests/config/mock_api.py) so API calls are throttled too.
+"""
+from .page_helpers import search_dates, wait_for
+
+NETWORK_PRESETS = {
+    'fast-3g': {'latency': 562.5, 'downloadThroughput': 180_000, 'uploadThroughput': 84_375},
+    'slow-4g': {'latency': 150, 'downloadThroughput': 200_000, 'uploadThroughput': 93_750},
+    'fast-4g': {'latency': 165, 'downloadThroughput': 1_012_500, 'uploadThroughput': 168_750},
+}
+
+# name: (CPU slowdown, network preset or None, go offline once loaded)
+PROFILES = {
+    'unthrottled': {'cpu': 1, 'network': None, 'offline_after_load': False},
+    'mid-tier-slow-4g': {'cpu': 4, 'network': 'slow-4g', 'offline_after_load': False},
+    'low-end-fast-3g': {'cpu': 4, 'network': 'fast-3g', 'offline_after_load': False},
+    'offline-after-load': {'cpu': 4, 'network': 'fast-4g', 'offline_after_load': True},
+}
+
+FLOWS = ['page_load', 'first_contentful_paint', 'hotel_list', 'search', 'guest_filter']
+
+# Records when #hotel-select first has real options, from the document start
+HOTEL_LIST_PROBE = """
+window.__monitoraTimings = {};
+document.addEventListener('DOMContentLoaded', () => {
+    const select = document.getElementById('hotel-select');
+    if (!select) return;
+    const check = () => {
+        if (select.options.length > 1 && !window.__monitoraTimings.hotelList) {
+            window.__monitoraTimings.hotelList = performance.now();
+            observer.disconnect();
+        }
+    };
+    const observer = new MutationObserver(check);
+    observer.observe(select, {childList: true});
+    check();
+});
+"""
+
+PAGE_LOAD_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+return {
+    page_load: nav.loadEventEnd,
+    first_contentful_paint: fcp ? fcp.startTime : null,
+    hotel_list: window.__monitoraTimings.hotelList || null,
+    transferred: performance.getEntriesByType('resource')
+        .reduce((sum, r) => sum + r.transferSize, nav.transferSize)
+};
+"""
+
+# Time from the click to the first frame showing results, empty or error state
+SEARCH_SCRIPT = """
+const [checkin, checkout] = arguments;
+const done = arguments[arguments.length - 1];
+const container = document.getElementById('hotels-cards-container');
+const set = (id, value) => {
+    const el = document.getElementById(id);
+    el.value = value;
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+};
+set('hotel-select', '-1');
+set('input-checkin', checkin);
+set('input-checkout', checkout);
+const started = performance.now();
+document.getElementById('search-button').click();
+(function poll() {
+    const outcome = container.querySelector('.hotel-card') ? 'results'
+        : container.querySelector('.empty-state') ? 'empty'
+        : container.querySelector('.error-state') ? 'error' : null;
+    if (!outcome) { requestAnimationFrame(poll); return; }
+    requestAnimationFrame(() => setTimeout(() => done({
+        elapsed: performance.now() - started, outcome
+    }), 0));
+})();
+"""
+
+# Time from a click on the guest "+" button to the frame with the re-filtered cards
+GUEST_FILTER_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const container = document.getElementById('hotels-cards-container');
+const plus = document.querySelector('.js-number-input .plus');
+if (!plus || plus.disabled) { done(null); return; }
+const observer = new MutationObserver(() => {
+    observer.disconnect();
+    requestAnimationFrame(() => setTimeout(() => done({
+        elapsed: performance.now() - started
+    }), 0));
+});
+observer.observe(container, {childList: true});
+const started = performance.now();
+plus.click();
+"""
+
+
+def network_conditions(preset, offline=False):
+    """Network.emulateNetworkConditions parameters for a preset name (None = no throttling)"""
+    params = {'offline': offline, 'latency': 0, 'downloadThroughput': -1, 'uploadThroughput': -1}
+    if preset:
+        params.update(NETWORK_PRESETS[preset])
+    return params
+
+
+def apply_profile(driver, profile):
+    """Cold cache plus the profile's CPU and network emulation"""
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+    driver.execute_cdp_cmd('Emulation.setCPUThrottlingRate', {'rate': profile['cpu']})
+    driver.execute_cdp_cmd('Network.emulateNetworkConditions', network_conditions(profile['network']))
+
+
+def reset_profile(driver):
+    driver.execute_cdp_cmd('Emulation.setCPUThrottlingRate', {'rate': 1})
+    driver.execute_cdp_cmd('Network.emulateNetworkConditions', network_conditions(None))
+
+
+def run_flows(driver, url, profile, timeout=180):
+    """
+    Time the core flows under one profile; use a fresh driver per profile
+    (the hotel list probe is registered for every new document)
+
+    Returns: {'page_load', 'first_contentful_paint', 'hotel_list', 'search',
+              'guest_filter' (ms or None), 'search_outcome', 'transferred'}
+    """
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': HOTEL_LIST_PROBE})
+    apply_profile(driver, profile)
+    driver.set_script_timeout(timeout)
+    try:
+        driver.get(url)
+        wait_for(driver, "document.readyState === 'complete'", timeout)
+        wait_for(driver, "window.__monitoraTimings.hotelList", timeout)
+        timings = driver.execute_script(PAGE_LOAD_SCRIPT)
+
+        if profile['offline_after_load']:
+            driver.execute_cdp_cmd('Network.emulateNetworkConditions',
+                                   network_conditions(profile['network'], offline=True))
+
+        search = driver.execute_async_script(SEARCH_SCRIPT, *search_dates())
+        timings['search'] = search['elapsed']
+        timings['search_outcome'] = search['outcome']
+
+        filtered = None
+        if search['outcome'] == 'results':
+            wait_for(driver, "!document.querySelector('.js-number-input .plus').disabled", timeout)
+            filtered = driver.execute_async_script(GUEST_FILTER_SCRIPT)
+        timings['guest_filter'] = filtered['elapsed'] if filtered else None
+    finally:
+        reset_profile(driver)
+    return timings
@@ -0,0 +1,81 @@
+"""
+Duration-Aware xdist Scheduling
+Longest-job-first distribution of test groups across pytest-xdist workers
+
+Usage:
+    pytest tests/ -n auto --duration-scheduling
+"""
+from xdist.scheduler import LoadScopeScheduling
+
+from .durations import group_scope
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """
+    LoadScope scheduling that hands out the most expensive group first
+
+    Groups are the same as ``--dist loadscope`` (a test class, or a module
+    of plain functions) so a class-scoped browser or web server is started
+    once per group. Whenever a worker runs dry it receives the longest
+    remaining group according to the duration history, which is the classic
+    LPT heuristic: the run ends close to max(longest group, total / workers).
+    """
+
+    def __init__(self, config, log=None, store=None):
+        super().__init__(config, log)
+        self.store = store
+        self._costs = {}
+
+    def _split_scope(self, nodeid):
+        return group_scope(nodeid)
+
+    def _scope_cost(self, scope):
+        if scope not in self._costs:
+            self._costs[scope] = self.store.estimate_group(self.workqueue[scope])
+        return self._costs[scope]
+
+    def _assign_work_unit(self, node):
+        """Move the longest pending group to the front before assigning it"""
+        longest = max(self.workqueue, key=self._scope_cost)
+        self.workqueue.move_to_end(longest, last=False)
+        super()._assign_work_unit(node)
+
+    def schedule(self):
+        first_distribution = self.collection is None
+        super().schedule()
+        if first_distribution and self.collection:
+            self._report_plan()
+
+    def _report_plan(self):
+        """Print the expected makespan bounds once the plan is known"""
+        costs = [self.store.estimate_group(unit) for unit in self._all_units()]
+        if not costs:
+            return
+        workers = max(len(self.nodes), 1)
+        critical_path = max(costs)
+        lower_bound = max(critical_path, sum(costs) / workers)
+        reporter = self.config.pluginmanager.get_plugin('terminalreporter')
+        if reporter:
+            reporter.write_line(
+                f"⏱️ Duration scheduling: {len(costs)} groups on {workers} workers, "
+                f"estimated total {sum(costs):.1f}s, critical path {critical_path:.1f}s, "
+                f"best possible wall time ~{lower_bound:.1f}s"
+            )
+
+    def _all_units(self):
+        units = list(self.workqueue.values())
+        for workload in self.assigned_work.values():
+            units.extend(workload.values())
+        return units
+
+
+class DurationSchedulingPlugin:
+    """Registers DurationScheduling as the xdist scheduler when requested"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def pytest_xdist_make_scheduler(self, config, log):
+        if not config.getoption('duration_scheduling'):
+            return None
+        return DurationScheduling(config, log, store=self.store)
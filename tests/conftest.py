@@ -11,6 +11,9 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root / 'src'))
 
+# Imported first so the startup profile's clock starts with the harness
+from config.startup_profile import phase
+
 # ============================================================================
 # Selenium Fixtures
 # ============================================================================
@@ -24,7 +27,8 @@ def chrome_options():
     try:
         # Use centralized configuration
         from config.selenium_config import get_chrome_options
-        return get_chrome_options()
+        # Warm profiles are applied per driver, see _driver_options()
+        return get_chrome_options(warm_profile=False)
     except ImportError:
         # Fallback to basic configuration
         from selenium.webdriver.chrome.options import Options
@@ -41,8 +45,21 @@ def chrome_options():
         
         return options
 
+def _driver_options(config, chrome_options):
+    """
+    Options for one driver: a private warm-profile clone when requested
+    (two Chrome processes can never share a user-data directory)
+    """
+    try:
+        from config.chrome_profile import warm_profile_enabled, with_warm_profile
+    except ImportError:
+        return chrome_options
+    if config.getoption("warm_profile") or warm_profile_enabled():
+        return with_warm_profile(chrome_options)
+    return chrome_options
+
 @pytest.fixture(scope="session")
-def driver_session(chrome_options):
+def driver_session(request, chrome_options):
     """
     Session-scoped WebDriver (shared across all tests)
     Use for tests that don't modify browser state
@@ -53,14 +70,18 @@ def driver_session(chrome_options):
     from selenium import webdriver
     from selenium.webdriver.chrome.service import Service
     
+    options = _driver_options(request.config, chrome_options)
+
     try:
         # Try to use configuration module
         from config.selenium_config import get_chromedriver_path
         service = Service(executable_path=get_chromedriver_path())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        with phase('driver launch'):
+            driver = webdriver.Chrome(service=service, options=options)
     except ImportError:
         # Fallback to default
-        driver = webdriver.Chrome(options=chrome_options)
+        with phase('driver launch'):
+            driver = webdriver.Chrome(options=options)
     
     yield driver
     
@@ -68,7 +89,7 @@ def driver_session(chrome_options):
     driver.quit()
 
 @pytest.fixture(scope="function")
-def driver_function(chrome_options):
+def driver_function(request, chrome_options):
     """
     Function-scoped WebDriver (new driver per test)
     Use for tests that modify browser state or require isolation
@@ -78,12 +99,16 @@ def driver_function(chrome_options):
     from selenium import webdriver
     from selenium.webdriver.chrome.service import Service
     
+    options = _driver_options(request.config, chrome_options)
+
     try:
         from config.selenium_config import get_chromedriver_path
         service = Service(executable_path=get_chromedriver_path())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        with phase('driver launch'):
+            driver = webdriver.Chrome(service=service, options=options)
     except ImportError:
-        driver = webdriver.Chrome(options=chrome_options)
+        with phase('driver launch'):
+            driver = webdriver.Chrome(options=options)
     
     yield driver
     
@@ -110,7 +135,6 @@ def web_server():
     import socketserver
     import threading
     import socket
-    import time
     from pathlib import Path
     
     # Find free port
@@ -133,25 +157,24 @@ def web_server():
             # Suppress server logs during tests
             pass
     
-    # Allow port reuse
-    socketserver.TCPServer.allow_reuse_address = True
-    httpd = socketserver.TCPServer(("", port), Handler)
-    
-    # Start server in background thread
-    server_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
-    server_thread.start()
-    
-    # Wait for server to be ready (reduced from 2s to 0.5s)
-    time.sleep(0.5)
-    
-    # Verify server is responding
-    import urllib.request
-    base_url = f"http://localhost:{port}"
-    try:
-        urllib.request.urlopen(f"{base_url}/", timeout=2)
-    except Exception as e:
-        httpd.shutdown()
-        raise RuntimeError(f"Server failed to start: {e}")
+    with phase('web server start'):
+        # Allow port reuse
+        socketserver.TCPServer.allow_reuse_address = True
+        httpd = socketserver.TCPServer(("", port), Handler)
+
+        # Start server in background thread
+        server_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        server_thread.start()
+
+        # Verify server is responding (the socket already listens once
+        # TCPServer() returns, so no startup sleep is needed)
+        import urllib.request
+        base_url = f"http://localhost:{port}"
+        try:
+            urllib.request.urlopen(f"{base_url}/", timeout=2)
+        except Exception as e:
+            httpd.shutdown()
+            raise RuntimeError(f"Server failed to start: {e}")
     
     print(f"✅ Test server started on {base_url}")
     
@@ -162,6 +185,48 @@ def web_server():
     httpd.shutdown()
     httpd.server_close()
 
+@pytest.fixture(scope="session")
+def app_server():
+    """
+    Session-scoped server for the repository root: public/index.html loads
+    its modules and styles from ../src, which web_server (public/ only)
+    answers with 404. Load f"{app_server}/public/index.html".
+    """
+    from config.static_server import start_server
+
+    with phase('app server start'):
+        httpd, base_url = start_server()
+    yield base_url
+    httpd.shutdown()
+    httpd.server_close()
+
+@pytest.fixture
+def index_page(app_server, driver_function):
+    """
+    Page object for index.html on the repository-root server (not yet opened)
+    Call .open() to load it; see config/index_page.py for the selectors
+    """
+    from config.index_page import IndexPage
+    return IndexPage(driver_function, f"{app_server}/public/index.html")
+
+@pytest.fixture
+def browser_console(request, driver_function):
+    """
+    Console messages and exceptions of driver_function's page, pushed into
+    a per-test ring buffer as they happen (see config/console_capture.py)
+    The console trail is printed with the report of a failing test
+    """
+    from config.console_capture import ConsoleCapture
+    capture = ConsoleCapture(driver_function).start()
+
+    yield capture
+
+    if hasattr(request.node, 'rep_call') and request.node.rep_call.failed:
+        print("\n🖥️  Browser console trail:")
+        for line in capture.trail():
+            print(f"   {line}")
+    capture.stop()
+
 # ============================================================================
 # Utility Fixtures
 # ============================================================================
@@ -227,6 +292,48 @@ def sample_hotel_data():
         ]
     }
 
+@pytest.fixture
+def synthetic_api():
+    """
+    Synthetic API payloads at any scale (see config/api_factory.py)
+    Usage: synthetic_api.search(hotels=25, vacancies_per_hotel=300, unavailable_ratio=0.2)
+    """
+    from types import SimpleNamespace
+    from config.api_factory import DatasetSpec, hotels_payload, iter_search_json, search_payload
+
+    def search(checkin=None, checkout=None, hotel='-1', **spec):
+        return search_payload(DatasetSpec(**spec), checkin, checkout, hotel)
+
+    def stream(checkin=None, checkout=None, hotel='-1', **spec):
+        return iter_search_json(DatasetSpec(**spec), checkin, checkout, hotel)
+
+    def hotels(**spec):
+        return hotels_payload(DatasetSpec(**spec))
+
+    return SimpleNamespace(search=search, stream=stream, hotels=hotels)
+
+@pytest.fixture
+def api_base_url(request):
+    """
+    API base URL for an 'api' test: --api-url, or the mock API while the
+    --api-circuit breaker is open
+    """
+    plugin = request.config.pluginmanager.get_plugin("api_circuit")
+    return plugin.breaker.route() if plugin else request.config.getoption("api_url")
+
+@pytest.fixture
+def api_page_query(api_base_url):
+    """
+    Query string that points index.html at api_base_url: none for the
+    production API, ?useLocalAPI=true for localhost:3001 (where the mock API
+    runs while the breaker is open)
+    """
+    if api_base_url == "http://localhost:3001/api":
+        return "?useLocalAPI=true"
+    if api_base_url == "https://www.mpbarbosa.com/api":
+        return ""
+    pytest.skip(f"index.html can only use the production API or localhost:3001, not {api_base_url}")
+
 @pytest.fixture
 def sample_search_params():
     """
@@ -245,6 +352,15 @@ def sample_search_params():
         "weekend_count": 1
     }
 
+@pytest.fixture(scope="session")
+def source_index():
+    """
+    Index of src/js and src/services modules (exports, imports, functions,
+    string literals), cached by content hash between runs
+    """
+    from config.js_index import source_index as build_source_index
+    return build_source_index()
+
 # ============================================================================
 # Cleanup Fixtures
 # ============================================================================
@@ -263,10 +379,119 @@ def reset_environment():
 # Configuration
 # ============================================================================
 
+def pytest_addoption(parser):
+    """
+    Harness command-line options
+    """
+    group = parser.getgroup("monitora", "Monitora Vagas test harness")
+    group.addoption(
+        "--durations-file",
+        default=None,
+        help="Historical per-test durations (default: tests/.test_durations.json; required with --shard)",
+    )
+    group.addoption(
+        "--duration-scheduling",
+        action="store_true",
+        default=False,
+        help="With -n, hand out test classes/modules longest-first from historical durations",
+    )
+    group.addoption(
+        "--warm-profile",
+        action="store_true",
+        default=False,
+        help="Start Chrome from a clone of the pre-warmed profile template (HTTP/code cache)",
+    )
+    group.addoption(
+        "--shard",
+        default=None,
+        metavar="I/N",
+        help="Run only shard I of N (1-based), balanced by historical durations",
+    )
+    group.addoption(
+        "--api-circuit",
+        choices=("off", "fail", "mock"),
+        default="off",
+        help="Gate 'api' tests with a /health circuit breaker: fail them fast or use the mock API while it is open",
+    )
+    group.addoption(
+        "--api-url",
+        default="https://www.mpbarbosa.com/api",
+        help="API base URL for 'api' tests (default: production)",
+    )
+    group.addoption(
+        "--startup-profile",
+        action="store_true",
+        default=False,
+        help="Print how long each harness startup phase took (also: STARTUP_PROFILE=1)",
+    )
+    group.addoption(
+        "--startup-profile-output",
+        default=None,
+        help="Also write the startup profile as JSON to this file",
+    )
+    group.addoption(
+        "--shard-results",
+        default=None,
+        help="Shard results file (default: tests/use_cases/results.shard-I-of-N.json)",
+    )
+
 def pytest_configure(config):
     """
     Pytest configuration hook
     """
+    from config.durations import DurationStore, DurationRecorder, DURATIONS_FILE
+    store = DurationStore(config.getoption("durations_file") or DURATIONS_FILE)
+
+    # Sharding runs on xdist workers too, since they do the collection
+    if config.getoption("shard"):
+        from config.sharding import ShardPlugin, parse_shard
+        try:
+            index, count = parse_shard(config.getoption("shard"))
+        except ValueError as e:
+            raise pytest.UsageError(str(e))
+        # Every agent has to plan from the same history, not its local one
+        durations_file = config.getoption("durations_file")
+        if not durations_file or not Path(durations_file).is_file():
+            raise pytest.UsageError(
+                "--shard needs the shared duration history: pass --durations-file FILE "
+                "(the same file on every agent)"
+            )
+        config.pluginmanager.register(
+            ShardPlugin(index, count, store, config.getoption("shard_results")),
+            "shard",
+        )
+
+    # Each xdist worker keeps its own breaker, since the workers run the tests
+    if config.getoption("api_circuit") != "off":
+        from config.circuit_breaker import CircuitBreaker, CircuitBreakerPlugin
+        from config.mock_api import MockAPI
+        # On port 3001, the local API index.html uses with ?useLocalAPI=true
+        fallback = MockAPI() if config.getoption("api_circuit") == "mock" else None
+        config.pluginmanager.register(
+            CircuitBreakerPlugin(CircuitBreaker(config.getoption("api_url"), fallback=fallback)),
+            "api_circuit",
+        )
+
+    # Duration history, the event log and the startup profile are kept by
+    # the controller only (xdist forwards worker reports)
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(store), "duration_recorder")
+
+        from config.event_log import EventLog, EventLogPlugin
+        config.pluginmanager.register(EventLogPlugin(EventLog("pytest")), "event_log")
+
+        from config.startup_profile import StartupProfilePlugin, enabled
+        if config.getoption("startup_profile") or enabled():
+            config.pluginmanager.register(
+                StartupProfilePlugin(config.getoption("startup_profile_output")), "startup_profile"
+            )
+
+        if config.pluginmanager.hasplugin("xdist"):
+            from config.xdist_scheduling import DurationSchedulingPlugin
+            config.pluginmanager.register(
+                DurationSchedulingPlugin(store), "duration_scheduling"
+            )
+
     # Add custom markers
     config.addinivalue_line(
         "markers", "selenium: mark test as requiring Selenium WebDriver"
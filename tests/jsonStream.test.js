@@ -0,0 +1,87 @@
+/**
+ * Unit Test Suite for the Incremental JSON Array Parser
+ * Items must come out as soon as their bytes are complete, whatever the
+ * chunk boundaries, and the whole document must still parse at the end
+ *
+ * @jest-environment node
+ */
+
+import { describe, test, expect } from '@jest/globals';
+import { JSONItemStream, readJSONItems } from '../src/services/jsonStream.js';
+
+const WEEKEND_RESPONSE = {
+    success: true,
+    data: {
+        searchDetails: { totalWeekendsSearched: 3, note: 'tricky "weekends": [ ] } text' },
+        weekends: [
+            { weekendNumber: 1, checkin: '2026-01-02', checkout: '2026-01-04', hasAvailability: true,
+              result: { vacancies: ['Guarujá: FURNAS (até 3 pessoas)02/01 - 04/01'], nested: [[1], { a: '}]\\' }] } },
+            { weekendNumber: 2, checkin: '2026-01-09', checkout: '2026-01-11', hasAvailability: false, result: {} },
+            { weekendNumber: 3, checkin: '2026-01-16', checkout: '2026-01-18', hasAvailability: true, result: {} }
+        ],
+        availability: { weekendsWithVacancies: 2 }
+    }
+};
+
+function feedInChunks(text, size, path) {
+    const stream = new JSONItemStream(path);
+    const items = [];
+    for (let i = 0; i < text.length; i += size) {
+        items.push(...stream.feed(text.slice(i, i + size)));
+    }
+    return { items, document: stream.close() };
+}
+
+describe('JSONItemStream', () => {
+
+    test('emits each weekend once its closing brace arrives', () => {
+        const text = JSON.stringify(WEEKEND_RESPONSE);
+        const firstEnd = text.indexOf('{"weekendNumber":2') - 1;
+        const stream = new JSONItemStream(['data', 'weekends']);
+
+        expect(stream.feed(text.slice(0, firstEnd - 1))).toEqual([]);
+        expect(stream.feed(text.slice(firstEnd - 1, firstEnd))).toEqual([WEEKEND_RESPONSE.data.weekends[0]]);
+        expect(stream.feed(text.slice(firstEnd))).toEqual(WEEKEND_RESPONSE.data.weekends.slice(1));
+        expect(stream.close()).toEqual(WEEKEND_RESPONSE);
+    });
+
+    test.each([1, 2, 3, 7, 64])('gives the same items for %i-character chunks', (size) => {
+        const { items, document } = feedInChunks(JSON.stringify(WEEKEND_RESPONSE, null, 2), size);
+
+        expect(items).toEqual(WEEKEND_RESPONSE.data.weekends);
+        expect(document).toEqual(WEEKEND_RESPONSE);
+    });
+
+    test('handles scalar items and a root-level array', () => {
+        expect(feedInChunks('{"a": [1, 2.5e3 , "x", true, null]}', 2, ['a']).items)
+            .toEqual([1, 2500, 'x', true, null]);
+        expect(feedInChunks('[{"a": 1}, {"b": 2}]', 3, []).items).toEqual([{ a: 1 }, { b: 2 }]);
+    });
+
+    test('close() rejects an incomplete document', () => {
+        const stream = new JSONItemStream();
+        stream.feed('{"data": {"weekends": [{"weekendNumber": 1}');
+        expect(() => stream.close()).toThrow(SyntaxError);
+    });
+});
+
+describe('readJSONItems', () => {
+
+    test('reads a byte stream split inside multi-byte characters', async () => {
+        const bytes = new TextEncoder().encode(JSON.stringify(WEEKEND_RESPONSE));
+        const body = new ReadableStream({
+            start(controller) {
+                for (let i = 0; i < bytes.length; i += 3) {
+                    controller.enqueue(bytes.slice(i, i + 3));
+                }
+                controller.close();
+            }
+        });
+        const seen = [];
+
+        const document = await readJSONItems({ body }, (weekend, index) => seen.push([index, weekend.weekendNumber]));
+
+        expect(seen).toEqual([[0, 1], [1, 2], [2, 3]]);
+        expect(document).toEqual(WEEKEND_RESPONSE);
+    });
+});
@@ -12,8 +12,11 @@ import subprocess
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from config.event_log import EventLog
 
-def run_test(test_file, description):
+
+def run_test(test_file, description, env=None):
     """Run a single test file and return result"""
     print("\n" + "=" * 70)
     print(f"🧪 {description}")
@@ -24,6 +27,7 @@ def run_test(test_file, description):
     try:
         result = subprocess.run(
             [sys.executable, str(test_path)],
+            env=env,
             capture_output=True,
             text=True,
             timeout=120
@@ -65,9 +69,13 @@ def main():
     ]
     
     results = []
+    events = EventLog('run_updated_tests')
+    events.run_start(suites=len(tests))
     
     for test_file, description in tests:
-        passed = run_test(test_file, description)
+        events.suite_start(test_file, description=description)
+        passed = run_test(test_file, description, events.child_env())
+        events.suite_end(test_file, 'passed' if passed else 'failed')
         results.append((description, passed))
     
     # Summary
@@ -88,6 +96,13 @@ def main():
     print(f"❌ Failed: {failed_count}")
     print("=" * 70)
     
+    events.run_end(
+        'passed' if failed_count == 0 else 'failed',
+        total=len(results),
+        passed=passed_count,
+        failed=failed_count
+    )
+    
     if failed_count == 0:
         print("\n🎉 ALL TESTS PASSED!")
         print("\n✅ Recent Updates Verified:")
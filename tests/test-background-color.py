@@ -6,11 +6,14 @@ Tests that the background color is set correctly
 
 import sys
 import os
+import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from config.event_log import EventLog
+
 class BackgroundColorTest:
     def __init__(self, url="http://localhost:8080"):
         self.url = url
@@ -18,6 +21,9 @@ class BackgroundColorTest:
         self.results = []
         self.passed = 0
         self.failed = 0
+        self.events = EventLog('BackgroundColorTest')
+        self.suite_name = 'Background Color'
+        self._last_result_at = time.perf_counter()
         
     def setup(self):
         """Initialize Chrome driver"""
@@ -88,6 +94,13 @@ class BackgroundColorTest:
             'details': details
         })
         
+        # Checks run back to back, so a check lasts since the previous result
+        now = time.perf_counter()
+        message = f"expected {expected}, got {actual}" if not passed and expected else None
+        self.events.test_end(self.suite_name, name, 'passed' if passed else 'failed',
+                             duration=now - self._last_result_at, message=message)
+        self._last_result_at = now
+        
         return passed
     
     def info(self, name, value):
@@ -277,9 +290,14 @@ class BackgroundColorTest:
         print("=" * 70)
         print()
         
+        self.events.run_start(url=self.url)
         if not self.setup():
+            self.events.run_end('error', message='Failed to initialize WebDriver')
             return False
         
+        self.events.suite_start(self.suite_name)
+        self._last_result_at = time.perf_counter()
+        outcome = 'error'
         try:
             print(f"Testing URL: {self.url}")
             print()
@@ -320,6 +338,7 @@ class BackgroundColorTest:
             print("=" * 70)
             print()
             
+            outcome = 'passed' if self.failed == 0 else 'failed'
             return self.failed == 0
             
         except Exception as e:
@@ -329,6 +348,9 @@ class BackgroundColorTest:
             return False
         finally:
             self.teardown()
+            self.events.suite_end(self.suite_name, outcome)
+            self.events.run_end(outcome, total=self.passed + self.failed,
+                                passed=self.passed, failed=self.failed)
 
 
 def main():
@@ -1,259 +1,318 @@
 #!/usr/bin/env python3
 """
 CSS Test Suite - Automated CSS Validation
-Tests CSS files in the public/css directory for:
+Tests CSS files in the src/styles directory for:
 - Syntax validation
 - Variable usage
 - Property conflicts
 - Accessibility compliance
 - Best practices
+
+Each stylesheet is parsed once (see config/css_parser.py, cached by content
+hash) and every check is a visitor over the shared rule tree.
 """
 
 import re
-import os
+import time
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List
 
-class CSSTestSuite:
-    def __init__(self, css_directory: str):
-        self.css_directory = Path(css_directory)
-        self.test_results = []
-        self.total_tests = 0
-        self.passed_tests = 0
-        self.failed_tests = 0
-        
-    def log_test(self, test_name: str, passed: bool, message: str):
-        """Log test result"""
-        self.total_tests += 1
-        if passed:
-            self.passed_tests += 1
-            status = "✓ PASS"
-        else:
-            self.failed_tests += 1
-            status = "✗ FAIL"
-        
-        result = f"{status}: {test_name} - {message}"
-        self.test_results.append(result)
-        print(result)
-    
-    def find_css_files(self) -> List[Path]:
-        """Find all CSS files in the directory"""
-        css_files = list(self.css_directory.rglob('*.css'))
-        self.log_test(
-            "Find CSS files",
-            len(css_files) > 0,
-            f"Found {len(css_files)} CSS files"
-        )
-        return css_files
-    
-    def read_css_file(self, file_path: Path) -> str:
-        """Read CSS file content"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return content
-        except Exception as e:
-            self.log_test(
-                f"Read {file_path.name}",
-                False,
-                f"Error reading file: {str(e)}"
-            )
-            return ""
-    
-    def test_css_syntax(self, content: str, filename: str) -> bool:
-        """Test for basic CSS syntax errors"""
-        # Check for balanced braces
-        open_braces = content.count('{')
-        close_braces = content.count('}')
-        balanced = open_braces == close_braces
-        
-        self.log_test(
+from config.css_parser import CSSVisitor, parse_files, walk
+
+VAR_USAGE = re.compile(r'var\(\s*(--[\w-]+)')
+HEX_COLOR = re.compile(r'#[0-9a-fA-F]{3,8}\b')
+RGB_COLOR = re.compile(r'rgba?\([^)]+\)')
+COLOR_VAR = re.compile(r'var\(\s*--color-[\w-]+')
+COMMON_BREAKPOINTS = ['768px', '992px', '1200px', '576px']
+
+
+class SyntaxCheck(CSSVisitor):
+    """Balanced braces, parse errors and property count"""
+
+    def __init__(self):
+        self.properties = 0
+
+    def visit_declaration(self, declaration, block):
+        self.properties += 1
+
+    def report(self, suite, filename, sheet, path):
+        open_braces, close_braces = sheet.braces
+        suite.log_test(
             f"Syntax - Balanced braces in {filename}",
-            balanced,
+            open_braces == close_braces,
             f"Open: {open_braces}, Close: {close_braces}"
         )
-        
-        # Check for semicolons after property values
-        property_pattern = r':\s*[^;{}]+\s*[;}]'
-        properties = re.findall(property_pattern, content)
-        
-        self.log_test(
+        suite.log_test(
+            f"Syntax - Parse errors in {filename}",
+            not sheet.errors,
+            "; ".join(f"line {line}: {error}" for line, error in sheet.errors[:5]) or "None"
+        )
+        suite.log_test(
             f"Syntax - Properties in {filename}",
-            len(properties) > 0,
-            f"Found {len(properties)} CSS properties"
+            self.properties > 0,
+            f"Found {self.properties} CSS properties"
         )
-        
-        return balanced
-    
-    def test_css_variables(self, content: str, filename: str):
-        """Test CSS variable usage"""
-        # Find variable declarations
-        var_declarations = re.findall(r'--[\w-]+:\s*[^;]+;', content)
-        
-        # Find variable usages
-        var_usages = re.findall(r'var\(--[\w-]+\)', content)
-        
-        self.log_test(
+
+
+class VariablesCheck(CSSVisitor):
+    """CSS custom property declarations and var() usages"""
+
+    def __init__(self):
+        self.declared = []
+        self.usages = []
+
+    def visit_declaration(self, declaration, block):
+        if declaration.property.startswith('--'):
+            self.declared.append(declaration.property)
+        if 'var(' in declaration.value:
+            self.usages.extend(VAR_USAGE.findall(declaration.value))
+
+    def report(self, suite, filename, sheet, path):
+        suite.log_test(
             f"Variables - Declarations in {filename}",
-            len(var_declarations) >= 0,
-            f"Found {len(var_declarations)} variable declarations"
+            True,
+            f"Found {len(self.declared)} variable declarations"
         )
-        
-        self.log_test(
+        suite.log_test(
             f"Variables - Usage in {filename}",
-            len(var_usages) >= 0,
-            f"Found {len(var_usages)} variable usages"
+            True,
+            f"Found {len(self.usages)} variable usages"
         )
-        
-        # Check for unused variables (in variables.css only)
         if 'variables.css' in filename:
-            declared_vars = set(re.findall(r'--[\w-]+', ' '.join(var_declarations)))
-            used_vars = set(re.findall(r'--[\w-]+', ' '.join(var_usages)))
-            
-            self.log_test(
+            suite.log_test(
                 f"Variables - Defined in {filename}",
-                len(declared_vars) > 0,
-                f"{len(declared_vars)} unique variables defined"
+                len(set(self.declared)) > 0,
+                f"{len(set(self.declared))} unique variables defined"
             )
-    
-    def test_color_values(self, content: str, filename: str):
-        """Test color value formats"""
-        # Find hex colors
-        hex_colors = re.findall(r'#[0-9a-fA-F]{3,8}', content)
-        
-        # Find rgb/rgba colors
-        rgb_colors = re.findall(r'rgba?\([^)]+\)', content)
-        
-        # Find CSS variable color usage
-        color_vars = re.findall(r'var\(--color-[\w-]+\)', content)
-        
-        total_colors = len(hex_colors) + len(rgb_colors) + len(color_vars)
-        
-        self.log_test(
+
+
+class ColorsCheck(CSSVisitor):
+    """Hex, rgb()/rgba() and --color-* variable usage"""
+
+    def __init__(self):
+        self.hex_colors = []
+        self.rgb_colors = 0
+        self.color_vars = 0
+
+    def visit_declaration(self, declaration, block):
+        value = declaration.value
+        # data: URIs carry percent-encoded '#'s that are not colours
+        if 'url(' in value:
+            value = re.sub(r'url\([^)]*\)', '', value)
+        if '#' in value:
+            self.hex_colors.extend(HEX_COLOR.findall(value))
+        if 'rgb' in value:
+            self.rgb_colors += len(RGB_COLOR.findall(value))
+        if '--color-' in value:
+            self.color_vars += len(COLOR_VAR.findall(value))
+
+    def report(self, suite, filename, sheet, path):
+        suite.log_test(
             f"Colors - Found in {filename}",
-            total_colors >= 0,
-            f"Hex: {len(hex_colors)}, RGB: {len(rgb_colors)}, Vars: {len(color_vars)}"
+            True,
+            f"Hex: {len(self.hex_colors)}, RGB: {self.rgb_colors}, Vars: {self.color_vars}"
         )
-        
-        # Check for valid hex colors
-        invalid_hex = [c for c in hex_colors if len(c) not in [4, 7, 9]]
-        self.log_test(
+        invalid_hex = [c for c in self.hex_colors if len(c) not in [4, 5, 7, 9]]
+        suite.log_test(
             f"Colors - Valid hex in {filename}",
             len(invalid_hex) == 0,
-            f"All {len(hex_colors)} hex colors are valid format"
+            f"All {len(self.hex_colors)} hex colors are valid format" if not invalid_hex
+            else f"Invalid: {', '.join(invalid_hex)}"
         )
-    
-    def test_responsive_design(self, content: str, filename: str):
-        """Test for responsive design patterns"""
-        # Find media queries
-        media_queries = re.findall(r'@media[^{]+{', content)
-        
-        self.log_test(
+
+
+class ResponsiveCheck(CSSVisitor):
+    """Media queries and the breakpoints they (or --breakpoint-* variables) use"""
+
+    def __init__(self):
+        self.media_queries = []
+        self.lengths = []
+
+    def visit_block(self, block, parents):
+        if block.at_keyword == 'media':
+            self.media_queries.append(block.at_params)
+
+    def visit_declaration(self, declaration, block):
+        if 'px' in declaration.value:
+            self.lengths.append(declaration.value)
+
+    def report(self, suite, filename, sheet, path):
+        suite.log_test(
             f"Responsive - Media queries in {filename}",
-            len(media_queries) >= 0,
-            f"Found {len(media_queries)} media queries"
+            True,
+            f"Found {len(self.media_queries)} media queries"
         )
-        
-        # Check for common breakpoints
-        common_breakpoints = ['768px', '992px', '1200px', '576px']
-        found_breakpoints = [bp for bp in common_breakpoints if bp in content]
-        
-        if len(media_queries) > 0:
-            self.log_test(
+        if self.media_queries:
+            params = ' '.join(self.media_queries + self.lengths)
+            found_breakpoints = [bp for bp in COMMON_BREAKPOINTS if bp in params]
+            suite.log_test(
                 f"Responsive - Breakpoints in {filename}",
                 len(found_breakpoints) > 0,
                 f"Uses breakpoints: {', '.join(found_breakpoints)}"
             )
-    
-    def test_accessibility(self, content: str, filename: str):
-        """Test for accessibility patterns"""
-        # Check for focus states
-        focus_states = re.findall(r':focus\s*{', content)
-        
-        # Check for outline properties
-        outline_props = re.findall(r'outline:\s*[^;]+;', content)
-        
-        self.log_test(
+
+
+class AccessibilityCheck(CSSVisitor):
+    """:focus and :hover states"""
+
+    def __init__(self):
+        self.focus_states = 0
+        self.hover_states = 0
+
+    def visit_block(self, block, parents):
+        for selector in block.selectors:
+            self.focus_states += selector.endswith(':focus')
+            self.hover_states += selector.endswith(':hover')
+
+    def report(self, suite, filename, sheet, path):
+        suite.log_test(
             f"Accessibility - Focus states in {filename}",
-            len(focus_states) >= 0,
-            f"Found {len(focus_states)} :focus selectors"
+            True,
+            f"Found {self.focus_states} :focus selectors"
         )
-        
-        # Check for hover states
-        hover_states = re.findall(r':hover\s*{', content)
-        
-        self.log_test(
+        suite.log_test(
             f"Accessibility - Hover states in {filename}",
-            len(hover_states) >= 0,
-            f"Found {len(hover_states)} :hover selectors"
+            True,
+            f"Found {self.hover_states} :hover selectors"
         )
-    
-    def test_transitions_animations(self, content: str, filename: str):
-        """Test for transitions and animations"""
-        # Find transition properties
-        transitions = re.findall(r'transition:\s*[^;]+;', content)
-        
-        # Find animations
-        animations = re.findall(r'animation:\s*[^;]+;', content)
-        
-        # Find keyframes
-        keyframes = re.findall(r'@keyframes\s+[\w-]+', content)
-        
-        self.log_test(
+
+
+class AnimationsCheck(CSSVisitor):
+    """Transitions, animations and @keyframes"""
+
+    def __init__(self):
+        self.transitions = 0
+        self.animations = 0
+        self.keyframes = []
+
+    def visit_block(self, block, parents):
+        if block.at_keyword in ('keyframes', '-webkit-keyframes'):
+            self.keyframes.append(block.at_params)
+
+    def visit_declaration(self, declaration, block):
+        self.transitions += declaration.property == 'transition'
+        self.animations += declaration.property == 'animation'
+
+    def report(self, suite, filename, sheet, path):
+        suite.log_test(
             f"Animations - Transitions in {filename}",
-            len(transitions) >= 0,
-            f"Found {len(transitions)} transition properties"
+            True,
+            f"Found {self.transitions} transition properties"
         )
-        
-        if len(keyframes) > 0:
-            self.log_test(
+        if self.keyframes:
+            suite.log_test(
                 f"Animations - Keyframes in {filename}",
                 True,
-                f"Found {len(keyframes)} @keyframes: {', '.join([k.split()[-1] for k in keyframes])}"
+                f"Found {len(self.keyframes)} @keyframes: {', '.join(self.keyframes)}"
             )
-    
-    def test_grid_flexbox(self, content: str, filename: str):
-        """Test for modern layout usage"""
-        # Find grid usage
-        grid_props = re.findall(r'display:\s*grid', content)
-        grid_template = re.findall(r'grid-template-', content)
-        
-        # Find flexbox usage
-        flex_props = re.findall(r'display:\s*flex', content)
-        flex_direction = re.findall(r'flex-direction:', content)
-        
-        self.log_test(
+
+
+class LayoutCheck(CSSVisitor):
+    """Grid and Flexbox usage"""
+
+    def __init__(self):
+        self.grid = 0
+        self.grid_templates = 0
+        self.flex = 0
+        self.flex_directions = 0
+
+    def visit_declaration(self, declaration, block):
+        prop, value = declaration.property, declaration.value
+        if prop == 'display':
+            self.grid += value in ('grid', 'inline-grid')
+            self.flex += value in ('flex', 'inline-flex')
+        elif prop.startswith('grid-template-'):
+            self.grid_templates += 1
+        elif prop == 'flex-direction':
+            self.flex_directions += 1
+
+    def report(self, suite, filename, sheet, path):
+        suite.log_test(
             f"Layout - Grid usage in {filename}",
-            len(grid_props) >= 0,
-            f"Grid containers: {len(grid_props)}, Grid templates: {len(grid_template)}"
+            True,
+            f"Grid containers: {self.grid}, Grid templates: {self.grid_templates}"
         )
-        
-        self.log_test(
+        suite.log_test(
             f"Layout - Flexbox usage in {filename}",
-            len(flex_props) >= 0,
-            f"Flex containers: {len(flex_props)}, Flex directions: {len(flex_direction)}"
+            True,
+            f"Flex containers: {self.flex}, Flex directions: {self.flex_directions}"
         )
-    
-    def test_imports(self, content: str, filename: str):
-        """Test CSS imports"""
-        imports = re.findall(r'@import\s+[\'"]([^\'"]+)[\'"]', content)
-        
-        if len(imports) > 0:
-            self.log_test(
-                f"Imports - Found in {filename}",
-                True,
-                f"Imports {len(imports)} files: {', '.join(imports)}"
+
+
+class ImportsCheck(CSSVisitor):
+    """@import statements point at existing files"""
+
+    def __init__(self):
+        self.imports = []
+
+    def visit_block(self, block, parents):
+        if block.at_keyword == 'import':
+            match = re.search(r'[\'"]([^\'"]+)[\'"]', block.at_params)
+            if match:
+                self.imports.append(match.group(1))
+
+    def report(self, suite, filename, sheet, path):
+        if not self.imports:
+            return
+        suite.log_test(
+            f"Imports - Found in {filename}",
+            True,
+            f"Imports {len(self.imports)} files: {', '.join(self.imports)}"
+        )
+        for import_path in self.imports:
+            import_file = (path.parent / import_path).resolve()
+            exists = import_file.exists()
+            suite.log_test(
+                f"Imports - File exists: {import_path}",
+                exists,
+                f"{'Found' if exists else 'Missing'}: {import_file}"
             )
-            
-            # Verify imported files exist
-            for import_path in imports:
-                import_file = self.css_directory / import_path.replace('./', '')
-                exists = import_file.exists()
-                self.log_test(
-                    f"Imports - File exists: {import_path}",
-                    exists,
-                    f"{'Found' if exists else 'Missing'}: {import_file}"
-                )
+
+
+# Add a new category by writing a CSSVisitor with a report() method
+CHECKS = [
+    SyntaxCheck,
+    VariablesCheck,
+    ColorsCheck,
+    ResponsiveCheck,
+    AccessibilityCheck,
+    AnimationsCheck,
+    LayoutCheck,
+    ImportsCheck,
+]
+
+
+class CSSTestSuite:
+    def __init__(self, css_directory: str):
+        self.css_directory = Path(css_directory)
+        self.test_results = []
+        self.total_tests = 0
+        self.passed_tests = 0
+        self.failed_tests = 0
+        
+    def log_test(self, test_name: str, passed: bool, message: str):
+        """Log test result"""
+        self.total_tests += 1
+        if passed:
+            self.passed_tests += 1
+            status = "✓ PASS"
+        else:
+            self.failed_tests += 1
+            status = "✗ FAIL"
+        
+        result = f"{status}: {test_name} - {message}"
+        self.test_results.append(result)
+        print(result)
+    
+    def find_css_files(self) -> List[Path]:
+        """Find all CSS files in the directory"""
+        css_files = sorted(self.css_directory.rglob('*.css'))
+        self.log_test(
+            "Find CSS files",
+            len(css_files) > 0,
+            f"Found {len(css_files)} CSS files"
+        )
+        return css_files
     
     def run_all_tests(self):
         """Run all CSS tests"""
@@ -272,20 +331,24 @@ class CSSTestSuite:
         print(f"Testing {len(css_files)} CSS files...")
         print()
         
+        start = time.perf_counter()
+        sheets = parse_files(css_files)
+
         for css_file in css_files:
-            print(f"\n--- Testing: {css_file.name} ---")
-            content = self.read_css_file(css_file)
-            
-            if content:
-                self.test_css_syntax(content, css_file.name)
-                self.test_css_variables(content, css_file.name)
-                self.test_color_values(content, css_file.name)
-                self.test_responsive_design(content, css_file.name)
-                self.test_accessibility(content, css_file.name)
-                self.test_transitions_animations(content, css_file.name)
-                self.test_grid_flexbox(content, css_file.name)
-                self.test_imports(content, css_file.name)
-        
+            filename = css_file.relative_to(self.css_directory).as_posix()
+            print(f"\n--- Testing: {filename} ---")
+            sheet = sheets[css_file]
+            if isinstance(sheet, OSError):
+                self.log_test(f"Read {filename}", False, f"Error reading file: {sheet}")
+                continue
+
+            checks = [check() for check in CHECKS]
+            walk(sheet, checks)
+            for check in checks:
+                check.report(self, filename, sheet, css_file)
+
+        elapsed = time.perf_counter() - start
+
         # Print summary
         print()
         print("=" * 70)
@@ -294,6 +357,7 @@ class CSSTestSuite:
         print(f"Total Tests:  {self.total_tests}")
         print(f"Passed:       {self.passed_tests} ✓")
         print(f"Failed:       {self.failed_tests} ✗")
+        print(f"Lint time:    {elapsed * 1000:.0f}ms")
         
         if self.total_tests > 0:
             pass_rate = (self.passed_tests / self.total_tests) * 100
@@ -308,7 +372,7 @@ def main():
     """Main test runner"""
     # Get the CSS directory path
     script_dir = Path(__file__).parent
-    css_dir = script_dir.parent / 'public' / 'css'
+    css_dir = script_dir.parent / 'src' / 'styles'
     
     if not css_dir.exists():
         print(f"Error: CSS directory not found at {css_dir}")
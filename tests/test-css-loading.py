@@ -14,6 +14,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from config.event_log import EventLog
+
 class CSSLoadingTestSuite:
     def __init__(self, url="http://localhost:8080"):
         self.url = url
@@ -22,6 +24,9 @@ class CSSLoadingTestSuite:
         self.total_tests = 0
         self.passed_tests = 0
         self.failed_tests = 0
+        self.events = EventLog('CSSLoadingTestSuite')
+        self.suite_name = 'CSS Loading'
+        self._last_result_at = time.perf_counter()
         
     def setup(self):
         """Setup Chrome driver"""
@@ -61,6 +66,12 @@ class CSSLoadingTestSuite:
         self.results.append({"name": name, "passed": passed, "message": message})
         print(result)
         
+        # Checks run back to back, so a check lasts since the previous result
+        now = time.perf_counter()
+        self.events.test_end(self.suite_name, name, 'passed' if passed else 'failed',
+                             duration=now - self._last_result_at, message=message)
+        self._last_result_at = now
+        
         return passed
     
     def test_page_loads(self):
@@ -450,10 +461,14 @@ class CSSLoadingTestSuite:
         print("=" * 70)
         print()
         
+        self.events.run_start(url=self.url)
         if not self.setup():
             print("Failed to setup WebDriver")
+            self.events.run_end('error', message='Failed to setup WebDriver')
             return False
         
+        self.events.suite_start(self.suite_name)
+        self._last_result_at = time.perf_counter()
         try:
             print(f"Testing URL: {self.url}")
             print()
@@ -517,6 +532,10 @@ class CSSLoadingTestSuite:
             
         finally:
             self.teardown()
+            outcome = 'passed' if self.failed_tests == 0 else 'failed'
+            self.events.suite_end(self.suite_name, outcome)
+            self.events.run_end(outcome, total=self.total_tests,
+                                passed=self.passed_tests, failed=self.failed_tests)
 
 
 def main():
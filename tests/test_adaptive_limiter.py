@@ -0,0 +1,111 @@
+"""
+Adaptive Concurrency Limiter
+AIMD limit arithmetic (additive growth per round trip, one multiplicative
+cut per round trip, latency spikes, Retry-After pauses), and the limiter
+settling below a capacity-limited mock API's 429 threshold.
+"""
+import io
+import time
+import urllib.error
+from email.message import Message
+
+from config.adaptive_limiter import AdaptiveLimiter, is_overload, retry_after, run_adaptive
+from config.mock_api import MockAPI
+from config.search_client import SearchClient
+from config.synthetic_monitor import SyntheticMonitor
+
+
+def http_error(code, headers=None):
+    message = Message()
+    for name, value in (headers or {}).items():
+        message[name] = value
+    return urllib.error.HTTPError('http://api/vagas/search', code, 'error', message, io.BytesIO(b''))
+
+
+def test_grows_by_one_per_round_trip_and_halves_once_per_round_trip():
+    limiter = AdaptiveLimiter(initial=4, max_limit=8)
+    for _ in range(4):
+        limiter.release(limiter.acquire(), 0.1)
+    assert limiter.concurrency == 4 and 4.9 < limiter.limit < 5
+
+    # Three overloads from the same round trip: only the first cuts
+    tickets = [limiter.acquire() for _ in range(3)]
+    for ticket in tickets:
+        limiter.release(ticket, 0.1, 'overload')
+    assert limiter.concurrency == 2 and (limiter.overloads, limiter.decreases) == (3, 1)
+
+    # Requests started after the cut may cut again; errors never move the limit
+    limiter.release(limiter.acquire(), 0.1, 'error')
+    limiter.release(limiter.acquire(), 0.1, 'overload')
+    assert limiter.concurrency == 1 and limiter.errors == 1
+    assert [limit for _, limit in limiter.history] == [4, 2, 1]
+
+
+def test_latency_spike_cuts_like_an_overload():
+    limiter = AdaptiveLimiter(initial=8)
+    for _ in range(10):
+        limiter.release(limiter.acquire(), 0.1)
+    limiter.release(limiter.acquire(), 0.5)
+    assert limiter.spikes == 1 and limiter.concurrency == 4
+
+    target = AdaptiveLimiter(initial=8, latency_target=0.3)
+    target.release(target.acquire(), 0.31)
+    assert target.concurrency == 4
+
+
+def test_overload_classification_and_retry_after():
+    assert is_overload(http_error(429)) and is_overload(http_error(503))
+    assert not is_overload(http_error(500)) and not is_overload(RuntimeError('x'))
+    assert is_overload(urllib.error.URLError(TimeoutError())) and is_overload(TimeoutError())
+    assert retry_after(http_error(429, {'Retry-After': '0.3'})) == 0.3
+    assert retry_after(http_error(429, {'Retry-After': 'Wed, 21 Oct 2026 07:28:00 GMT'})) is None
+
+    limiter = AdaptiveLimiter(initial=4)
+    limiter.release(limiter.acquire(), 0.1, 'overload', retry_after=0.3)
+    started = time.monotonic()
+    limiter.release(limiter.acquire(), 0.1)
+    assert time.monotonic() - started >= 0.25
+
+
+def test_settles_below_the_backend_capacity():
+    with MockAPI(port=0, search_delay=0.05, search_capacity=6) as api:
+        limiter = AdaptiveLimiter(initial=2, max_limit=32)
+        client = SearchClient(api.base_url, timeout=10)
+        searches = [(str(hotel), f'2026-11-{day:02d}', f'2026-11-{day + 2:02d}')
+                    for day in range(1, 21) for hotel in range(1, 7)]
+        outcomes = run_adaptive(limiter, lambda search: client.search(*search), searches, retries=5)
+
+    report = limiter.report()
+    print(f"\n🎚️  settled at {report['settled']}, {report['overloads']} overloads, "
+          f"{report['throughput']:.1f} searches/s")
+    assert not [result for _, result, _ in outcomes if isinstance(result, Exception)]
+    assert report['overloads'] == api.rejected > 0
+    assert api.peak_searches <= 6 and report['peak_in_flight'] <= 8
+    assert 2 <= report['settled'] <= 7
+
+
+def test_monitor_probes_share_the_limiter_and_export_it():
+    limiter = AdaptiveLimiter(initial=1, max_limit=4)
+    monitor = SyntheticMonitor({'a': lambda: True, 'b': lambda: True}, limiter=limiter)
+    monitor.run_cycle()
+
+    assert limiter.completed == 2 and limiter.peak_in_flight == 1
+    assert 'monitora_concurrency_limit{value="settled"}' in monitor.render_metrics()
+
+
+def test_monitor_times_probes_inside_the_slot_and_limits_only_api_probes():
+    limiter = AdaptiveLimiter(initial=1, max_limit=1)
+
+    def slow():
+        time.sleep(0.1)
+        return True
+
+    monitor = SyntheticMonitor({'api_a': slow, 'api_b': slow, 'page': slow},
+                               limiter=limiter, limited=['api_a', 'api_b'])
+    monitor.run_cycle()
+
+    # The API probes ran one after the other, but neither counts the wait
+    assert limiter.completed == 2
+    for name in ('api_a', 'api_b', 'page'):
+        [(ok, seconds)] = monitor.stats[name].samples
+        assert ok and 0.1 <= seconds < 0.18, (name, seconds)
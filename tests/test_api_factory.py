@@ -0,0 +1,112 @@
+"""
+Synthetic API Data Factory
+Payload shape, edge-case knobs and streamed/in-memory equivalence, plus a
+large streamed dataset served by the mock API and rendered by the page.
+"""
+import json
+import re
+import urllib.request
+
+import pytest
+
+from config.api_factory import DatasetSpec, iter_search_json, search_payload
+from config.mock_api import MockAPI
+
+CHECKIN, CHECKOUT = '2026-02-10', '2026-02-14'
+# guestNumberFilter.js: /at[eé]\s+(\d+)\s+pessoas?/i
+GUEST_PATTERN = re.compile(r'at[eé]\s+(\d+)\s+pessoas?', re.IGNORECASE)
+
+
+def test_search_payload_shape_and_capacities(synthetic_api):
+    body = synthetic_api.search(CHECKIN, CHECKOUT, hotels=30, vacancies_per_hotel=40,
+                                capacity_weights={2: 1, 4: 1})
+    data = body['data']
+    groups = data['result']['hotelGroups']
+
+    assert data['hasAvailability'] is True and 'holidayPackage' not in body
+    assert len(groups) == 30 and 'Amparo 2' in groups
+    assert len(data['result']['vacancies']) == 1200
+    capacities = {int(GUEST_PATTERN.search(text).group(1)) for texts in groups.values() for text in texts}
+    assert capacities == {2, 4}
+    first = groups['Amparo'][0]
+    assert re.fullmatch(r'.+ \(até \d pessoas\)\d\d/02 - \d\d/02 \(\d dias livres\) - \d Quarto\(s\)', first)
+    assert synthetic_api.hotels(hotels=30)['data'][1] == {'hotelId': '1', 'name': 'Amparo', 'type': 'Hotel'}
+
+
+def test_text_variants_unavailable_ratio_and_hotel_filter():
+    spec = DatasetSpec(hotels=5, vacancies_per_hotel=200, accentless_ratio=0.5, singular_ratio=0.5)
+    texts = search_payload(spec, CHECKIN, CHECKOUT)['data']['result']['vacancies']
+
+    assert any('(ate ' in text for text in texts) and any('(até ' in text for text in texts)
+    assert any(' pessoa)' in text for text in texts) and any(' pessoas)' in text for text in texts)
+    assert all(GUEST_PATTERN.search(text) for text in texts)
+
+    one = search_payload(spec, CHECKIN, CHECKOUT, hotel='3')['data']['result']['hotelGroups']
+    assert list(one) == ['Areado']
+
+    spec = DatasetSpec(hotels=5, vacancies_per_hotel=2, unavailable_ratio=0.3)
+    days = [f'2026-03-{day:02d}' for day in range(1, 29)]
+    answers = [search_payload(spec, day, '2026-03-29')['data']['hasAvailability'] for day in days]
+    assert 0 < answers.count(False) < len(days)
+    empty = search_payload(spec, days[answers.index(False)], '2026-03-29')['data']
+    assert empty['result'] == {
+        'hasAvailability': False, 'status': 'NO AVAILABILITY',
+        'summary': 'No período escolhido não há nenhum quarto disponível',
+        'vacancies': [], 'hotelGroups': {},
+    }
+
+
+def test_holiday_window_sets_package_and_full_stays():
+    body = search_payload(DatasetSpec(hotels=2, vacancies_per_hotel=3), '2026-12-27', '2027-01-02')
+
+    assert body['holidayPackage']['type'] == 'NEW_YEAR'
+    assert body['holidayPackage']['dates'] == {'checkin': '2026-12-27', 'checkout': '2027-01-02'}
+    assert all('27/12 - 02/01 (6 dias livres)' in text for text in body['data']['result']['vacancies'])
+
+
+@pytest.mark.parametrize('checkin, checkout, hotel', [
+    (CHECKIN, CHECKOUT, '-1'), ('2026-12-22', '2026-12-27', '-1'), (CHECKIN, CHECKOUT, '99'),
+])
+def test_stream_matches_in_memory_payload(checkin, checkout, hotel):
+    spec = DatasetSpec(hotels=7, vacancies_per_hotel=9, accentless_ratio=0.2, seed=3)
+    streamed = ''.join(iter_search_json(spec, checkin, checkout, hotel))
+
+    assert json.loads(streamed) == search_payload(spec, checkin, checkout, hotel)
+
+
+def test_mock_api_streams_a_dataset_spec():
+    spec = DatasetSpec(hotels=25, vacancies_per_hotel=400)
+    with MockAPI(port=0, search_response=spec) as api:
+        url = f"{api.base_url}/vagas/search?hotel=-1&checkin={CHECKIN}&checkout={CHECKOUT}"
+        with urllib.request.urlopen(url) as response:
+            assert response.headers['Content-Length'] is None
+            body = json.load(response)
+
+    assert body == search_payload(spec, CHECKIN, CHECKOUT)
+    assert len(body['data']['result']['vacancies']) == 10_000
+
+
+@pytest.mark.selenium
+@pytest.mark.slow
+def test_page_renders_a_streamed_dataset(chrome_options):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    from config.index_page import IndexPage
+    from config.selenium_config import get_chromedriver_path
+    from config.static_server import serve_directory
+
+    spec = DatasetSpec(hotels=25, vacancies_per_hotel=300, accentless_ratio=0.1, singular_ratio=0.1)
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=chrome_options)
+    try:
+        with serve_directory() as base_url, MockAPI(search_response=spec):
+            page = IndexPage(driver, f"{base_url}/public/index.html").open('?useLocalAPI=true')
+            page.run_search(checkin=CHECKIN, checkout=CHECKOUT)
+            cards = page.result_count()
+            page.set_guests(4)
+    finally:
+        driver.quit()
+
+    print(f"\n🏨 {cards} hotel cards on the first page of 25 x 300 vacancies")
+    assert cards == 10
@@ -0,0 +1,139 @@
+"""
+API Circuit Breaker
+Opening after consecutive failures, fast-failing or rerouting to the mock
+API while open, closing from the background re-probe, and the pytest
+plugin's gating of 'api' tests.
+"""
+import time
+import urllib.error
+import urllib.request
+from types import SimpleNamespace
+
+import pytest
+
+from config.circuit_breaker import CLOSED, OPEN, CircuitBreaker, CircuitBreakerPlugin, CircuitOpen, probe_health
+from config.mock_api import MockAPI
+
+
+class FakeAPI:
+    """Health probe whose answer the test controls"""
+
+    def __init__(self, healthy=True):
+        self.healthy = healthy
+        self.probes = 0
+
+    def __call__(self, base_url):
+        self.probes += 1
+        return None if self.healthy else 'Connection refused'
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_opens_after_consecutive_failures_and_fails_fast():
+    api = FakeAPI(healthy=False)
+    breaker = CircuitBreaker('http://api', failure_threshold=3, probe_interval=60, probe=api)
+
+    assert not breaker.probe() and not breaker.probe()
+    breaker.record_success()   # a success in between resets the count
+    assert not breaker.probe() and not breaker.probe() and breaker.state == CLOSED
+    assert not breaker.probe() and breaker.state == OPEN
+
+    with pytest.raises(CircuitOpen, match='Connection refused'):
+        breaker.route()
+    with pytest.raises(CircuitOpen):
+        breaker.call(lambda: 'not called')
+    assert breaker.fast_failed == 2
+    breaker.stop()
+
+
+def test_background_reprobe_closes_the_breaker():
+    api = FakeAPI(healthy=False)
+    breaker = CircuitBreaker('http://api', probe_interval=0.05, probe=api)
+    breaker.probe(trip=True)
+    assert breaker.is_open
+
+    time.sleep(0.2)
+    assert breaker.is_open and api.probes > 1
+    api.healthy = True
+    assert wait_for(lambda: not breaker.is_open)
+    assert [state for _, state in breaker.transitions] == [OPEN, CLOSED]
+    assert breaker.route() == 'http://api'
+    breaker.stop()
+
+
+def test_open_breaker_routes_to_the_mock_api():
+    breaker = CircuitBreaker('http://127.0.0.1:9/api', probe_interval=60, probe_timeout=1,
+                             fallback=MockAPI(port=0))
+    try:
+        assert probe_health('http://127.0.0.1:9/api', timeout=1) is not None
+        breaker.probe(trip=True)
+        base_url = breaker.route()
+        with urllib.request.urlopen(f"{base_url}/health", timeout=5) as response:
+            assert response.getcode() == 200
+        assert probe_health(base_url) is None and breaker.rerouted == 1
+    finally:
+        breaker.stop()
+
+
+def test_breakers_share_a_mock_api_already_on_the_port():
+    # xdist workers each have a breaker, all with the mock on port 3001
+    first = CircuitBreaker('http://127.0.0.1:9/api', probe_interval=60, probe_timeout=1,
+                           fallback=MockAPI(port=0))
+    try:
+        first.probe(trip=True)
+        base_url = first.route()
+        second = CircuitBreaker('http://127.0.0.1:9/api', probe_interval=60, probe_timeout=1,
+                                fallback=MockAPI(port=first.fallback.port))
+        try:
+            second.probe(trip=True)
+            assert second.route() == base_url and second.rerouted == 1
+        finally:
+            second.stop()
+        assert probe_health(base_url) is None
+    finally:
+        first.stop()
+
+
+def test_call_counts_connection_errors_only():
+    breaker = CircuitBreaker('http://api', failure_threshold=2, probe_interval=60, probe=FakeAPI())
+
+    def refused():
+        raise urllib.error.URLError(ConnectionRefusedError())
+
+    with pytest.raises(ValueError):
+        breaker.call(lambda: int('x'))
+    for _ in range(2):
+        with pytest.raises(urllib.error.URLError):
+            breaker.call(refused)
+    assert breaker.is_open and breaker.failures == 2
+    breaker.stop()
+
+
+def test_plugin_gates_api_tests_and_confirms_failures_with_a_probe():
+    api = FakeAPI()
+    breaker = CircuitBreaker('http://api', failure_threshold=2, probe_interval=60, probe=api)
+    plugin = CircuitBreakerPlugin(breaker)
+    api_item = SimpleNamespace(get_closest_marker=lambda name: name == 'api' or None)
+
+    def report(outcome, keywords=('api',)):
+        return SimpleNamespace(when='call', keywords=dict.fromkeys(keywords, 1),
+                               passed=outcome == 'passed', failed=outcome == 'failed')
+
+    plugin.pytest_sessionstart(None)
+    plugin.pytest_runtest_setup(api_item)
+    plugin.pytest_runtest_logreport(report('failed'))   # API healthy: an ordinary failure
+    plugin.pytest_runtest_logreport(report('failed', keywords=()))
+    assert api.probes == 2 and breaker.state == CLOSED
+
+    api.healthy = False
+    plugin.pytest_runtest_logreport(report('failed'))
+    plugin.pytest_runtest_logreport(report('failed'))
+    assert breaker.is_open
+    with pytest.raises(pytest.fail.Exception, match='API circuit open'):
+        plugin.pytest_runtest_setup(api_item)
+    plugin.pytest_sessionfinish(None)
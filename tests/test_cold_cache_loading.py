@@ -0,0 +1,80 @@
+"""
+Cold vs Warm Cache Page Load
+Measures index.html with an empty Chrome profile and with a clone of the
+pre-warmed profile template (see tests/config/chrome_profile.py).
+
+Only this suite pays the cold-cache cost on purpose; other suites can opt
+into the warm profile with --warm-profile or CHROME_WARM_PROFILE=1.
+"""
+import pytest
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.chrome_profile import has_template, with_warm_profile
+from config.selenium_config import get_chromedriver_path
+
+pytestmark = [pytest.mark.selenium, pytest.mark.slow]
+
+LOAD_METRICS_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+return {
+    domContentLoaded: nav.domContentLoadedEventEnd,
+    load: nav.loadEventEnd,
+    resources: resources.length,
+    // transferSize 0 with a body means the response came from the cache
+    cached: resources.filter(r => r.transferSize === 0 && r.decodedBodySize > 0).length,
+    transferred: resources.reduce((sum, r) => sum + r.transferSize, 0)
+};
+"""
+
+
+def measure_load(options, url):
+    """Load the page in a new driver and return navigation metrics"""
+    driver = webdriver.Chrome(
+        service=Service(executable_path=get_chromedriver_path()),
+        options=options
+    )
+    try:
+        driver.get(url)
+        WebDriverWait(driver, 30).until(
+            lambda d: d.execute_script(
+                "const n = performance.getEntriesByType('navigation')[0];"
+                "return n && n.loadEventEnd > 0;"
+            )
+        )
+        return driver.execute_script(LOAD_METRICS_SCRIPT)
+    finally:
+        driver.quit()
+
+
+def print_metrics(label, metrics):
+    print(f"\n📊 {label}: DOMContentLoaded {metrics['domContentLoaded']:.0f}ms, "
+          f"load {metrics['load']:.0f}ms, "
+          f"{metrics['cached']}/{metrics['resources']} resources from cache, "
+          f"{metrics['transferred'] / 1024:.1f} KB transferred")
+
+
+def test_cold_cache_page_load(web_server, chrome_options):
+    """Empty profile: every asset is fetched"""
+    metrics = measure_load(chrome_options, f"{web_server}/index.html")
+    print_metrics("Cold cache", metrics)
+
+    assert metrics['load'] > 0
+    assert metrics['resources'] > 0
+
+
+def test_warm_cache_page_load(web_server, chrome_options):
+    """Warm profile clone: vendor assets come from the disk cache"""
+    if not has_template():
+        pytest.skip("No warm profile template (run: cd tests && python3 -m config.chrome_profile URL)")
+
+    url = f"{web_server}/index.html"
+    cold = measure_load(chrome_options, url)
+    warm = measure_load(with_warm_profile(chrome_options), url)
+    print_metrics("Cold cache", cold)
+    print_metrics("Warm cache", warm)
+
+    assert warm['cached'] > cold['cached'], "Warm profile should serve assets from cache"
+    assert warm['transferred'] <= cold['transferred']
@@ -0,0 +1,107 @@
+"""
+Console Capture
+DevTools event parsing and the ring buffer, plus push delivery of console
+errors and uncaught exceptions from a real page without sleeping.
+"""
+import pytest
+
+from config.console_capture import ConsoleBuffer, ConsoleEvent, parse_event
+
+APP = 'http://localhost:8080/src/js/hotelSearch.js'
+
+
+def test_console_call_keeps_level_text_and_location():
+    event = parse_event({'method': 'Runtime.consoleAPICalled', 'params': {
+        'type': 'warning',
+        'args': [{'type': 'string', 'value': 'Hotels:'}, {'type': 'number', 'value': 25},
+                 {'type': 'object', 'description': 'Array(25)'}],
+        'timestamp': 1700.5,
+        'stackTrace': {'callFrames': [
+            {'functionName': 'loadHotels', 'url': APP, 'lineNumber': 41, 'columnNumber': 8},
+        ]},
+    }})
+
+    assert (event.source, event.level, event.text) == ('console', 'warning', 'Hotels: 25 Array(25)')
+    assert event.location == f'{APP}:42:9'
+    assert event.stack == [f'loadHotels {APP}:42:9']
+
+
+def test_exception_and_log_entry_are_errors():
+    exception = parse_event({'method': 'Runtime.exceptionThrown', 'params': {
+        'timestamp': 1,
+        'exceptionDetails': {
+            'text': 'Uncaught', 'url': APP, 'lineNumber': 9, 'columnNumber': 2,
+            'exception': {'description': "TypeError: x is undefined\n    at handleFormSubmit"},
+        },
+    }})
+    network = parse_event({'method': 'Log.entryAdded', 'params': {'entry': {
+        'source': 'network', 'level': 'error', 'timestamp': 2,
+        'text': 'Failed to load resource: 404', 'url': 'http://localhost:8080/favicon.ico',
+    }}})
+
+    assert str(exception) == f'[error] exception: TypeError: x is undefined ({APP}:10:3)'
+    assert (network.source, network.level, network.line) == ('network', 'error', 0)
+    assert parse_event({'method': 'Page.loadEventFired', 'params': {}}) is None
+    assert parse_event({'id': 3, 'result': {}}) is None
+
+
+def test_ring_buffer_marks_ignores_and_reports_the_trail():
+    buffer = ConsoleBuffer(capacity=3)
+    buffer.append(ConsoleEvent('console', 'info', 'booting'))
+    buffer.append(ConsoleEvent('network', 'error', 'Failed to load resource', url='/favicon.ico'))
+    mark = buffer.mark()
+    buffer.append(ConsoleEvent('console', 'info', 'hotels loaded'))
+    buffer.append(ConsoleEvent('exception', 'error', 'TypeError: boom', url=APP, line=3))
+
+    assert buffer.dropped == 1
+    assert [event.text for event in buffer.events()] == [
+        'Failed to load resource', 'hotels loaded', 'TypeError: boom',
+    ]
+    assert [event.text for event in buffer.errors(since=mark)] == ['TypeError: boom']
+    assert buffer.errors(ignore=('favicon', 'boom')) == []
+
+    with pytest.raises(AssertionError) as failure:
+        buffer.assert_no_errors(since=mark)
+    assert 'TypeError: boom' in str(failure.value)
+    assert '[info] console: hotels loaded' in str(failure.value)
+
+    buffer.clear()
+    buffer.assert_no_errors()
+
+
+@pytest.mark.selenium
+@pytest.mark.slow
+def test_errors_are_pushed_without_polling(chrome_options):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    from config.console_capture import ConsoleCapture
+    from config.selenium_config import get_chromedriver_path
+    from config.static_server import serve_directory
+
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=chrome_options)
+    try:
+        with serve_directory() as base_url, ConsoleCapture(driver) as console:
+            driver.get(f"{base_url}/public/index.html")
+            before = console.mark()
+
+            driver.execute_script("console.error('capture check', 1);")
+            driver.execute_async_script(
+                "const done = arguments[0];"
+                "setTimeout(() => { throw new Error('uncaught capture check'); });"
+                "setTimeout(done, 0);"
+            )
+            errors = console.errors(since=before)
+            trail = console.trail()
+    finally:
+        driver.quit()
+
+    print("\n🖥️  Console trail:")
+    for line in trail:
+        print(f"   {line}")
+
+    assert [(error.source, error.text) for error in errors] == [
+        ('console', 'capture check 1'), ('exception', 'Error: uncaught capture check'),
+    ]
+    assert errors[1].stack
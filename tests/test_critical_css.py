@@ -0,0 +1,83 @@
+"""
+Critical CSS
+Pure checks for the critical block builder plus the size budget on the
+block extracted from index.html at the mobile and desktop viewports.
+"""
+import pytest
+
+from config.critical_css import (
+    CRITICAL_BUDGET_BYTES, inline_snippet, merge_viewports, minify, render_critical,
+)
+
+
+def _rule(key, text, critical, wrappers=()):
+    return {'key': list(key), 'href': 'main.css', 'wrappers': list(wrappers),
+            'text': text, 'critical': critical}
+
+
+def test_minify_keeps_strings_and_descendant_pseudo_classes():
+    css = '.nav :hover ,  .a > .b {\n  content: ", ";\n  color: rgba(0, 0, 0, .5);\n}'
+    assert minify(css) == '.nav :hover,.a>.b{content: ", ";color: rgba(0,0,0,.5)}'
+
+
+def test_critical_rules_are_merged_across_viewports_in_order():
+    mobile = {'rules': [
+        _rule((0, 0), 'body { margin: 0; }', True),
+        _rule((0, 1, 0), '.nav { display: none; }', True, ['@media (max-width: 767px)']),
+        _rule((0, 2), '.footer { color: red; }', False),
+    ]}
+    desktop = {'rules': [
+        _rule((0, 0), 'body { margin: 0; }', True),
+        _rule((0, 1, 0), '.nav { display: none; }', False, ['@media (max-width: 767px)']),
+        _rule((0, 1, 1), '.menu { top: 0; }', False, ['@media (max-width: 767px)']),
+        _rule((1, 0), '.hero { height: 60vh; }', True),
+    ]}
+
+    css = render_critical(merge_viewports([mobile, desktop]))
+
+    assert css == ('body{margin: 0}'
+                   '@media (max-width: 767px){.nav{display: none}}'
+                   '.hero{height: 60vh}')
+
+
+def test_inline_snippet_defers_stylesheets():
+    links = [{'href': 'https://cdn.example/bootstrap.min.css', 'media': None,
+              'integrity': 'sha384-abc', 'crossorigin': 'anonymous'}]
+    snippet = inline_snippet('body{margin:0}', links)
+
+    assert snippet.startswith('<style id="critical-css">body{margin:0}</style>')
+    assert ('<link href="https://cdn.example/bootstrap.min.css" integrity="sha384-abc" '
+            'crossorigin="anonymous" rel="preload" as="style" '
+            'onload="this.onload=null;this.rel=&#x27;stylesheet&#x27;">') in snippet
+    assert '<noscript>' in snippet and 'rel="stylesheet"' in snippet
+
+
+@pytest.mark.selenium
+@pytest.mark.slow
+def test_critical_css_within_budget(chrome_options):
+    """The above-the-fold block for index.html must fit the inline budget"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    from config.critical_css import extract
+    from config.page_helpers import API_STUB_SCRIPT
+    from config.selenium_config import get_chromedriver_path
+    from config.static_server import serve_directory
+
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=chrome_options)
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': API_STUB_SCRIPT})
+        with serve_directory() as base_url:
+            critical, links, opaque, counts = extract(driver, f"{base_url}/public/index.html")
+    finally:
+        driver.quit()
+
+    size = len(critical.encode('utf-8'))
+    print(f"\n📦 Critical CSS: {size:,} bytes, rules per viewport: {counts}")
+
+    assert all(counts.values()), "Every viewport should have above-the-fold rules"
+    assert links, "index.html stylesheets should be listed for deferred loading"
+    assert size <= CRITICAL_BUDGET_BYTES, (
+        f"Critical CSS is {size:,} bytes, budget is {CRITICAL_BUDGET_BYTES:,}"
+    )
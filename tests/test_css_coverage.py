@@ -0,0 +1,161 @@
+"""
+Tests for the CSS rule coverage report
+"""
+from pathlib import Path
+
+import pytest
+
+from config.css_coverage import CSSCoverageRecorder, build_report, local_path, style_rules
+
+STYLESHEET = Path(__file__).parent.parent / 'src' / 'styles' / 'index-page.css'
+URL = 'http://localhost:8080/src/styles/index-page.css'
+
+
+def _rule_at(text, selector):
+    """(start, end) of the rule whose prelude is exactly `selector`"""
+    for start, end in style_rules(text):
+        if text[start:end].split('{', 1)[0].strip() == selector:
+            return start, end
+    raise AssertionError(f"no rule {selector!r}")
+
+
+def _usage(sheet_id, span, used=True):
+    return {'styleSheetId': sheet_id, 'startOffset': span[0], 'endOffset': span[1], 'used': used}
+
+
+class FakeDriver:
+    """
+    CDP rule usage as Chrome reports it (used rules only, per delta), and
+    document.styleSheets as DOCUMENT_SHEETS_SCRIPT reads it
+    """
+
+    def __init__(self, text, deltas, final, texts=None, documents=None):
+        self.texts = texts or {'1': text}
+        self.deltas = list(deltas)
+        self.final = final
+        self.documents = documents if documents is not None else [{'href': URL, 'text': text}]
+
+    def execute_cdp_cmd(self, command, params):
+        if command == 'CSS.takeCoverageDelta':
+            return {'coverage': self.deltas.pop(0)}
+        if command == 'CSS.stopRuleUsageTracking':
+            return {'ruleUsage': self.final}
+        if command == 'CSS.getStyleSheetText':
+            return {'text': self.texts[params['styleSheetId']]}
+        return {}
+
+    def execute_async_script(self, script):
+        return self.documents
+
+
+def test_style_rules_cover_every_rule_but_not_keyframes():
+    text = STYLESHEET.read_text(encoding='utf-8')
+    rules = style_rules(text)
+    preludes = [text[start:end].split('{', 1)[0].strip() for start, end in rules]
+
+    assert '.cache-status-tooltip' in preludes
+    assert preludes.count('.fixed-header') == 1
+    assert not any(p in ('from', 'to') or p.endswith('%') for p in preludes)
+    assert all(text[end - 1] == '}' for _, end in rules)
+
+
+def test_unused_rules_are_all_rules_minus_every_snapshot():
+    text = STYLESHEET.read_text(encoding='utf-8')
+    tooltip = _rule_at(text, '.cache-status-tooltip')
+    header = _rule_at(text, '.fixed-header')
+    brand = _rule_at(text, '.fixed-header .navbar-brand')
+    # Chrome's final ruleUsage only has the rules used since the last delta
+    driver = FakeDriver(text, deltas=[[_usage('1', tooltip)], [_usage('1', header)]],
+                        final=[_usage('1', brand)])
+    recorder = CSSCoverageRecorder(driver)
+    recorder.snapshot('initial')
+    recorder.snapshot('results')
+
+    [entry] = recorder.stop()
+
+    rules = style_rules(text)
+    used_bytes = {name: len(text[s:e].encode('utf-8')) for name, (s, e) in
+                  {'tooltip': tooltip, 'header': header, 'brand': brand}.items()}
+    assert entry['url'] == URL
+    assert entry['rules'] == len(rules) > 3
+    assert entry['unused_rules'] == len(rules) - 3
+    assert entry['unused_bytes'] == entry['rule_bytes'] - sum(used_bytes.values())
+    assert entry['first_used_in'] == {
+        'initial': used_bytes['tooltip'],
+        'results': used_bytes['header'] + used_bytes['brand'],
+    }
+    unused = {rule['selector'] for rule in entry['unused']}
+    assert '.cache-status-tooltip .tooltip-inner' in unused
+    assert not unused & {'.cache-status-tooltip', '.fixed-header', '.fixed-header .navbar-brand'}
+    assert entry['unused'][0]['line'] == text.count('\n', 0, _rule_at(
+        text, '.cache-status-tooltip .tooltip-inner')[0]) + 1
+
+
+def test_sheets_are_named_by_their_document_text():
+    text = STYLESHEET.read_text(encoding='utf-8')
+    inline = '.hero { margin: 0; }\n'
+    unused = '.print-only { display: none; }\n'
+    other = 'http://localhost:8080/src/styles/print.css'
+    driver = FakeDriver(text, deltas=[[_usage('1', _rule_at(text, '.fixed-header')),
+                                       _usage('2', (0, len(inline) - 1))]], final=[],
+                        texts={'1': text, '2': inline},
+                        documents=[{'href': other, 'text': unused}, {'href': URL, 'text': text},
+                                   {'href': None, 'text': inline},
+                                   {'href': 'https://cdn.example/x.css', 'text': None}])
+    recorder = CSSCoverageRecorder(driver)
+    recorder.snapshot('initial')
+
+    report = {entry['url']: entry for entry in recorder.stop()}
+
+    assert set(report) == {URL, other, 'inline:2'}
+    assert report[URL]['unused_rules'] == report[URL]['rules'] - 1
+    # A sheet no state matched is still reported, all of it unused
+    assert (report[other]['rules'], report[other]['unused_rules']) == (1, 1)
+    assert report['inline:2']['unused_bytes'] == 0
+
+
+def test_report_orders_files_by_unused_bytes():
+    text = STYLESHEET.read_text(encoding='utf-8')
+    small = '.hero { margin: 0; }\n'
+    sheets = {'1': {'url': URL, 'text': text}, '2': {'url': 'inline:2', 'text': small}}
+    used = {('2', 0, len(small) - 1): 'initial'}
+
+    page, inline = build_report(sheets, used, ['initial'])
+
+    assert page['url'] == URL and page['unused_rules'] == page['rules']
+    assert (inline['rules'], inline['unused_bytes']) == (1, 0)
+
+
+def test_local_path_only_maps_own_origin():
+    origin = 'http://localhost:8080'
+    assert local_path('http://localhost:8080/src/styles/main.css', origin) == 'src/styles/main.css'
+    cdn = 'https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css'
+    assert local_path(cdn, origin) == cdn
+
+
+@pytest.mark.selenium
+@pytest.mark.slow
+def test_real_page_report_names_own_stylesheets(chrome_options):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    from config.page_helpers import wait_for
+    from config.selenium_config import get_chromedriver_path
+    from config.static_server import serve_directory
+
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=chrome_options)
+    try:
+        with serve_directory() as base_url:
+            recorder = CSSCoverageRecorder(driver)
+            recorder.start()
+            driver.get(f"{base_url}/public/index.html")
+            wait_for(driver, "document.querySelectorAll('#hotel-select option').length > 1")
+            recorder.snapshot('initial')
+            report = [entry for entry in recorder.stop() if entry['url'].startswith(base_url)]
+    finally:
+        driver.quit()
+
+    assert report, "no stylesheet of the page's own origin was reported"
+    assert any(entry['url'].endswith('/src/styles/index-page.css') for entry in report)
+    assert all(entry['rules'] > 0 for entry in report)
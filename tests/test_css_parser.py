@@ -0,0 +1,100 @@
+"""
+Tests for the single-pass CSS parser and its content-hash cache
+"""
+import pytest
+
+from config import css_parser
+from config.css_parser import CSSVisitor, parse, parse_files, walk
+
+SAMPLE = """
+/* header { not: a rule } */
+@import './global/variables.css';
+:root { --color-primary: #1a73e8; }
+.btn, .btn:hover {
+    background: url(data:image/png;base64,AAA=) no-repeat;
+    color: var(--color-primary) !important;
+}
+@media (max-width: 768px) {
+    .btn { display: flex; }
+}
+"""
+
+
+class Collector(CSSVisitor):
+    def __init__(self):
+        self.blocks = []
+        self.declarations = []
+
+    def visit_block(self, block, parents):
+        self.blocks.append((block.prelude, len(parents)))
+
+    def visit_declaration(self, declaration, block):
+        self.declarations.append(declaration.property)
+
+
+def test_parse_builds_rule_tree():
+    sheet = parse(SAMPLE)
+
+    assert sheet.errors == []
+    assert sheet.braces == [4, 4]
+    assert sheet.comments == 1
+    imports, root, button, media = sheet.children
+    assert (imports.at_keyword, imports.body) == ('import', False)
+    assert root.declarations[0].property == '--color-primary'
+    assert button.selectors == ['.btn', '.btn:hover']
+    background, color = button.declarations
+    assert background.value == 'url(data:image/png;base64,AAA=) no-repeat'
+    assert (color.value, color.important) == ('var(--color-primary)', True)
+    assert media.at_keyword == 'media' and media.children[0].declarations[0].value == 'flex'
+    assert SAMPLE[button.start:button.end].startswith('.btn, .btn:hover {')
+    assert SAMPLE[button.end - 1] == '}' and SAMPLE[imports.start:imports.end].endswith("css';")
+    assert SAMPLE[media.children[0].start:media.children[0].end] == '.btn { display: flex; }'
+
+    collector = Collector()
+    walk(sheet, [collector])
+    assert ('.btn', 1) in collector.blocks
+    assert collector.declarations == ['--color-primary', 'background', 'color', 'display']
+
+
+def test_parse_reports_errors():
+    sheet = parse(".a { color: red;\n}\n}\n.b { color blue; }\n.c { margin: 0;")
+    messages = [message for _, message in sheet.errors]
+    assert "Unexpected '}'" in messages
+    assert any(m.startswith("Malformed declaration") for m in messages)
+    assert any(m.startswith("Unclosed block") for m in messages)
+    assert sheet.errors[0][0] == 3
+
+
+def test_parse_files_caches_by_content_hash(tmp_path, monkeypatch):
+    monkeypatch.setattr(css_parser, 'CACHE_DIR', tmp_path / 'cache')
+    stylesheet = tmp_path / 'a.css'
+    stylesheet.write_text(SAMPLE)
+
+    calls = []
+    real_parse = css_parser.parse
+    monkeypatch.setattr(css_parser, 'parse', lambda *a: calls.append(a) or real_parse(*a))
+
+    first = parse_files([stylesheet])[stylesheet]
+    second = parse_files([stylesheet])[stylesheet]
+    assert len(calls) == 1
+    assert second.digest == first.digest and len(second.children) == 4
+
+    stylesheet.write_text(SAMPLE + ".new { top: 0; }")
+    assert len(parse_files([stylesheet])[stylesheet].children) == 5
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize('stale', [
+    b'cconfig.css_parser_v0\nStyleSheet\n)\x81.',   # module renamed since
+    b'cconfig.css_parser\nOldSheet\n)\x81.',        # class removed since
+    b'\x80\x05garbage',
+])
+def test_outdated_cache_entries_are_reparsed(tmp_path, monkeypatch, stale):
+    monkeypatch.setattr(css_parser, 'CACHE_DIR', tmp_path / 'cache')
+    stylesheet = tmp_path / 'a.css'
+    stylesheet.write_text(SAMPLE)
+    digest = parse_files([stylesheet])[stylesheet].digest
+    css_parser._cache_path(digest).write_bytes(stale)
+
+    assert len(parse_files([stylesheet])[stylesheet].children) == 4
+    assert css_parser._load_cached(digest).digest == digest
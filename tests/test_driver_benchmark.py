@@ -0,0 +1,170 @@
+"""
+Driver Overhead Benchmark
+Process-tree CPU/RSS accounting, WebDriver round-trip counting and the
+per-scenario medians, plus the scenarios run through both engines against
+the working tree and the mock API.
+"""
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from config import driver_benchmark
+from config.driver_benchmark import (
+    METRICS, SCENARIOS, SET_VALUE_SCRIPT, PlaywrightEngine, Sample, SeleniumEngine, measure, process_tree,
+    summarize, tree_usage,
+)
+
+linux_only = pytest.mark.skipif(not driver_benchmark.PROC.joinpath('self', 'stat').exists(),
+                                reason="needs /proc")
+
+
+@linux_only
+def test_process_tree_includes_children_and_their_cpu():
+    child = subprocess.Popen([sys.executable, '-c', 'sum(range(10**7)); print(flush=True); input()'],
+                             stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    try:
+        child.stdout.readline()  # the child has burnt its CPU
+        assert child.pid in process_tree()
+        cpu, client_cpu, rss = tree_usage()
+        assert cpu > client_cpu > 0 and rss > 0
+    finally:
+        child.communicate(b'\n')
+
+
+@linux_only
+def test_cpu_of_children_that_exited_is_kept():
+    cpu_before, client_before, _ = tree_usage()
+    subprocess.run([sys.executable, '-c', 'sum(range(3 * 10**7))'], check=True)
+    cpu_after, client_after, _ = tree_usage()
+
+    # The child is gone; its CPU is now in this process's cutime/cstime
+    assert (cpu_after - cpu_before) - (client_after - client_before) > 0.1
+
+
+class FakeDriver:
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, command, params=None):
+        self.commands.append(command)
+        return {'value': None}
+
+    def get(self, url):
+        self.execute('get', {'url': url})
+
+
+def test_selenium_engine_counts_every_command():
+    driver = FakeDriver()
+    engine = SeleniumEngine(driver)
+
+    driver.get('about:blank')
+    driver.execute('findElement')
+    assert engine.round_trips == 2 and driver.commands == ['get', 'findElement']
+
+
+class FakePage:
+    """Sync-API page whose private connection counts sent messages"""
+
+    def __init__(self):
+        self._impl_obj = SimpleNamespace(_connection=SimpleNamespace(_last_id=7))
+        self.evaluated = []
+
+    def goto(self, url):
+        self._impl_obj._connection._last_id += 1
+
+    def locator(self, selector):
+        return SimpleNamespace(evaluate=lambda script, arg: self.evaluated.append((selector, script, arg)))
+
+
+def test_playwright_engine_counts_messages_in_checked_releases_only():
+    page = FakePage()
+    engine = PlaywrightEngine(page, playwright_version='1.49.1')
+    page.goto('about:blank')
+    assert engine.round_trips == 1
+    engine.round_trips = 0
+    page.goto('about:blank')
+    assert engine.round_trips == 1
+
+    assert PlaywrightEngine(FakePage(), playwright_version='2.0.0').round_trips is None
+    assert PlaywrightEngine(SimpleNamespace(), playwright_version='1.49.1').round_trips is None
+
+
+def test_both_engines_set_values_with_the_same_script():
+    page = FakePage()
+    PlaywrightEngine(page, playwright_version='1.49.1').set_value('#checkin', '2026-01-02')
+    assert page.evaluated == [('#checkin', SET_VALUE_SCRIPT, '2026-01-02')]
+
+    driver = FakeDriver()
+    scripts = []
+    driver.find_element = lambda by, selector: selector
+    driver.execute_script = lambda script, *args: scripts.append((script, args))
+    SeleniumEngine(driver).set_value('#checkin', '2026-01-02')
+    assert scripts == [(f"({SET_VALUE_SCRIPT})(arguments[0], arguments[1]);", ('#checkin', '2026-01-02'))]
+
+
+class FakeEngine:
+    name = 'fake'
+
+    def __init__(self):
+        self.round_trips = 0
+        self.calls = []
+
+    def open(self, url):
+        self.round_trips += 1
+        self.calls.append(url)
+
+    def wait(self, expression, timeout=30):
+        self.round_trips += 3
+
+
+def test_measure_resets_round_trips_per_scenario():
+    engine = FakeEngine()
+
+    sample = measure(engine, 'page_load', 'http://x/public/index.html')
+
+    assert engine.calls == ['about:blank', 'http://x/public/index.html']
+    assert (sample.engine, sample.scenario, sample.round_trips) == ('fake', 'page_load', 4)
+    assert sample.wall_ms >= 0
+
+
+def test_summarize_takes_medians_per_engine_and_scenario():
+    samples = [Sample('selenium', 'page_load', wall, trips, 50.0, 10.0, 300.0)
+               for wall, trips in [(100.0, 10), (300.0, 12), (200.0, 11)]]
+    samples.append(Sample('playwright', 'page_load', 80.0, 4))
+
+    summary = summarize(samples)
+
+    assert summary[('selenium', 'page_load')] == {
+        'runs': 3, 'wall_ms': 200.0, 'round_trips': 11, 'cpu_ms': 50.0, 'client_cpu_ms': 10.0, 'rss_mb': 300.0,
+    }
+    assert summary[('playwright', 'page_load')]['cpu_ms'] is None
+    assert set(summary[('playwright', 'page_load')]) == {'runs', *METRICS}
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("engine_name", driver_benchmark.ENGINES)
+def test_scenarios_run_on_both_engines(engine_name):
+    pytest.importorskip(engine_name)
+    from config.mock_api import MockAPI
+    from config.render_benchmark import synthetic_search_response
+    from config.static_server import serve_directory
+
+    try:
+        api = MockAPI(search_response=synthetic_search_response(24, 20)).start()
+    except OSError:
+        pytest.skip("Port 3001 is taken (is the real API running?)")
+    try:
+        with serve_directory() as base_url, driver_benchmark.ENGINE_FACTORIES[engine_name]() as engine:
+            samples = driver_benchmark.run_benchmark(
+                engine, f"{base_url}/public/index.html?useLocalAPI=true", runs=2)
+    finally:
+        api.stop()
+
+    for (engine, scenario), row in summarize(samples).items():
+        print(f"\n🏎️  {engine:<10} {scenario:<20} {row['wall_ms']:.0f}ms  {row['round_trips']} trips")
+    assert {sample.scenario for sample in samples} == set(SCENARIOS)
+    assert all(sample.round_trips is None or sample.round_trips > 0 for sample in samples)
+    if engine_name == 'selenium':
+        assert None not in {sample.round_trips for sample in samples}
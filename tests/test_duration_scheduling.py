@@ -0,0 +1,97 @@
+"""
+Tests for duration history and longest-job-first xdist scheduling
+"""
+import json
+
+import pytest
+
+from config.durations import DurationStore, group_scope
+
+
+def test_group_scope_keeps_classes_together():
+    assert group_scope("tests/test_web_ui.py::TradeUnionWebUITest::test_01") == \
+        "tests/test_web_ui.py::TradeUnionWebUITest"
+    assert group_scope("tests/test_quick_union.py::test_union") == "tests/test_quick_union.py"
+    assert group_scope("tests/test_a.py::TestX::test_url[http://x::8080]") == "tests/test_a.py::TestX"
+    assert group_scope("tests/test_a.py::test_pair[a::b]") == "tests/test_a.py"
+
+
+def test_store_estimates_unknown_tests_with_median(tmp_path):
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps({"a": 1.0, "b": 3.0, "c": 10.0}))
+    store = DurationStore(path)
+
+    assert store.estimate("a") == 1.0
+    assert store.estimate("unknown") == 3.0
+    assert store.estimate_group(["a", "b", "unknown"]) == 7.0
+
+
+def test_store_smooths_new_observations(tmp_path):
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps({"a": 4.0}))
+    store = DurationStore(path)
+    store.record("a", 1.0)
+    store.record("a", 1.0)  # setup + call
+    store.record("b", 0.5)
+    store.save()
+
+    saved = json.loads(path.read_text())
+    assert saved == {"a": 3.0, "b": 0.5}
+
+
+def test_store_tolerates_corrupt_history(tmp_path):
+    path = tmp_path / "durations.json"
+    path.write_text("{not json")
+    assert DurationStore(path).durations == {}
+
+
+class _FakeNode:
+    def __init__(self, name):
+        self.gateway = type("Gateway", (), {"id": name})
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indexes):
+        self.sent.append(indexes)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def test_scheduler_assigns_longest_group_first(tmp_path):
+    pytest.importorskip("xdist")
+    from config.xdist_scheduling import DurationScheduling
+
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps({
+        "t.py::Slow::a": 30.0, "t.py::Slow::b": 30.0,
+        "t.py::Medium::a": 20.0,
+        "t.py::fast_1": 1.0, "t.py::fast_2": 1.0, "t.py::fast_3": 1.0,
+    }))
+    collection = list(json.loads(path.read_text()))
+
+    class _Config:
+        class option:
+            tx = ["2*popen"]
+            duration_scheduling = True
+
+        def getoption(self, name):
+            return getattr(self.option, name)
+
+        def getvalue(self, name):
+            return getattr(self.option, name, None)
+
+        class pluginmanager:
+            @staticmethod
+            def get_plugin(name):
+                return None
+
+    sched = DurationScheduling(_Config(), store=DurationStore(path))
+    nodes = [_FakeNode("gw0"), _FakeNode("gw1")]
+    for node in nodes:
+        sched.add_node(node)
+        sched.add_node_collection(node, collection)
+    sched.schedule()
+
+    assert list(sched.assigned_work[nodes[0]])[0] == "t.py::Slow"
+    assert list(sched.assigned_work[nodes[1]])[0] == "t.py::Medium"
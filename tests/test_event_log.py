@@ -0,0 +1,83 @@
+"""
+Tests for the unified JSONL test-event log
+"""
+import json
+import os
+
+from config.event_log import EventAggregator, EventLog, read_events
+
+
+def test_event_log_appends_one_json_object_per_line(tmp_path, monkeypatch):
+    monkeypatch.delenv("TEST_EVENT_RUN_ID", raising=False)
+    path = tmp_path / "events.jsonl"
+    log = EventLog("unit", path=path)
+
+    log.run_start()
+    with log.suite("CSS Loading"):
+        log.test_start("CSS Loading", "page loads")
+        log.test_end("CSS Loading", "page loads", "failed", message="HTTP 500",
+                     artifacts=["shot.png"])
+    log.run_end("failed")
+
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [e["event"] for e in events] == [
+        "run_start", "suite_start", "test_start", "test_end", "suite_end", "run_end"
+    ]
+    assert {e["run"] for e in events} == {log.run_id}
+    assert events[3]["artifacts"] == ["shot.png"]
+    assert events[3]["duration"] >= 0
+
+
+def test_child_runs_record_their_parent(tmp_path, monkeypatch):
+    monkeypatch.delenv("TEST_EVENT_RUN_ID", raising=False)
+    path = tmp_path / "events.jsonl"
+    parent = EventLog("runner", path=path)
+    env = parent.child_env({"BASE_URL": "http://localhost:8080"})
+
+    # Nothing leaks into this process: a second run here is not a child
+    assert "TEST_EVENT_RUN_ID" not in os.environ
+    assert "parent" not in EventLog("runner", path=path).run_start()
+    assert env == {"BASE_URL": "http://localhost:8080", "TEST_EVENT_RUN_ID": parent.run_id}
+
+    monkeypatch.setenv("TEST_EVENT_RUN_ID", env["TEST_EVENT_RUN_ID"])
+    assert EventLog("suite", path=path).run_start()["parent"] == parent.run_id
+
+
+def test_full_log_is_rotated_and_followed(tmp_path):
+    path = tmp_path / "events.jsonl"
+    log = EventLog("unit", path=path, max_bytes=300)
+    follow = read_events(path, follow=True, poll_interval=0.01)
+
+    log.run_start()
+    assert next(follow)["event"] == "run_start"
+    while not (tmp_path / "events.jsonl.1").exists():
+        log.test_end("suite", "test", "passed", duration=0.1)
+        assert next(follow)["event"] == "test_end"
+    # The event that rotated the log is the first one of the new file
+    assert [e["event"] for e in read_events(path)] == ["test_end"]
+    assert path.stat().st_size < 300 and (tmp_path / "events.jsonl.1").stat().st_size >= 300
+
+    log.run_end("passed")
+    assert next(follow)["event"] == "run_end"
+
+
+def test_aggregator_counts_outcomes_and_failures(tmp_path):
+    path = tmp_path / "events.jsonl"
+    lines = [
+        {"run": "r1", "event": "run_start", "runner": "pytest"},
+        {"run": "r1", "event": "test_end", "test": "a", "outcome": "passed", "duration": 1.0},
+        {"run": "r1", "event": "test_end", "test": "b", "outcome": "failed", "duration": 2.0},
+        {"run": "r1", "event": "run_end", "outcome": "failed"},
+    ]
+    # A torn final line (writer still busy) is ignored until completed
+    path.write_text("".join(json.dumps(e) + "\n" for e in lines) + '{"run": "r1", "ev')
+
+    aggregator = EventAggregator()
+    for event in read_events(path):
+        aggregator.consume(event)
+
+    assert aggregator.total == 2
+    assert aggregator.counts["failed"] == 1
+    assert aggregator.test_time == 3.0
+    assert aggregator.runs["r1"]["outcome"] == "failed"
+    assert [f["test"] for f in aggregator.failures] == ["b"]
@@ -0,0 +1,69 @@
+"""
+Heap Leak Soak
+Growth detection on synthetic samples plus a short soak of the real
+search / inline edit / clear cycle (scripts/soak-heap-leaks.py runs longer).
+"""
+import pytest
+
+from config.heap_soak import detect_leaks, linear_slope
+
+SOAK_CYCLES = 20
+SAMPLE_EVERY = 5
+
+
+def _samples(**series):
+    length = len(next(iter(series.values())))
+    return [
+        dict({'cycle': index * 5}, **{metric: values[index] for metric, values in series.items()})
+        for index in range(length)
+    ]
+
+
+def test_linear_slope():
+    assert linear_slope([0, 1, 2, 3], [10, 12, 14, 16]) == 2
+    assert linear_slope([5], [1]) == 0.0
+
+
+def test_sustained_growth_is_a_leak():
+    samples = _samples(nodes=[900, 1000, 1100, 1210, 1300, 1405],
+                       listeners=[40, 45, 41, 44, 42, 43])
+
+    findings = detect_leaks(samples, thresholds={'nodes': 10, 'listeners': 2})
+
+    assert [finding.metric for finding in findings] == ['nodes']
+    assert findings[0].slope > 19
+    assert findings[0].first == 1000, "The warm-up sample is excluded"
+
+
+def test_single_jump_is_not_sustained_growth():
+    # One-off allocation (e.g. a lazily created modal) then flat
+    samples = _samples(heap=[4e6, 4e6, 9e6, 9e6, 9e6, 9e6, 9e6])
+
+    assert detect_leaks(samples, thresholds={'heap': 64 * 1024}) == []
+
+
+@pytest.mark.selenium
+@pytest.mark.slow
+def test_search_clear_cycles_do_not_leak(chrome_options, tmp_path):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    from config.page_helpers import API_STUB_SCRIPT
+    from config.heap_soak import SoakHarness
+    from config.selenium_config import get_chromedriver_path
+    from config.static_server import serve_directory
+
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=chrome_options)
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': API_STUB_SCRIPT})
+        with serve_directory() as base_url:
+            harness = SoakHarness(driver, f"{base_url}/public/index.html",
+                                  every=SAMPLE_EVERY, snapshot_dir=tmp_path)
+            samples, findings = harness.run(SOAK_CYCLES)
+    finally:
+        driver.quit()
+
+    assert len(samples) == SOAK_CYCLES // SAMPLE_EVERY + 1
+    assert all(path.stat().st_size > 0 for path in harness.snapshots)
+    assert not findings, "Sustained growth:\n" + "\n".join(f.describe() for f in findings)
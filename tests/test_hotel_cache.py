@@ -0,0 +1,89 @@
+"""
+Hotel List Cache
+The Python tooling's 24h hotel list cache against the mock API: cache
+hits send nothing, expired entries revalidate with a body-less 304, the
+scrape endpoint is only used on request, and an unreachable API serves
+the stale copy.
+"""
+import json
+
+import pytest
+
+from config.hotel_cache import HotelListCache
+from config.mock_api import MockAPI
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def api():
+    with MockAPI(port=0) as api:
+        yield api
+
+
+def hotel_requests(api):
+    return [path for path, _ in api.requests if path.startswith('/api/vagas/hoteis')]
+
+
+def test_fetches_once_then_serves_from_file(api, tmp_path):
+    clock = Clock()
+    cache = HotelListCache(api.base_url, tmp_path / 'hotels.json', clock=clock)
+
+    first = cache.get()
+    clock.now += 23 * 60 * 60
+    second = HotelListCache(api.base_url, tmp_path / 'hotels.json', clock=clock).get()
+
+    assert (first.source, second.source) == ('hoteis', 'cache')
+    assert second.hotels == first.hotels == api.hotels
+    assert second.count == len(api.hotels)
+    assert hotel_requests(api) == ['/api/vagas/hoteis']
+
+
+def test_expired_entry_is_revalidated_with_304(api, tmp_path):
+    clock = Clock()
+    cache = HotelListCache(api.base_url, tmp_path / 'hotels.json', clock=clock)
+    cache.get()
+
+    clock.now += 25 * 60 * 60
+    assert cache.get_stats()['expired']
+    revalidated = cache.get()
+
+    assert revalidated.source == 'revalidated' and revalidated.hotels == api.hotels
+    assert cache.requests[-1][1] == 304
+    assert not cache.get_stats()['expired'] and cache.get().source == 'cache'
+
+    # A changed list fails If-None-Match and is fetched again
+    api.hotels = api.hotels[:3]
+    assert cache.get(max_age=0).source == 'hoteis' and cache.get().hotels == api.hotels[:3]
+
+
+def test_scrape_only_on_request_and_entries_per_api(api, tmp_path):
+    path = tmp_path / 'hotels.json'
+    scraped = HotelListCache(api.base_url, path).get(scrape=True)
+    other = HotelListCache('http://example.invalid/api', path)
+
+    assert scraped.source == 'scrape' and scraped.body['count'] == len(api.hotels)
+    assert hotel_requests(api) == ['/api/vagas/hoteis/scrape']
+    assert other.get_stats() == {'exists': False}
+    assert list(json.loads(path.read_text())) == [api.base_url]
+
+
+def test_unreachable_api_serves_stale_entry(tmp_path):
+    clock = Clock()
+    with MockAPI(port=0) as api:
+        cache = HotelListCache(api.base_url, tmp_path / 'hotels.json', timeout=2, clock=clock)
+        cache.get()
+
+    clock.now += 48 * 60 * 60
+    stale = cache.get()
+    assert stale.source == 'stale' and stale.count == len(api.hotels)
+
+    cache.clear()
+    with pytest.raises(OSError):
+        cache.get()
@@ -0,0 +1,122 @@
+"""
+Index Page Object
+Handle caching, invalidation and stale-element recovery against a fake
+driver, selectors against public/index.html, plus a search / guests /
+clear round on the real page.
+"""
+from pathlib import Path
+
+import pytest
+
+from config.index_page import CSS, LOCATORS, IndexPage
+
+INDEX_HTML = Path(__file__).parent.parent / 'public' / 'index.html'
+
+
+class FakeElement:
+    def __init__(self, selector, stale=False):
+        self.selector = selector
+        self.stale = stale
+
+    @property
+    def text(self):
+        self._check()
+        return f"text of {self.selector}"
+
+    def click(self):
+        self._check()
+        return 'clicked'
+
+    def _check(self):
+        if self.stale:
+            from selenium.common.exceptions import StaleElementReferenceException
+            raise StaleElementReferenceException('element is not attached to the page document')
+
+
+class FakeDriver:
+    def __init__(self):
+        self.finds = []
+        self.urls = []
+
+    def find_element(self, by, selector):
+        assert by == CSS
+        self.finds.append(selector)
+        return FakeElement(selector)
+
+    def get(self, url):
+        self.urls.append(url)
+
+
+def test_elements_are_found_once_per_page_state():
+    driver = FakeDriver()
+    page = IndexPage(driver, 'http://localhost/index.html')
+
+    page.open(wait_for_hotels=False)
+    assert page.search_button.click() == 'clicked'
+    assert page.search_button.text == 'text of #search-button'
+    assert page.element('search_button') is page.search_button
+    assert driver.finds == ['#search-button']
+
+    page.open('?useLocalAPI=true', wait_for_hotels=False)
+    page.search_button.click()
+
+    assert driver.urls[-1] == 'http://localhost/index.html?useLocalAPI=true'
+    assert driver.finds == ['#search-button', '#search-button']
+    assert page.lookups == 2
+
+    with pytest.raises(AttributeError):
+        page.no_such_element
+
+
+def test_stale_handle_is_resolved_again():
+    pytest.importorskip('selenium')
+    driver = FakeDriver()
+    page = IndexPage(driver, 'http://localhost/index.html')
+
+    page.hotel_select.click()
+    page.hotel_select.element.stale = True  # the app re-rendered the select
+
+    assert page.hotel_select.click() == 'clicked'
+    assert page.hotel_select.text == 'text of #hotel-select'
+    assert page.stale_recoveries == 1
+    assert driver.finds == ['#hotel-select', '#hotel-select']
+
+
+def test_locators_exist_in_index_html():
+    html = INDEX_HTML.read_text(encoding='utf-8')
+    for name, selector in LOCATORS.items():
+        element_id = selector.split()[0].lstrip('#')
+        assert f'id="{element_id}"' in html, f"{name}: {selector} not in index.html"
+
+
+@pytest.mark.selenium
+@pytest.mark.slow
+def test_search_guests_and_clear(chrome_options):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    from config.page_helpers import API_STUB_SCRIPT
+    from config.selenium_config import get_chromedriver_path
+    from config.static_server import serve_directory
+
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=chrome_options)
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': API_STUB_SCRIPT})
+        with serve_directory() as base_url:
+            page = IndexPage(driver, f"{base_url}/public/index.html").open()
+            page.run_search()
+            assert page.results_visible()
+            assert page.result_count() > 0
+
+            page.set_guests(4)
+            assert page.guests() == 4
+            page.set_guests(2)
+
+            page.clear_results()
+            assert not page.results_visible()
+    finally:
+        driver.quit()
+
+    print(f"\n🔎 {page.lookups} element lookups, {page.stale_recoveries} stale handles recovered")
+    assert page.lookups <= len(LOCATORS)
@@ -0,0 +1,90 @@
+"""
+Interaction Latency (INP)
+Percentile and attribution maths on recorded entries, plus the per-control
+interaction-to-next-paint distribution on a large "Todas" result set.
+"""
+import pytest
+
+from config.interaction_latency import (
+    DURATION_THRESHOLD_MS, attribute_long_tasks, interaction_latencies, module_name,
+)
+
+ORIGIN = 'http://localhost:8080'
+
+
+def test_latency_is_the_longest_entry_per_action():
+    actions = [
+        {'control': 'guest-plus', 'start': 0, 'end': 100},
+        {'control': 'guest-plus', 'start': 200, 'end': 300},
+        {'control': 'keyboard-help', 'start': 400, 'end': 500},
+    ]
+    events = [
+        {'interactionId': 1, 'name': 'pointerdown', 'startTime': 10, 'duration': 24},
+        {'interactionId': 1, 'name': 'click', 'startTime': 12, 'duration': 120},
+        {'interactionId': 2, 'name': 'click', 'startTime': 210, 'duration': 64},
+    ]
+
+    report = interaction_latencies(events, actions)
+
+    assert report['guest-plus']['samples'] == [120, 64]
+    assert report['guest-plus']['max'] == 120
+    assert report['keyboard-help'] == {
+        'samples': [DURATION_THRESHOLD_MS], 'below_threshold': 1,
+        'p50': DURATION_THRESHOLD_MS, 'p75': DURATION_THRESHOLD_MS,
+        'p98': DURATION_THRESHOLD_MS, 'max': DURATION_THRESHOLD_MS,
+    }
+
+
+def test_long_frames_are_attributed_to_modules():
+    actions = [{'control': 'guest-plus', 'start': 0, 'end': 500}]
+    frames = [
+        {'startTime': 10, 'duration': 180, 'renderStart': 150, 'scripts': [
+            {'sourceURL': f'{ORIGIN}/src/js/guestNumberFilter.js', 'duration': 110},
+            {'sourceURL': f'{ORIGIN}/src/services/pagination.js', 'duration': 20},
+        ]},
+        {'startTime': 300, 'duration': 30, 'renderStart': 320, 'scripts': []},  # not long
+    ]
+
+    report = attribute_long_tasks(frames, [], actions, ORIGIN)
+
+    assert report == {'guest-plus': {
+        'src/js/guestNumberFilter.js': 110,
+        'src/services/pagination.js': 20,
+        '(style/layout/paint)': 40,
+    }}
+    assert module_name('https://cdn.example/x.js', ORIGIN) == 'https://cdn.example/x.js'
+
+
+@pytest.mark.selenium
+@pytest.mark.slow
+def test_interaction_latency_per_control(chrome_options):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    from config.interaction_latency import measure
+    from config.render_benchmark import synthetic_search_response
+    from config.selenium_config import get_chromedriver_path
+    from config.static_server import serve_directory
+
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=chrome_options)
+    try:
+        with serve_directory() as base_url:
+            latencies, attribution, _ = measure(
+                driver, f"{base_url}/public/index.html",
+                synthetic_search_response(25, 100), repeats=3
+            )
+    finally:
+        driver.quit()
+
+    print(f"\n{'Control':<22}{'n':>4}{'p50':>8}{'p75':>8}{'p98':>8}{'max':>8}  top module")
+    for control, stats in latencies.items():
+        modules = attribution.get(control) or {}
+        top = max(modules, key=modules.get) if modules else '-'
+        print(f"{control:<22}{len(stats['samples']):>4}{stats['p50']:>6.0f}ms{stats['p75']:>6.0f}ms"
+              f"{stats['p98']:>6.0f}ms{stats['max']:>6.0f}ms  {top}")
+
+    assert set(latencies) == {
+        'guest-plus', 'guest-minus', 'filter-chip-remove', 'inline-editor-toggle',
+        'keyboard-help', 'keyboard-arrow',
+    }
@@ -0,0 +1,76 @@
+"""
+Tests for the content-hash keyed JS source index
+"""
+import pytest
+
+from config.js_index import SourceIndex, StaleSourceWarning, scan
+
+MODULE = """
+import { logger } from '../services/logger.js';
+import Default, * as helpers from './helpers.js';
+// export function commented() {}
+const pattern = /['"]\\/export/g;
+
+export const apiClient = new Client();
+export async function search(query) {
+    return `<div id="results">${query}</div>`;
+}
+class Client {
+    searchVacancies(params) {
+        if (params) { return 1 / 2; }
+    }
+}
+const handler = async (event) => event;
+export { Client as BuscaVagasAPIClient };
+export default apiClient;
+"""
+
+
+def test_scan_records_module_structure():
+    info = scan(MODULE)
+    assert info['exports'] == ['BuscaVagasAPIClient', 'apiClient', 'default', 'search']
+    assert info['imports'] == {
+        '../services/logger.js': ['logger'],
+        './helpers.js': ['*', 'default'],
+    }
+    for name in ('search', 'Client', 'searchVacancies', 'handler'):
+        assert name in info['functions']
+    assert 'commented' not in info['functions'] and 'if' not in info['functions']
+    assert '<div id="results">${query}</div>' in info['strings']
+
+
+def test_index_is_reused_by_content_hash(tmp_path):
+    (tmp_path / 'src' / 'js').mkdir(parents=True)
+    source = tmp_path / 'src' / 'js' / 'app.js'
+    source.write_text(MODULE)
+    index_file = tmp_path / 'index.json'
+
+    first = SourceIndex(tmp_path, ('src/js/*.js',), index_file).build()
+    assert first.scanned == 1
+    first.save()
+
+    second = SourceIndex(tmp_path, ('src/js/*.js',), index_file).build()
+    assert second.scanned == 0
+    app = second['src/js/app.js']
+    assert app.defines('searchVacancies')
+    assert app.contains_string('id="results"')
+    assert app.resolve('../services/logger.js') == 'src/services/logger.js'
+
+    source.write_text(MODULE + "\nexport function added() {}\n")
+    third = SourceIndex(tmp_path, ('src/js/*.js',), index_file).build()
+    assert third.scanned == 1 and 'added' in third['src/js/app.js'].exports
+
+
+def test_missing_path_is_reported_once(tmp_path):
+    index = SourceIndex(tmp_path, (), tmp_path / 'index.json')
+    with pytest.warns(StaleSourceWarning):
+        assert index.module('src/components/QuickSearch/QuickSearch.js') is None
+    assert index.module('src/components/QuickSearch/QuickSearch.js') is None
+    assert index.missing == {'src/components/QuickSearch/QuickSearch.js': 2}
+    with pytest.raises(KeyError):
+        index['src/components/QuickSearch/QuickSearch.js']
+
+
+def test_repository_modules_indexed(source_index):
+    assert 'src/services/apiClient.js' in source_index.modules
+    assert 'getAllHotelCards' in source_index['src/js/hotelSearch.js'].exports
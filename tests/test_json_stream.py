@@ -0,0 +1,107 @@
+"""
+Incremental JSON Streaming
+Weekend results parsed as their bytes arrive: the item scanner against
+arbitrary chunk boundaries, the synthetic weekend payload, the mock API's
+trickled chunked response, and the page's apiClient in streaming mode.
+"""
+import json
+import random
+
+import pytest
+
+from config.api_factory import DatasetSpec, iter_weekend_json, weekend_dates, weekend_payload
+from config.json_stream import JSONItemStream, fetch_weekends, iter_json_items
+from config.mock_api import MockAPI
+
+SPEC = DatasetSpec(hotels=4, vacancies_per_hotel=3, unavailable_ratio=0.5, accentless_ratio=0.3)
+
+
+def test_items_match_for_any_chunk_boundaries():
+    body = weekend_payload(SPEC, 6, '2026-03-02')
+    text = json.dumps(body, ensure_ascii=False, indent=1).encode('utf-8')
+    rng = random.Random(0)
+
+    for _ in range(50):
+        stream, items, position = JSONItemStream(), [], 0
+        while position < len(text):
+            size = rng.randint(1, 40)
+            items += stream.feed(text[position:position + size])
+            position += size
+        assert items == body['data']['weekends']
+        assert stream.close() == body
+
+
+def test_item_is_emitted_with_its_closing_brace():
+    text = '{"data": {"searchDetails": {"weekends": "]"}, "weekends": [{"n": "}"}, 2, "x", [3]], "z": 1}}'
+    stream = JSONItemStream()
+    first_end = text.index('}, 2') + 1
+
+    assert stream.feed(text[:first_end - 1]) == []
+    assert stream.feed(text[first_end - 1:first_end]) == [{'n': '}'}]
+    assert stream.feed(text[first_end:]) == [2, 'x', [3]]
+    assert list(iter_json_items([text], ('data', 'searchDetails'))) == []
+
+
+def test_weekend_payload_and_stream_agree():
+    assert weekend_dates(2, '2026-10-16') == [('2026-10-23', '2026-10-25'), ('2026-10-30', '2026-11-01')]
+
+    body = weekend_payload(SPEC, 8, '2026-03-02')
+    weekends = body['data']['weekends']
+    assert json.loads(''.join(iter_weekend_json(SPEC, 8, '2026-03-02'))) == body
+    assert [w['weekendNumber'] for w in weekends] == list(range(1, 9))
+    assert body['data']['availability']['weekendsWithVacancies'] == sum(w['hasAvailability'] for w in weekends)
+    assert 0 < body['data']['availability']['weekendsWithoutVacancies'] < 8
+
+
+def test_mock_api_trickles_weekends_and_client_sees_each_early():
+    arrivals = []
+    with MockAPI(port=0, weekend_spec=SPEC, weekend_delay=0.2) as api:
+        data = fetch_weekends(api.base_url, 4, lambda weekend, seconds: arrivals.append(seconds))
+
+    assert len(data['weekends']) == 4 and data['searchDetails']['totalWeekendsSearched'] == 4
+    # One weekend per delay: the first arrives long before the body is complete
+    assert arrivals[0] < 0.35 and arrivals[-1] >= 0.8
+    assert arrivals == sorted(arrivals)
+
+
+def test_mock_api_rejects_out_of_range_counts():
+    with MockAPI(port=0) as api:
+        with pytest.raises(Exception) as error:
+            fetch_weekends(api.base_url, 13)
+    assert error.value.code == 400
+
+
+@pytest.mark.selenium
+@pytest.mark.slow
+def test_page_client_streams_weekends(chrome_options):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    from config.selenium_config import get_chromedriver_path
+    from config.static_server import serve_directory
+
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=chrome_options)
+    try:
+        with serve_directory() as base_url, MockAPI(weekend_spec=SPEC, weekend_delay=0.5):
+            driver.get(f"{base_url}/public/index.html?useLocalAPI=true")
+            driver.set_script_timeout(30)
+            timings = driver.execute_async_script("""
+                const done = arguments[arguments.length - 1];
+                import('../src/services/apiClient.js').then(async ({ apiClient }) => {
+                    const started = performance.now();
+                    const arrivals = [];
+                    const data = await apiClient.searchWeekendVacancies(4, {
+                        onWeekend: () => arrivals.push(performance.now() - started)
+                    });
+                    done({arrivals, total: performance.now() - started, weekends: data.weekends.length});
+                }).catch(error => done({error: String(error)}));
+            """)
+    finally:
+        driver.quit()
+
+    assert 'error' not in timings, timings.get('error')
+    print(f"\n📡 first weekend after {timings['arrivals'][0]:.0f}ms, all {timings['weekends']} "
+          f"after {timings['total']:.0f}ms")
+    assert len(timings['arrivals']) == timings['weekends'] == 4
+    assert timings['arrivals'][0] < timings['total'] / 2
@@ -0,0 +1,71 @@
+"""
+Precache Manifest
+Checks that the sw.js manifest follows index.html's real dependency graph
+and that its version only moves when an asset changes.
+"""
+from config.precache import build_manifest, render_manifest
+
+
+def _page(tmp_path):
+    (tmp_path / 'public').mkdir()
+    (tmp_path / 'src' / 'styles').mkdir(parents=True)
+    (tmp_path / 'src' / 'js').mkdir(parents=True)
+    (tmp_path / 'public' / 'index.html').write_text(
+        '<link rel="stylesheet" href="https://cdn.example/bootstrap.min.css">'
+        '<link rel="stylesheet" href="../src/styles/main.css">'
+        '<script src="vendor/jquery/jquery.min.js"></script>'
+        '<script type="module" src="../src/js/app.js"></script>'
+        '<script type="module">import { x } from "../src/js/inline.js";</script>'
+    )
+    (tmp_path / 'src' / 'styles' / 'main.css').write_text(
+        '@import url("theme.css");\n'
+        '@font-face { font-family: A; src: url(a.eot); src: url(a.woff2) format("woff2"); }\n'
+        '.logo { background: url(data:image/png;base64,AAAA); }\n'
+    )
+    (tmp_path / 'src' / 'styles' / 'theme.css').write_text(':root { --c: red; }')
+    (tmp_path / 'src' / 'styles' / 'a.woff2').write_bytes(b'font')
+    (tmp_path / 'src' / 'js' / 'app.js').write_text("import { api } from './api.js';")
+    (tmp_path / 'src' / 'js' / 'api.js').write_text("export const api = 1;")
+    (tmp_path / 'src' / 'js' / 'inline.js').write_text("export const x = 1;")
+
+
+def test_manifest_follows_the_dependency_graph(tmp_path):
+    _page(tmp_path)
+    manifest = build_manifest(root=tmp_path)
+    urls = [asset['url'] for asset in manifest['assets']]
+
+    assert urls == sorted([
+        './', 'index.html', '../src/styles/main.css', '../src/styles/theme.css',
+        '../src/styles/a.woff2', '../src/js/app.js', '../src/js/api.js', '../src/js/inline.js',
+    ])
+    assert manifest['runtime'] == ['https://cdn.example/bootstrap.min.css']
+    # A 404 would fail the whole install, so missing files are reported, not listed
+    assert manifest['missing'] == ['public/vendor/jquery/jquery.min.js']
+    assert 'missing' not in render_manifest(manifest)
+
+
+def test_version_changes_only_with_content(tmp_path):
+    _page(tmp_path)
+    first = build_manifest(root=tmp_path)
+    assert build_manifest(root=tmp_path)['version'] == first['version']
+
+    (tmp_path / 'src' / 'js' / 'api.js').write_text("export const api = 2;")
+    second = build_manifest(root=tmp_path)
+
+    assert second['version'] != first['version']
+    changed = [
+        new['url'] for old, new in zip(first['assets'], second['assets'])
+        if old['revision'] != new['revision']
+    ]
+    assert changed == ['../src/js/api.js']
+
+
+def test_index_html_manifest_covers_loaded_modules():
+    manifest = build_manifest()
+    urls = {asset['url'] for asset in manifest['assets']}
+
+    assert {'index.html', '../src/styles/main.css', '../src/services/apiClient.js'} <= urls
+    # Reached only through imports, never named in index.html
+    assert '../src/styles/global/variables.css' in urls
+    assert '../src/config/constants.js' in urls
+    assert all(not url.startswith('http') for url in urls)
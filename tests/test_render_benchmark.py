@@ -0,0 +1,104 @@
+"""
+Result Rendering Benchmark
+Large "Todas" responses (25 hotels x up to hundreds of vacancies) through
+displayResults() and pagination, with scripting/layout/paint time from the
+Chrome trace and DOM node counts per case.
+"""
+import pytest
+
+from config.render_benchmark import summarize_trace, synthetic_search_response
+
+# (hotels, vacancies per hotel); the last rows are high-season "Todas" searches
+CASES = [(25, 10), (25, 50), (25, 100), (25, 300)]
+ITEMS_PER_PAGE = 10
+
+
+def _event(name, ts, dur=None, ph='X', cat='devtools.timeline', tid=1):
+    event = {'name': name, 'ts': ts, 'ph': ph, 'cat': cat, 'pid': 7, 'tid': tid}
+    if dur is not None:
+        event['dur'] = dur
+    return event
+
+
+def test_synthetic_response_shape():
+    response = synthetic_search_response(hotels=25, vacancies_per_hotel=3)
+    result = response['data']['result']
+
+    assert response['data']['hasAvailability'] is True
+    assert len(result['hotelGroups']) == 25
+    assert len(result['vacancies']) == 75
+    assert all('pessoas' in text for texts in result['hotelGroups'].values() for text in texts)
+    assert synthetic_search_response(25, 3) == response, "Same seed, same response"
+
+
+def test_trace_summary_uses_self_time_and_inherits_categories():
+    events = [
+        _event('monitora:search-response', 1_000, ph='R', cat='blink.user_timing'),
+        _event('RunTask', 2_000, 60_000),
+        _event('FunctionCall', 2_000, 40_000),
+        _event('v8.gc', 10_000, 5_000),          # unlisted: inherits scripting
+        _event('Layout', 20_000, 10_000),        # forced layout inside the script
+        _event('RunTask', 70_000, 8_000),
+        _event('Paint', 71_000, 6_000),
+        _event('FunctionCall', 71_000, 99_000, tid=2),  # another thread
+        _event('monitora:render-end', 90_000, ph='R', cat='blink.user_timing'),
+    ]
+
+    summary = summarize_trace(events, 'monitora:search-response', 'monitora:render-end')
+
+    assert summary['scripting'] == 30.0
+    assert summary['rendering'] == 10.0
+    assert summary['painting'] == 6.0
+    assert summary['other'] == 22.0
+    assert (summary['tasks'], summary['long_tasks'], summary['longest_task']) == (2, 1, 60.0)
+    assert summarize_trace(events, 'monitora:search-response', 'missing') is None
+
+
+@pytest.mark.selenium
+@pytest.mark.slow
+def test_large_result_rendering(chrome_options):
+    """Render every case, check what pagination shows and print the costs"""
+    import copy
+
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    from config.page_helpers import API_STUB_SCRIPT
+    from config.render_benchmark import run_case, trace_logging
+    from config.selenium_config import get_chromedriver_path
+    from config.static_server import serve_directory
+
+    options = trace_logging(copy.deepcopy(chrome_options))
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=options)
+    results = []
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': API_STUB_SCRIPT})
+        with serve_directory() as base_url:
+            for hotels, vacancies in CASES:
+                results.append(run_case(driver, f"{base_url}/public/index.html", hotels, vacancies))
+    finally:
+        driver.quit()
+
+    print(f"\n{'Case':<12}{'Phase':<8}{'Wall':>9}{'Script':>9}{'Layout':>9}{'Paint':>8}"
+          f"{'Long':>6}{'Max task':>10}{'DOM':>8}{'Live':>8}")
+    print('-' * 87)
+    for result in results:
+        case = f"{result['hotels']}x{result['vacancies']}"
+        for phase in ('render', 'page'):
+            metrics = result[phase]
+            if not metrics:
+                continue
+            trace = metrics['trace'] or {}
+            print(f"{case:<12}{phase:<8}{metrics['elapsed']:>7.0f}ms"
+                  f"{trace.get('scripting', 0):>7.0f}ms{trace.get('rendering', 0):>7.0f}ms"
+                  f"{trace.get('painting', 0):>6.0f}ms{trace.get('long_tasks', 0):>6}"
+                  f"{trace.get('longest_task', 0):>8.0f}ms{metrics['documentNodes']:>8}"
+                  f"{metrics.get('liveNodes', ''):>8}")
+
+    for result in results:
+        render = result['render']
+        assert render['cards'] == min(result['hotels'], ITEMS_PER_PAGE)
+        assert render['vacancyItems'] == render['cards'] * result['vacancies']
+        assert render['trace'], "Trace marks missing; was the session created with trace_logging()?"
+        assert result['page'] and result['page']['cards'] == ITEMS_PER_PAGE
@@ -0,0 +1,77 @@
+"""
+Single-Flight Search Client
+Concurrent identical searches against the mock API must reach the backend
+once and share the result; different or later searches, and failures,
+must not be shared.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from config.mock_api import MockAPI
+from config.search_client import SearchClient, SingleFlight, search_url
+
+
+def search_requests(api):
+    return [(path, query.get('hotel')) for path, query in api.requests if path == '/api/vagas/search']
+
+
+def test_identical_concurrent_searches_share_one_request():
+    with MockAPI(port=0, search_delay=0.3) as api:
+        client = SearchClient(api.base_url, timeout=10)
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda _: client.search('-1', '2026-11-06', '2026-11-08'), range(8)))
+
+    assert search_requests(api) == [('/api/vagas/search', '-1')]
+    assert all(result is results[0] for result in results)
+    assert (client.flight.started, client.flight.shared) == (1, 7)
+    assert client.flight.in_flight() == []
+
+
+def test_different_and_sequential_searches_are_not_shared():
+    with MockAPI(port=0, search_delay=0.2) as api:
+        client = SearchClient(api.base_url, timeout=10)
+        with ThreadPoolExecutor(4) as pool:
+            list(pool.map(lambda hotel: client.search(hotel, '2026-11-06', '2026-11-08'), ['-1', '12', '-1', '12']))
+        client.search('-1', '2026-11-06', '2026-11-08')
+
+    assert sorted(search_requests(api)) == [('/api/vagas/search', '-1')] * 2 + [('/api/vagas/search', '12')]
+    assert search_url(api.base_url, '-1', '2026-11-06', '2026-11-08') == \
+        f"{api.base_url}/vagas/search?hotel=-1&checkin=2026-11-06&checkout=2026-11-08"
+
+
+def test_failure_reaches_every_waiting_caller():
+    flight, started, calls = SingleFlight(), threading.Event(), []
+
+    def failing():
+        calls.append(1)
+        started.set()
+        threading.Event().wait(0.2)
+        raise RuntimeError('scrape failed')
+
+    def call():
+        with pytest.raises(RuntimeError, match='scrape failed'):
+            flight.do('search', failing)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=call) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert calls == [1] and flight.shared == 3
+    assert flight.do('search', lambda: 'retried') == 'retried'
+
+
+def test_weekend_searches_are_coalesced():
+    with MockAPI(port=0, weekend_delay=0.1) as api:
+        client = SearchClient(api.base_url, timeout=10)
+        with ThreadPoolExecutor(3) as pool:
+            results = list(pool.map(lambda _: client.search_weekends(2), range(3)))
+
+    assert [path for path, _ in api.requests] == ['/api/vagas/search/weekends']
+    assert len(results[0]['weekends']) == 2 and results[1] is results[0]
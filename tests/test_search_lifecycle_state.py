@@ -1,6 +1,9 @@
 """
 Test Suite for FR-008A: Search Lifecycle UI State Management
 Tests the enabled/disabled state of UI elements throughout the search lifecycle.
+
+Classes that run a search are marked 'api'; with --api-circuit they fail
+fast or use the mock API while the API is down.
 """
 
 import pytest
@@ -25,6 +28,18 @@ def driver():
     driver.quit()
 
 
+@pytest.fixture
+def page_url(app_server):
+    """index.html on the repository-root server, so its ../src modules load"""
+    return f"{app_server}/public/index.html"
+
+
+@pytest.fixture
+def api_page_url(page_url, api_page_query):
+    """index.html pointed at the API under test (see api_base_url in conftest.py)"""
+    return f"{page_url}{api_page_query}"
+
+
 def wait_for_element(driver, by, value, timeout=10):
     """Helper to wait for element"""
     return WebDriverWait(driver, timeout).until(
@@ -54,9 +69,9 @@ def is_element_visible(driver, element_id):
 class TestInitialPageLoadState:
     """Test AC-008A.1 to AC-008A.4: Initial Page Load State"""
     
-    def test_01_initial_all_inputs_enabled(self, driver):
+    def test_01_initial_all_inputs_enabled(self, driver, page_url):
         """AC-008A.1: All input elements enabled on page load"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(page_url)
         
         # Wait for page to load
         wait_for_element(driver, By.ID, 'hotel-select')
@@ -70,9 +85,9 @@ class TestInitialPageLoadState:
         assert is_element_enabled(checkin_input), "Check-in input should be enabled"
         assert is_element_enabled(checkout_input), "Check-out input should be enabled"
     
-    def test_02_initial_search_button_enabled(self, driver):
+    def test_02_initial_search_button_enabled(self, driver, page_url):
         """AC-008A.2: Search button enabled on page load"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(page_url)
         
         wait_for_element(driver, By.ID, 'search-button')
         time.sleep(1)
@@ -82,9 +97,9 @@ class TestInitialPageLoadState:
         assert is_element_enabled(search_btn), "Search button should be enabled"
         assert search_btn.text.lower() == 'busca vagas', "Search button should have correct text"
     
-    def test_03_initial_start_new_search_hidden(self, driver):
+    def test_03_initial_start_new_search_hidden(self, driver, page_url):
         """AC-008A.3: Reset button not visible on page load"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(1)
@@ -92,9 +107,9 @@ class TestInitialPageLoadState:
         assert not is_element_visible(driver, 'reset-btn'), \
             "Reset button should be hidden initially"
     
-    def test_04_initial_action_buttons_hidden(self, driver):
+    def test_04_initial_action_buttons_hidden(self, driver, page_url):
         """AC-008A.4: Copy and Clear buttons not visible on page load"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(1)
@@ -105,12 +120,13 @@ class TestInitialPageLoadState:
             "Results container should not be visible initially"
 
 
+@pytest.mark.api
 class TestSearchingState:
     """Test AC-008A.5 to AC-008A.12: During Search Execution State"""
     
-    def test_05_searching_inputs_disabled(self, driver):
+    def test_05_searching_inputs_disabled(self, driver, api_page_url):
         """AC-008A.5-7: Inputs disabled during search"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         # Wait for hotels to load
         wait_for_element(driver, By.ID, 'hotel-select')
@@ -137,9 +153,9 @@ class TestSearchingState:
         assert is_element_disabled(checkin_input), "Check-in input should be disabled during search"
         assert is_element_disabled(checkout_input), "Check-out input should be disabled during search"
     
-    def test_06_searching_button_disabled(self, driver):
+    def test_06_searching_button_disabled(self, driver, api_page_url):
         """AC-008A.9-10: Search button disabled with 'Buscando...' text"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(2)
@@ -158,9 +174,9 @@ class TestSearchingState:
         assert '🔍' in search_btn.text or 'Buscando' in search_btn.text, \
             "Search button should show searching text"
     
-    def test_07_searching_visual_indication(self, driver):
+    def test_07_searching_visual_indication(self, driver, api_page_url):
         """AC-008A.12: Disabled elements have visual indication"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(2)
@@ -178,12 +194,13 @@ class TestSearchingState:
         assert float(opacity) < 1.0, "Disabled elements should have reduced opacity"
 
 
+@pytest.mark.api
 class TestResultsState:
     """Test AC-008A.13 to AC-008A.21: After Search Completion State"""
     
-    def test_08_results_date_inputs_remain_disabled(self, driver):
+    def test_08_results_date_inputs_remain_disabled(self, driver, api_page_url):
         """AC-008A.13-15: Hotel and date inputs remain disabled after search"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(2)
@@ -204,9 +221,9 @@ class TestResultsState:
         assert is_element_disabled(checkin_input), "Check-in input should remain disabled"
         assert is_element_disabled(checkout_input), "Check-out input should remain disabled"
     
-    def test_09_results_search_button_disabled(self, driver):
+    def test_09_results_search_button_disabled(self, driver, api_page_url):
         """AC-008A.17: Search button remains disabled after search"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(2)
@@ -220,9 +237,9 @@ class TestResultsState:
         search_btn = driver.find_element(By.ID, 'search-button')
         assert is_element_disabled(search_btn), "Search button should remain disabled after search"
     
-    def test_10_results_start_new_search_visible(self, driver):
+    def test_10_results_start_new_search_visible(self, driver, api_page_url):
         """AC-008A.18: Reset button visible after search"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(2)
@@ -239,9 +256,9 @@ class TestResultsState:
         start_new_btn = driver.find_element(By.ID, 'reset-btn')
         assert is_element_enabled(start_new_btn), "Reset button should be enabled"
     
-    def test_11_results_action_buttons_visible(self, driver):
+    def test_11_results_action_buttons_visible(self, driver, api_page_url):
         """AC-008A.19-20: Copy and Clear buttons visible after search"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(2)
@@ -258,21 +275,22 @@ class TestResultsState:
             "Results container should be visible"
 
 
+@pytest.mark.api
 class TestStartNewSearchAction:
     """Test AC-008A.26 to AC-008A.37: Reset Action"""
     
-    def test_12_start_new_search_button_exists(self, driver):
+    def test_12_start_new_search_button_exists(self, driver, api_page_url):
         """AC-008A.26: Reset button has correct ID"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'reset-btn')
         
         btn = driver.find_element(By.ID, 'reset-btn')
         assert btn is not None, "Reset button should exist with correct ID"
     
-    def test_13_start_new_search_clears_results(self, driver):
+    def test_13_start_new_search_clears_results(self, driver, api_page_url):
         """AC-008A.27-28: Reset clears and hides results"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(2)
@@ -293,9 +311,9 @@ class TestStartNewSearchAction:
         assert 'visible' not in results_container.get_attribute('class'), \
             "Results container should be hidden after Reset"
     
-    def test_14_start_new_search_enables_inputs(self, driver):
+    def test_14_start_new_search_enables_inputs(self, driver, api_page_url):
         """AC-008A.29-31: Reset enables hotel and date inputs"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(2)
@@ -318,9 +336,9 @@ class TestStartNewSearchAction:
         assert is_element_enabled(checkin_input), "Check-in input should be enabled"
         assert is_element_enabled(checkout_input), "Check-out input should be enabled"
     
-    def test_15_start_new_search_enables_search_button(self, driver):
+    def test_15_start_new_search_enables_search_button(self, driver, api_page_url):
         """AC-008A.32: Reset enables search button"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(2)
@@ -337,9 +355,9 @@ class TestStartNewSearchAction:
         assert is_element_enabled(search_btn), "Search button should be enabled"
         assert search_btn.text.lower() == 'busca vagas', "Search button should have original text"
     
-    def test_16_start_new_search_hides_itself(self, driver):
+    def test_16_start_new_search_hides_itself(self, driver, api_page_url):
         """AC-008A.33: Reset hides itself"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(2)
@@ -355,9 +373,9 @@ class TestStartNewSearchAction:
         assert not is_element_visible(driver, 'reset-btn'), \
             "Reset button should be hidden after click"
     
-    def test_17_start_new_search_resets_guest_counter(self, driver):
+    def test_17_start_new_search_resets_guest_counter(self, driver, api_page_url):
         """AC-008A.35-36: Reset resets guest counter to default"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(2)
@@ -374,9 +392,9 @@ class TestStartNewSearchAction:
         assert '2' in guest_input.get_attribute('value'), \
             "Guest counter should reset to 2"
     
-    def test_18_start_new_search_preserves_dates(self, driver):
+    def test_18_start_new_search_preserves_dates(self, driver, api_page_url):
         """AC-008A.36: Reset preserves date values (dates remain in input fields)"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(2)
@@ -408,12 +426,13 @@ class TestStartNewSearchAction:
             "Check-out input should be enabled after Reset"
 
 
+@pytest.mark.api
 class TestButtonStateTransitions:
     """Test button state transitions throughout lifecycle"""
     
-    def test_19_search_button_vs_start_new_search_distinction(self, driver):
+    def test_19_search_button_vs_start_new_search_distinction(self, driver, api_page_url):
         """AC-008A: Verify distinct behavior of search vs start new search buttons"""
-        driver.get('http://localhost:3001/index.html')
+        driver.get(api_page_url)
         
         wait_for_element(driver, By.ID, 'hotel-select')
         time.sleep(2)
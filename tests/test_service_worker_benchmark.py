@@ -0,0 +1,151 @@
+"""
+Service Worker Benchmark
+First visit, repeat visit and offline load of index.html with and without
+public/sw.js, using the precache manifest generated from the page's real
+dependency graph (scripts/generate-precache-manifest.py).
+
+A copy of public/ and src/ is served (so index.html can load ../src) with
+the manifest generated into it, leaving the working tree untouched; the
+service worker is opted into on localhost with ?sw=1.
+"""
+import shutil
+import statistics
+
+import pytest
+
+from config.precache import ROOT_DIR, build_manifest, write_manifest
+
+pytestmark = [pytest.mark.selenium, pytest.mark.slow]
+
+REPEAT_VISITS = 3
+
+LOAD_METRICS_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const entries = [nav].concat(performance.getEntriesByType('resource'));
+const local = entries.filter(r => r.name.startsWith(location.origin));
+return {
+    domContentLoaded: nav.domContentLoadedEventEnd,
+    load: nav.loadEventEnd,
+    resources: local.length,
+    // workerStart is set on every request the service worker handled
+    fromWorker: local.filter(r => r.workerStart > 0).length,
+    network: local.filter(r => r.workerStart === 0 && r.transferSize > 0).length,
+    transferred: local.reduce((sum, r) => sum + r.transferSize, 0)
+};
+"""
+
+
+def _wait_loaded(driver):
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    WebDriverWait(driver, 30).until(
+        lambda d: d.execute_script(
+            "const n = performance.getEntriesByType('navigation')[0];"
+            "return n && n.loadEventEnd > 0;"
+        )
+    )
+
+
+def _visit(driver, url):
+    driver.get(url)
+    _wait_loaded(driver)
+    return driver.execute_script(LOAD_METRICS_SCRIPT)
+
+
+def _offline_visit(driver, url):
+    """Load url with the server stopped and the network emulated offline"""
+    from selenium.common.exceptions import WebDriverException
+
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.emulateNetworkConditions', {
+        'offline': True, 'latency': 0, 'downloadThroughput': -1, 'uploadThroughput': -1,
+    })
+    try:
+        metrics = _visit(driver, url)
+        rendered = driver.execute_script(
+            "return !!document.querySelector('form') && !location.href.startsWith('chrome-error:');"
+        )
+    except WebDriverException:
+        return None
+    return metrics if rendered else None
+
+
+def built_tree(directory):
+    """Copy of the served tree with its precache manifest, as `npm run build` leaves it"""
+    for name in ('public', 'src'):
+        shutil.copytree(ROOT_DIR / name, directory / name,
+                        ignore=shutil.ignore_patterns('precache-manifest.js'))
+    manifest = build_manifest(root=directory)
+    write_manifest(manifest, directory / 'public' / 'precache-manifest.js')
+    return manifest
+
+
+def run_scenarios(options, root, use_service_worker):
+    """First, median repeat and offline visit for one mode"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    from config.selenium_config import get_chromedriver_path
+    from config.static_server import start_server
+
+    httpd, base_url = start_server(root)
+    url = f"{base_url}/public/index.html" + ("?sw=1" if use_service_worker else "?sw=0")
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=options)
+    try:
+        first = _visit(driver, url)
+        if use_service_worker:
+            driver.set_script_timeout(30)
+            # Repeat visits only count once the worker controls the page
+            driver.execute_async_script(
+                "const done = arguments[arguments.length - 1];"
+                "navigator.serviceWorker.ready.then(() => done(true));"
+            )
+        repeats = [_visit(driver, url) for _ in range(REPEAT_VISITS)]
+        httpd.shutdown()
+        httpd.server_close()
+        httpd = None
+        offline = _offline_visit(driver, url)
+    finally:
+        driver.quit()
+        if httpd:
+            httpd.shutdown()
+            httpd.server_close()
+
+    repeat = dict(repeats[-1], load=statistics.median(r['load'] for r in repeats),
+                  domContentLoaded=statistics.median(r['domContentLoaded'] for r in repeats))
+    return {'first': first, 'repeat': repeat, 'offline': offline}
+
+
+def print_table(results):
+    print(f"\n{'Scenario':<22}{'DCL':>9}{'Load':>9}{'Network':>10}{'From SW':>9}{'KB':>9}")
+    print('-' * 68)
+    for mode, scenarios in results.items():
+        for name, metrics in scenarios.items():
+            label = f"{name} ({mode})"
+            if metrics is None:
+                print(f"{label:<22}{'failed to load':>46}")
+                continue
+            print(f"{label:<22}{metrics['domContentLoaded']:>7.0f}ms{metrics['load']:>7.0f}ms"
+                  f"{metrics['network']:>10}{metrics['fromWorker']:>9}"
+                  f"{metrics['transferred'] / 1024:>9.1f}")
+
+
+def test_service_worker_repeat_and_offline_visits(chrome_options, tmp_path):
+    """With the SW the repeat visit needs no local network and the page loads offline"""
+    manifest = built_tree(tmp_path)
+    print(f"\n📦 Precache manifest {manifest['version']}: {len(manifest['assets'])} assets")
+
+    results = {
+        'no SW': run_scenarios(chrome_options, tmp_path, use_service_worker=False),
+        'SW': run_scenarios(chrome_options, tmp_path, use_service_worker=True),
+    }
+    print_table(results)
+
+    with_sw, without_sw = results['SW'], results['no SW']
+    assert without_sw['offline'] is None, "Without the SW the page should not load offline"
+    assert with_sw['offline'] is not None, "index.html should load offline from the precache"
+    assert with_sw['repeat']['network'] == 0, (
+        f"{with_sw['repeat']['network']} same-origin requests bypassed the precache on a repeat visit"
+    )
+    assert with_sw['repeat']['load'] <= without_sw['repeat']['load'] * 1.2
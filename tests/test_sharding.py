@@ -0,0 +1,118 @@
+"""
+Tests for duration-balanced shard plans and shard result merging
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from config.durations import DurationStore
+from config.sharding import build_shard_plan, durations_digest, merge_shard_results, parse_shard
+
+
+def _store(tmp_path, durations):
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps(durations))
+    return DurationStore(path)
+
+
+def test_parse_shard():
+    assert parse_shard("2/4") == (2, 4)
+    for bad in ("0/4", "5/4", "1/0", "a/b", "3"):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+
+def test_plan_balances_by_duration(tmp_path):
+    store = _store(tmp_path, {"a": 40.0, "b": 30.0, "c": 20.0, "d": 10.0})
+    groups = {name: {"nodeids": [name], "resources": set()} for name in "abcd"}
+
+    shards = build_shard_plan(groups, 2, store)
+
+    assert [shard["scopes"] for shard in shards] == [["a", "d"], ["b", "c"]]
+    assert [shard["load"] for shard in shards] == [50.0, 50.0]
+
+
+def test_plan_charges_resources_once_per_shard(tmp_path):
+    store = _store(tmp_path, {"ui_1": 1.0, "ui_2": 1.0, "unit": 2.0})
+    groups = {
+        "ui_1": {"nodeids": ["ui_1"], "resources": {"browser"}},
+        "ui_2": {"nodeids": ["ui_2"], "resources": {"browser"}},
+        "unit": {"nodeids": ["unit"], "resources": set()},
+    }
+
+    shards = build_shard_plan(groups, 2, store)
+
+    # Both browser groups share one browser startup instead of paying twice
+    assert shards[0]["scopes"] == ["unit"]
+    assert shards[1]["scopes"] == ["ui_1", "ui_2"]
+
+
+def test_plan_is_deterministic(tmp_path):
+    store = _store(tmp_path, {})
+    groups = {f"g{i}": {"nodeids": [f"g{i}"], "resources": set()} for i in range(7)}
+    first = build_shard_plan(groups, 3, store)
+    second = build_shard_plan(dict(reversed(list(groups.items()))), 3, store)
+    assert [s["scopes"] for s in first] == [s["scopes"] for s in second]
+
+
+def test_merge_shard_results():
+    shard_1 = {
+        "timestamp": "2026-01-01T10:00:00",
+        "summary": {"total": 1, "passed": 1, "failed": 0, "skipped": 0, "duration": 2.0},
+        "tests": {"a": {"passed": True, "skipped": False, "message": "Success", "duration": 2.0}},
+    }
+    shard_2 = {
+        "timestamp": "2026-01-01T09:59:00",
+        "summary": {"total": 2, "passed": 0, "failed": 1, "skipped": 1, "duration": 1.5},
+        "tests": {
+            "b": {"passed": False, "skipped": False, "message": "Failed", "duration": 1.5},
+            "c": {"passed": False, "skipped": True, "message": "Skipped", "duration": 0},
+        },
+    }
+
+    merged = merge_shard_results([shard_1, shard_2])
+
+    assert merged["timestamp"] == "2026-01-01T09:59:00"
+    assert merged["summary"] == {
+        "total": 3, "passed": 1, "failed": 1, "skipped": 1, "duration": 3.5
+    }
+    assert set(merged["tests"]) == {"a", "b", "c"}
+
+
+def _shard_file(tmp_path, index, count, durations):
+    path = tmp_path / f"results.shard-{index}-of-{count}.json"
+    path.write_text(json.dumps({
+        "timestamp": "2026-01-01T10:00:00",
+        "shard": {"index": index, "count": count, "durations": durations},
+        "summary": {"total": 1, "passed": 1, "failed": 0, "skipped": 0, "duration": 1.0},
+        "tests": {f"t{index}": {"passed": True, "skipped": False, "message": "Success", "duration": 1.0}},
+    }))
+    return str(path)
+
+
+def test_durations_digest_identifies_the_history(tmp_path):
+    assert durations_digest(_store(tmp_path, {"a": 1.0, "b": 2.0})) == \
+        durations_digest(_store(tmp_path, {"b": 2.0, "a": 1.0}))
+    assert durations_digest(_store(tmp_path, {"a": 1.5})) != durations_digest(_store(tmp_path, {"a": 1.0}))
+
+
+def test_merge_script_refuses_missing_shards_and_mixed_plans(tmp_path):
+    script = Path(__file__).parent.parent / "scripts" / "merge-shard-results.py"
+    output = tmp_path / "results.json"
+
+    def merge(*shards):
+        return subprocess.run([sys.executable, str(script), *shards, "--output", str(output)],
+                              capture_output=True, text=True)
+
+    missing = merge(_shard_file(tmp_path, 1, 3, "abc"), _shard_file(tmp_path, 3, 3, "abc"))
+    assert missing.returncode == 1 and "Missing shards: 2" in missing.stdout
+    mixed = merge(_shard_file(tmp_path, 1, 2, "abc"), _shard_file(tmp_path, 2, 2, "def"))
+    assert mixed.returncode == 1 and "different duration history" in mixed.stdout
+    assert not output.exists()
+
+    complete = merge(_shard_file(tmp_path, 1, 2, "abc"), _shard_file(tmp_path, 2, 2, "abc"))
+    assert complete.returncode == 0
+    assert json.loads(output.read_text())["summary"]["total"] == 2
@@ -0,0 +1,133 @@
+"""
+Harness Startup Profiling
+Phase timing and the printed breakdown, the pytest plugin's collection
+and first-test entries, and environment discovery cached by binary
+fingerprint.
+"""
+import json
+import os
+import time
+from types import SimpleNamespace
+
+from config.discovery_cache import discover, fingerprint
+from config.startup_profile import StartupProfiler, StartupProfilePlugin
+
+
+class Finder:
+    """Discovery function that counts its runs"""
+
+    def __init__(self, value):
+        self.value = value
+        self.runs = 0
+
+    def __call__(self):
+        self.runs += 1
+        return self.value
+
+
+def test_phases_are_summed_in_order_of_first_occurrence():
+    profiler = StartupProfiler()
+    profiler.before = 0.25
+    with profiler.phase('binary discovery', 'chrome'):
+        time.sleep(0.01)
+    with profiler.phase('driver launch'):
+        time.sleep(0.02)
+    with profiler.phase('binary discovery', 'chromedriver'):
+        pass
+
+    rows = {name: (total, count, details) for name, total, count, details in profiler.breakdown()}
+    assert list(rows) == ['interpreter + imports', 'binary discovery', 'driver launch']
+    assert rows['binary discovery'][1:] == (2, ['chrome', 'chromedriver'])
+    assert rows['driver launch'][0] >= 0.02
+
+    rendered = profiler.render()
+    assert 'Harness startup breakdown' in rendered
+    assert '×2  (chrome, chromedriver)' in rendered
+
+
+def test_once_phases_and_milestones_keep_the_first_occurrence():
+    profiler = StartupProfiler()
+    profiler.before = None
+    for _ in range(3):
+        with profiler.phase('first navigation', once=True):
+            pass
+    profiler.milestone('first test')
+    first = profiler.milestones['first test']
+    profiler.milestone('first test')
+
+    assert [p.name for p in profiler.phases] == ['first navigation']
+    assert profiler.milestones['first test'] == first
+    assert '➜ first test after' in profiler.render()
+
+
+def test_phase_is_recorded_when_the_block_raises():
+    profiler = StartupProfiler()
+    try:
+        with profiler.phase('driver launch'):
+            raise RuntimeError('chrome not reachable')
+    except RuntimeError:
+        pass
+    assert [p.name for p in profiler.phases] == ['driver launch']
+
+
+def test_plugin_records_collection_and_writes_json(tmp_path, monkeypatch):
+    import config.startup_profile as startup_profile
+    profiler = StartupProfiler()
+    monkeypatch.setattr(startup_profile, 'profiler', profiler)
+    output = tmp_path / 'startup.json'
+    plugin = StartupProfilePlugin(str(output))
+    lines = []
+
+    plugin.pytest_sessionstart(None)
+    plugin.pytest_collection_finish(SimpleNamespace(items=[1, 2, 3]))
+    plugin.pytest_runtest_logstart('test_x', None)
+    plugin.pytest_terminal_summary(SimpleNamespace(write_line=lines.append))
+
+    assert any('session start + collection' in line and '3 tests' in line for line in lines)
+    assert profiler.printed
+    data = json.loads(output.read_text())
+    assert 'first test' in data['milestones']
+    assert [row['name'] for row in data['breakdown']][-1] == 'session start + collection'
+
+
+def test_discovery_is_cached_until_the_fingerprint_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv('PATH', str(tmp_path / 'bin'))
+    cache_file = tmp_path / 'discovery.json'
+    binary = tmp_path / 'chrome'
+    binary.write_text('v1')
+    find = Finder(str(binary))
+
+    assert discover('chrome_binary', [binary], find, cache_file) == (str(binary), False)
+    assert discover('chrome_binary', [binary], find, cache_file) == (str(binary), True)
+    assert find.runs == 1
+
+    # A Chrome upgrade changes the binary's size/mtime
+    before = fingerprint([binary])
+    binary.write_text('version 2')
+    os.utime(binary, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert fingerprint([binary]) != before
+    assert discover('chrome_binary', [binary], find, cache_file) == (str(binary), False)
+    assert find.runs == 2
+
+    assert discover('chrome_binary', [binary], find, cache_file, refresh=True)[1] is False
+    assert find.runs == 3
+
+
+def test_discovery_reruns_when_the_cached_path_is_gone(tmp_path, monkeypatch):
+    monkeypatch.setenv('PATH', '')
+    cache_file = tmp_path / 'discovery.json'
+    driver = tmp_path / 'drivers' / 'chromedriver'
+    driver.parent.mkdir()
+    driver.write_text('')
+    find = Finder(str(driver))
+
+    discover('chromedriver', [], find, cache_file)
+    driver.unlink()
+    assert discover('chromedriver', [], find, cache_file) == (str(driver), False)
+    assert find.runs == 2
+
+    # "Not found" is cached too, until the fingerprint changes
+    missing = Finder(None)
+    assert discover('absent', [], missing, cache_file) == (None, False)
+    assert discover('absent', [], missing, cache_file) == (None, True)
+    assert missing.runs == 1
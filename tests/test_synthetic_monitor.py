@@ -0,0 +1,34 @@
+"""
+Tests for the synthetic monitoring percentiles and Prometheus export
+"""
+from config.synthetic_monitor import SyntheticMonitor, percentile
+
+
+def test_percentile_interpolates():
+    values = [0.1, 0.2, 0.3, 0.4, 0.5]
+    assert percentile(values, 0.5) == 0.3
+    assert abs(percentile(values, 0.95) - 0.48) < 1e-9
+    assert percentile([0.7], 0.99) == 0.7
+
+
+def test_monitor_tracks_availability_and_writes_metrics(tmp_path):
+    results = iter([True, False, True, True])
+
+    def flaky():
+        if not next(results):
+            raise ConnectionError("down")
+        return True
+
+    metrics_file = tmp_path / "metrics.prom"
+    monitor = SyntheticMonitor({"app": flaky}, interval=0, window=2, metrics_file=metrics_file)
+    monitor.run(cycles=4)
+
+    stats = monitor.stats["app"]
+    assert (stats.successes, stats.failures) == (3, 1)
+    assert stats.availability == 1.0  # failure already left the 2-sample window
+
+    text = metrics_file.read_text()
+    assert 'monitora_probe_latency_seconds{endpoint="app",quantile="0.95"}' in text
+    assert 'monitora_probe_latency_seconds_count{endpoint="app"} 4' in text
+    assert 'monitora_probes_total{endpoint="app",result="failure"} 1' in text
+    assert 'monitora_probe_availability_ratio{endpoint="app"} 1.000000' in text
@@ -0,0 +1,76 @@
+"""
+Throttling Profile Matrix
+Page load, hotel list population, search and guest filtering timed under
+CPU/network emulation profiles (tests/config/throttling.py), with the API
+served by the local MockAPI so API calls are throttled as well.
+
+test_11_mobile_optimization and test_19_responsive_design_cross_device
+cover the mobile layout; this suite covers mobile speed.
+"""
+import json
+
+import pytest
+
+from config.throttling import FLOWS, NETWORK_PRESETS, PROFILES, network_conditions
+
+
+def test_network_conditions():
+    assert network_conditions(None) == {
+        'offline': False, 'latency': 0, 'downloadThroughput': -1, 'uploadThroughput': -1,
+    }
+    offline = network_conditions('fast-3g', offline=True)
+    assert offline['offline'] is True
+    assert offline['latency'] == NETWORK_PRESETS['fast-3g']['latency']
+    assert all(p['network'] in NETWORK_PRESETS for p in PROFILES.values() if p['network'])
+
+
+@pytest.fixture(scope="module")
+def matrix_servers():
+    """Repository root server plus the mock API on :3001"""
+    from config.mock_api import MockAPI
+    from config.render_benchmark import synthetic_search_response
+    from config.static_server import start_server
+
+    try:
+        api = MockAPI(search_response=synthetic_search_response(24, 20)).start()
+    except OSError:
+        pytest.skip("Port 3001 is taken (is the real API running?)")
+    httpd, base_url = start_server()
+    yield f"{base_url}/public/index.html?useLocalAPI=true"
+    httpd.shutdown()
+    httpd.server_close()
+    api.stop()
+
+
+@pytest.mark.selenium
+@pytest.mark.slow
+@pytest.mark.parametrize("profile_name", list(PROFILES))
+def test_core_flows_under_profile(profile_name, matrix_servers, chrome_options, record_property):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    from config.selenium_config import get_chromedriver_path
+    from config.throttling import run_flows
+
+    profile = PROFILES[profile_name]
+    driver = webdriver.Chrome(service=Service(executable_path=get_chromedriver_path()),
+                              options=chrome_options)
+    try:
+        timings = run_flows(driver, matrix_servers, profile)
+    finally:
+        driver.quit()
+
+    record_property("timings", json.dumps(timings))
+    cells = '  '.join(
+        f"{flow} {timings[flow]:.0f}ms" if timings.get(flow) is not None else f"{flow} -"
+        for flow in FLOWS
+    )
+    print(f"\n⏱️  {profile_name:<20} {cells}  ({timings['transferred'] / 1024:.0f} KB, "
+          f"search: {timings['search_outcome']})")
+
+    assert timings['hotel_list'] is not None, "Hotel list never populated"
+    if profile['offline_after_load']:
+        assert timings['search_outcome'] == 'error', "Offline search should show the error state"
+    else:
+        assert timings['search_outcome'] == 'results'
+        assert timings['guest_filter'] is not None, "Guest filter did not re-render the cards"
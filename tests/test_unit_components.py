@@ -33,29 +33,27 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from config.js_index import source_index, stale_paths
+
 class TestQuickSearchComponent(unittest.TestCase):
     """Unit tests for QuickSearch component functionality"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.quicksearch_js_path = PROJECT_ROOT / "src" / "components" / "QuickSearch" / "QuickSearch.js"
-        self.quicksearch_css_path = PROJECT_ROOT / "src" / "components" / "QuickSearch" / "QuickSearch.css"
+    QUICKSEARCH_JS = "src/components/QuickSearch/QuickSearch.js"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Look the component up once in the session source index"""
+        cls.module = source_index().module(cls.QUICKSEARCH_JS)
+        if cls.module is None:
+            # Reported once in the stale source paths summary
+            raise unittest.SkipTest(f"Stale source path: {cls.QUICKSEARCH_JS}")
         
     def test_quicksearch_js_file_exists(self):
-        """Test that QuickSearch.js file exists and is readable"""
-        self.assertTrue(self.quicksearch_js_path.exists(), "QuickSearch.js should exist")
-        self.assertTrue(self.quicksearch_js_path.is_file(), "QuickSearch.js should be a file")
-        
-        # Test file is readable
-        with open(self.quicksearch_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            self.assertGreater(len(content), 1000, "QuickSearch.js should have substantial content")
+        """Test that QuickSearch.js file exists and has substantial content"""
+        self.assertGreater(len(self.module.functions), 5, "QuickSearch.js should have substantial content")
     
     def test_quicksearch_contains_required_functions(self):
         """Test that QuickSearch.js contains all required functions"""
-        with open(self.quicksearch_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         required_functions = [
             'QuickSearch',
             'initializeQuickSearch', 
@@ -67,13 +65,10 @@ class TestQuickSearchComponent(unittest.TestCase):
         ]
         
         for func_name in required_functions:
-            self.assertIn(func_name, content, f"QuickSearch.js should contain {func_name} function")
+            self.assertTrue(self.module.defines(func_name), f"QuickSearch.js should contain {func_name} function")
     
     def test_quicksearch_html_structure(self):
         """Test QuickSearch HTML structure contains required elements"""
-        with open(self.quicksearch_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         required_elements = [
             'id="quick-union"',
             'id="quick-start-date"', 
@@ -85,13 +80,10 @@ class TestQuickSearchComponent(unittest.TestCase):
         ]
         
         for element in required_elements:
-            self.assertIn(element, content, f"QuickSearch should contain {element}")
+            self.assertTrue(self.module.contains_string(element), f"QuickSearch should contain {element}")
     
     def test_quicksearch_button_classes(self):
         """Test that all search buttons have proper CSS classes"""
-        with open(self.quicksearch_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         button_classes = [
             'class="quick-search-button primary"',      # Standard search
             'class="quick-search-button selenium-search"', # Selenium search  
@@ -99,7 +91,7 @@ class TestQuickSearchComponent(unittest.TestCase):
         ]
         
         for button_class in button_classes:
-            self.assertIn(button_class, content, f"Should contain button with {button_class}")
+            self.assertTrue(self.module.contains_string(button_class), f"Should contain button with {button_class}")
 
 class TestQuickSearchCSS(unittest.TestCase):
     """Unit tests for QuickSearch CSS styling and variables"""
@@ -207,6 +199,37 @@ class TestCSSVariablesConsistency(unittest.TestCase):
                 f"Color value {color_value} should be hex, rgb, or CSS variable format"
             )
 
+class TestJSModuleStructure(unittest.TestCase):
+    """Static structure of src/js and src/services from the source index"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.index = source_index()
+    
+    def test_modules_indexed(self):
+        """Test that the JS and service modules were found"""
+        self.assertIn('src/services/apiClient.js', self.index)
+        self.assertIn('src/js/hotelSearch.js', self.index)
+    
+    def test_relative_imports_resolve(self):
+        """Test that every named import is exported by the imported module"""
+        for path, module in list(self.index.modules.items()):
+            for specifier, names in module.imports.items():
+                if not specifier.startswith('.'):
+                    continue
+                with self.subTest(module=path, imports=specifier):
+                    target = self.index.module(module.resolve(specifier))
+                    self.assertIsNotNone(target, f"{path} imports missing {specifier}")
+                    unresolved = sorted(names - target.exports - {'*'})
+                    self.assertEqual(unresolved, [], f"{specifier} does not export {unresolved}")
+    
+    def test_api_client_exports(self):
+        """Test that the API client exposes its class and singleton"""
+        api_client = self.index['src/services/apiClient.js']
+        for name in ('BuscaVagasAPIClient', 'apiClient'):
+            self.assertIn(name, api_client.exports)
+        self.assertTrue(api_client.defines('searchVacancies'))
+
 class TestDateUtilities(unittest.TestCase):
     """Unit tests for date handling utilities"""
     
@@ -376,6 +399,7 @@ def run_unit_tests():
         TestQuickSearchComponent,
         TestQuickSearchCSS,
         TestCSSVariablesConsistency,
+        TestJSModuleStructure,
         TestDateUtilities,
         TestSearchStrategyLogic,
         TestErrorHandling,
@@ -407,6 +431,12 @@ def run_unit_tests():
         for test, error in result.errors:
             print(f"- {test}: {error.split(chr(10))[0]}")  # First line only
     
+    stale = stale_paths()
+    if stale:
+        print("\nStale source paths:")
+        for path, lookups in stale.items():
+            print(f"- {path} ({lookups} lookups)")
+    
     success = len(result.failures) == 0 and len(result.errors) == 0
     print(f"\nOverall Result: {'✓ PASSED' if success else '✗ FAILED'}")
     print("=" * 70)
@@ -22,6 +22,8 @@ import threading
 import socket
 from pathlib import Path
 
+from config.console_capture import ConsoleCapture
+
 class TradeUnionWebUITest(unittest.TestCase):
     """Test suite for Trade Union Hotel Search Platform web UI"""
     
@@ -102,6 +104,9 @@ class TradeUnionWebUITest(unittest.TestCase):
         
         # Configure implicit wait
         cls.driver.implicitly_wait(10)
+        
+        # Console messages and exceptions are pushed as they happen
+        cls.console = ConsoleCapture(cls.driver).start()
         print("WebDriver initialized successfully")
     
     @classmethod
@@ -116,6 +121,7 @@ class TradeUnionWebUITest(unittest.TestCase):
     def setUp(self):
         """Set up for each test"""
         self.wait = WebDriverWait(self.driver, 15)
+        self.console.clear()
         print(f"\n--- Starting Test: {self._testMethodName} ---")
     
     def tearDown(self):
@@ -124,10 +130,15 @@ class TradeUnionWebUITest(unittest.TestCase):
         # Take screenshot on failure
         if hasattr(self, '_outcome') and not self._outcome.success:
             self.take_screenshot(f"failure_{self._testMethodName}")
+            print("Browser console trail:")
+            for line in self.console.trail():
+                print(f"  {line}")
     
     @classmethod
     def tearDownClass(cls):
         """Clean up test environment"""
+        if hasattr(cls, 'console'):
+            cls.console.stop()
         if hasattr(cls, 'driver'):
             cls.driver.quit()
             print("WebDriver closed")
@@ -297,25 +308,22 @@ class TradeUnionWebUITest(unittest.TestCase):
     def test_07_javascript_errors(self):
         """Test for JavaScript errors in console"""
         self.driver.get(f"{self.base_url}/index.html")
-        time.sleep(5)  # Wait for JavaScript to execute
+        self.wait.until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete"
+        )
         
-        # Get browser logs
-        try:
-            logs = self.driver.get_log('browser')
-            error_logs = [log for log in logs if log['level'] == 'SEVERE']
-            
-            if error_logs:
-                print(f"! Found {len(error_logs)} JavaScript errors:")
-                for log in error_logs:
-                    print(f"  - {log['message']}")
-            else:
-                print("✓ No severe JavaScript errors found")
-            
-            # Don't fail the test for JavaScript errors, just report them
-            # self.assertEqual(len(error_logs), 0, f"JavaScript errors found: {error_logs}")
-            
-        except Exception as e:
-            print(f"! Could not retrieve browser logs: {e}")
+        # Errors were pushed as they happened; errors() flushes the rest
+        error_logs = self.console.errors()
+        
+        if error_logs:
+            print(f"! Found {len(error_logs)} JavaScript errors:")
+            for error in error_logs:
+                print(f"  - {error}")
+        else:
+            print("✓ No severe JavaScript errors found")
+        
+        # Don't fail the test for JavaScript errors, just report them
+        # self.console.assert_no_errors()
     
     def test_08_page_performance(self):
         """Test basic page performance metrics"""
@@ -680,8 +688,9 @@ class TradeUnionWebUITest(unittest.TestCase):
             time.sleep(3)
             
             # Check for JavaScript errors specific to SearchFormHandler
-            logs = self.driver.get_log('browser')
-            error_logs = [log for log in logs if log['level'] == 'SEVERE' and 'Date method selection elements not found' in log['message']]
+            after_load = self.console.mark()
+            error_logs = [error for error in self.console.errors()
+                          if 'Date method selection elements not found' in error.text]
             
             self.assertEqual(len(error_logs), 0, f"SearchFormHandler should not throw 'Date method selection elements not found' error: {error_logs}")
             print("✓ No SearchFormHandler errors on QuickSearch page")
@@ -709,9 +718,8 @@ class TradeUnionWebUITest(unittest.TestCase):
             time.sleep(1)
             
             # Check for additional JavaScript errors after modal open
-            logs_after_modal = self.driver.get_log('browser')
-            new_error_logs = [log for log in logs_after_modal if log['level'] == 'SEVERE' and log not in logs]
-            searchform_errors = [log for log in new_error_logs if 'Date method selection elements not found' in log['message']]
+            searchform_errors = [error for error in self.console.errors(since=after_load)
+                                 if 'Date method selection elements not found' in error.text]
             
             self.assertEqual(len(searchform_errors), 0, f"SearchFormHandler should not error when advanced modal opens: {searchform_errors}")
             print("✓ No SearchFormHandler errors when advanced modal opened")
@@ -1010,12 +1018,11 @@ class TradeUnionWebUITest(unittest.TestCase):
                 self.take_screenshot("hotel_vacancy_search_issue")
                 
                 # Check if there were any JavaScript errors
-                logs = self.driver.get_log('browser')
-                js_errors = [log for log in logs if log['level'] == 'SEVERE']
+                js_errors = self.console.errors()
                 if js_errors:
                     print("JavaScript errors detected:")
                     for error in js_errors[-3:]:  # Show last 3 errors
-                        print(f"  - {error['message']}")
+                        print(f"  - {error}")
                 
                 # This is not necessarily a test failure - CORS restrictions are expected
                 print("Note: Hotel vacancy search may fail due to CORS restrictions (expected behavior)")
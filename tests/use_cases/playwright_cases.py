@@ -0,0 +1,324 @@
+"""
+UC-001..UC-005 on Playwright
+Async ports of the use-case checks for run_use_case_tests_playwright.py.
+Each case gets a fresh page in its own browser context and locates
+elements through config/index_page.py's LOCATORS, so the IDs stay in step
+with the page object the Selenium suites use.
+"""
+import asyncio
+import time
+from datetime import date, timedelta
+
+from config.api_factory import HOTEL_NAMES
+from config.page_helpers import search_dates
+from config.index_page import HOTEL_CARDS, LOCATORS, SEARCH_FINISHED
+from config.playwright_runner import CASES, use_case
+
+try:
+    from playwright.async_api import expect
+except ImportError:
+    expect = None
+
+PAGE_TITLE = "Busca de Vagas em Hotéis Sindicais - AFPESP"
+EXPECTED_HOTELS = ["Todas"] + HOTEL_NAMES[:24]
+SEARCH_TIMEOUT = 60_000
+
+
+def locator(page, name):
+    return page.locator(LOCATORS[name])
+
+
+async def fill_search(page, hotel='-1', checkin=None, checkout=None):
+    """Set hotel and dates in one evaluate (typing into date inputs is locale-dependent)"""
+    if checkin is None or checkout is None:
+        checkin, checkout = search_dates()
+    await page.evaluate("""([fields, values]) => fields.forEach((selector, i) => {
+        const el = document.querySelector(selector);
+        el.value = values[i];
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    })""", [[LOCATORS['hotel_select'], LOCATORS['checkin'], LOCATORS['checkout']],
+            [hotel, checkin, checkout]])
+
+
+async def run_search(page, **fields):
+    """Fill and submit the form, then wait until the search settles"""
+    await fill_search(page, **fields)
+    await locator(page, 'search_button').click()
+    await page.wait_for_function(SEARCH_FINISHED, timeout=SEARCH_TIMEOUT)
+
+
+def plus_days(iso, days):
+    return (date.fromisoformat(iso) + timedelta(days=days)).isoformat()
+
+
+async def guest_count(page):
+    """The guest <input>'s value (it has no text content)"""
+    return int(await locator(page, 'guest_quantity').input_value() or 0)
+
+
+# ============================================================================
+# UC-001: First-Time User Hotel Search
+# ============================================================================
+
+@use_case('UC-001', 'TC-001-01', 'Page loads successfully')
+async def page_loads(page, env):
+    await env.open(page, wait_for_hotels=False)
+    await expect(locator(page, 'search_form')).to_be_visible()
+
+
+@use_case('UC-001', 'TC-001-02', 'Page title is correct')
+async def page_title(page, env):
+    await env.open(page, wait_for_hotels=False)
+    await expect(page).to_have_title(PAGE_TITLE)
+
+
+@use_case('UC-001', 'TC-001-03', 'Hotel select shows a loading state')
+async def hotel_loading_state(page, env):
+    release = asyncio.Event()
+
+    async def hold(route):
+        await release.wait()
+        await route.continue_()
+
+    await page.route('**/vagas/hoteis*', hold)
+    try:
+        await env.open(page, wait_for_hotels=False)
+        await expect(page.locator(f"{LOCATORS['hotel_select']} option").first).to_have_text('Loading...')
+    finally:
+        release.set()
+    await expect(page.locator(f"{LOCATORS['hotel_select']} option").nth(1)).to_be_attached()
+
+
+@use_case('UC-001', 'TC-001-04', 'Hotel list is populated')
+async def hotel_list_populated(page, env):
+    await env.open(page)
+    values = await page.eval_on_selector_all(
+        f"{LOCATORS['hotel_select']} option", "options => options.map(o => o.value).filter(Boolean)")
+    assert len(values) >= 25, f"expected at least 25 hotels, found {len(values)}"
+    return f"{len(values)} hotels"
+
+
+@use_case('UC-001', 'TC-001-05', 'A hotel can be selected')
+async def hotel_selectable(page, env):
+    await env.open(page)
+    await locator(page, 'hotel_select').select_option(label='Amparo')
+    await expect(locator(page, 'hotel_select')).not_to_have_value('-1')
+
+
+@use_case('UC-001', 'TC-001-06', 'Check-in date can be set')
+async def checkin_settable(page, env):
+    await env.open(page)
+    checkin, _ = search_dates()
+    await locator(page, 'checkin').fill(checkin)
+    await expect(locator(page, 'checkin')).to_have_value(checkin)
+
+
+@use_case('UC-001', 'TC-001-07', 'Check-out date can be set')
+async def checkout_settable(page, env):
+    await env.open(page)
+    _, checkout = search_dates()
+    await locator(page, 'checkout').fill(checkout)
+    await expect(locator(page, 'checkout')).to_have_value(checkout)
+
+
+@use_case('UC-001', 'TC-001-08', 'Guest count defaults to 2')
+async def guest_default(page, env):
+    await env.open(page)
+    assert await guest_count(page) == 2
+
+
+@use_case('UC-001', 'TC-001-09', 'Search button is enabled')
+async def search_enabled(page, env):
+    await env.open(page)
+    await expect(locator(page, 'search_button')).to_be_enabled()
+
+
+@use_case('UC-001', 'TC-001-10', 'Search displays results')
+async def search_displays_results(page, env):
+    await env.open(page)
+    await run_search(page)
+    await expect(locator(page, 'results_container')).to_be_visible()
+    return f"{await page.locator(HOTEL_CARDS).count()} hotel cards"
+
+
+# ============================================================================
+# UC-002: Advanced Search with Filters
+# ============================================================================
+
+@use_case('UC-002', 'TC-002-01', 'Guest filter is disabled before a search')
+async def guest_filter_disabled(page, env):
+    await env.open(page)
+    await expect(locator(page, 'guest_plus')).to_be_disabled()
+    await expect(locator(page, 'guest_minus')).to_be_disabled()
+
+
+@use_case('UC-002', 'TC-002-03', 'Minus button decreases guests')
+async def guest_minus(page, env):
+    await env.open(page)
+    await run_search(page)
+    before = await guest_count(page)
+    await locator(page, 'guest_minus').click()
+    assert await guest_count(page) == before - 1
+
+
+@use_case('UC-002', 'TC-002-04', 'Plus button increases guests up to 10')
+async def guest_plus(page, env):
+    await env.open(page)
+    await run_search(page)
+    for _ in range(12):
+        await locator(page, 'guest_plus').click()
+    assert await guest_count(page) <= 10
+
+
+@use_case('UC-002', 'TC-002-06', 'Booking rules toggle')
+async def booking_rules_toggle(page, env):
+    await env.open(page)
+    toggle = locator(page, 'booking_rules_toggle')
+    await expect(toggle).to_be_checked()
+    # The toggle lives in the collapsed advanced-options panel
+    await toggle.set_checked(False, force=True)
+    await expect(toggle).not_to_be_checked()
+
+
+# ============================================================================
+# UC-003: Date Range Validation
+# ============================================================================
+
+@use_case('UC-003', 'TC-003-01', 'Valid check-in date is accepted')
+async def valid_checkin(page, env):
+    await env.open(page)
+    today = date.today().isoformat()
+    await locator(page, 'checkin').fill(today)
+    await expect(locator(page, 'checkin')).to_have_value(today)
+
+
+@use_case('UC-003', 'TC-003-04', 'One-night stay is accepted')
+async def one_night(page, env):
+    await env.open(page)
+    checkin, _ = search_dates()
+    await fill_search(page, checkin=checkin, checkout=plus_days(checkin, 1))
+    await expect(locator(page, 'search_button')).to_be_enabled()
+
+
+@use_case('UC-003', 'TC-003-05', 'Thirty-night stay is accepted')
+async def thirty_nights(page, env):
+    await env.open(page)
+    checkin, _ = search_dates()
+    await fill_search(page, checkin=checkin, checkout=plus_days(checkin, 30))
+    await expect(locator(page, 'search_button')).to_be_enabled()
+
+
+@use_case('UC-003', 'TC-003-08', 'Search is enabled with valid dates')
+async def valid_dates(page, env):
+    await env.open(page)
+    await fill_search(page)
+    await expect(locator(page, 'search_button')).to_be_enabled()
+
+
+# ============================================================================
+# UC-004: Search Lifecycle Management
+# ============================================================================
+
+@use_case('UC-004', 'TC-004-01', 'Initial state: form enabled, reset hidden')
+async def initial_state(page, env):
+    await env.open(page)
+    for name in ('hotel_select', 'checkin', 'checkout', 'search_button'):
+        await expect(locator(page, name)).to_be_enabled()
+    await expect(locator(page, 'reset_button')).to_be_hidden()
+
+
+@use_case('UC-004', 'TC-004-07', 'Reset button appears after a search')
+async def reset_after_search(page, env):
+    await env.open(page)
+    await run_search(page)
+    await expect(locator(page, 'reset_button')).to_be_visible()
+    await expect(locator(page, 'reset_button')).to_have_attribute('aria-label', 'Iniciar nova busca')
+
+
+# ============================================================================
+# UC-005: Hotel List Browser Verification
+# ============================================================================
+
+def _options(page):
+    return page.locator(f"{LOCATORS['hotel_select']} option")
+
+
+@use_case('UC-005', 'TC-005-01', 'Page loads successfully')
+async def hotel_page_loads(page, env):
+    await env.open(page, wait_for_hotels=False)
+    await expect(locator(page, 'hotel_select')).to_be_visible()
+
+
+@use_case('UC-005', 'TC-005-02', 'Hotel select dropdown exists')
+async def hotel_select_exists(page, env):
+    await env.open(page)
+    await expect(locator(page, 'hotel_select')).to_be_visible()
+    await expect(locator(page, 'hotel_select')).to_be_enabled()
+
+
+@use_case('UC-005', 'TC-005-03', 'Hotel count is 25')
+async def hotel_count(page, env):
+    await env.open(page)
+    await expect(_options(page)).to_have_count(len(EXPECTED_HOTELS))
+
+
+@use_case('UC-005', 'TC-005-04', 'All expected hotels present')
+async def hotel_names(page, env):
+    await env.open(page)
+    names = [name.strip() for name in await _options(page).all_text_contents()]
+    missing = [name for name in EXPECTED_HOTELS if name not in names]
+    assert not missing, f"missing hotels: {missing}"
+
+
+@use_case('UC-005', 'TC-005-05', 'No duplicate hotels')
+async def no_duplicates(page, env):
+    await env.open(page)
+    names = [name.strip() for name in await _options(page).all_text_contents()]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    assert not duplicates, f"duplicate hotels: {duplicates}"
+    await expect(_options(page).first).to_have_attribute('value', '-1')
+
+
+@use_case('UC-005', 'TC-005-06', 'Hotel options have values')
+async def option_values(page, env):
+    await env.open(page)
+    values = await page.eval_on_selector_all(
+        f"{LOCATORS['hotel_select']} option", "options => options.map(o => o.value)")
+    assert all(values), "options without a value"
+    assert len(set(values)) == len(values), "duplicate option values"
+
+
+@use_case('UC-005', 'TC-005-07', 'A specific hotel can be selected')
+async def select_guaruja(page, env):
+    await env.open(page)
+    await locator(page, 'hotel_select').select_option(label='Guarujá')
+    selected = await locator(page, 'hotel_select').evaluate("el => el.selectedOptions[0].text")
+    assert selected.strip() == 'Guarujá'
+
+
+@use_case('UC-005', 'TC-005-08', 'Hotel list loads within 5 seconds')
+async def hotel_list_load_time(page, env):
+    started = time.perf_counter()
+    await env.open(page, timeout=5)
+    elapsed = time.perf_counter() - started
+    assert elapsed < 5, f"hotel list took {elapsed:.2f}s"
+    return f"Loaded in {elapsed:.2f}s"
+
+
+@use_case('UC-005', 'TC-005-09', 'Hotel list comes from the hotels API')
+async def hotels_api_response(page, env):
+    async with page.expect_response(lambda response: '/vagas/hoteis' in response.url) as info:
+        await env.open(page, wait_for_hotels=False)
+    response = await info.value
+    assert response.ok, f"hotels API answered {response.status}"
+
+
+@use_case('UC-005', 'TC-005-10', 'Display complete hotel list')
+async def complete_hotel_list(page, env):
+    await env.open(page)
+    names = [name.strip() for name in await _options(page).all_text_contents()]
+    assert names == EXPECTED_HOTELS, f"hotel list differs: {names}"
+    return f"Displayed {len(names)} hotels"
+
+
+__all__ = ['CASES', 'EXPECTED_HOTELS']
@@ -11,6 +11,10 @@ import sys
 import subprocess
 import argparse
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from config.event_log import EventLog
 
 try:
     from colorama import Fore, Style, init
@@ -140,6 +144,8 @@ def main():
             return 1
     
     # Start testing
+    events = EventLog('run_use_case_tests')
+    events.run_start(env=args.env, uc=args.uc)
     start_time = datetime.now()
     print_header("USE CASE TEST EXECUTION")
     print(f"Start Time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -161,8 +167,11 @@ def main():
         for suite in test_suites:
             test_file = os.path.join(script_dir, suite['file'])
             
+            suite_key = f"{env_config['name']}-{suite['id']}"
+            
             if not os.path.exists(test_file):
                 print(f"{Fore.YELLOW}⚠️  Skipping {suite['id']}: File not found{Style.RESET_ALL}\n")
+                events.suite_end(suite_key, 'skipped', duration=0, message='File not found')
                 continue
             
             print(f"\n{Fore.CYAN}{Style.BRIGHT}{suite['id']}: {suite['name']}{Style.RESET_ALL}")
@@ -170,9 +179,10 @@ def main():
             print(f"File: {suite['file']}\n")
             
             results['total'] += 1
-            passed = run_test_suite(test_file, env_config['vars'])
+            events.suite_start(suite_key, file=suite['file'], priority=suite['priority'])
+            passed = run_test_suite(test_file, events.child_env(env_config['vars']))
+            events.suite_end(suite_key, 'passed' if passed else 'failed')
             
-            suite_key = f"{env_config['name']}-{suite['id']}"
             results['by_suite'][suite_key] = 'PASSED' if passed else 'FAILED'
             
             if passed:
@@ -202,6 +212,12 @@ def main():
     
     # Exit code
     exit_code = 0 if results['failed'] == 0 else 1
+    events.run_end(
+        'passed' if exit_code == 0 else 'failed',
+        total=results['total'],
+        passed=results['passed'],
+        failed=results['failed']
+    )
     
     if exit_code == 0:
         print(f"\n{Fore.GREEN}{Style.BRIGHT}✅ ALL TESTS PASSED{Style.RESET_ALL}")
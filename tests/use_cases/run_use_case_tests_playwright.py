@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Concurrent Use Case Test Runner (Playwright)
+Executes the UC-001 through UC-005 checks of playwright_cases.py in one
+Chromium, each test in its own browser context, several at a time.
+
+Results are written in the results.json format of run_use_case_tests.py
+/ collect-use-case-results.py, so both runners can be compared directly.
+
+Usage:
+    python3 tests/use_cases/run_use_case_tests_playwright.py --serve
+    python3 tests/use_cases/run_use_case_tests_playwright.py --env production --concurrency 4
+    python3 tests/use_cases/run_use_case_tests_playwright.py --uc UC-005 --uc UC-001
+"""
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+from contextlib import ExitStack
+from datetime import datetime
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR.parent))
+from config.event_log import EventLog  # noqa: E402
+from config.playwright_runner import (  # noqa: E402
+    DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT, CaseEnv, results_document, run_cases, select_cases,
+)
+
+try:
+    from colorama import Fore, Style, init
+    init(autoreset=True)
+except ImportError:
+    class Fore:
+        GREEN = RED = YELLOW = CYAN = BLUE = MAGENTA = ''
+    class Style:
+        BRIGHT = RESET_ALL = ''
+
+ENVIRONMENTS = {
+    'local': 'http://localhost:8080/public/index.html',
+    'production': 'https://www.mpbarbosa.com/public/index.html',
+}
+DEFAULT_OUTPUT = SCRIPT_DIR / 'results.playwright.json'
+
+
+def print_header(message):
+    """Print formatted header"""
+    print(f"\n{Fore.CYAN}{Style.BRIGHT}{'='*80}")
+    print(f"{Fore.CYAN}{Style.BRIGHT}{message:^80}")
+    print(f"{Fore.CYAN}{Style.BRIGHT}{'='*80}{Style.RESET_ALL}\n")
+
+
+def print_result(case, outcome):
+    """One line per finished test, in completion order"""
+    if outcome['skipped']:
+        color, symbol = Fore.YELLOW, '⏭️ '
+    elif outcome['passed']:
+        color, symbol = Fore.GREEN, '✅'
+    else:
+        color, symbol = Fore.RED, '❌'
+    print(f"  {color}{symbol} {case.key:60s} {outcome['duration']:6.2f}s  {outcome['message']}{Style.RESET_ALL}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run use case tests concurrently on Playwright')
+    parser.add_argument('--env', choices=sorted(ENVIRONMENTS), default='local',
+                        help='Test environment (default: local)')
+    parser.add_argument('--url', help='Page URL (overrides --env)')
+    parser.add_argument('--serve', action='store_true',
+                        help='Serve the working tree and the mock API locally (?useLocalAPI=true)')
+    parser.add_argument('--uc', action='append', help='Run a specific use case (repeatable, e.g. UC-001)')
+    parser.add_argument('--tc', action='append', help='Run a specific test (repeatable, e.g. TC-005-03)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Browser contexts running at once (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f'Per-test timeout in seconds (default: {DEFAULT_TIMEOUT})')
+    parser.add_argument('--headed', action='store_true', help='Show the browser')
+    parser.add_argument('--output', default=str(DEFAULT_OUTPUT),
+                        help=f'Results file (default: {DEFAULT_OUTPUT.name})')
+    args = parser.parse_args()
+
+    try:
+        import playwright_cases
+    except ImportError as e:
+        print(f"{Fore.RED}❌ {e}{Style.RESET_ALL}")
+        return 1
+    if playwright_cases.expect is None:
+        print(f"{Fore.RED}❌ Playwright not installed. Run: pip install playwright && "
+              f"python -m playwright install chromium{Style.RESET_ALL}")
+        return 1
+
+    cases = select_cases(playwright_cases.CASES, args.uc, args.tc)
+    if not cases:
+        print(f"{Fore.RED}❌ No use case tests match {args.uc or ''} {args.tc or ''}{Style.RESET_ALL}")
+        return 1
+
+    with ExitStack() as stack:
+        if args.serve:
+            from config.mock_api import MockAPI
+            from config.static_server import serve_directory
+            base_url = stack.enter_context(serve_directory())
+            api = stack.enter_context(MockAPI())
+            env = CaseEnv(f"{base_url}/public/index.html", '?useLocalAPI=true', api.base_url)
+        else:
+            env = CaseEnv(args.url or ENVIRONMENTS[args.env])
+
+        events = EventLog('run_use_case_tests_playwright')
+        events.run_start(env='serve' if args.serve else args.env, uc=args.uc, concurrency=args.concurrency)
+        start_time = datetime.now()
+        print_header("USE CASE TEST EXECUTION (PLAYWRIGHT)")
+        print(f"Start Time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"URL: {env.page_url}")
+        print(f"Tests: {len(cases)} in {len({case.suite for case in cases})} suites, "
+              f"{args.concurrency} at a time\n")
+
+        started = time.perf_counter()
+        outcomes = asyncio.run(run_cases(cases, env, concurrency=args.concurrency, timeout=args.timeout,
+                                         headless=not args.headed, events=events,
+                                         on_result=print_result))
+        wall_time = time.perf_counter() - started
+
+    document = results_document(outcomes, start_time, wall_time)
+    summary = document['summary']
+    Path(args.output).write_text(json.dumps(document, indent=2, ensure_ascii=False) + '\n')
+
+    print_header("TEST EXECUTION SUMMARY")
+    print(f"Wall Time: {summary['wall_time']:.2f}s (summed test time {summary['duration']:.2f}s)")
+    print(f"\n{Fore.CYAN}Results:{Style.RESET_ALL}")
+    print(f"  Total Tests: {summary['total']}")
+    print(f"  {Fore.GREEN}Passed: {summary['passed']}{Style.RESET_ALL}")
+    print(f"  {Fore.RED}Failed: {summary['failed']}{Style.RESET_ALL}")
+    print(f"  {Fore.YELLOW}Skipped: {summary['skipped']}{Style.RESET_ALL}")
+    print(f"\n💾 Results saved to {args.output}")
+
+    exit_code = 0 if summary['failed'] == 0 else 1
+    events.run_end('passed' if exit_code == 0 else 'failed', total=summary['total'],
+                   passed=summary['passed'], failed=summary['failed'], skipped=summary['skipped'])
+
+    if exit_code == 0:
+        print(f"\n{Fore.GREEN}{Style.BRIGHT}✅ ALL TESTS PASSED{Style.RESET_ALL}")
+    else:
+        print(f"\n{Fore.RED}{Style.BRIGHT}❌ SOME TESTS FAILED{Style.RESET_ALL}")
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
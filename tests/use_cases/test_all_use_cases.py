@@ -19,6 +19,8 @@ This integrated test suite covers:
 import unittest
 import time
 import os
+import sys
+from pathlib import Path
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -28,6 +30,11 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.keys import Keys
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from config.discovery_cache import discover  # noqa: E402
+from config.selenium_config import get_chrome_binary_path  # noqa: E402
+from config.startup_profile import phase  # noqa: E402
+
 try:
     from colorama import Fore, Style, init
     init(autoreset=True)
@@ -55,12 +62,22 @@ class ComprehensiveUseCaseTests(unittest.TestCase):
         chrome_options.add_argument('--disable-gpu')
         
         try:
-            # Try with webdriver_manager
-            service = Service(ChromeDriverManager().install())
-            cls.driver = webdriver.Chrome(service=service, options=chrome_options)
+            # Try with webdriver_manager; its driver matches the installed
+            # Chrome, so the download check is skipped until Chrome changes
+            chrome_binary = get_chrome_binary_path()
+            with phase('binary discovery', 'webdriver_manager'):
+                driver_path, _ = discover(
+                    'webdriver_manager_chromedriver',
+                    [chrome_binary] if chrome_binary else [],
+                    lambda: ChromeDriverManager().install(),
+                )
+            service = Service(driver_path)
+            with phase('driver launch'):
+                cls.driver = webdriver.Chrome(service=service, options=chrome_options)
         except:
             # Fallback to system ChromeDriver
-            cls.driver = webdriver.Chrome(options=chrome_options)
+            with phase('driver launch', 'system chromedriver'):
+                cls.driver = webdriver.Chrome(options=chrome_options)
         cls.driver.implicitly_wait(10)
         cls.wait = WebDriverWait(cls.driver, 30)
         
@@ -80,7 +97,8 @@ class ComprehensiveUseCaseTests(unittest.TestCase):
     
     def setUp(self):
         """Reset for each test"""
-        self.driver.get(self.base_url)
+        with phase('first navigation', once=True):
+            self.driver.get(self.base_url)
         time.sleep(2)
     
     # ===========================================
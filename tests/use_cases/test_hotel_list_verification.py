@@ -9,12 +9,21 @@ This test checks:
 3. Hotel data structure is correct
 4. No duplicate hotels
 5. All required fields are present
+
+The list is read through the hotel list cache (config/hotel_cache.py) but
+always revalidated against /vagas/hoteis (max_age=0, usually a body-less
+304), so Test 1 really reaches the API; --scrape forces the expensive
+/vagas/hoteis/scrape endpoint.
 """
 
 import sys
-import urllib.request
-import json
+import argparse
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.hotel_cache import HotelListCache  # noqa: E402
 
 try:
     from colorama import Fore, Style, init
@@ -32,7 +41,7 @@ def print_header(message):
     print(f"{Fore.CYAN}{Style.BRIGHT}{'='*80}{Style.RESET_ALL}\n")
 
 
-def verify_hotel_api():
+def verify_hotel_api(scrape=False):
     """Verify hotel API returns all expected hotels"""
     
     print_header("HOTEL LIST VERIFICATION TEST")
@@ -59,20 +68,23 @@ def verify_hotel_api():
         print(f"{Fore.YELLOW}Test 1: Checking API accessibility...{Style.RESET_ALL}")
         results['total_tests'] += 1
         
-        api_url = "https://www.mpbarbosa.com/api/vagas/hoteis/scrape"
-        req = urllib.request.Request(api_url, headers={'User-Agent': 'Mozilla/5.0'})
-        response = urllib.request.urlopen(req, timeout=10)
+        cache = HotelListCache()
+        # A fresh cache hit would pass without contacting the API
+        hotel_list = cache.get(max_age=0, scrape=scrape)
+        status = f"HTTP {cache.requests[-1][1]}" if cache.requests else "no request"
+        if hotel_list.source == 'stale':
+            # The API errored or was unreachable; only an expired cached list is left
+            raise RuntimeError(f"API not accessible ({status if cache.requests else 'no response'}); only a stale cached hotel list is available")
         
-        print(f"{Fore.GREEN}✅ API accessible (HTTP {response.getcode()}){Style.RESET_ALL}")
+        print(f"{Fore.GREEN}✅ API accessible ({hotel_list.source}, {status}){Style.RESET_ALL}")
         results['passed'] += 1
-        results['details'].append(('API Accessibility', 'PASS', f"HTTP {response.getcode()}"))
+        results['details'].append(('API Accessibility', 'PASS', f"{hotel_list.source}, {status}"))
         
         # Test 2: Valid JSON Response
         print(f"\n{Fore.YELLOW}Test 2: Checking JSON response...{Style.RESET_ALL}")
         results['total_tests'] += 1
         
-        content = response.read().decode('utf-8')
-        data = json.loads(content)
+        data = hotel_list.body
         
         print(f"{Fore.GREEN}✅ Valid JSON response{Style.RESET_ALL}")
         results['passed'] += 1
@@ -95,8 +107,8 @@ def verify_hotel_api():
         print(f"\n{Fore.YELLOW}Test 4: Checking hotel count...{Style.RESET_ALL}")
         results['total_tests'] += 1
         
-        reported_count = data.get('count', 0)
-        hotels = data.get('data', [])
+        reported_count = hotel_list.count
+        hotels = hotel_list.hotels
         actual_count = len(hotels)
         
         print(f"   Reported count: {reported_count}")
@@ -230,4 +242,8 @@ def verify_hotel_api():
 
 
 if __name__ == '__main__':
-    sys.exit(verify_hotel_api())
+    parser = argparse.ArgumentParser(description='Hotel list verification')
+    parser.add_argument('--scrape', action='store_true',
+                        help='Fetch /vagas/hoteis/scrape instead of revalidating /vagas/hoteis')
+    args = parser.parse_args()
+    sys.exit(verify_hotel_api(scrape=args.scrape))
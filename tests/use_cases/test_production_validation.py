@@ -5,10 +5,15 @@ Tests production site availability and key functionality using HTTP requests.
 """
 
 import sys
+import argparse
 import urllib.request
 import urllib.error
-import json
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.hotel_cache import HotelListCache  # noqa: E402
 
 try:
     from colorama import Fore, Style, init
@@ -26,25 +31,40 @@ def print_header(message):
     print(f"{Fore.CYAN}{Style.BRIGHT}{'='*80}{Style.RESET_ALL}\n")
 
 
+PRODUCTION_URL = "https://www.mpbarbosa.com/submodules/monitora_vagas/public"
+API_BASE_URL = "https://www.mpbarbosa.com/api"
+REQUEST_TIMEOUT = 10
+
+# The hotel list changes rarely: kept in the file cache and revalidated
+# against /vagas/hoteis (a conditional GET) instead of scraping on every run
+hotel_cache = HotelListCache(API_BASE_URL, timeout=REQUEST_TIMEOUT)
+
+
+def fetch(url, timeout=REQUEST_TIMEOUT):
+    """GET a URL, returning (status, body); raises on HTTP and network errors"""
+    req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+    response = urllib.request.urlopen(req, timeout=timeout)
+    return response.getcode(), response.read().decode('utf-8')
+
+
 def test_api_hotels_count(url, description=""):
     """Test if API returns correct number of hotels"""
     try:
-        # Check the API endpoint
-        api_url = "https://www.mpbarbosa.com/api/vagas/hoteis/scrape"
-        req = urllib.request.Request(api_url, headers={'User-Agent': 'Mozilla/5.0'})
-        response = urllib.request.urlopen(req, timeout=10)
-        content = response.read().decode('utf-8')
-        
-        import json
-        data = json.loads(content)
+        # Always revalidate (usually a body-less 304, see config/hotel_cache.py),
+        # so a down API is not hidden by the 24h file cache
+        hotel_list = hotel_cache.get(max_age=0)
+        if hotel_list.source == 'stale':
+            print(f"{Fore.RED}❌ {description}: Hotel API unreachable (only a stale cached list){Style.RESET_ALL}")
+            return False
         
-        if data.get('success') and data.get('count'):
-            hotel_count = data.get('count')
-            hotels = data.get('data', [])
+        if hotel_list.body.get('success') and hotel_list.count:
+            hotel_count = hotel_list.count
+            hotels = hotel_list.hotels
             actual_count = len(hotels)
             
             if actual_count == hotel_count and actual_count >= 25:
-                print(f"{Fore.GREEN}✅ {description}: {actual_count} hotels returned (expected: {hotel_count}){Style.RESET_ALL}")
+                print(f"{Fore.GREEN}✅ {description}: {actual_count} hotels returned (expected: {hotel_count}, "
+                      f"{hotel_list.source}){Style.RESET_ALL}")
                 
                 # Print first few hotel names for verification
                 hotel_names = [h.get('name') for h in hotels[:5]]
@@ -66,9 +86,7 @@ def test_api_hotels_count(url, description=""):
 def test_url(url, expected_status=200, description=""):
     """Test URL availability"""
     try:
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        response = urllib.request.urlopen(req, timeout=10)
-        status = response.getcode()
+        status, _ = fetch(url)
         
         if status == expected_status:
             print(f"{Fore.GREEN}✅ {description or url}: HTTP {status}{Style.RESET_ALL}")
@@ -87,9 +105,7 @@ def test_url(url, expected_status=200, description=""):
 def test_content(url, expected_strings, description=""):
     """Test if URL contains expected content"""
     try:
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        response = urllib.request.urlopen(req, timeout=10)
-        content = response.read().decode('utf-8')
+        _, content = fetch(url)
         
         all_found = True
         for expected in expected_strings:
@@ -106,11 +122,96 @@ def test_content(url, expected_strings, description=""):
         return False
 
 
+# ============================================================================
+# Monitoring Mode
+# ============================================================================
+
+APP_EXPECTED_CONTENT = [
+    "Busca de Vagas em Hotéis Sindicais - AFPESP",
+    'id="hotel-select"', 'id="input-checkin"', 'id="input-checkout"',
+    'id="search-button"', 'id="guest-filter-card"', 'id="apply-booking-rules"',
+    'id="results-container"', 'bootstrap', 'type="module"', 'src="../src/js/',
+]
+
+
+def probe_page(url, expected_strings=()):
+    """Monitoring probe: HTTP 200 and all expected content present"""
+    status, content = fetch(url)
+    missing = [s for s in expected_strings if s not in content]
+    if status != 200 or missing:
+        raise AssertionError(f"HTTP {status}, missing {missing[:3]}")
+    return True
+
+
+def probe_hotels_api(min_hotels=25):
+    """
+    Monitoring probe: hotel API answers with the full hotel list; every
+    probe revalidates (max_age=0), usually a body-less 304
+    """
+    hotel_list = hotel_cache.get(max_age=0)
+    if hotel_list.source == 'stale':
+        raise AssertionError("Hotel API unreachable")
+    hotels = hotel_list.hotels
+    if not hotel_list.body.get('success') or len(hotels) != hotel_list.count or len(hotels) < min_hotels:
+        raise AssertionError(f"Unexpected hotel list ({len(hotels)} hotels)")
+    return True
+
+
+def run_monitor(args):
+    """Run the production probes concurrently on an interval"""
+    from config.adaptive_limiter import shared_limiter
+    from config.synthetic_monitor import SyntheticMonitor
+    
+    probes = {
+        'app_page': lambda: probe_page(PRODUCTION_URL, APP_EXPECTED_CONTENT),
+        'hotels_api': probe_hotels_api,
+    }
+    monitor = SyntheticMonitor(
+        probes,
+        interval=args.interval,
+        window=args.window,
+        metrics_file=args.metrics_file,
+        limiter=shared_limiter(),  # backs off on 429s/timeouts from production
+        limited=['hotels_api'],
+    )
+    
+    print_header("PRODUCTION SYNTHETIC MONITORING")
+    print(f"Endpoints: {', '.join(probes)}")
+    print(f"Interval: {args.interval}s, rolling window: {args.window} samples")
+    print(f"Metrics file: {args.metrics_file}\n")
+    
+    def report(m):
+        failing = [name for name, stats in m.stats.items() if not stats.last_success]
+        color = Fore.RED if failing else Fore.GREEN
+        print(f"{color}{m.status_line()}{Style.RESET_ALL}")
+        for name in failing:
+            print(f"{Fore.RED}   ❌ {name}: {m.stats[name].last_error}{Style.RESET_ALL}")
+    
+    monitor.run(cycles=args.cycles, on_cycle=report)
+    return 0
+
+
 def main():
+    parser = argparse.ArgumentParser(description='Production environment validation')
+    parser.add_argument('--monitor', action='store_true',
+                        help='Keep probing on an interval and export Prometheus metrics')
+    parser.add_argument('--interval', type=float, default=60,
+                        help='Seconds between probe cycles (default: 60)')
+    parser.add_argument('--window', type=int, default=100,
+                        help='Samples kept per endpoint for percentiles (default: 100)')
+    parser.add_argument('--cycles', type=int, default=None,
+                        help='Stop after N cycles (default: run until interrupted)')
+    parser.add_argument('--metrics-file', default='production_metrics.prom',
+                        help='Prometheus textfile output (default: production_metrics.prom)')
+    args = parser.parse_args()
+    
+    if args.monitor:
+        return run_monitor(args)
+    
     print_header("PRODUCTION ENVIRONMENT VALIDATION")
     print(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     
-    production_url = "https://www.mpbarbosa.com/submodules/monitora_vagas/public"
+    production_url = PRODUCTION_URL
     app_url = production_url  # index.html is served by default
     
     results = {
@@ -5,7 +5,7 @@ Validates test environment and provides setup instructions.
 """
 
 import sys
-import subprocess
+import shutil
 import importlib.util
 
 def check_python_version():
@@ -32,17 +32,13 @@ def check_package(package_name, install_name=None):
 def check_command(command, name=None):
     """Check if command is available"""
     name = name or command
-    try:
-        result = subprocess.run(['which', command], capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"✓ {name} available: {result.stdout.strip()}")
-            return True
-        else:
-            print(f"✗ {name} NOT found")
-            return False
-    except Exception:
-        print(f"✗ {name} NOT found")
-        return False
+    # shutil.which searches PATH in-process instead of spawning `which`
+    path = shutil.which(command)
+    if path:
+        print(f"✓ {name} available: {path}")
+        return True
+    print(f"✗ {name} NOT found")
+    return False
 
 def main():
     print("=" * 70)